@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Check that PetMedix queries stay index-backed
+Usage: python advise_indexes.py [--min-rows N] [--create-missing]
+
+EXPLAINs every read query the Database class issues and lists the ones that
+scan a whole table, plus any managed index missing from the database.
+"""
+
+import argparse
+import sys
+from modules.database import Database
+from modules.index_advisor import capture_queries, find_full_scans, missing_indexes
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that PetMedix queries stay index-backed")
+    parser.add_argument("--min-rows", type=int, default=0,
+                        help="ignore full scans the optimizer estimates below this many rows")
+    parser.add_argument("--create-missing", action="store_true",
+                        help="create any missing managed index")
+    args = parser.parse_args()
+
+    db = Database()
+    if not db.conn:
+        print("❌ Could not connect to the database.")
+        sys.exit(1)
+    try:
+        missing = missing_indexes(db)
+        for name, table, columns in missing:
+            print(f"❌ Missing index {name} on {table}({columns})")
+            if args.create_missing:
+                db.cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({columns})")
+                print(f"✅ Created {name}")
+        if not missing:
+            print("✅ All managed indexes exist")
+
+        captured = capture_queries(db)
+        scans = [scan for scan in find_full_scans(db, captured) if scan["rows"] >= args.min_rows]
+        print(f"\nExplained {len(captured)} queries, {len(scans)} full scans:")
+        for scan in sorted(scans, key=lambda scan: scan["rows"], reverse=True):
+            print(f"  {scan['method']:<36} {scan['table']:<18} {scan['type']:<6} "
+                  f"~{scan['rows']} rows  {scan['extra']}")
+
+        # Non-zero exit so the check can gate a scheduled job
+        sys.exit(1 if scans or (missing and not args.create_missing) else 0)
+    finally:
+        db.close_connection()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Measure edit-to-redraw latency of the appointment table, full reload against a data_events row patch
+Usage: python -m benchmarks.edit_redraw [--sizes N ...] [--edits N] [--database NAME]
+
+For each table size, seeds a scratch database (default: petmedix_bench) with that
+many appointments, loads them all into an AppointmentTableModel shown in a
+QTableView (offscreen unless QT_QPA_PLATFORM says otherwise), then edits
+appointments one at a time. The legacy path re-fetches every row and resets the
+model, as populate_tables did after each edit; the patched path re-reads only
+the edited row when Database.update_appointment publishes the change. Each
+timing runs from the UPDATE to the repainted viewport. Never point it at the
+live database.
+"""
+
+import argparse
+import os
+import random
+import time
+from datetime import date, timedelta
+from modules.database import Database
+from modules.data_events import data_events
+from modules.appointment_model import AppointmentTableModel
+from benchmarks.unbilled_reports import create_database
+
+PETS = 50
+STATUSES = ("Scheduled", "Completed", "Urgent", "Cancelled")
+
+
+def seed(db, appointments):
+    cursor = db.cursor
+    cursor.execute("DELETE FROM appointments")
+    cursor.execute("DELETE FROM billing_services")
+    cursor.execute("DELETE FROM billing")
+    cursor.execute("DELETE FROM pets")
+    cursor.execute("DELETE FROM clients")
+    cursor.executemany(
+        "INSERT INTO clients (client_id, name, email) VALUES (?, ?, ?)",
+        [(i, f"Client {i}", f"client{i}@example.com") for i in range(1, PETS + 1)]
+    )
+    cursor.executemany(
+        "INSERT INTO pets (pet_id, client_id, name) VALUES (?, ?, ?)",
+        [(i, i, f"Pet {i}") for i in range(1, PETS + 1)]
+    )
+    start = date.today() - timedelta(days=730)
+    cursor.executemany(
+        """INSERT INTO appointments (pet_id, client_id, date, time, status, payment_status, reason, veterinarian)
+           VALUES (?, ?, ?, ?, ?, 'UNPAID', ?, 'Dr. Bench')""",
+        [
+            (i % PETS + 1, i % PETS + 1, start + timedelta(days=random.randrange(730)),
+             f"{random.randrange(8, 18):02d}:{random.choice((0, 30)):02d}:00", random.choice(STATUSES),
+             f"Check-up {i}")
+            for i in range(appointments)
+        ]
+    )
+    db.conn.commit()
+    cursor.execute("SELECT appointment_id, pet_id, client_id, date, time, payment_status, reason, veterinarian "
+                   "FROM appointments")
+    return cursor.fetchall()
+
+
+def edit(db, appointment):
+    appointment_id, pet_id, client_id, day, at, payment, reason, vet = appointment
+    db.update_appointment(appointment_id, pet_id, client_id, day, at, random.choice(STATUSES), payment, reason, vet)
+
+
+def timed_edits(db, view, appointments, redraw):
+    """Mean milliseconds from the UPDATE to a repainted viewport, redraw() running in between."""
+    started = time.perf_counter()
+    for appointment in appointments:
+        edit(db, appointment)
+        redraw()
+        view.viewport().repaint()
+    return (time.perf_counter() - started) * 1000 / len(appointments)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--edits", type=int, default=50)
+    parser.add_argument("--database", default="petmedix_bench")
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication, QTableView
+    app = QApplication([])
+
+    create_database(args.database)
+    db = Database(database=args.database)
+    if not db.conn:
+        print("❌ Could not connect to the benchmark database.")
+        return
+    try:
+        print(f"{'rows':>8}  {'full reload':>14}  {'row patch':>12}")
+        for size in args.sizes:
+            appointments = seed(db, size)
+            model = AppointmentTableModel()
+            view = QTableView()
+            view.setModel(model)
+            view.resize(1200, 800)
+            view.show()
+            model.set_rows(db.fetch_appointments_page(limit=size))
+            app.processEvents()
+            sample = random.sample(appointments, min(args.edits, len(appointments)))
+
+            def reload():
+                model.set_rows(db.fetch_appointments_page(limit=size))
+
+            reload_ms = timed_edits(db, view, sample, reload)
+
+            def patch(entity, appointment_id, op):
+                model.put_row(db.fetch_appointment(appointment_id))
+
+            data_events.subscribe(patch)
+            try:
+                patch_ms = timed_edits(db, view, sample, lambda: None)
+            finally:
+                data_events.unsubscribe(patch)
+
+            print(f"{size:8d}  {reload_ms:11.2f} ms  {patch_ms:9.2f} ms")
+            view.close()
+    finally:
+        db.close_connection()
+
+
+if __name__ == "__main__":
+    main()
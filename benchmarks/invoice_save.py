@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Measure invoices saved per second, the legacy multi-round-trip path against Database.save_billing
+Usage: python -m benchmarks.invoice_save [--invoices N] [--lines N] [--database NAME]
+
+Seeds a scratch database (default: petmedix_bench) with clients and pets, then
+saves the same synthetic invoices both ways. Never point it at the live database.
+"""
+
+import argparse
+import time
+from datetime import date
+from modules.database import Database
+from benchmarks.unbilled_reports import create_database
+
+PETS = 50
+
+
+def seed(db):
+    cursor = db.cursor
+    cursor.execute("DELETE FROM billing_services")
+    cursor.execute("DELETE FROM billing")
+    cursor.execute("DELETE FROM pets")
+    cursor.execute("DELETE FROM clients")
+    cursor.executemany(
+        "INSERT INTO clients (client_id, name, email) VALUES (?, ?, ?)",
+        [(i, f"Client {i}", f"client{i}@example.com") for i in range(1, PETS + 1)]
+    )
+    cursor.executemany(
+        "INSERT INTO pets (pet_id, client_id, name) VALUES (?, ?, ?)",
+        [(i, i, f"Pet {i}") for i in range(1, PETS + 1)]
+    )
+    db.conn.commit()
+
+
+def synthetic_invoice(i, lines):
+    services = [(f"Consultation {n}", 1, 500.0, 500.0, date.today()) for n in range(lines)]
+    subtotal = 500.0 * lines
+    pet_id = i % PETS + 1
+    return dict(
+        client_id=pet_id, pet_id=pet_id, date_issued=date.today(), total_amount=subtotal * 1.12,
+        payment_status="PAID", payment_method="CASH", received_by="Bench", invoice_no=None,
+        reason="Consultation", veterinarian="Dr. Bench", notes="", subtotal=subtotal,
+        vat=subtotal * 0.12, partial_amount=0, services=services,
+    )
+
+
+def legacy_save(db, invoice):
+    """The statements the invoice form sent before save_billing took the service lines."""
+    cursor = db.cursor
+    cursor.execute(
+        "SELECT invoice_no FROM billing WHERE invoice_no LIKE ? ORDER BY invoice_no DESC LIMIT 1",
+        (f"INV-{date.today().year}-%",)
+    )
+    last = cursor.fetchone()
+    invoice_no = f"INV-{date.today().year}-{str(int(last[0].split('-')[-1]) + 1 if last else 1).zfill(4)}"
+    cursor.execute("SELECT 1 FROM clients WHERE client_id = ?", (invoice["client_id"],))
+    cursor.fetchone()
+    cursor.execute("SELECT 1 FROM pets WHERE pet_id = ?", (invoice["pet_id"],))
+    cursor.fetchone()
+    db.conn.begin()
+    cursor.execute("""
+        INSERT INTO billing (
+            client_id, pet_id, date_issued, total_amount, payment_status,
+            payment_method, received_by, invoice_no, reason, veterinarian, notes,
+            subtotal, vat, partial_amount
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, (
+        invoice["client_id"], invoice["pet_id"], invoice["date_issued"], invoice["total_amount"],
+        invoice["payment_status"], invoice["payment_method"], invoice["received_by"], invoice_no,
+        invoice["reason"], invoice["veterinarian"], invoice["notes"], invoice["subtotal"],
+        invoice["vat"], invoice["partial_amount"]
+    ))
+    billing_id = cursor.lastrowid
+    cursor.execute("SELECT * FROM billing WHERE billing_id = ?", (billing_id,))
+    cursor.fetchone()
+    db.conn.commit()
+    for service in invoice["services"]:
+        cursor.execute("""
+            INSERT INTO billing_services
+            (billing_id, service_description, quantity, unit_price, line_total, service_date)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (billing_id, *service))
+    db.conn.commit()
+    return billing_id, invoice_no
+
+
+def timed(save, invoices):
+    started = time.perf_counter()
+    for invoice in invoices:
+        if not save(invoice):
+            raise RuntimeError("invoice was not saved")
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--invoices", type=int, default=500)
+    parser.add_argument("--lines", type=int, default=4, help="service lines per invoice")
+    parser.add_argument("--database", default="petmedix_bench")
+    args = parser.parse_args()
+
+    create_database(args.database)
+    db = Database(database=args.database)
+    if not db.conn:
+        print("❌ Could not connect to the benchmark database.")
+        return
+    try:
+        invoices = [synthetic_invoice(i, args.lines) for i in range(args.invoices)]
+        print(f"Saving {args.invoices} invoices x {args.lines} service lines each way...")
+
+        seed(db)
+        legacy_time = timed(lambda invoice: legacy_save(db, invoice), invoices)
+        seed(db)
+        single_time = timed(lambda invoice: db.save_billing(**invoice), invoices)
+
+        print(f"legacy round trips : {legacy_time:7.2f} s  {args.invoices / legacy_time:8.1f} invoices/s")
+        print(f"save_billing       : {single_time:7.2f} s  {args.invoices / single_time:8.1f} invoices/s")
+        print(f"speed-up           : {legacy_time / single_time:7.1f}x")
+    finally:
+        db.close_connection()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Measure batch PDF throughput, one process against a process pool
+Usage: python -m benchmarks.pdf_export [--invoices N] [--reports N] [--rows N] [--processes N ...]
+
+Renders synthetic invoices and treatment reports (no database needed) into a
+temporary directory with export_batch and prints documents per second.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+from modules.pdf_export import TREATMENT_REPORT_HEADERS, export_batch
+
+CLINIC = {"name": "PetMedix Animal Clinic", "address": "1 Bench Street", "contact_number": "0917 000 0000",
+          "vet_license": "VL-0000"}
+
+
+def synthetic_jobs(folder, invoices, reports, rows):
+    day = date.today() - timedelta(days=30)
+    jobs = []
+    for i in range(invoices):
+        services = [
+            (f"Consultation: service {n} for pet {i}", day, 1, 500.0 + n, 500.0 + n)
+            for n in range(random.randint(1, 6))
+        ]
+        subtotal = sum(service[4] for service in services)
+        jobs.append(("invoice", os.path.join(folder, f"Invoice_{i}.pdf"), CLINIC, {
+            "invoice_no": f"INV-{i:05d}", "date_issued": day, "veterinarian": "Dr. Bench", "vet_license": "VL-1",
+            "reason": "Consultation", "notes": "Synthetic invoice " * 8,
+            "subtotal": subtotal, "vat": subtotal * 0.12, "total_amount": subtotal * 1.12,
+            "payment_status": "PAID", "payment_method": "CASH", "received_by": "Bench", "partial_amount": 0,
+            "client": {"name": f"Client {i}", "control_number": f"CN-BEN-{i:04d}", "address": "Bench",
+                       "contact_number": "0917", "email": f"client{i}@example.com"},
+            "pet": {"name": f"Pet {i}", "species": "Dog", "breed": "Aspin", "age": 3},
+            "services": services,
+        }))
+    treatments = list(TREATMENT_REPORT_HEADERS)
+    for i in range(reports):
+        treatment = treatments[i % len(treatments)]
+        records = [
+            ((day + timedelta(days=n % 30)).isoformat(), treatment, f"Pet {n}", f"Client {n}",
+             "reason", "detail", "treatment", "Bench", "Low")
+            for n in range(rows)
+        ]
+        jobs.append(("treatment_report", os.path.join(folder, f"Report_{i}.pdf"), CLINIC, (treatment, records)))
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--invoices", type=int, default=200)
+    parser.add_argument("--reports", type=int, default=24)
+    parser.add_argument("--rows", type=int, default=300, help="records per treatment report")
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    baseline = None
+    with tempfile.TemporaryDirectory() as folder:
+        jobs = synthetic_jobs(folder, args.invoices, args.reports, args.rows)
+        print(f"{len(jobs)} documents ({args.invoices} invoices, {args.reports} reports x {args.rows} rows)")
+        for processes in dict.fromkeys(args.processes):
+            started = time.perf_counter()
+            written, failed = export_batch(jobs, processes)
+            elapsed = time.perf_counter() - started
+            baseline = baseline or elapsed
+            print(f"{processes:3d} process{'es' if processes > 1 else '  '}: {elapsed:7.2f} s  "
+                  f"{len(written) / elapsed:7.1f} docs/s  {baseline / elapsed:5.1f}x  ({len(failed)} failed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Time every public Database method and the main screens against a synthetic clinic
+Usage: python -m benchmarks.suite [--generate [scale options]] [--repeat N] [--screen-repeat N] [--no-screens]
+                                  [--role ROLE] [--output results.json] [--compare baseline.json] [--database NAME]
+
+Runs against a scratch database (default: petmedix_bench) filled by
+benchmarks.synthetic_data; --generate fills it first and takes the same scale
+options. Read methods are called with the arguments in index_advisor.READ_METHODS,
+mapped onto rows that exist in the generated data; write methods run in
+create/update/delete cycles that leave the data as they found it. Each screen
+is built offscreen and timed until its background loads have landed and it has
+been painted once. --output saves the results as JSON and --compare prints the
+change against an earlier file. It refuses to run against the live database
+unless --i-know is given.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+from modules.database import Database
+from modules.index_advisor import READ_METHODS
+from modules.treatment_events import REPORT_TABLES
+from benchmarks.unbilled_reports import create_database
+from benchmarks.synthetic_data import (
+    generate, row_counts, add_scale_arguments, scale_from_arguments, refuse_live_database,
+    PASSWORD, SECURITY_ANSWERS
+)
+
+# Public methods the suite does not call: schema and one-off data migrations, and the pool itself
+SKIPPED_METHODS = {
+    "close_connection", "create_tables", "generate_license_numbers", "migrate_medical_records",
+    "pool_stats", "update_old_license_numbers",
+}
+SETTLE_TIMEOUT = 120  # seconds a screen may take to finish loading
+
+
+class Sample:
+    """Rows of the generated data that the benchmark calls refer to."""
+
+    def __init__(self, db):
+        cursor = db.cursor
+        cursor.execute("""
+            SELECT c.client_id, c.name, c.email, p.pet_id, p.name
+            FROM clients c JOIN pets p ON p.client_id = c.client_id
+            ORDER BY c.client_id, p.pet_id LIMIT 1
+        """)
+        self.client_id, self.client_name, self.email, self.pet_id, self.pet_name = cursor.fetchone()
+        cursor.execute("SELECT user_id, name, email FROM users WHERE role = 'Veterinarian' ORDER BY user_id LIMIT 1")
+        self.vet_id, vet_name, self.vet_email = cursor.fetchone()
+        self.vet = f"Dr. {vet_name}"
+        # index_advisor's placeholder arguments and what stands in for them here
+        self.replacements = {
+            "client@example.com": self.email,
+            "Client": self.client_name,
+            "Pet": self.pet_name,
+            "Dr. Vet": self.vet,
+            "2025V0001": self.vet_id,
+        }
+
+    def arguments(self, args, kwargs):
+        swap = lambda value: self.replacements.get(value, value) if isinstance(value, str) else value
+        return tuple(swap(arg) for arg in args), {name: swap(value) for name, value in kwargs.items()}
+
+
+def label(method, args=(), kwargs=None):
+    """A name for one benchmarked call that stays the same from day to day."""
+    def show(value):
+        return "date" if isinstance(value, date) else repr(value)
+    parts = [show(arg) for arg in args] + [f"{name}={show(value)}" for name, value in (kwargs or {}).items()]
+    return f"{method}({', '.join(parts)})"
+
+
+def summary(samples):
+    ordered = sorted(samples)
+    return {
+        "runs": len(ordered),
+        "first_ms": round(samples[0], 3),
+        "min_ms": round(ordered[0], 3),
+        "median_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+class Timings:
+    def __init__(self):
+        self.samples = {}
+
+    @contextmanager
+    def __call__(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.samples.setdefault(name, []).append((time.perf_counter() - started) * 1000)
+
+    def summaries(self):
+        return {name: summary(samples) for name, samples in self.samples.items()}
+
+
+def time_reads(db, sample, timer, repeat):
+    calls = [(method, args, kwargs, label(method, args, kwargs)) for method, args, kwargs in READ_METHODS]
+    calls += [
+        ("fetch_counts", (), {}, "fetch_counts()"),
+        ("authenticate_user", (sample.vet_email, PASSWORD), {}, "authenticate_user(email, password)"),
+        ("authenticate_user", (sample.vet_id, PASSWORD), {}, "authenticate_user(user_id, password)"),
+        ("verify_security_answers", (sample.vet_id, *SECURITY_ANSWERS), {}, "verify_security_answers(user_id, ...)"),
+        ("check_password_history", (sample.vet_id, "not-used-before"), {}, "check_password_history(user_id, ...)"),
+    ]
+    for method, args, kwargs, name in calls:
+        args, kwargs = sample.arguments(args, kwargs)
+        for _ in range(repeat):
+            with timer(name):
+                getattr(db, method)(*args, **kwargs)
+
+
+def appointment_cycle(db, sample, timer):
+    today = date.today()
+    with timer("save_appointment()"):
+        appointment_id = db.save_appointment(sample.pet_id, sample.client_id, today, "Scheduled", "Pending",
+                                             "Benchmark", sample.vet, "09:00:00")
+    with timer("update_appointment()"):
+        db.update_appointment(appointment_id, sample.pet_id, sample.client_id, today, "09:30:00", "Completed",
+                              "Paid", "Benchmark", sample.vet)
+    with timer("delete_appointment()"):
+        db.delete_appointment(appointment_id)
+
+
+def report_cycle(db, sample, timer):
+    today = date.today().isoformat()
+    for record_type, (table, key, _) in REPORT_TABLES.items():
+        with timer(f"save_medical_record({record_type!r})"):
+            db.save_medical_record(sample.pet_id, sample.client_id, today, record_type, "Benchmark", "Benchmark",
+                                   today, sample.vet, "Low Risk")
+        db.cursor.execute(f"SELECT MAX({key}) FROM {table}")
+        record_id = db.cursor.fetchone()[0]
+        with timer(f"update_medical_record({record_type!r})"):
+            db.update_medical_record(record_type, record_id, today, "Benchmark", "Edited", today, sample.vet,
+                                     "High Risk")
+        with timer(f"delete_medical_record({record_type!r})"):
+            db.delete_medical_record(record_type, record_id)
+
+
+def billing_cycle(db, sample, timer):
+    today = date.today()
+    services = [("Consultation", 1, 500.0, 500.0, today), ("Vaccination", 2, 850.0, 1700.0, today)]
+    invoice = dict(total_amount=2464.0, payment_status="UNPAID", payment_method="CASH", received_by="Benchmark",
+                   reason="Consultation", veterinarian=sample.vet, notes="", subtotal=2200.0, vat=264.0,
+                   services=services)
+    with timer("save_billing()"):
+        billing_id, _ = db.save_billing(sample.client_id, sample.pet_id, today, invoice_no=None, **invoice)
+    invoice["payment_status"] = "PAID"
+    with timer("update_billing()"):
+        db.update_billing(billing_id, sample.client_id, sample.pet_id, today, **invoice)
+    with timer("delete_invoice()"):
+        db.delete_invoice(billing_id)
+
+
+def client_cycle(db, sample, timer):
+    email = "suite-client@example.com"
+    with timer("save_client(new)"):
+        db.save_client("Suite Client", "Manila", "09170000000", email)
+    with timer("save_client(existing)"):
+        db.save_client("Suite Client", "Makati", "09170000001", email)
+    db.cursor.execute("DELETE FROM clients WHERE email = ?", (email,))
+    db.conn.commit()
+
+
+def user_cycle(db, sample, timer):
+    with timer("create_user()"):
+        user_id = db.create_user("Suite", "User", "suite-user@petmedix.com", PASSWORD, "Receptionist", "Verified")
+    with timer("save_user_profile(new)"):
+        db.save_user_profile(user_id, "09170000000", "Manila", "Female", date(1990, 1, 1))
+    with timer("save_user_profile(existing)"):
+        db.save_user_profile(user_id, "09170000001", "Makati", "Female", date(1990, 1, 1))
+    with timer("save_security_questions()"):
+        db.save_security_questions(user_id, "Q1?", SECURITY_ANSWERS[0], "Q2?", SECURITY_ANSWERS[1],
+                                   "Q3?", SECURITY_ANSWERS[2])
+    with timer("update_password()"):
+        db.update_password(user_id, "changed-password")
+    with timer("add_to_password_history()"):
+        db.add_to_password_history(user_id, "0" * 64)
+    # Cascades to the profile, answers and password history
+    db.cursor.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
+    db.conn.commit()
+
+
+def sequence_cycle(db, sample, timer):
+    # Reserved numbers go back to their sequences on rollback
+    for method, args in (("generate_invoice_no", ()), ("generate_invoice_nos", (10,)),
+                         ("generate_user_id", ("Veterinarian",)), ("generate_user_ids", ("Receptionist", 10))):
+        with timer(label(method, args)):
+            getattr(db, method)(*args)
+        db.conn.rollback()
+
+
+def clinic_cycle(db, sample, timer):
+    clinic = db.get_clinic_info()
+    with timer("save_clinic_info()"):
+        db.save_clinic_info(clinic["name"], clinic["address"], clinic["contact_number"], clinic["email"],
+                            clinic["employees_count"], vet_license=clinic["vet_license"])
+
+
+WRITE_CYCLES = (appointment_cycle, report_cycle, billing_cycle, client_cycle, user_cycle, sequence_cycle,
+                clinic_cycle)
+
+
+def time_writes(db, sample, timer, repeat):
+    for _ in range(repeat):
+        for cycle in WRITE_CYCLES:
+            cycle(db, sample, timer)
+
+
+def untimed_methods(names):
+    """Public Database methods neither benchmarked nor listed in SKIPPED_METHODS."""
+    timed = {name.split("(")[0] for name in names}
+    public = {name for name in dir(Database) if not name.startswith("_") and callable(getattr(Database, name))}
+    return sorted(public - timed - SKIPPED_METHODS)
+
+
+def screen_builders(role, sample):
+    """(name, builder) for each main screen; imported here so Qt starts only when screens are timed."""
+    from PySide6.QtWidgets import QWidget
+    from modules.home import get_home_widget
+    from modules.client import get_client_widget
+    from modules.report import get_report_widget
+    from modules.appointment import get_appointment_widget
+    from modules.billing import update_billing_widget
+    from modules.setting import get_setting_widget
+    return [
+        ("dashboard", lambda: get_home_widget(role)),
+        ("clients", lambda: get_client_widget(QWidget(), role)),
+        ("reports", lambda: get_report_widget(role)),
+        ("appointments", lambda: get_appointment_widget(role)),
+        ("billings", lambda: update_billing_widget(role)(role)),
+        ("settings", lambda: get_setting_widget(user_id=sample.vet_id)),
+    ]
+
+
+def settle(app):
+    """Process events until no background query is in flight, then paint once."""
+    from modules.db_worker import db_executor
+    deadline = time.monotonic() + SETTLE_TIMEOUT
+    app.processEvents()
+    while db_executor.is_busy():
+        if time.monotonic() > deadline:
+            print("⚠️ Gave up waiting for background queries")
+            break
+        db_executor.wait_for_done(10)
+        app.processEvents()
+
+
+def time_screens(sample, timer, role, repeat):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    for name, build in screen_builders(role, sample):
+        for _ in range(repeat):
+            try:
+                with timer(name):
+                    widget = build()
+                    widget.resize(1280, 720)
+                    widget.show()
+                    settle(app)
+                    widget.grab()
+            except Exception as e:
+                print(f"❌ Could not build the {name} screen: {e}")
+                timer.samples.pop(name, None)
+                break
+            widget.close()
+            widget.deleteLater()
+            app.processEvents()
+
+
+def compare(results, baseline, threshold):
+    """Print median changes against an earlier results file; returns the number of slower entries."""
+    if baseline.get("scale") != results.get("scale"):
+        print("⚠️ The baseline ran at a different scale; changes are not like for like")
+    slower = 0
+    for section in ("methods", "screens"):
+        before_section = baseline.get(section, {})
+        print(f"\n{section}: median ms, baseline → now")
+        for name, now in results[section].items():
+            before = before_section.get(name)
+            if before is None:
+                print(f"  {'':>10}   {now['median_ms']:10.2f}  {'new':>8}  {name}")
+                continue
+            change = (now["median_ms"] - before["median_ms"]) / before["median_ms"] if before["median_ms"] else 0.0
+            flag = "⚠️" if change > threshold else "  "
+            slower += change > threshold
+            print(f"  {before['median_ms']:10.2f} → {now['median_ms']:10.2f}  {change:+8.1%} {flag} {name}")
+        for name in sorted(set(before_section) - set(results[section])):
+            print(f"  {before_section[name]['median_ms']:10.2f}   {'':>10}  {'gone':>8}  {name}")
+    return slower
+
+
+def print_results(results):
+    for section in ("methods", "screens"):
+        entries = sorted(results[section].items(), key=lambda item: -item[1]["median_ms"])
+        print(f"\n{section} ({len(entries)}), slowest first")
+        print(f"  {'median':>10} {'p95':>10} {'first':>10} {'runs':>5}")
+        for name, entry in entries:
+            print(f"  {entry['median_ms']:10.2f} {entry['p95_ms']:10.2f} {entry['first_ms']:10.2f} "
+                  f"{entry['runs']:5d}  {name}")
+
+
+def run(args):
+    db = Database()
+    if not db.conn:
+        print("❌ Could not connect to the benchmark database.")
+        sys.exit(1)
+    try:
+        if args.generate:
+            print("Generating synthetic data...")
+            generate(db, scale_from_arguments(args), args.years, args.seed, args.batch)
+        scale = row_counts(db)
+        if not scale["clients"]:
+            print("❌ The benchmark database is empty; run with --generate or python -m benchmarks.synthetic_data")
+            sys.exit(1)
+        print(f"Scale: {', '.join(f'{table} {count}' for table, count in scale.items() if count)}")
+        sample = Sample(db)
+
+        methods = Timings()
+        time_reads(db, sample, methods, args.repeat)
+        time_writes(db, sample, methods, args.repeat)
+    finally:
+        db.close_connection()
+
+    missing = untimed_methods(methods.samples)
+    if missing:
+        print(f"⚠️ Not benchmarked: {', '.join(missing)} (add them to the suite or SKIPPED_METHODS)")
+
+    screens = Timings()
+    if not args.no_screens:
+        time_screens(sample, screens, args.role, args.screen_repeat)
+
+    results = {
+        "started": datetime.now().isoformat(timespec="seconds"),
+        "database": args.database,
+        "scale": scale,
+        "repeat": args.repeat,
+        "methods": methods.summaries(),
+        "screens": screens.summaries(),
+    }
+    print_results(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✅ Results written to {args.output}")
+    if args.compare:
+        try:
+            with open(args.compare, encoding="utf-8") as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not read {args.compare}: {e}")
+            sys.exit(1)
+        slower = compare(results, baseline, args.threshold)
+        print(f"\n{slower} entries more than {args.threshold:.0%} slower than {args.compare}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database", default="petmedix_bench")
+    parser.add_argument("--generate", action="store_true", help="fill the database first (see the scale options)")
+    add_scale_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=5, help="calls per database method")
+    parser.add_argument("--screen-repeat", type=int, default=3, help="builds per screen")
+    parser.add_argument("--no-screens", action="store_true")
+    parser.add_argument("--role", default="Receptionist", help="user role the screens are built for")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="print the change against an earlier --output file")
+    parser.add_argument("--threshold", type=float, default=0.10, help="slowdown flagged by --compare (0.10 = 10%%)")
+    parser.add_argument("--i-know", action="store_true", help="allow --database to name the live database")
+    args = parser.parse_args()
+
+    if refuse_live_database(args.database, args.i_know):
+        sys.exit(1)
+    create_database(args.database)
+    # Screens open their own Database() connections; send them to the scratch database
+    # too, and put the default back however the run ends
+    live_database = Database.default_database
+    Database.default_database = args.database
+    try:
+        run(args)
+    finally:
+        Database.default_database = live_database
+
+
+if __name__ == "__main__":
+    main()
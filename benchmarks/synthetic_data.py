@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Fill a scratch database with a synthetic clinic at a chosen scale
+Usage: python -m benchmarks.synthetic_data [--clients N] [--pets N] [--treatments N] [--appointments N]
+                                           [--invoices N] [--users N] [--years N] [--seed N] [--database NAME]
+
+Empties the scratch database (default: petmedix_bench) and writes users with
+profiles and security questions, the clinic, clients, pets, all six treatment
+tables, appointments, invoices and their service lines, using batched
+executemany inserts with key checks off. The same --seed gives the same rows,
+so benchmark runs against it are comparable. Every user's password is "bench"
+(the admin keeps admin123). It refuses to run against the live database
+unless --i-know is given.
+"""
+
+import argparse
+import hashlib
+import random
+import time
+from datetime import date, timedelta
+from modules.database import Database
+from modules.sequences import seed_from_existing, format_invoice_no, invoice_prefix
+from modules.treatment_events import REPORT_TABLES, RISK_STATUS_REPORTS
+from benchmarks.unbilled_reports import create_database
+
+DEFAULT_SCALE = {
+    "clients": 10000,
+    "pets": 50000,
+    "treatments": 500000,
+    "appointments": 100000,
+    "invoices": 50000,
+    "users": 40,
+}
+BATCH_SIZE = 5000
+# The application's own database, read before any benchmark points Database elsewhere
+LIVE_DATABASE = Database.default_database
+PASSWORD = "bench"
+SECURITY_ANSWERS = ("blue", "manila", "rex")
+
+# Share of the treatments written to each report type
+TREATMENT_SHARES = {
+    "Consultation": 0.30,
+    "Deworming": 0.15,
+    "Vaccination": 0.25,
+    "Surgery": 0.05,
+    "Grooming": 0.15,
+    "Other Treatments": 0.10,
+}
+
+# Every table the generator writes, emptied before it starts
+TABLES = (
+    "billing_services", "billing", "appointments",
+    *(table for table, _, _ in REPORT_TABLES.values()),
+    "pet_notes", "pets", "clients",
+    "password_history", "security_questions", "user_profiles", "users", "clinic_info", "sequences",
+)
+
+FIRST_NAMES = ("Maria", "Jose", "Ana", "Juan", "Carmen", "Luis", "Rosa", "Pedro", "Elena", "Miguel",
+               "Sofia", "Carlos", "Isabel", "Antonio", "Lucia", "Rafael", "Teresa", "Diego", "Clara", "Paolo")
+LAST_NAMES = ("Santos", "Reyes", "Cruz", "Bautista", "Garcia", "Mendoza", "Torres", "Flores", "Ramos", "Aquino",
+              "Villanueva", "Castillo", "Navarro", "Domingo", "Salazar", "Fernandez", "Lopez", "Morales")
+CITIES = ("Manila", "Quezon City", "Makati", "Pasig", "Taguig", "Cebu", "Davao", "Baguio", "Iloilo", "Bacolod")
+PET_NAMES = ("Bella", "Max", "Luna", "Charlie", "Coco", "Rocky", "Milo", "Daisy", "Buddy", "Lucky",
+             "Kitty", "Simba", "Nala", "Oreo", "Choco", "Mochi", "Shadow", "Ginger", "Pepper", "Tiger")
+BREEDS = {
+    "Dog": ("Aspin", "Shih Tzu", "Labrador", "Poodle", "Beagle", "Golden Retriever"),
+    "Cat": ("Puspin", "Persian", "Siamese", "Maine Coon"),
+    "Rabbit": ("Holland Lop", "Netherland Dwarf"),
+    "Bird": ("Lovebird", "Cockatiel"),
+}
+COLORS = ("Black", "White", "Brown", "Tan", "Gray", "Orange", "Cream", "Tricolor")
+
+# Values for each report type's three detail columns (see REPORT_TABLES); None marks a follow-up date
+TREATMENT_DETAILS = {
+    "Consultation": (("Vomiting", "Limping", "Skin rash", "Loss of appetite", "Annual check-up"),
+                     ("Gastritis", "Sprain", "Dermatitis", "Otitis", "Healthy"),
+                     ("Antibiotics for 7 days", "Rest and pain relief", "Medicated shampoo", "Ear drops")),
+    "Deworming": (("Pyrantel", "Praziquantel", "Fenbendazole"), ("1 tablet", "2.5 ml", "5 ml"), None),
+    "Vaccination": (("Anti-rabies", "5-in-1", "4-in-1", "Kennel cough"), ("1 ml", "0.5 ml"), None),
+    "Surgery": (("Spay", "Neuter", "Mass removal", "Dental extraction"), ("Isoflurane", "Ketamine", "Propofol"), None),
+    "Grooming": (("Full groom", "Bath and blow dry", "Nail trim", "Haircut"), ("Calm", "Matted coat", "Anxious"), None),
+    "Other Treatments": (("Wound care", "Fluid therapy", "Laser therapy"), ("Povidone", "Lactated Ringer's", "None"),
+                         ("Once", "3 days", "1 week")),
+}
+APPOINTMENT_REASONS = ("Check-up", "Vaccination", "Deworming", "Grooming", "Follow-up", "Surgery consult")
+SERVICES = (("Consultation", 500.0), ("Vaccination", 850.0), ("Deworming", 300.0), ("Grooming", 700.0),
+            ("Laboratory test", 1200.0), ("Surgery", 8500.0), ("Medication", 250.0), ("Confinement (day)", 1000.0))
+
+
+def hashed(text):
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def insert_rows(db, table, columns, rows, batch_size=BATCH_SIZE):
+    """executemany rows (any iterable) into table in batches and commit; returns the row count."""
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+    count = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            db.cursor.executemany(sql, batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        db.cursor.executemany(sql, batch)
+        count += len(batch)
+    db.conn.commit()
+    return count
+
+
+def refuse_live_database(name, i_know=False):
+    """Return True, after saying why, when name is the live database and --i-know was not given."""
+    if name == LIVE_DATABASE and not i_know:
+        print(f"❌ {name} is the live database and benchmarks overwrite its data; pass --i-know to use it anyway.")
+        return True
+    return False
+
+
+def clear(db):
+    db.cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+    for table in TABLES:
+        db.cursor.execute(f"TRUNCATE TABLE {table}")
+    db.cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+    db.conn.commit()
+
+
+def make_users(count, rng):
+    """User rows plus the veterinarian names the other tables refer to (as "Dr. <name>")."""
+    year = date.today().year
+    users = [("2025A0001", "Admin", None, "admin@petmedix.com", hashed("admin123"), "Admin", "Verified", None)]
+    vets = []
+    for i in range(1, max(count, 3)):
+        name, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        if i % 2:
+            user_id, role, license_number = f"{year}V{i:04d}", "Veterinarian", f"PRC{rng.randrange(10 ** 7):07d}"
+            vets.append(f"Dr. {name}")
+        else:
+            user_id, role, license_number = f"{year}R{i:04d}", "Receptionist", None
+        users.append((user_id, name, last, f"user{i}@petmedix.com", hashed(PASSWORD), role, "Verified",
+                      license_number))
+    return users, vets
+
+
+def random_date(rng, start, days):
+    return start + timedelta(days=rng.randrange(days))
+
+
+def generate(db, scale, years=3, seed=1, batch_size=BATCH_SIZE, report=print):
+    """Empty the database and write a synthetic clinic of the given scale (keys as DEFAULT_SCALE)."""
+    rng = random.Random(seed)
+    today = date.today()
+    start = today - timedelta(days=365 * years)
+    days = (today - start).days + 1
+
+    def timed_insert(table, columns, rows):
+        started = time.perf_counter()
+        count = insert_rows(db, table, columns, rows, batch_size)
+        report(f"  {table:<18} {count:9d} rows  {time.perf_counter() - started:7.1f} s")
+        return count
+
+    clear(db)
+    db.cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+    db.cursor.execute("SET UNIQUE_CHECKS = 0")
+    try:
+        users, vets = make_users(scale["users"], rng)
+        receptionists = [user[1] for user in users if user[5] == "Receptionist"] or ["Front Desk"]
+        timed_insert("users", ("user_id", "name", "last_name", "email", "hashed_password", "role", "status",
+                               "license_number"), users)
+        timed_insert("user_profiles", ("user_id", "contact_number", "address", "gender", "birthdate"), (
+            (user[0], f"09{rng.randrange(10 ** 9):09d}", rng.choice(CITIES), rng.choice(("Male", "Female")),
+             date(rng.randrange(1970, 2000), rng.randrange(1, 13), rng.randrange(1, 29)))
+            for user in users
+        ))
+        answers = [hashed(answer) for answer in SECURITY_ANSWERS]
+        timed_insert("security_questions", ("user_id", "question_one", "answer_one", "question_two", "answer_two",
+                                            "question_three", "answer_three"), (
+            (user[0], "Favourite colour?", answers[0], "Birthplace?", answers[1], "First pet?", answers[2])
+            for user in users
+        ))
+        timed_insert("clinic_info", ("name", "address", "contact_number", "email", "employees_count", "vet_license"),
+                     [("PetMedix Benchmark Clinic", "Manila", "0281234567", "clinic@petmedix.com", len(users),
+                       "PRC0000001")])
+
+        clients = scale["clients"]
+        addresses = [rng.choice(CITIES) for _ in range(clients)]
+        timed_insert("clients", ("client_id", "name", "address", "contact_number", "email", "control_number"), (
+            (i, f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", addresses[i - 1],
+             f"09{rng.randrange(10 ** 9):09d}", f"client{i}@example.com", f"CN-{addresses[i - 1][:3].upper()}-{i:04d}")
+            for i in range(1, clients + 1)
+        ))
+
+        # Every client gets a pet before any client gets a second one
+        pet_clients = [i if i <= clients else rng.randrange(1, clients + 1) for i in range(1, scale["pets"] + 1)]
+
+        def pet_rows():
+            for pet_id, client_id in enumerate(pet_clients, 1):
+                species = rng.choice(tuple(BREEDS))
+                birthdate = random_date(rng, today - timedelta(days=365 * 15), 365 * 15)
+                yield (pet_id, client_id, rng.choice(PET_NAMES), rng.choice(("Male", "Female")), species,
+                       rng.choice(BREEDS[species]), rng.choice(COLORS), birthdate, (today - birthdate).days // 365,
+                       round(rng.uniform(0.5, 40), 2), round(rng.uniform(5, 30), 2))
+
+        timed_insert("pets", ("pet_id", "client_id", "name", "gender", "species", "breed", "color", "birthdate",
+                              "age", "weight", "height"), pet_rows())
+
+        def treatment_rows(treatment, count):
+            details = TREATMENT_DETAILS[treatment]
+            for _ in range(count):
+                pet_id = rng.randrange(1, len(pet_clients) + 1)
+                day = random_date(rng, start, days)
+                values = [rng.choice(choices) if choices else day + timedelta(days=rng.randrange(14, 365))
+                          for choices in details]
+                row = (pet_id, pet_clients[pet_id - 1], day, rng.choice(vets), *values)
+                if treatment in RISK_STATUS_REPORTS:
+                    row += (rng.choice(("Low Risk", "Low Risk", "Medium Risk", "High Risk")),)
+                yield row
+
+        for treatment, share in TREATMENT_SHARES.items():
+            table, _, detail_columns = REPORT_TABLES[treatment]
+            columns = ("pet_id", "client_id", "date", "veterinarian", *detail_columns)
+            if treatment in RISK_STATUS_REPORTS:
+                columns += ("risk_status",)
+            timed_insert(table, columns, treatment_rows(treatment, int(scale["treatments"] * share)))
+
+        def appointment_rows():
+            for _ in range(scale["appointments"]):
+                pet_id = rng.randrange(1, len(pet_clients) + 1)
+                # A quarter of the appointments are still ahead
+                day = random_date(rng, start, days + days // 3)
+                if day > today:
+                    status = rng.choice(("Scheduled", "Scheduled", "Scheduled", "Urgent", "Rescheduled"))
+                    payment = "Pending"
+                else:
+                    status = rng.choice(("Completed", "Completed", "Completed", "Cancelled", "No-Show"))
+                    payment = "Paid" if status == "Completed" else "Unpaid"
+                yield (pet_id, pet_clients[pet_id - 1], day, f"{rng.randrange(8, 18):02d}:{rng.choice((0, 30)):02d}:00",
+                       status, payment, rng.choice(APPOINTMENT_REASONS), rng.choice(vets))
+
+        timed_insert("appointments", ("pet_id", "client_id", "date", "time", "status", "payment_status", "reason",
+                                      "veterinarian"), appointment_rows())
+
+        # Invoices are numbered per year of issue, in date order, like the INV-<year> sequences
+        issued = sorted(random_date(rng, start, days) for _ in range(scale["invoices"]))
+        invoice_numbers = {}
+        lines = []
+
+        def billing_rows():
+            for billing_id, day in enumerate(issued, 1):
+                pet_id = rng.randrange(1, len(pet_clients) + 1)
+                services = rng.sample(SERVICES, rng.randrange(1, 5))
+                subtotal = 0.0
+                for description, price in services:
+                    quantity = rng.randrange(1, 3)
+                    subtotal += quantity * price
+                    lines.append((billing_id, description, quantity, price, quantity * price, day))
+                vat = round(subtotal * 0.12, 2)
+                total = round(subtotal + vat, 2)
+                status = rng.choice(("PAID", "PAID", "PAID", "UNPAID", "PARTIAL"))
+                number = invoice_numbers[day.year] = invoice_numbers.get(day.year, 0) + 1
+                yield (billing_id, format_invoice_no(invoice_prefix(day.year), number), pet_clients[pet_id - 1],
+                       pet_id, day, subtotal, vat, total, status,
+                       round(total / 2, 2) if status == "PARTIAL" else 0.0,
+                       rng.choice(("CASH", "CREDIT CARD", "GCASH", "BANK TRANSFER")), rng.choice(receptionists),
+                       services[0][0], rng.choice(vets), "")
+
+        timed_insert("billing", ("billing_id", "invoice_no", "client_id", "pet_id", "date_issued", "subtotal", "vat",
+                                 "total_amount", "payment_status", "partial_amount", "payment_method", "received_by",
+                                 "reason", "veterinarian", "notes"), billing_rows())
+        timed_insert("billing_services", ("billing_id", "service_description", "quantity", "unit_price", "line_total",
+                                          "service_date"), lines)
+    finally:
+        db.cursor.execute("SET UNIQUE_CHECKS = 1")
+        db.cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+
+    # New invoices and users continue after the generated numbers
+    seed_from_existing(db.cursor)
+    db.conn.commit()
+
+
+def row_counts(db):
+    """Rows per generated table, to record the scale a benchmark ran at."""
+    counts = {}
+    for table in TABLES:
+        db.cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        counts[table] = db.cursor.fetchone()[0]
+    return counts
+
+
+def add_scale_arguments(parser):
+    for name, default in DEFAULT_SCALE.items():
+        parser.add_argument(f"--{name}", type=int, default=default)
+    parser.add_argument("--years", type=int, default=3, help="history length; a third as much again is booked ahead")
+    parser.add_argument("--seed", type=int, default=1, help="random seed; the same seed gives the same data")
+    parser.add_argument("--batch", type=int, default=BATCH_SIZE, help="rows per executemany")
+
+
+def scale_from_arguments(args):
+    return {name: getattr(args, name) for name in DEFAULT_SCALE}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_scale_arguments(parser)
+    parser.add_argument("--database", default="petmedix_bench")
+    parser.add_argument("--i-know", action="store_true", help="allow --database to name the live database")
+    args = parser.parse_args()
+
+    if refuse_live_database(args.database, args.i_know):
+        return
+    create_database(args.database)
+    db = Database(database=args.database)
+    if not db.conn:
+        print("❌ Could not connect to the benchmark database.")
+        return
+    try:
+        print(f"Generating {', '.join(f'{n} {name}' for name, n in scale_from_arguments(args).items())}...")
+        started = time.perf_counter()
+        generate(db, scale_from_arguments(args), args.years, args.seed, args.batch)
+        print(f"✅ Done in {time.perf_counter() - started:.1f} s")
+    finally:
+        db.close_connection()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Compare the legacy six-way LEFT JOIN unpaid-report query with Database.fetch_unpaid_reports
+Usage: python -m benchmarks.unbilled_reports [--pets N] [--per-table N] [--database NAME]
+
+Seeds a scratch database (default: petmedix_bench) with synthetic clients, pets,
+treatments and invoices, then times both queries. Never point it at the live database.
+"""
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+import mariadb
+from modules.database import Database
+
+# The query fetch_unpaid_reports used before the UNION ALL rewrite
+LEGACY_UNPAID_QUERY = """
+    SELECT
+        COALESCE(c.date, d.date, v.date, s.date, g.date, o.date) as treatment_date,
+        p.name AS pet_name,
+        cl.name AS client_name,
+        CASE
+            WHEN c.consultation_id IS NOT NULL THEN 'Consultation'
+            WHEN d.deworming_id IS NOT NULL THEN 'Deworming'
+            WHEN v.vaccination_id IS NOT NULL THEN 'Vaccination'
+            WHEN s.surgery_id IS NOT NULL THEN 'Surgery'
+            WHEN g.grooming_id IS NOT NULL THEN 'Grooming'
+            WHEN o.treatment_id IS NOT NULL THEN 'Other Treatment'
+        END as treatment_type,
+        COALESCE(c.veterinarian, d.veterinarian, v.veterinarian, s.veterinarian, g.veterinarian, o.veterinarian) as veterinarian
+    FROM pets p
+    JOIN clients cl ON p.client_id = cl.client_id
+    LEFT JOIN consultations c ON p.pet_id = c.pet_id
+    LEFT JOIN deworming d ON p.pet_id = d.pet_id
+    LEFT JOIN vaccinations v ON p.pet_id = v.pet_id
+    LEFT JOIN surgeries s ON p.pet_id = s.pet_id
+    LEFT JOIN grooming g ON p.pet_id = g.pet_id
+    LEFT JOIN other_treatments o ON p.pet_id = o.pet_id
+    LEFT JOIN billing b ON (
+        p.pet_id = b.pet_id AND
+        (
+            DATE(c.date) = b.date_issued OR
+            DATE(d.date) = b.date_issued OR
+            DATE(v.date) = b.date_issued OR
+            DATE(s.date) = b.date_issued OR
+            DATE(g.date) = b.date_issued OR
+            DATE(o.date) = b.date_issued
+        )
+    )
+    WHERE b.billing_id IS NULL
+    ORDER BY treatment_date DESC
+"""
+
+# NOT NULL columns each treatment table needs besides pet_id, client_id, date and veterinarian
+TREATMENT_COLUMNS = {
+    "consultations": ("reason", "diagnosis", "prescribed_treatment"),
+    "deworming": ("medication", "dosage", "next_scheduled"),
+    "vaccinations": ("vaccine", "dosage", "next_scheduled"),
+    "surgeries": ("surgery_type", "anesthesia", "next_followup"),
+    "grooming": ("services", "notes", "next_scheduled"),
+    "other_treatments": ("treatment_type", "medication", "dosage"),
+}
+
+
+def create_database(name):
+    conn = mariadb.connect(host="localhost", user="root", password="")
+    try:
+        conn.cursor().execute(f"CREATE DATABASE IF NOT EXISTS {name}")
+    finally:
+        conn.close()
+
+
+def seed(db, pets, per_table, billed_ratio=0.3):
+    """Fill the scratch database with synthetic rows; billed_ratio of treatment dates get an invoice."""
+    cursor = db.cursor
+    for table in TREATMENT_COLUMNS:
+        cursor.execute(f"DELETE FROM {table}")
+    cursor.execute("DELETE FROM billing")
+    cursor.execute("DELETE FROM pets")
+    cursor.execute("DELETE FROM clients")
+
+    cursor.executemany(
+        "INSERT INTO clients (client_id, name, email) VALUES (?, ?, ?)",
+        [(i, f"Client {i}", f"client{i}@example.com") for i in range(1, pets + 1)]
+    )
+    cursor.executemany(
+        "INSERT INTO pets (pet_id, client_id, name) VALUES (?, ?, ?)",
+        [(i, i, f"Pet {i}") for i in range(1, pets + 1)]
+    )
+
+    start = date.today() - timedelta(days=365)
+    invoices = set()
+    for table in TREATMENT_COLUMNS:
+        extra = TREATMENT_COLUMNS[table]
+        columns = ", ".join(("pet_id", "client_id", "date", "veterinarian") + extra)
+        placeholders = ", ".join("?" * (4 + len(extra)))
+        rows = []
+        for pet_id in range(1, pets + 1):
+            for _ in range(per_table):
+                day = start + timedelta(days=random.randrange(365))
+                filler = tuple(day if column.startswith("next_") else "n/a" for column in extra)
+                rows.append((pet_id, pet_id, day, "Dr. Bench") + filler)
+                if random.random() < billed_ratio:
+                    invoices.add((pet_id, day))
+        cursor.executemany(f"INSERT INTO {table} ({columns}) VALUES ({placeholders})", rows)
+
+    cursor.executemany(
+        "INSERT INTO billing (client_id, pet_id, date_issued, total_amount, payment_status) VALUES (?, ?, ?, 0, 'PAID')",
+        [(pet_id, pet_id, day) for pet_id, day in invoices]
+    )
+    db.conn.commit()
+
+
+def legacy_unpaid_reports(db):
+    db.cursor.execute(LEGACY_UNPAID_QUERY)
+    return db.cursor.fetchall()
+
+
+def timed(fetch, repeat=3):
+    """Return (best seconds, row count) over a few runs."""
+    best = None
+    rows = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = len(fetch())
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pets", type=int, default=500)
+    parser.add_argument("--per-table", type=int, default=2,
+                        help="treatments per pet in each table (the legacy query grows with its 6th power)")
+    parser.add_argument("--database", default="petmedix_bench")
+    args = parser.parse_args()
+
+    create_database(args.database)
+    db = Database(database=args.database)
+    if not db.conn:
+        print("❌ Could not connect to the benchmark database.")
+        return
+    try:
+        print(f"Seeding {args.pets} pets x {args.per_table} treatments per table...")
+        seed(db, args.pets, args.per_table)
+
+        legacy_time, legacy_rows = timed(lambda: legacy_unpaid_reports(db))
+        feed_time, feed_rows = timed(db.fetch_unpaid_reports)
+        print(f"legacy LEFT JOIN : {legacy_time * 1000:9.1f} ms  {legacy_rows:8d} rows")
+        print(f"treatment_events: {feed_time * 1000:9.1f} ms  {feed_rows:8d} rows")
+        print(f"speed-up         : {legacy_time / feed_time:9.1f}x")
+    finally:
+        db.close_connection()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Export PetMedix documents as PDFs in bulk
+Usage: python export_pdfs.py {invoices,reports,appointments,all} [--month YYYY-MM | --from YYYY-MM-DD --to YYYY-MM-DD]
+                             [--processes N] [--output DIR]
+
+Documents are built from database rows and rendered in a process pool:
+one PDF per invoice, one per treatment type, one appointment list per day.
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date
+from modules.database import Database
+from modules.date_windows import date_window
+from modules.pdf_export import appointment_jobs, export_batch, invoice_jobs, treatment_report_jobs
+
+JOB_BUILDERS = {
+    "invoices": invoice_jobs,
+    "reports": treatment_report_jobs,
+    "appointments": appointment_jobs,
+}
+
+def parse_window(args):
+    if args.month:
+        year, month = map(int, args.month.split("-"))
+        return date_window("month", today=date(year, month, 1))
+    start = date.fromisoformat(args.date_from) if args.date_from else None
+    end = date.fromisoformat(args.date_to) if args.date_to else None
+    return date_window("custom", start=start, end=end)
+
+def show_progress(done, total, file_path, error):
+    if error:
+        print(f"❌ [{done}/{total}] {os.path.basename(file_path)}: {error}")
+    else:
+        print(f"✅ [{done}/{total}] {os.path.basename(file_path)}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Export PetMedix documents as PDFs in bulk")
+    parser.add_argument("kind", choices=[*JOB_BUILDERS, "all"])
+    parser.add_argument("--month", help="calendar month to export, e.g. 2025-03")
+    parser.add_argument("--from", dest="date_from", help="first day to export (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="date_to", help="last day to export, inclusive (YYYY-MM-DD)")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="worker processes (default: one per CPU; 1 renders in this process)")
+    parser.add_argument("--output", default=os.path.join("pdf_reports", "batch"))
+    args = parser.parse_args()
+
+    try:
+        start, end = parse_window(args)
+    except ValueError as e:
+        print(f"❌ Invalid date: {e}")
+        sys.exit(2)
+
+    db = Database()
+    if not db.conn:
+        print("❌ Could not connect to the database.")
+        sys.exit(1)
+    try:
+        kinds = list(JOB_BUILDERS) if args.kind == "all" else [args.kind]
+        jobs = []
+        for kind in kinds:
+            jobs += JOB_BUILDERS[kind](db, start, end, os.path.join(args.output, kind))
+    finally:
+        # Workers do not use the database; release the connection before rendering
+        db.close_connection()
+
+    if not jobs:
+        print("No documents in that date range.")
+        return
+
+    started = time.perf_counter()
+    written, failed = export_batch(jobs, args.processes, show_progress)
+    elapsed = time.perf_counter() - started
+    print(f"\nWrote {len(written)} PDFs to {args.output} in {elapsed:.1f}s "
+          f"({len(written) / elapsed:.1f} documents/s), {len(failed)} failed")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
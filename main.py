@@ -3,6 +3,10 @@ from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
 from modules.login import LoginWindow
 from modules.petmedix import PetMedix
+from modules.connection_pool import close_all_pools
+from modules.db_worker import db_executor
+from modules.query_stats import query_stats
+from modules.log import setup_logging
 
 # Import development configuration
 try:
@@ -17,7 +21,28 @@ except ImportError:
         "first_name": "Test"
     }
 
+def option(name, default=None):
+    """Value following a --name flag on the command line, or default."""
+    if name in sys.argv[:-1]:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+# Console and logs/petmedix.log at INFO; --log-level DEBUG for everything,
+# --debug billing,database for chosen modules only
+setup_logging(
+    level=option("--log-level", "INFO").upper(),
+    module_levels={module: "DEBUG" for module in option("--debug", "").split(",") if module}
+)
+
 app = QApplication(sys.argv)
+# Let background queries finish before their connections are closed
+app.aboutToQuit.connect(lambda: db_executor.wait_for_done(3000))
+app.aboutToQuit.connect(close_all_pools)
+
+# python main.py --query-stats stats.json writes per-statement timings on exit
+stats_path = option("--query-stats")
+if stats_path:
+    app.aboutToQuit.connect(lambda: query_stats.dump(stats_path))
 
 app.setWindowIcon(QIcon("assets/logo.ico"))
 
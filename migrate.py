@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Apply PetMedix schema migrations
+Usage: python migrate.py [--status | --reseed-sequences]
+
+--reseed-sequences moves the invoice and user ID counters past any IDs that
+were inserted without them (e.g. after importing data.sql).
+"""
+
+import sys
+from modules.database import Database
+from modules.migrations import current_version, pending_migrations, LATEST_VERSION
+from modules.sequences import seed_from_existing
+
+def show_status(db):
+    """Print the current schema version and any pending migrations"""
+    print(f"Schema version: {current_version(db)} (latest: {LATEST_VERSION})")
+    pending = pending_migrations(db)
+    if not pending:
+        print("✅ Schema is up to date")
+    for version, description in pending:
+        print(f"  pending {version}: {description}")
+
+def reseed_sequences(db):
+    """Raise every ID counter to the highest ID already stored"""
+    for name, last_value in sorted(seed_from_existing(db.cursor).items()):
+        print(f"  {name}: highest stored number {last_value}")
+    db.conn.commit()
+    print("✅ Sequences are past every stored ID")
+
+def main():
+    db = Database()
+    if not db.conn:
+        print("❌ Could not connect to the database.")
+        sys.exit(1)
+    try:
+        if len(sys.argv) > 1 and sys.argv[1] == "--status":
+            show_status(db)
+        elif len(sys.argv) > 1 and sys.argv[1] == "--reseed-sequences":
+            reseed_sequences(db)
+        else:
+            db.create_tables()
+            show_status(db)
+    finally:
+        db.close_connection()
+
+if __name__ == "__main__":
+    main()
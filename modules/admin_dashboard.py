@@ -6,12 +6,18 @@ from PySide6.QtWidgets import (
     QButtonGroup
 )
 from PySide6.QtCore import Qt, QSize, QDate, QTimer
-from PySide6.QtGui import QIcon, QPixmap, QColor, QPainter, QPainterPath, QDoubleValidator
+from PySide6.QtGui import QIcon, QColor, QDoubleValidator
 from modules.database import Database
+from modules.query_stats import query_stats, PERCENTILES
+from modules.reference_data import reference_data
+from modules.thumbnails import thumbnails
 from modules.utils import create_styled_message_box, show_message
 import os
 from shutil import copyfile
 from modules.setting import UpdateClinicInfoDialog
+from modules.log import LEVELS, get_level, get_logger, module_levels, set_level, set_module_level
+
+log = get_logger(__name__)
 
 class AdminDashboard(QWidget):
     def __init__(self):
@@ -91,8 +97,13 @@ class AdminDashboard(QWidget):
         self.users_btn.setCheckable(True)
         self.users_btn.clicked.connect(lambda: self.show_page("users"))
 
+        self.diagnostics_btn = QPushButton("Diagnostics")
+        self.diagnostics_btn.setCheckable(True)
+        self.diagnostics_btn.clicked.connect(lambda: self.show_page("diagnostics"))
+
         sidebar_layout.addWidget(self.dashboard_btn)
         sidebar_layout.addWidget(self.users_btn)
+        sidebar_layout.addWidget(self.diagnostics_btn)
         sidebar_layout.addStretch()
 
         # Logout button
@@ -113,6 +124,7 @@ class AdminDashboard(QWidget):
         # Initialize pages
         self.setup_dashboard_page()
         self.setup_users_page()
+        self.setup_diagnostics_page()
 
         # Show dashboard by default
         self.show_page("dashboard")
@@ -184,42 +196,26 @@ class AdminDashboard(QWidget):
         clinic_info_column.setVerticalSpacing(10)
         clinic_info_column.setHorizontalSpacing(10)
         clinic_labels = {}
+        def load_clinic_data():
+            """The clinic record from the reference-data cache, keyed the way these widgets use it."""
+            clinic = reference_data.clinic()
+            if not clinic:
+                return {"name": "", "address": "", "contact": "", "email": "", "employees": "", "logo_path": "", "vet_license": "VET-214"}
+            return {
+                "name": clinic["name"],
+                "address": clinic["address"],
+                "contact": clinic["contact_number"],
+                "email": clinic["email"],
+                "employees": str(clinic["employees_count"]),
+                "logo_path": clinic["logo_path"] or "",
+                "vet_license": clinic["vet_license"] or "VET-214"
+            }
+
         def update_clinic_info_ui():
-            db = Database()
-            try:
-                db.cursor.execute("SELECT name, address, contact_number, email, employees_count, logo_path, vet_license FROM clinic_info LIMIT 1")
-                clinic_row = db.cursor.fetchone()
-                if clinic_row:
-                    clinic_data = {
-                        "name": clinic_row[0],
-                        "address": clinic_row[1],
-                        "contact": clinic_row[2],
-                        "email": clinic_row[3],
-                        "employees": str(clinic_row[4]),
-                        "logo_path": clinic_row[5] or "",
-                        "vet_license": clinic_row[6] or "VET-214"
-                    }
-                else:
-                    clinic_data = {"name": "", "address": "", "contact": "", "email": "", "employees": "", "logo_path": "", "vet_license": "VET-214"}
-            except Exception as e:
-                print(f"❌ Error loading clinic data: {e}")
-                clinic_data = {"name": "", "address": "", "contact": "", "email": "", "employees": "", "logo_path": "", "vet_license": "VET-214"}
+            clinic_data = load_clinic_data()
             # Update logo
             if clinic_data.get("logo_path") and os.path.exists(clinic_data["logo_path"]):
-                original_pixmap = QPixmap(clinic_data["logo_path"])
-                size = clinic_logo.size()
-                rounded_pixmap = QPixmap(size)
-                rounded_pixmap.fill(Qt.transparent)
-                painter = QPainter(rounded_pixmap)
-                painter.setRenderHint(QPainter.Antialiasing)
-                path = QPainterPath()
-                path.addEllipse(0, 0, size.width(), size.height())
-                painter.setClipPath(path)
-                scaled_pixmap = original_pixmap.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-                painter.drawPixmap(0, 0, scaled_pixmap)
-                painter.end()
-                clinic_logo.setPixmap(rounded_pixmap)
-                clinic_logo.setText("")
+                thumbnails.show_on(clinic_logo, clinic_data["logo_path"], fallback_text="Clinic\nLogo")
             else:
                 clinic_logo.setText("Clinic\nLogo")
             # Update info fields
@@ -249,7 +245,6 @@ class AdminDashboard(QWidget):
                 clinic_info_column.addWidget(value, row, 1)
                 clinic_labels[label_text.replace(":", "")] = value
                 row += 1
-            db.close_connection()
         update_clinic_info_ui()
         def upload_logo():
             file_path, _ = QFileDialog.getOpenFileName(self, "Select Clinic Logo", "", "Images (*.png *.jpg *.jpeg)")
@@ -293,22 +288,7 @@ class AdminDashboard(QWidget):
         update_clinic_btn.setFixedWidth(120)
         
         def open_update_clinic_dialog():
-            db = Database()
-            db.cursor.execute("SELECT name, address, contact_number, email, employees_count, logo_path, vet_license FROM clinic_info LIMIT 1")
-            clinic_row = db.cursor.fetchone()
-            if clinic_row:
-                clinic_data = {
-                    "name": clinic_row[0],
-                    "address": clinic_row[1],
-                    "contact": clinic_row[2],
-                    "email": clinic_row[3],
-                    "employees": str(clinic_row[4]),
-                    "logo_path": clinic_row[5] or "",
-                    "vet_license": clinic_row[6] or "VET-214"
-                }
-            else:
-                clinic_data = {"name": "", "address": "", "contact": "", "email": "", "employees": "", "logo_path": "", "vet_license": "VET-214"}
-            db.close_connection()
+            clinic_data = load_clinic_data()
             dialog = UpdateClinicInfoDialog(clinic_data)
             if dialog.exec():
                 updated_data = dialog.get_updated_data()
@@ -536,10 +516,167 @@ class AdminDashboard(QWidget):
         # Load initial data
         self.load_users()
 
+    def setup_diagnostics_page(self):
+        self.diagnostics_page = QWidget()
+        layout = QVBoxLayout(self.diagnostics_page)
+
+        header_layout = QHBoxLayout()
+        header = QLabel("Query Diagnostics")
+        header.setStyleSheet("font-size: 24px; font-weight: bold;")
+        header_layout.addWidget(header)
+        header_layout.addStretch()
+
+        button_style = """
+            QPushButton {
+                background-color: #012547;
+                color: white;
+                border: none;
+                padding: 10px 20px;
+                border-radius: 5px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #023d6d;
+            }
+        """
+        for text, handler in (("Refresh", self.load_query_stats),
+                              ("Reset", self.reset_query_stats),
+                              ("Save JSON", self.save_query_stats)):
+            button = QPushButton(text)
+            button.setStyleSheet(button_style)
+            button.clicked.connect(handler)
+            header_layout.addWidget(button)
+        layout.addLayout(header_layout)
+
+        self.diagnostics_summary = QLabel()
+        self.diagnostics_summary.setStyleSheet("font-size: 13px; color: #555; margin: 10px 0;")
+        layout.addWidget(self.diagnostics_summary)
+
+        # Runtime log levels, e.g. DEBUG for billing only while chasing a problem
+        logging_layout = QHBoxLayout()
+        logging_layout.addWidget(QLabel("Log level for"))
+        self.log_module_dropdown = QComboBox()
+        self.log_module_dropdown.setMinimumWidth(180)
+        self.log_level_dropdown = QComboBox()
+        self.log_level_dropdown.addItems(LEVELS)
+        logging_layout.addWidget(self.log_module_dropdown)
+        logging_layout.addWidget(self.log_level_dropdown)
+        logging_layout.addStretch()
+        layout.addLayout(logging_layout)
+        self.log_module_dropdown.currentIndexChanged.connect(self.show_log_level)
+        self.log_level_dropdown.activated.connect(self.change_log_level)
+
+        # One row per normalized statement, slowest total time first
+        headers = ["Statement", "Calls", "Rows", "Total ms", "Mean ms"]
+        headers += [f"p{p} ms" for p in PERCENTILES] + ["Max ms", "Called From"]
+        self.query_stats_table = QTableWidget()
+        self.query_stats_table.setColumnCount(len(headers))
+        self.query_stats_table.setHorizontalHeaderLabels(headers)
+        header_view = self.query_stats_table.horizontalHeader()
+        header_view.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header_view.setSectionResizeMode(0, QHeaderView.Stretch)
+        self.query_stats_table.setStyleSheet("""
+            QTableWidget {
+                background-color: white;
+                border: 1px solid #ddd;
+                border-radius: 5px;
+            }
+            QHeaderView::section {
+                background-color: #012547;
+                color: white;
+                padding: 10px;
+                border: none;
+                font-weight: bold;
+                font-size: 14px;
+            }
+        """)
+        self.query_stats_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.query_stats_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.query_stats_table.verticalHeader().setVisible(False)
+        layout.addWidget(self.query_stats_table)
+
+    def load_query_stats(self):
+        statements = query_stats.snapshot()
+        calls = sum(entry["calls"] for entry in statements)
+        total_ms = sum(entry["total_ms"] for entry in statements)
+        pools = ", ".join(
+            f"{stats['hits']} pool hits / {stats['misses']} new connections"
+            for stats in Database.pool_stats().values()
+        )
+        self.diagnostics_summary.setText(
+            f"{len(statements)} distinct statements, {calls} calls, {total_ms / 1000:.2f} s in the database "
+            f"since {query_stats.started:%Y-%m-%d %H:%M}" + (f"  ·  {pools}" if pools else "")
+        )
+
+        self.query_stats_table.setSortingEnabled(False)
+        self.query_stats_table.setRowCount(len(statements))
+        for row, entry in enumerate(statements):
+            callers = entry["callers"]
+            values = [entry["sql"], entry["calls"], entry["rows"], entry["total_ms"], entry["mean_ms"]]
+            values += [entry[f"p{p}_ms"] for p in PERCENTILES]
+            values += [entry["max_ms"], callers[0][0] if callers else ""]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem()
+                if column == 0:
+                    item.setText(value)
+                    item.setToolTip(value)
+                elif column == len(values) - 1:
+                    item.setText(value)
+                    item.setToolTip("\n".join(f"{caller} ({count})" for caller, count in callers))
+                else:
+                    # Numeric data so the column sorts by value, not text
+                    item.setData(Qt.DisplayRole, value)
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.query_stats_table.setItem(row, column, item)
+        self.query_stats_table.setSortingEnabled(True)
+
+    def load_log_levels(self):
+        selected = self.log_module_dropdown.currentData()
+        self.log_module_dropdown.blockSignals(True)
+        self.log_module_dropdown.clear()
+        self.log_module_dropdown.addItem("All modules", None)
+        for module in module_levels():
+            self.log_module_dropdown.addItem(module, module)
+        index = self.log_module_dropdown.findData(selected)
+        self.log_module_dropdown.setCurrentIndex(max(index, 0))
+        self.log_module_dropdown.blockSignals(False)
+        self.show_log_level()
+
+    def show_log_level(self):
+        module = self.log_module_dropdown.currentData()
+        level = module_levels().get(module) if module else get_level()
+        self.log_level_dropdown.setCurrentText(level or get_level())
+
+    def change_log_level(self):
+        module = self.log_module_dropdown.currentData()
+        level = self.log_level_dropdown.currentText()
+        if module:
+            set_module_level(module, level)
+        else:
+            set_level(level)
+        log.info("Log level for %s set to %s", module or "all modules", level)
+
+    def reset_query_stats(self):
+        query_stats.reset()
+        self.load_query_stats()
+
+    def save_query_stats(self):
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Query Statistics", "query_stats.json", "JSON Files (*.json)"
+        )
+        if not file_path:
+            return
+        try:
+            query_stats.dump(file_path)
+            show_message(self, f"Query statistics saved to {file_path}")
+        except OSError as e:
+            show_message(self, f"Could not save query statistics: {e}", QMessageBox.Critical)
+
     def show_page(self, page):
         # Reset all buttons
         self.dashboard_btn.setChecked(False)
         self.users_btn.setChecked(False)
+        self.diagnostics_btn.setChecked(False)
 
         # Clear content area
         for i in reversed(range(self.content_layout.count())): 
@@ -554,6 +691,11 @@ class AdminDashboard(QWidget):
             self.users_btn.setChecked(True)
             self.content_layout.addWidget(self.users_page)
             self.load_users()
+        elif page == "diagnostics":
+            self.diagnostics_btn.setChecked(True)
+            self.content_layout.addWidget(self.diagnostics_page)
+            self.load_query_stats()
+            self.load_log_levels()
 
     def update_dashboard_stats(self):
         db = Database()
@@ -576,7 +718,7 @@ class AdminDashboard(QWidget):
             self.receptionists_card_value.setText(str(total_receptionists))
 
         except Exception as e:
-            print(f"❌ Error updating dashboard stats: {e}")
+            log.error("❌ Error updating dashboard stats: %s", e)
         finally:
             db.close_connection()
 
@@ -610,7 +752,7 @@ class AdminDashboard(QWidget):
                     self.users_table.setItem(row, col, item)
 
         except Exception as e:
-            print(f"❌ Error loading users: {e}")
+            log.error("❌ Error loading users: %s", e)
         finally:
             db.close_connection()
 
@@ -652,6 +794,7 @@ class AdminDashboard(QWidget):
                     WHERE user_id = ?
                 """, (user_id,))
                 db.conn.commit()
+                reference_data.invalidate_users()
                 
                 # Show success message
                 success_msg = create_styled_message_box(
@@ -671,7 +814,7 @@ class AdminDashboard(QWidget):
                 # Update dashboard stats after verifying user
                 self.update_dashboard_stats()
             except Exception as e:
-                print(f"Error verifying user: {e}")
+                log.error("Error verifying user: %s", e)
                 db.conn.rollback()
                 # Show error message
                 error_msg = create_styled_message_box(
@@ -699,6 +842,7 @@ class AdminDashboard(QWidget):
             try:
                 db.cursor.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
                 db.conn.commit()
+                reference_data.invalidate_users()
                 
                 # Show success message
                 success_msg = create_styled_message_box(
@@ -718,7 +862,7 @@ class AdminDashboard(QWidget):
                 # Update dashboard stats after deleting user
                 self.update_dashboard_stats()
             except Exception as e:
-                print(f"Error deleting user: {e}")
+                log.error("Error deleting user: %s", e)
                 db.conn.rollback()
                 # Show error message
                 error_msg = create_styled_message_box(
@@ -796,6 +940,7 @@ class AdminDashboard(QWidget):
                         WHERE user_id = ?
                     """, (user_id,))
                     db.conn.commit()
+                    reference_data.invalidate_users()
                     
                     # Show success message
                     success_msg = create_styled_message_box(
@@ -815,7 +960,7 @@ class AdminDashboard(QWidget):
                     # Update dashboard stats after unverifying user
                     self.update_dashboard_stats()
                 except Exception as e:
-                    print(f"Error unverifying user: {e}")
+                    log.error("Error unverifying user: %s", e)
                     db.conn.rollback()
                     # Show error message
                     error_msg = create_styled_message_box(
@@ -1142,7 +1287,7 @@ class EditUserDialog(QDialog):
             if result and result[0]:
                 self.license_number_input.setText(result[0])
         except Exception as e:
-            print(f"Error loading license number: {e}")
+            log.error("Error loading license number: %s", e)
         finally:
             db.close_connection()
         license_field_layout.addWidget(self.license_number_input)
@@ -1267,6 +1412,7 @@ class EditUserDialog(QDialog):
                 WHERE user_id = ?
             """, (name, email, role, license_number, self.user_id))
             db.conn.commit()
+            reference_data.invalidate_users()
             show_message(self, "User updated successfully!")
             self.accept()
         except Exception as e:
@@ -3,15 +3,24 @@ import os
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
     QDialog, QMessageBox, QFileDialog, QComboBox, QTextEdit, QDateEdit,
-    QHeaderView, QTableWidgetItem, QTimeEdit, QAbstractSpinBox
+    QHeaderView, QTableWidgetItem, QTimeEdit, QAbstractSpinBox, QTableView
 )
 from PySide6.QtGui import QColor, QBrush, QIcon
 from PySide6.QtCore import Qt, QDate, QSize, QTime
 from modules.database import Database
+from modules.data_events import data_events, DELETE
+from modules.db_worker import db_executor
+from modules.table_versions import table_versions
+from modules.pdf_export import render_table
+from modules.reference_data import reference_data
+from modules.appointment_model import (
+    APPOINTMENT_HEADERS, STATUS_COLUMN, AppointmentTableModel
+)
 from modules.utils import create_styled_message_box, show_message
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
 from datetime import datetime
+from modules.log import get_logger
+
+log = get_logger(__name__)
 
 def format_datetime_for_display(dt_str):
     """Convert 'YYYY-MM-DD HH:MM:SS' to '1PM', '2AM', etc."""
@@ -38,7 +47,7 @@ def set_datetime_fields(dialog, datetime_str):
         dialog.time_edit.setTime(dialog.time_edit.time().fromString(f"{hour_12:02d}:{minute:02d}", "hh:mm"))
         dialog.ampm_combo.setCurrentText(ampm)
     except Exception as e:
-        print(f"Error setting datetime fields: {e}")
+        log.error("Error setting datetime fields: %s", e)
 
 class AppointmentFormDialog(QDialog):
     def __init__(self, is_view_mode=False):
@@ -375,41 +384,29 @@ class AppointmentFormDialog(QDialog):
 
             db.close_connection()
         except Exception as e:
-            print("Failed to load pet names:", e)
+            log.error("Failed to load pet names: %s", e)
             self.pet_name_combo.addItem("Error loading pets")
             
     def load_vet_names(self):
         """Load veterinarian names into the vet_combo."""
         try:
-            db = Database()
-            cursor = db.cursor
-
             # Add placeholder text
             self.vet_combo.addItem("Select Veterinarian")
             self.vet_combo.setCurrentIndex(0)  # Set the placeholder as default
 
-            # Fetch veterinarian names from the database
-            cursor.execute("""
-                SELECT name
-                FROM users
-                WHERE role = 'Veterinarian'
-                ORDER BY name ASC
-            """)
-            rows = cursor.fetchall()
+            # Veterinarian names from the shared reference-data cache
+            rows = reference_data.veterinarians()
 
             if not rows:
                 self.vet_combo.addItem("No veterinarians found")
                 return
 
-            for row in rows:
-                vet_name = row[0]
+            for _, vet_name, _, _ in rows:
                 if not vet_name.startswith("Dr. "):
                     vet_name = f"Dr. {vet_name}"
                 self.vet_combo.addItem(vet_name)  # Add each veterinarian name to the dropdown
-
-            db.close_connection()
         except Exception as e:
-            print("Failed to load veterinarian names:", e)
+            log.error("Failed to load veterinarian names: %s", e)
             self.vet_combo.addItem("Error loading veterinarians")
 
 def save_pdf(table, table_type):
@@ -422,136 +419,10 @@ def save_pdf(table, table_type):
     file_name = f"{table_type}_Appointments_{timestamp}.pdf"
     file_path = os.path.join(folder_path, file_name)
 
-    # Create PDF in landscape mode
-    c = canvas.Canvas(file_path, pagesize=letter)
-    width, height = letter
-    # Swap width and height for landscape
-    width, height = height, width
-    c.setPageSize((width, height))
-
-    # Get clinic information from database
-    db = Database()
-    clinic_info = None
-    license_number = None
-    try:
-        clinic_info = db.get_clinic_info()
-        # Get clinic license number
-        db.cursor.execute("SELECT vet_license FROM clinic_info LIMIT 1")
-        result = db.cursor.fetchone()
-        if result and result[0]:
-            license_number = result[0]
-    except Exception as e:
-        print(f"Error fetching clinic info: {e}")
-    finally:
-        db.close_connection()
-
-    # Set up margins and spacing
-    x_margin = 50
-    y_margin = 50
-    row_height = 25
-    header_height = 100
-
-    # Draw header
-    # Clinic Logo (if available)
-    logo_path = "assets/logologin.png"
-    if os.path.exists(logo_path):
-        c.drawImage(logo_path, x_margin, height - y_margin - 50, width=50, height=50)
-
-    # Clinic Information
-    if clinic_info:
-        c.setFont("Helvetica-Bold", 16)
-        c.drawString(x_margin + 60, height - y_margin - 20, clinic_info.get("name", "PetMedix Animal Clinic"))
-        
-        # Draw license number if available
-        if license_number:
-            c.setFont("Helvetica", 10)
-            c.drawString(x_margin + 60, height - y_margin - 35, f"License No: {license_number}")
-        
-        c.setFont("Helvetica", 12)
-        c.drawString(x_margin + 60, height - y_margin - 50, clinic_info.get("address", ""))
-        c.drawString(x_margin + 60, height - y_margin - 70, f"Contact: {clinic_info.get('contact_number', '')}")
-
-    # Report Title and Date
-    c.setFont("Helvetica-Bold", 14)
-    c.drawString(width - 250, height - y_margin - 20, f"{table_type} Appointments")
-    c.setFont("Helvetica", 12)
-    c.drawString(width - 250, height - y_margin - 40, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-
-    # Draw a line under the header
-    c.setStrokeColorRGB(0.145098, 0.278431, 0.278431, 1.0)  # #012547 in RGB with full opacity
-    c.line(x_margin, height - y_margin - header_height, width - x_margin, height - y_margin - header_height)
-
-    # Table headers
-    y_start = height - y_margin - header_height - 30
-    headers = [table.horizontalHeaderItem(i).text() for i in range(table.columnCount())]
-    
-    # Calculate column widths based on content
-    col_widths = []
-    total_width = width - (2 * x_margin)
-    for i in range(table.columnCount()):
-        # Get the maximum width needed for this column
-        header_width = len(headers[i]) * 7  # Approximate width for header text
-        content_width = 0
-        for row in range(table.rowCount()):
-            item = table.item(row, i)
-            if item:
-                content_width = max(content_width, len(item.text()) * 7)
-        col_widths.append(max(header_width, content_width) + 10)  # Add padding
-
-    # Adjust column widths to fit page
-    total_col_width = sum(col_widths)
-    if total_col_width > total_width:
-        ratio = total_width / total_col_width
-        col_widths = [w * ratio for w in col_widths]
-
-    # Draw table headers
-    x_pos = x_margin
-    c.setFont("Helvetica-Bold", 10)
-    for i, header in enumerate(headers):
-        c.drawString(x_pos + 5, y_start, header)
-        x_pos += col_widths[i]
-
-    # Draw table content
-    c.setFont("Helvetica", 10)
-    y_pos = y_start - row_height
-    for row in range(table.rowCount()):
-        # Check if we need a new page
-        if y_pos < y_margin + row_height:
-            c.showPage()
-            # Redraw header on new page
-            c.setFont("Helvetica-Bold", 16)
-            c.drawString(x_margin + 60, height - y_margin - 20, clinic_info.get("name", "PetMedix Animal Clinic"))
-            c.setFont("Helvetica-Bold", 14)
-            c.drawString(width - 250, height - y_margin - 20, f"{table_type} Appointments (continued)")
-            c.setFont("Helvetica", 10)
-            y_pos = height - y_margin - header_height - 30
-
-        x_pos = x_margin
-        for col in range(table.columnCount()):
-            item = table.item(row, col)
-            if item:
-                # Only apply background color for status column (index 5)
-                if col == 5:  # Status column
-                    bg_color = item.background().color()
-                    if bg_color:
-                        r, g, b, _ = bg_color.getRgbF()
-                        c.setFillColorRGB(r, g, b)
-                        c.rect(x_pos, y_pos - 15, col_widths[col], row_height, fill=True)
-                    c.setFillColorRGB(0, 0, 0)  # Reset to black for text after drawing background
-                else:
-                    c.setFillColorRGB(0, 0, 0)  # Ensure text is black for other columns
-
-                # Draw text
-                c.drawString(x_pos + 5, y_pos, item.text())
-            x_pos += col_widths[col]
-        y_pos -= row_height
-
-    # Add footer
-    c.setFont("Helvetica", 8)
-    c.drawString(x_margin, y_margin, f"Generated by PetMedix System on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    c.drawString(width - x_margin - 100, y_margin, f"Page 1")
-
-    c.save()
+    model = table.model()
+    rows = [model.row_values(row) for row in range(model.rowCount())]
+    render_table(file_path, None, f"{table_type} Appointments", APPOINTMENT_HEADERS, rows,
+                 fill_column=STATUS_COLUMN)
     show_message(None, "PDF successfully saved to:\n{}".format(file_path), QMessageBox.Information)
 
 def get_appointment_widget(user_role):
@@ -564,52 +435,41 @@ def get_appointment_widget(user_role):
     current_search = ""
 
     def filter_appointments(search_text):
-        """Filter both urgent and all appointments tables based on search text."""
+        """Search both urgent and all appointments; the database does the matching, page by page."""
         nonlocal current_search
         current_search = search_text.lower()
-        
-        visible_rows = 0
-        for table in [urgent_table, all_table]:
-            for row in range(table.rowCount()):
-                show_row = False
-                for col in range(table.columnCount()):
-                    item = table.item(row, col)
-                    if item and current_search in item.text().lower():
-                        show_row = True
-                        break
-                table.setRowHidden(row, not show_row)
-                if show_row:
-                    visible_rows += 1
+        for model in appointment_models:
+            model.set_search(current_search)
 
         # Update table headers to show search status
         for table in [urgent_table, all_table]:
             header = table.horizontalHeader()
-            if current_search:
-                header.setStyleSheet("""
-                    QHeaderView::section {
-                        background-color: #FED766;
-                        color: #000;
-                        font-weight: bold;
-                        height: 40px;
-                        font-family: Lato;
-                    }
-                """)
-                # Add search indicator to header
-                if visible_rows > 0:
-                    header.setToolTip(f"Showing {visible_rows} results for '{current_search}'")
-                else:
-                    header.setToolTip(f"No results found for '{current_search}'")
-            else:
-                header.setStyleSheet("""
-                    QHeaderView::section {
-                        background-color: #FED766;
-                        color: #000;
-                        font-weight: bold;
-                        height: 40px;
-                        font-family: Lato;
-                    }
-                """)
+            header.setStyleSheet("""
+                QHeaderView::section {
+                    background-color: #FED766;
+                    color: #000;
+                    font-weight: bold;
+                    height: 40px;
+                    font-family: Lato;
+                }
+            """)
+        show_search_status()
+
+    def show_search_status():
+        """Count the results loaded so far for the current search in the header tooltips."""
+        for table in [urgent_table, all_table]:
+            model = table.model()
+            visible_rows = model.rowCount()
+            header = table.horizontalHeader()
+            if not current_search:
                 header.setToolTip("")
+            elif visible_rows > 0:
+                more = "+" if model.has_more() else ""
+                header.setToolTip(f"Showing {visible_rows}{more} results for '{current_search}'")
+            elif model.has_more():
+                header.setToolTip(f"Searching for '{current_search}'...")
+            else:
+                header.setToolTip(f"No results found for '{current_search}'")
 
     # Make filter_appointments available to the main window
     content.filter_appointments = filter_appointments
@@ -618,7 +478,9 @@ def get_appointment_widget(user_role):
         # Detect which table is visible
         table = urgent_table if urgent_table.isVisible() else all_table
         table_type = "Urgent" if table is urgent_table else "All"
-        save_pdf(table, table_type)
+        # The PDF covers the whole history, not just the pages scrolled so far; the
+        # remaining pages load in the background and the PDF is written once they are in
+        table.model().fetch_all(lambda: save_pdf(table, table_type))
 
     # Header setup
     header = QWidget()
@@ -778,8 +640,7 @@ def get_appointment_widget(user_role):
 
         # Safely fetch data from the table
         def get_item_text(row, column):
-            item = table.item(row, column)
-            return item.text() if item else ""
+            return table.model().index(row, column).data() or ""
 
         # Get date and time
         date = get_item_text(row, 0)
@@ -798,7 +659,7 @@ def get_appointment_widget(user_role):
             dialog.time_edit.setTime(qtime)
             dialog.ampm_combo.setCurrentText("PM" if time_obj.hour >= 12 else "AM")
         except ValueError as e:
-            print(f"Error parsing time {time}: {e}")
+            log.error("Error parsing time %s: %s", time, e)
             # Set default time if parsing fails
             dialog.time_edit.setTime(QTime(9, 0))
             dialog.ampm_combo.setCurrentText("AM")
@@ -838,19 +699,39 @@ def get_appointment_widget(user_role):
         dialog.exec()
 
     # --- Tables Setup ---
-    def create_table(headers):
-        table = QTableWidget()
-        table.setColumnCount(len(headers))
-        table.setRowCount(15)
-        table.setHorizontalHeaderLabels(headers)
+    def load_appointment_page(after_key, limit, search, status, on_rows):
+        """Page loader for the models: fetch one page on the background executor."""
+        after_date, after_time, after_id = after_key or (None, None, None)
+        db_executor.submit(
+            lambda db: db.fetch_appointments_page(
+                after_date, after_time, after_id, limit=limit, search=search, status=status
+            ),
+            key=f"appointments:{status or 'all'}",
+            on_result=on_rows,
+            on_error=lambda message: on_rows([]),
+            context=content,
+        )
+
+    # One model per table: the Urgent tab pages only urgent appointments from the
+    # database. Pages are fetched in the background as the user scrolls down.
+    all_model = AppointmentTableModel(content, page_loader=load_appointment_page)
+    urgent_model = AppointmentTableModel(content, page_loader=load_appointment_page, status="Urgent")
+    appointment_models = [urgent_model, all_model]
+    for model in appointment_models:
+        model.modelReset.connect(show_search_status)
+        model.rowsInserted.connect(show_search_status)
+
+    def create_table(model):
+        table = QTableView()
+        table.setModel(model)
         table.horizontalHeader().setStretchLastSection(True)
         table.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)  # Make columns non-resizable
         table.horizontalHeader().setSectionsClickable(False)
-        table.setEditTriggers(QTableWidget.NoEditTriggers)  # Make cells non-editable
-        table.setSelectionBehavior(QTableWidget.SelectRows)  # Select entire rows
-        table.setSelectionMode(QTableWidget.SingleSelection)  # Only one row can be selected at a time
+        table.setEditTriggers(QTableView.NoEditTriggers)  # Make cells non-editable
+        table.setSelectionBehavior(QTableView.SelectRows)  # Select entire rows
+        table.setSelectionMode(QTableView.SingleSelection)  # Only one row can be selected at a time
         table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: white;
                 color: black;
                 gridline-color: #000;
@@ -861,7 +742,7 @@ def get_appointment_widget(user_role):
                 font-weight: bold;
                 height: 40px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #E3F2FD;
                 color: black;
             }
@@ -869,31 +750,13 @@ def get_appointment_widget(user_role):
         table.verticalHeader().setVisible(False)
         return table
 
-    urgent_table = create_table([
-        "Date",
-        "Time",
-        "Pet Name",
-        "Owner/Client",
-        "Reason for Appointment",
-        "Status",
-        "Payment Status",
-        "Veterinarian In Charge"
-    ])
+    urgent_table = create_table(urgent_model)
     for i, width in enumerate([100, 100, 120, 150, 200, 180, 200, 150]):
         urgent_table.setColumnWidth(i, width)
     urgent_table.hide()
     layout.addWidget(urgent_table)
 
-    all_table = create_table([
-        "Date",
-        "Time",
-        "Pet Name",
-        "Owner/Client",
-        "Reason for Appointment",
-        "Status",
-        "Payment Status",
-        "Veterinarian In Charge"
-    ])
+    all_table = create_table(all_model)
     for i, width in enumerate([100, 100, 120, 150, 200, 180, 200, 150]):
         all_table.setColumnWidth(i, width)
     layout.addWidget(all_table)
@@ -904,7 +767,7 @@ def get_appointment_widget(user_role):
         selected_rows = table.selectionModel().selectedRows()
         
         if selected_rows:
-            print("Row selected, showing buttons")  # Debug print
+            log.debug("Row selected, showing buttons")
             view_button.show()
             # Only show edit and delete buttons for non-veterinarian users
             if user_role.lower() != "veterinarian":
@@ -914,7 +777,7 @@ def get_appointment_widget(user_role):
                 edit_button.hide()
                 delete_button.hide()
         else:
-            print("No row selected, hiding buttons")  # Debug print
+            log.debug("No row selected, hiding buttons")
             view_button.hide()
             edit_button.hide()
             delete_button.hide()
@@ -938,12 +801,12 @@ def get_appointment_widget(user_role):
         selected_rows = table.selectionModel().selectedRows()
         if selected_rows:
             row = selected_rows[0].row()
+            appointment_id = table.model().appointment_id(row)
             dialog = AppointmentFormDialog()
 
             # Safely fetch data from the table
             def get_item_text(row, column):
-                item = table.item(row, column)
-                return item.text() if item else ""
+                return table.model().index(row, column).data() or ""
 
             # Get date and time
             date = get_item_text(row, 0)
@@ -962,7 +825,7 @@ def get_appointment_widget(user_role):
                 dialog.time_edit.setTime(qtime)
                 dialog.ampm_combo.setCurrentText("PM" if time_obj.hour >= 12 else "AM")
             except ValueError as e:
-                print(f"Error parsing time {time}: {e}")
+                log.error("Error parsing time %s: %s", time, e)
                 # Set default time if parsing fails
                 dialog.time_edit.setTime(QTime(9, 0))
                 dialog.ampm_combo.setCurrentText("AM")
@@ -991,10 +854,6 @@ def get_appointment_widget(user_role):
                         hour = 0
                     new_time = f"{hour:02d}:{minute:02d}:00"
 
-                    # Convert original time to 24-hour format for comparison
-                    original_time_obj = datetime.strptime(time, "%I:%M %p")
-                    original_time_str = original_time_obj.strftime("%H:%M:%S")
-
                     # Get the pet_id and client_id for the update
                     pet_name = dialog.pet_name_combo.currentText().strip()
                     if " - " in pet_name:
@@ -1008,33 +867,22 @@ def get_appointment_widget(user_role):
                     """, (pet_name,))
                     pet_id, client_id = db.cursor.fetchone()
 
-                    db.cursor.execute("""
-                        UPDATE appointments
-                        SET date = ?, time = ?, status = ?, payment_status = ?, 
-                            reason = ?, veterinarian = ?, pet_id = ?, client_id = ?
-                        WHERE date = ? AND time = ? AND reason = ?
-                    """, (
+                    # on_data_changed redraws the row
+                    db.update_appointment(
+                        appointment_id,
+                        pet_id,
+                        client_id,
                         new_date,
                         new_time,
                         dialog.status_combo.currentText(),
                         dialog.payment_combo.currentText(),
                         dialog.reason_input.toPlainText().strip(),
                         dialog.vet_combo.currentText().strip(),
-                        pet_id,
-                        client_id,
-                        # Use the original date, time and reason as identifiers
-                        date,
-                        original_time_str,
-                        get_item_text(row, 4)
-                    ))
-                    db.conn.commit()
+                    )
                     show_message(None, "Appointment updated successfully!", QMessageBox.Information)
-
-                    # Refresh the table
-                    populate_tables()
                 except Exception as e:
                     show_message(None, f"Failed to update appointment: {e}", QMessageBox.Critical)
-                    print(f"Error updating appointment: {e}")
+                    log.error("Error updating appointment: %s", e)
                 finally:
                     db.close_connection()
         else:
@@ -1046,19 +894,8 @@ def get_appointment_widget(user_role):
         if selected_rows:
             row = selected_rows[0].row()
             
-            # Get the appointment details
-            date = table.item(row, 0).text()
-            time = table.item(row, 1).text()
-            reason = table.item(row, 4).text()
-            pet_name = table.item(row, 2).text()
-            client_name = table.item(row, 3).text()
-
-            print(f"Attempting to delete appointment:")
-            print(f"Date: {date}")
-            print(f"Time: {time}")
-            print(f"Reason: {reason}")
-            print(f"Pet: {pet_name}")
-            print(f"Client: {client_name}")
+            appointment_id = table.model().appointment_id(row)
+            log.debug("Attempting to delete appointment %s", appointment_id)
 
             confirmation = create_styled_message_box(
                 QMessageBox.Question,
@@ -1069,65 +906,16 @@ def get_appointment_widget(user_role):
             confirmation.setDefaultButton(QMessageBox.No)
             
             if confirmation.exec() == QMessageBox.Yes:
-                # Delete the appointment from the database
+                # Delete the appointment from the database; on_data_changed removes its row
                 db = Database()
                 try:
-                    # First get the pet_id and client_id
-                    db.cursor.execute("""
-                        SELECT p.pet_id, c.client_id
-                        FROM pets p
-                        JOIN clients c ON p.client_id = c.client_id
-                        WHERE p.name = ? AND c.name = ?
-                    """, (pet_name, client_name))
-                    
-                    result = db.cursor.fetchone()
-                    if not result:
-                        raise Exception(f"Could not find pet '{pet_name}' for client '{client_name}'")
-                    
-                    pet_id, client_id = result
-                    print(f"Found pet_id: {pet_id}, client_id: {client_id}")
-
-                    # Convert time to 24-hour format for database
-                    time_obj = datetime.strptime(time, "%I:%M %p")
-                    time_str = time_obj.strftime("%H:%M:%S")
-                    print(f"Converted time to 24-hour format: {time_str}")
-
-                    # Debug: Check if the appointment exists
-                    db.cursor.execute("""
-                        SELECT a.*, p.name as pet_name, c.name as client_name 
-                        FROM appointments a
-                        JOIN pets p ON a.pet_id = p.pet_id
-                        JOIN clients c ON a.client_id = c.client_id
-                        WHERE p.pet_id = ? AND c.client_id = ? AND DATE(a.date) = ?
-                    """, (pet_id, client_id, date))
-                    
-                    existing_appointments = db.cursor.fetchall()
-                    if not existing_appointments:
-                        print("Debug - No appointments found for this pet/client on this date")
-                        raise Exception("No appointments found for this pet/client on this date.")
-                    
-                    print("\nFound these appointments for this pet/client on this date:")
-                    for app in existing_appointments:
-                        print(f"Date: {app[3]}, Time: {app[4]}, Reason: {app[7]}")
-
-                    # Now delete using the IDs, date, time, and reason
-                    db.cursor.execute("""
-                        DELETE FROM appointments
-                        WHERE pet_id = ? AND client_id = ? AND DATE(date) = ? AND time = ? AND reason = ?
-                    """, (pet_id, client_id, date, time_str, reason))
-                    
-                    if db.cursor.rowcount == 0:
+                    if not db.delete_appointment(appointment_id):
                         raise Exception("No appointment was deleted. Please check if the appointment exists.")
-                    
-                    db.conn.commit()
-                    print("Appointment deleted successfully")
+                    log.debug("Appointment deleted successfully")
                     show_message(None, "Appointment deleted successfully!", QMessageBox.Information)
-
-                    # Refresh the table
-                    populate_tables()
                 except Exception as e:
                     error_msg = f"Failed to delete appointment: {str(e)}"
-                    print(error_msg)
+                    log.error("%s", error_msg)
                     show_message(None, error_msg, QMessageBox.Critical)
                 finally:
                     db.close_connection()
@@ -1139,119 +927,44 @@ def get_appointment_widget(user_role):
     delete_button.clicked.connect(handle_delete)
 
     def populate_tables():
-        db = Database()
         try:
-            appointments = db.fetch_appointments()
-            print(f"Fetched appointments: {appointments}")
-            urgent_table.setRowCount(0)
-            all_table.setRowCount(0)
-            for appointment in appointments:
-                date = str(appointment[0])
-                time = str(appointment[1])
-                display_date = date  # Already formatted by DATE_FORMAT
-                
-                # Convert time to 12-hour format
-                try:
-                    time_obj = datetime.strptime(time, "%H:%M:%S")
-                    display_time = time_obj.strftime("%I:%M %p")
-                except ValueError as e:
-                    print(f"Error parsing time {time}: {e}")
-                    display_time = time  # Use original time if parsing fails
-                
-                pet_name = str(appointment[2])
-                client_name = str(appointment[3])
-                reason = str(appointment[4])
-                status = str(appointment[5])
-                payment_status = str(appointment[6])
-                veterinarian = str(appointment[7])  # Remove the Dr. prefix since it's already in the database
-
-                # --- All Table ---
-                all_row_position = all_table.rowCount()
-                all_table.insertRow(all_row_position)
-                # Date
-                item = QTableWidgetItem(display_date)
-                item.setTextAlignment(Qt.AlignCenter)
-                all_table.setItem(all_row_position, 0, item)
-                # Time
-                item = QTableWidgetItem(display_time)
-                item.setTextAlignment(Qt.AlignCenter)
-                all_table.setItem(all_row_position, 1, item)
-                # Pet Name
-                item = QTableWidgetItem(pet_name)
-                item.setTextAlignment(Qt.AlignCenter)
-                all_table.setItem(all_row_position, 2, item)
-                # Owner/Client
-                item = QTableWidgetItem(client_name)
-                item.setTextAlignment(Qt.AlignCenter)
-                all_table.setItem(all_row_position, 3, item)
-                # Reason
-                item = QTableWidgetItem(reason)
-                item.setTextAlignment(Qt.AlignCenter)
-                all_table.setItem(all_row_position, 4, item)
-                # Status
-                status_item = QTableWidgetItem(status)
-                status_item.setTextAlignment(Qt.AlignCenter)
-                # Set background color based on status
-                status_lower = status.lower()
-                if status_lower == "scheduled":
-                    status_item.setBackground(QBrush(QColor("#FFEEBA")))
-                elif status_lower == "completed":
-                    status_item.setBackground(QBrush(QColor("#DFF2BF")))
-                elif status_lower == "urgent":
-                    status_item.setBackground(QBrush(QColor("#FFBABA")))
-                elif status_lower in ["cancelled", "no-show"]:
-                    status_item.setBackground(QBrush(QColor("#D3D3D3")))
-                elif status_lower == "rescheduled":
-                    status_item.setBackground(QBrush(QColor("orange")))
-                all_table.setItem(all_row_position, 5, status_item)
-                # Payment Status
-                item = QTableWidgetItem(payment_status)
-                item.setTextAlignment(Qt.AlignCenter)
-                all_table.setItem(all_row_position, 6, item)
-                # Veterinarian
-                item = QTableWidgetItem(veterinarian)
-                item.setTextAlignment(Qt.AlignCenter)
-                all_table.setItem(all_row_position, 7, item)
-
-                # --- Urgent Table ---
-                if status.lower() == "urgent":
-                    urgent_row_position = urgent_table.rowCount()
-                    urgent_table.insertRow(urgent_row_position)
-                    item = QTableWidgetItem(display_date)
-                    item.setTextAlignment(Qt.AlignCenter)
-                    urgent_table.setItem(urgent_row_position, 0, item)
-                    item = QTableWidgetItem(display_time)
-                    item.setTextAlignment(Qt.AlignCenter)
-                    urgent_table.setItem(urgent_row_position, 1, item)
-                    item = QTableWidgetItem(pet_name)
-                    item.setTextAlignment(Qt.AlignCenter)
-                    urgent_table.setItem(urgent_row_position, 2, item)
-                    item = QTableWidgetItem(client_name)
-                    item.setTextAlignment(Qt.AlignCenter)
-                    urgent_table.setItem(urgent_row_position, 3, item)
-                    item = QTableWidgetItem(reason)
-                    item.setTextAlignment(Qt.AlignCenter)
-                    urgent_table.setItem(urgent_row_position, 4, item)
-                    urgent_status_item = QTableWidgetItem(status)
-                    urgent_status_item.setTextAlignment(Qt.AlignCenter)
-                    urgent_status_item.setBackground(QBrush(QColor("#FFBABA")))
-                    urgent_table.setItem(urgent_row_position, 5, urgent_status_item)
-                    item = QTableWidgetItem(payment_status)
-                    item.setTextAlignment(Qt.AlignCenter)
-                    urgent_table.setItem(urgent_row_position, 6, item)
-                    item = QTableWidgetItem(veterinarian)
-                    item.setTextAlignment(Qt.AlignCenter)
-                    urgent_table.setItem(urgent_row_position, 7, item)
-
+            # First pages are fetched off the GUI thread; later pages load as the user scrolls
+            for model in appointment_models:
+                model.reload()
         except Exception as e:
-            print(f"❌ Error populating tables: {e}")
-            import traceback
-            traceback.print_exc()  # Print the full error traceback
-        finally:
-            db.close_connection()
+            log.error("❌ Error populating tables: %s", e, exc_info=True)
 
-    # Populate tables on widget load
+    # Populate tables on widget load, and again when the main window re-enters the page
     populate_tables()
+    content.refresh = populate_tables
+
+    def on_data_changed(entity, appointment_id, op):
+        """data_events listener: re-read just the appointment that changed instead of every page."""
+        if entity != "appointments":
+            return
+        # The row is redrawn here, so this write needs no reload when the page is shown again
+        content.synced_versions.update(table_versions.snapshot("appointments"))
+        if op == DELETE:
+            for model in appointment_models:
+                model.remove_appointment(appointment_id)
+            return
+
+        def put(row):
+            for model in appointment_models:
+                if row:
+                    model.put_row(row)
+                else:
+                    model.remove_appointment(appointment_id)
+
+        db_executor.submit(
+            lambda db: db.fetch_appointment(appointment_id),
+            key=f"appointment:{appointment_id}",
+            on_result=put,
+            context=content,
+        )
+
+    content.synced_versions = {}
+    data_events.subscribe(on_data_changed, owner=content)
 
     def show_table(table_to_show):
         for table in [urgent_table, all_table]:
@@ -1309,7 +1022,7 @@ def get_appointment_widget(user_role):
             db = Database()
             try:
                 # Fetch the pet, client IDs, and client name
-                print(f"DEBUG: Searching for pet name '{pet_name}' in the database.")
+                log.debug("Searching for pet name '%s' in the database.", pet_name)
                 db.cursor.execute("""
                     SELECT p.pet_id, c.client_id, c.name AS client_name
                     FROM pets p
@@ -1317,31 +1030,24 @@ def get_appointment_widget(user_role):
                     WHERE LOWER(p.name) = LOWER(?)
                 """, (pet_name,))
                 result = db.cursor.fetchone()
-                print(f"DEBUG: Query result for pet_name '{pet_name}': {result}")
+                log.debug("Query result for pet_name '%s': %s", pet_name, result)
                 if not result:
                     show_message(dialog, f"Pet '{pet_name}' not found in the database! Please ensure the pet is registered.", QMessageBox.Warning)
                     return
 
                 pet_id, client_id, client_name = result
 
-                # Insert the appointment into the database with separate date and time
-                db.cursor.execute("""
-                    INSERT INTO appointments (pet_id, client_id, date, time, status, payment_status, reason, veterinarian)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (pet_id, client_id, date, time_str, status, payment, reason, veterinarian))
-                db.conn.commit()
+                # Insert the appointment; on_data_changed adds its row
+                db.save_appointment(pet_id, client_id, date, status, payment, reason, veterinarian, time=time_str)
 
                 # Show a success message
                 show_message(dialog, "Appointment added successfully!", QMessageBox.Information)
-
-                # Refresh the table
-                populate_tables()
             except Exception as e:
                 show_message(dialog, f"Failed to save appointment: {e}", QMessageBox.Critical)
             finally:
                 db.close_connection()
         else:
-            print("Appointment creation cancelled")
+            log.debug("Appointment creation cancelled")
 
     add_appointment_button.clicked.connect(open_appointment_form)
 
@@ -1505,7 +1211,7 @@ class PetAppointmentsDialog(QDialog):
             self.setFixedHeight(dialog_height)
                 
         except Exception as e:
-            print(f"Error loading pet appointments: {e}")
+            log.error("Error loading pet appointments: %s", e)
         finally:
             db.close_connection()
 
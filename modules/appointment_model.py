@@ -0,0 +1,293 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QBrush, QColor
+from modules.log import get_logger
+
+log = get_logger(__name__)
+
+APPOINTMENT_HEADERS = [
+    "Date",
+    "Time",
+    "Pet Name",
+    "Owner/Client",
+    "Reason for Appointment",
+    "Status",
+    "Payment Status",
+    "Veterinarian In Charge"
+]
+
+DATE_COLUMN, TIME_COLUMN, PET_COLUMN, CLIENT_COLUMN, REASON_COLUMN, STATUS_COLUMN, PAYMENT_COLUMN, VET_COLUMN = range(8)
+
+# Status colours shared by every view; brushes are built once, not per cell
+STATUS_BRUSHES = {
+    "scheduled": QBrush(QColor("#FFEEBA")),
+    "completed": QBrush(QColor("#DFF2BF")),
+    "urgent": QBrush(QColor("#FFBABA")),
+    "cancelled": QBrush(QColor("#D3D3D3")),
+    "no-show": QBrush(QColor("#D3D3D3")),
+    "rescheduled": QBrush(QColor("orange")),
+}
+
+_display_times = {}
+
+
+def to_display_time(time_str):
+    """Convert 'HH:MM:SS' to '01:30 PM' without strptime; results are memoised per distinct time."""
+    display = _display_times.get(time_str)
+    if display is None:
+        try:
+            hour, minute = int(time_str[0:2]), int(time_str[3:5])
+            display = f"{hour % 12 or 12:02d}:{minute:02d} {'PM' if hour >= 12 else 'AM'}"
+        except (ValueError, TypeError):
+            log.error("Error parsing time %s", time_str)
+            display = str(time_str)
+        _display_times[time_str] = display
+    return display
+
+
+class AppointmentTableModel(QAbstractTableModel):
+    """Appointment rows kept as one list per column, newest first.
+
+    Rows are Database.fetch_appointments_page rows. Besides the displayed
+    columns the model keeps each row's (date, time, appointment_id) sort key.
+    A model can be limited to one status and to a search; both are applied
+    by the database, so every matching appointment can be paged in, and by
+    put_row to rows patched in afterwards.
+
+    Pages come from page_loader(after_key, limit, search, status, on_rows),
+    which fetches them off the UI thread and calls on_rows(rows) when they
+    arrive. One page is requested at a time; a page requested before the
+    last reload or search change is dropped when it arrives.
+    """
+
+    def __init__(self, parent=None, page_loader=None, page_size=200, status=None):
+        super().__init__(parent)
+        self._columns = [[] for _ in APPOINTMENT_HEADERS]
+        self._keys = []
+        self._ids = []  # appointment_id per row, for list.index lookups
+        self.status_filter = status
+        self._search = ""
+        self._page_loader = page_loader
+        self._page_size = page_size
+        self._last_key = None
+        self._exhausted = page_loader is None
+        self._loading = False
+        self._generation = 0  # moves on every reload, so late pages of an old query are dropped
+        self._when_complete = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns[0])
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(APPOINTMENT_HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._columns[index.column()][index.row()]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.BackgroundRole and index.column() == STATUS_COLUMN:
+            return STATUS_BRUSHES.get(self._columns[STATUS_COLUMN][index.row()].lower())
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return APPOINTMENT_HEADERS[section]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted and not self._loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted or self._loading:
+            return
+        self._request(self._last_key)
+
+    @property
+    def page_size(self):
+        return self._page_size
+
+    @property
+    def search(self):
+        return self._search
+
+    def has_more(self):
+        """True while pages beyond the loaded rows may exist."""
+        return not self._exhausted
+
+    def reload(self):
+        """Drop every loaded row and fetch the first page again."""
+        self._generation += 1
+        self._loading = False
+        self.set_rows([])
+        if self._page_loader is None:
+            self._exhausted = True
+            self._run_when_complete()
+            return
+        self._exhausted = False
+        self._request(None)
+
+    def set_search(self, text):
+        """Show only appointments matching text (see Database.fetch_appointments_page); reloads if it changed."""
+        text = " ".join(text.lower().split())
+        if text != self._search:
+            self._search = text
+            self.reload()
+
+    def fetch_all(self, then=None):
+        """Load every remaining page, then call then(), e.g. to export the whole history."""
+        if then is not None:
+            self._when_complete.append(then)
+        if self._exhausted:
+            self._run_when_complete()
+        elif not self._loading:
+            self._request(self._last_key)
+
+    def _request(self, after_key):
+        self._loading = True
+        generation = self._generation
+        self._page_loader(after_key, self._page_size, self._search or None, self.status_filter,
+                          lambda rows: self._page_arrived(generation, after_key, rows))
+
+    def _page_arrived(self, generation, after_key, rows):
+        if generation != self._generation:
+            return
+        self._loading = False
+        rows = rows or []
+        self._exhausted = len(rows) < self._page_size
+        if rows:
+            self._last_key = tuple(rows[-1][-3:])
+        elif after_key is None:
+            self._last_key = None
+        if after_key is None:
+            self.set_rows(rows)
+        else:
+            self.append_rows(rows)
+        if self._when_complete:
+            self.fetch_all()
+
+    def _run_when_complete(self):
+        callbacks, self._when_complete = self._when_complete, []
+        for callback in callbacks:
+            callback()
+
+    def set_rows(self, rows):
+        """Replace the contents with rows as returned by Database.fetch_appointments_page."""
+        self.beginResetModel()
+        self._columns = [[] for _ in APPOINTMENT_HEADERS]
+        self._keys = []
+        self._ids = []
+        self._extend(rows)
+        self.endResetModel()
+
+    def append_rows(self, rows):
+        """Append rows after the current last row."""
+        if not rows:
+            return
+        first = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._extend(rows)
+        self.endInsertRows()
+
+    def put_row(self, row_data):
+        """Insert or replace one appointment (a fetch_appointments_page row) in its sorted place.
+
+        A row outside the model's status or search is removed instead, and one
+        that sorts below the last loaded page is left for fetchMore to bring in.
+        """
+        appointment_id = row_data[-1]
+        if not self.accepts(row_data):
+            self.remove_appointment(appointment_id)
+            return
+        key = self._sort_key(row_data)
+        row = self.row_of(appointment_id)
+        if row is not None and self._keys[row] == key:
+            # Same place: rewrite the cells
+            self._set(row, row_data)
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+            return
+        if row is not None:
+            self.remove_appointment(appointment_id)
+        position = self._position(key)
+        if position == self.rowCount() and not self._exhausted:
+            return
+        self.beginInsertRows(QModelIndex(), position, position)
+        for column in self._columns:
+            column.insert(position, None)
+        self._keys.insert(position, key)
+        self._ids.insert(position, appointment_id)
+        self._set(position, row_data)
+        self.endInsertRows()
+
+    def remove_appointment(self, appointment_id):
+        """Drop one appointment's row, if it is loaded."""
+        row = self.row_of(appointment_id)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        for column in self._columns:
+            del column[row]
+        del self._keys[row]
+        del self._ids[row]
+        self.endRemoveRows()
+
+    def appointment_id(self, row):
+        return self._ids[row]
+
+    def row_of(self, appointment_id):
+        """The row showing appointment_id, or None if it is not loaded."""
+        try:
+            return self._ids.index(appointment_id)
+        except ValueError:
+            return None
+
+    def row_values(self, row):
+        """Return the display values of one row, in header order."""
+        return [column[row] for column in self._columns]
+
+    def status(self, row):
+        return self._columns[STATUS_COLUMN][row]
+
+    def accepts(self, row_data):
+        """Whether a fetch_appointments_page row belongs in this model, by the rules the query applies."""
+        if self.status_filter is not None and str(row_data[STATUS_COLUMN]).lower() != self.status_filter.lower():
+            return False
+        if not self._search:
+            return True
+        values = [str(row_data[0]).lower(), to_display_time(str(row_data[1])).lower()]
+        values += [str(row_data[col]).lower() for col in range(PET_COLUMN, len(APPOINTMENT_HEADERS))]
+        return all(any(word in value for value in values) for word in self._search.split())
+
+    def _extend(self, rows):
+        columns = self._columns
+        for row in rows:
+            columns[DATE_COLUMN].append(str(row[0]))
+            columns[TIME_COLUMN].append(to_display_time(str(row[1])))
+            for col in range(PET_COLUMN, len(APPOINTMENT_HEADERS)):
+                columns[col].append(str(row[col]))
+            self._keys.append(self._sort_key(row))
+            self._ids.append(row[-1])
+
+    def _set(self, position, row):
+        columns = self._columns
+        columns[DATE_COLUMN][position] = str(row[0])
+        columns[TIME_COLUMN][position] = to_display_time(str(row[1]))
+        for col in range(PET_COLUMN, len(APPOINTMENT_HEADERS)):
+            columns[col][position] = str(row[col])
+
+    @staticmethod
+    def _sort_key(row):
+        # The formatted date and time sort like the raw keyset columns
+        return str(row[0]), str(row[1]), row[-1]
+
+    def _position(self, key):
+        """Where key goes in the newest-first order (binary search)."""
+        low, high = 0, len(self._keys)
+        while low < high:
+            middle = (low + high) // 2
+            if self._keys[middle] > key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
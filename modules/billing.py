@@ -6,23 +6,26 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, QDate, QSize, QTimer
 from PySide6.QtGui import QDoubleValidator, QIcon
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.pdfgen import canvas
 from datetime import datetime
 import os
 
 from modules.database import Database
+from modules.db_worker import db_executor
+from modules.data_events import data_events, DELETE
+from modules.table_versions import table_versions
+from modules.pdf_export import render_invoice
+from modules.reference_data import reference_data
+from modules.treatment_events import EVENT_TYPE, EVENT_DATE, EVENT_DETAILS, EVENT_VETERINARIAN
 from modules.utils import show_message, create_styled_message_box
+from modules.log import get_logger
+
+log = get_logger(__name__)
 
 
 class InvoiceFormDialog(QDialog):
     def __init__(self, is_view_mode=False, user_role=None):
         try:
-            print("\n=== Debug: Initializing InvoiceFormDialog ===")
+            log.debug("=== Initializing InvoiceFormDialog ===")
             super().__init__()
             self.setWindowTitle("PetMedix - Billing")
             self.setFixedSize(1000, 750)
@@ -45,21 +48,19 @@ class InvoiceFormDialog(QDialog):
             self.db = None
             try:
                 self.db = Database()
-                print("Database connection established")
+                log.debug("Database connection established")
             except Exception as db_error:
-                print(f"Error connecting to database: {db_error}")
+                log.error("Error connecting to database: %s", db_error)
                 QMessageBox.critical(self, "Error", "Failed to connect to database. Please try again.")
                 raise
             
             # Create the UI
-            print("Setting up UI...")
+            log.debug("Setting up UI...")
             self.setup_ui()
-            print("UI setup complete")
+            log.debug("UI setup complete")
             
         except Exception as e:
-            print(f"Error in InvoiceFormDialog initialization: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("Error in InvoiceFormDialog initialization: %s", e, exc_info=True)
             raise
 
     def __del__(self):
@@ -516,25 +517,18 @@ class InvoiceFormDialog(QDialog):
         
         db = Database()
         try:
-            new_invoice_no = db.generate_invoice_no()
+            # Only a preview: the number is reserved when the invoice is saved
+            new_invoice_no = db.preview_invoice_no()
             self.invoice_field.setText(new_invoice_no)
         finally:
             db.close_connection()
             
-        db = Database()
-        try:
-            if db.conn:
-                clinic = db.get_clinic_info()
-                if clinic:
-                    self.clinic_field.setText(clinic["name"] or "")
-                    self.clinic_address_field.setText(clinic["address"] or "")
-                    self.clinic_contact_field.setText(clinic["contact_number"] or "")
-                    self.clinic_email_field.setText(clinic["email"] or "")
-            else:
-                print("❌ Could not connect to database.")
-        finally:
-            if db.conn:
-                db.close_connection()
+        clinic = reference_data.clinic()
+        if clinic:
+            self.clinic_field.setText(clinic["name"] or "")
+            self.clinic_address_field.setText(clinic["address"] or "")
+            self.clinic_contact_field.setText(clinic["contact_number"] or "")
+            self.clinic_email_field.setText(clinic["email"] or "")
         
         # Bottom buttons
         button_container = QWidget()
@@ -694,16 +688,14 @@ class InvoiceFormDialog(QDialog):
                     self.total_field.setText(f"{subtotal:.2f}")
 
             except Exception as calc_error:
-                print(f"Error in calculations: {calc_error}")
+                log.error("Error in calculations: %s", calc_error)
                 # Set safe default values
                 self.subtotal_field.setText("0.00")
                 self.vat_field.setText("0.00")
                 self.total_field.setText("0.00")
                 
         except Exception as e:
-            print(f"Error in update_total: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("Error in update_total: %s", e, exc_info=True)
             # Set safe default values
             self.subtotal_field.setText("0.00")
             self.vat_field.setText("0.00")
@@ -720,13 +712,9 @@ class InvoiceFormDialog(QDialog):
     def get_invoice_data(self):
         """Get all data from the invoice form."""
         try:
-            print("\n=== Debug: Getting Invoice Data ===")
-            
             # Get client and pet IDs
             client_id = self.client_dropdown.currentData()
             pet_id = self.pet_dropdown.currentData()
-            print(f"Client ID: {client_id}")
-            print(f"Pet ID: {pet_id}")
             
             # Get date and convert to YYYY-MM-DD format
             try:
@@ -741,7 +729,6 @@ class InvoiceFormDialog(QDialog):
                 except ValueError:
                     # If conversion fails, use current date
                     date_issued = datetime.now().strftime("%Y-%m-%d")
-            print(f"Date Issued: {date_issued}")
             
             # Get payment details
             payment_status = self.payment_status_group.checkedButton().text()
@@ -749,43 +736,32 @@ class InvoiceFormDialog(QDialog):
             if payment_status != "UNPAID":
                 payment_method = self.payment_method_group.checkedButton().text()
             received_by = self.received_by_dropdown.currentText()
-            print(f"Payment Status: {payment_status}")
-            print(f"Payment Method: {payment_method}")
-            print(f"Received By: {received_by}")
             
             # Get amounts
             subtotal = float(self.subtotal_field.text().replace('₱', '').replace(',', ''))
             vat = float(self.vat_field.text().replace('₱', '').replace(',', ''))
             total_amount = float(self.total_field.text().replace('₱', '').replace(',', ''))
             partial_amount = float(self.partial_amount_field.text() or '0')
-            print(f"Subtotal: {subtotal}")
-            print(f"VAT: {vat}")
-            print(f"Total Amount: {total_amount}")
-            print(f"Partial Amount: {partial_amount}")
             
             # Get other details
             reason = self.reason_dropdown.currentText()
             veterinarian = self.vet_dropdown.currentText()
             notes = self.notes_edit.toPlainText().strip()  # Get notes and remove leading/trailing whitespace
-            print(f"Reason: {reason}")
-            print(f"Veterinarian: {veterinarian}")
-            print(f"Notes: {notes}")
             
             # Generate invoice number
             invoice_no = self.invoice_field.text()
-            print(f"Generated Invoice No: {invoice_no}")
             
             # Validate required fields
             if not client_id or not pet_id or not date_issued or not total_amount or not payment_status:
-                print("❌ Missing required fields")
+                log.error("❌ Missing required fields")
                 return None
                 
             if payment_status == 'PARTIAL' and partial_amount <= 0:
-                print("❌ Partial payment amount must be greater than 0")
+                log.error("❌ Partial payment amount must be greater than 0")
                 return None
                 
             if payment_status == 'PARTIAL' and partial_amount >= total_amount:
-                print("❌ Partial payment amount must be less than total amount")
+                log.error("❌ Partial payment amount must be less than total amount")
                 return None
             
             data = {
@@ -805,16 +781,12 @@ class InvoiceFormDialog(QDialog):
                 'partial_amount': partial_amount
             }
             
-            print("\nFinal Invoice Data:")
-            for key, value in data.items():
-                print(f"{key}: {value}")
+            log.debug("Final invoice data: %s", data)
             
             return data
             
         except Exception as e:
-            print(f"❌ Error getting invoice data: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("❌ Error getting invoice data: %s", e, exc_info=True)
             return None
         
     def load_clients(self):
@@ -832,47 +804,27 @@ class InvoiceFormDialog(QDialog):
                 self.client_dropdown.addItem(name, client_id)  # Store client_id as user data
                 
         except Exception as e:
-            print(f"❌ Error loading clients: {e}")
+            log.error("❌ Error loading clients: %s", e)
         finally:
             db.close_connection()
             
     def load_receptionists(self):
         """Load receptionist names into the received_by_dropdown."""
-        db = Database()
-        try:
-            # Fetch receptionist names from the database
-            db.cursor.execute("SELECT user_id, name FROM users WHERE role = 'Receptionist' ORDER BY name")
-            receptionists = db.cursor.fetchall()
-
-            # Clear the dropdown and add receptionists
-            self.received_by_dropdown.clear()
-            self.received_by_dropdown.addItem("-- Select Receptionist --", None)  # Default placeholder
-
-            for user_id, name in receptionists:
-                self.received_by_dropdown.addItem(name, user_id)  # Store user_id as user data
+        # Clear the dropdown and add receptionists
+        self.received_by_dropdown.clear()
+        self.received_by_dropdown.addItem("-- Select Receptionist --", None)  # Default placeholder
 
-        except Exception as e:
-            print(f"❌ Error loading receptionists: {e}")
-        finally:
-            db.close_connection()
+        for user_id, name, _, _ in reference_data.receptionists():
+            self.received_by_dropdown.addItem(name, user_id)  # Store user_id as user data
             
     def load_veterinarians(self):
         """Load all veterinarians into the vet dropdown."""
-        db = Database()
-        try:
-            db.cursor.execute("SELECT user_id, name, last_name FROM users WHERE role = 'Veterinarian' ORDER BY name")
-            vets = db.cursor.fetchall()
+        self.vet_dropdown.clear()
+        self.vet_dropdown.addItem("-- Select Veterinarian --", None)
 
-            self.vet_dropdown.clear()
-            self.vet_dropdown.addItem("-- Select Veterinarian --", None)
-
-            for user_id, name, last_name in vets:
-                full_name = f"{name} {last_name}".strip()
-                self.vet_dropdown.addItem(full_name, user_id)
-        except Exception as e:
-            print(f"❌ Error loading veterinarians: {e}")
-        finally:
-            db.close_connection()
+        for user_id, name, last_name, _ in reference_data.veterinarians():
+            full_name = f"{name} {last_name or ''}".strip()
+            self.vet_dropdown.addItem(full_name, user_id)
 
     def on_client_selected(self, index):
         """Handle client selection and update related fields."""
@@ -915,9 +867,7 @@ class InvoiceFormDialog(QDialog):
                     self.load_pets_for_client(client_id)
                     
             except Exception as e:
-                print(f"Error loading client details: {e}")
-                import traceback
-                traceback.print_exc()
+                log.error("Error loading client details: %s", e, exc_info=True)
                 # Set safe default values
                 self.client_address_field.clear()
                 self.client_contact_field.clear()
@@ -926,9 +876,7 @@ class InvoiceFormDialog(QDialog):
             finally:
                 db.close_connection()
         except Exception as e:
-            print(f"Error in client selection: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("Error in client selection: %s", e, exc_info=True)
 
     def load_pets_for_client(self, client_id):
         """Load pets for the selected client."""
@@ -951,7 +899,7 @@ class InvoiceFormDialog(QDialog):
                 self.pet_dropdown.addItem(name, pet_id)  # Store pet_id as user data
                 
         except Exception as e:
-            print(f"❌ Error loading pets: {e}")
+            log.error("❌ Error loading pets: %s", e)
         finally:
             db.close_connection()
 
@@ -997,9 +945,7 @@ class InvoiceFormDialog(QDialog):
                         self.load_timer.start(100)  # 100ms delay
                     
             except Exception as e:
-                print(f"Error loading pet details: {e}")
-                import traceback
-                traceback.print_exc()
+                log.error("Error loading pet details: %s", e, exc_info=True)
                 # Set safe default values
                 self.pet_species_field.clear()
                 self.pet_breed_field.clear()
@@ -1009,9 +955,7 @@ class InvoiceFormDialog(QDialog):
             finally:
                 db.close_connection()
         except Exception as e:
-            print(f"Error in pet selection: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("Error in pet selection: %s", e, exc_info=True)
 
     def delayed_load_services(self):
         """Load services in a delayed manner to avoid Qt event issues."""
@@ -1021,7 +965,7 @@ class InvoiceFormDialog(QDialog):
         try:
             # Skip loading services if we're loading an existing invoice
             if hasattr(self, 'loading_invoice') and self.loading_invoice:
-                print("Skipping service loading for existing invoice")
+                log.debug("Skipping service loading for existing invoice")
                 return
                 
             # Disconnect any existing itemChanged connection
@@ -1042,83 +986,27 @@ class InvoiceFormDialog(QDialog):
                     self.services_table.removeRow(0)
                 
                 db = Database()
-                cursor = db.cursor
 
                 # Get the selected reason for visit safely
                 selected_reason = self.reason_dropdown.currentText() if hasattr(self, 'reason_dropdown') else "-- Select Treatment Type --"
-                print(f"Selected reason: {selected_reason}")
-
-                # Base query for all treatment types
-                base_query = """
-                    SELECT 
-                        'Consultation' as type,
-                        date,
-                        COALESCE(prescribed_treatment, '') as treatment_details,
-                        COALESCE(veterinarian, '') as veterinarian
-                    FROM consultations
-                    WHERE pet_id = ?
-                    UNION ALL
-                    SELECT 
-                        'Deworming' as type,
-                        date,
-                        COALESCE(medication, '') as treatment_details,
-                        COALESCE(veterinarian, '') as veterinarian
-                    FROM deworming
-                    WHERE pet_id = ?
-                    UNION ALL
-                    SELECT 
-                        'Vaccination' as type,
-                        date,
-                        COALESCE(vaccine, '') as treatment_details,
-                        COALESCE(veterinarian, '') as veterinarian
-                    FROM vaccinations
-                    WHERE pet_id = ?
-                    UNION ALL
-                    SELECT 
-                        'Surgery' as type,
-                        date,
-                        COALESCE(surgery_type, '') as treatment_details,
-                        COALESCE(veterinarian, '') as veterinarian
-                    FROM surgeries
-                    WHERE pet_id = ?
-                    UNION ALL
-                    SELECT 
-                        'Grooming' as type,
-                        date,
-                        COALESCE(services, '') as treatment_details,
-                        COALESCE(veterinarian, '') as veterinarian
-                    FROM grooming
-                    WHERE pet_id = ?
-                    UNION ALL
-                    SELECT 
-                        'Other Treatments' as type,
-                        date,
-                        COALESCE(medication, '') as treatment_details,
-                        COALESCE(veterinarian, '') as veterinarian
-                    FROM other_treatments
-                    WHERE pet_id = ?
-                """
+                log.debug("Selected reason: %s", selected_reason)
 
-                # If a specific reason is selected, filter by that type
+                # The dropdown says "Other Treatments"; treatment_events says "Other Treatment"
+                treatment_type = None
                 if selected_reason and selected_reason != "-- Select Treatment Type --":
-                    query = f"""
-                        SELECT * FROM (
-                            {base_query}
-                        ) AS combined_services
-                        WHERE type = ?
-                        ORDER BY date DESC
-                    """
-                    cursor.execute(query, (self.pending_pet_id,) * 6 + (selected_reason,))
-                else:
-                    # If no specific reason selected, show all records
-                    query = f"""
-                        {base_query}
-                        ORDER BY date DESC
-                    """
-                    cursor.execute(query, (self.pending_pet_id,) * 6)
-                
-                services = cursor.fetchall()
-                print(f"Found {len(services)} services")
+                    treatment_type = "Other Treatment" if selected_reason == "Other Treatments" else selected_reason
+
+                events = db.fetch_treatment_events(pet_id=self.pending_pet_id, treatment_type=treatment_type)
+                services = [
+                    (
+                        "Other Treatments" if event[EVENT_TYPE] == "Other Treatment" else event[EVENT_TYPE],
+                        event[EVENT_DATE],
+                        event[EVENT_DETAILS],
+                        event[EVENT_VETERINARIAN] or "",
+                    )
+                    for event in events
+                ]
+                log.debug("Found %s services", len(services))
                 
                 # Add services to the table safely
                 for row_num, service in enumerate(services):
@@ -1164,13 +1052,11 @@ class InvoiceFormDialog(QDialog):
                         self.services_table.setItem(row_num, 5, total_item)
 
                     except Exception as row_error:
-                        print(f"Error processing service row {row_num}: {row_error}")
+                        log.error("Error processing service row %s: %s", row_num, row_error)
                         continue
 
             except Exception as db_error:
-                print(f"Database error: {db_error}")
-                import traceback
-                traceback.print_exc()
+                log.error("Database error: %s", db_error, exc_info=True)
             finally:
                 # Always ensure database connection is closed
                 try:
@@ -1194,9 +1080,7 @@ class InvoiceFormDialog(QDialog):
                 self.pending_pet_id = None
 
         except Exception as e:
-            print(f"Error in delayed_load_services: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("Error in delayed_load_services: %s", e, exc_info=True)
             # Ensure signals and updates are re-enabled
             try:
                 self.services_table.setUpdatesEnabled(True)
@@ -1207,16 +1091,7 @@ class InvoiceFormDialog(QDialog):
 
     def get_default_price(self, service_type):
         """Get default price based on service type."""
-        # All prices set to 0.00 as requested
-        prices = {
-            "Consultation": 0.00,
-            "Deworming": 0.00,
-            "Vaccination": 0.00,
-            "Surgery": 0.00,
-            "Grooming": 0.00,
-            "Other": 0.00
-        }
-        return prices.get(service_type, 0.00)  # Default to 0.00 if service type not found
+        return reference_data.default_price(service_type)
 
     def on_payment_method_changed(self, state):
         """Handle payment method checkbox state changes to ensure only one is checked."""
@@ -1416,7 +1291,7 @@ class InvoiceFormDialog(QDialog):
     def load_invoice_data(self, billing_id):
         """Load invoice data for viewing."""
         try:
-            print(f"\n=== Debug: Loading invoice data for billing_id {billing_id} ===")
+            log.debug("=== Loading invoice data for billing_id %s ===", billing_id)
             if not billing_id:
                 raise ValueError("Invalid billing ID")
 
@@ -1424,16 +1299,16 @@ class InvoiceFormDialog(QDialog):
             self.loading_invoice = True
 
             if not self.db or not self.db.conn:
-                print("Database connection not available, attempting to reconnect...")
+                log.debug("Database connection not available, attempting to reconnect...")
                 try:
                     self.db = Database()
                 except Exception as db_error:
-                    print(f"Failed to reconnect to database: {db_error}")
+                    log.error("Failed to reconnect to database: %s", db_error)
                     raise ValueError("Database connection failed")
 
             try:
                 # Get billing data with named columns for better readability
-                print("Fetching billing data...")
+                log.debug("Fetching billing data...")
                 self.db.cursor.execute("""
                     SELECT 
                         b.billing_id,
@@ -1467,21 +1342,21 @@ class InvoiceFormDialog(QDialog):
                 
                 result = self.db.cursor.fetchone()
                 if not result:
-                    print(f"No invoice found with ID {billing_id}")
+                    log.debug("No invoice found with ID %s", billing_id)
                     raise ValueError(f"Invoice with ID {billing_id} not found")
                     
                 columns = [desc[0] for desc in self.db.cursor.description]
                 billing_data = dict(zip(columns, result))
-                print("Billing data fetched successfully")
+                log.debug("Billing data fetched successfully")
 
                 # First load all clients and pets to populate dropdowns
-                print("Loading clients...")
+                log.debug("Loading clients...")
                 self.load_clients()
-                print("Loading pets...")
+                log.debug("Loading pets...")
                 self.load_pets_for_client(billing_data.get('client_id'))
 
                 # Set the values in the form with safe defaults
-                print("Setting form values...")
+                log.debug("Setting form values...")
                 try:
                     self.date_field.setText(str(billing_data.get('date_issued', '')))
                     self.invoice_field.setText(str(billing_data.get('invoice_no', '')))
@@ -1562,7 +1437,7 @@ class InvoiceFormDialog(QDialog):
                         self.vat_field.setText("0.00")
                         self.total_field.setText("0.00")
 
-                    print("Loading services...")
+                    log.debug("Loading services...")
                     # Load services from billing_services instead of pet history
                     self.db.cursor.execute("""
                         SELECT service_description, service_date, quantity, unit_price, line_total 
@@ -1571,7 +1446,7 @@ class InvoiceFormDialog(QDialog):
                         ORDER BY service_date DESC
                     """, (billing_id,))
                     services = self.db.cursor.fetchall()
-                    print(f"Found {len(services)} services")
+                    log.debug("Found %s services", len(services))
 
                     # Ensure we're disconnected from itemChanged
                     if self.services_table_connected:
@@ -1652,15 +1527,15 @@ class InvoiceFormDialog(QDialog):
                     # Force an update of totals
                     self.update_total(None)
 
-                    print("Services loaded successfully")
-                    print("All form data set successfully")
+                    log.debug("Services loaded successfully")
+                    log.debug("All form data set successfully")
 
                 except Exception as form_error:
-                    print(f"Error setting form values: {form_error}")
+                    log.error("Error setting form values: %s", form_error)
                     raise
 
             except Exception as db_error:
-                print(f"Database error: {db_error}")
+                log.error("Database error: %s", db_error)
                 raise
             finally:
                 # Clear loading_invoice flag
@@ -1670,9 +1545,7 @@ class InvoiceFormDialog(QDialog):
                     self.db = None
 
         except Exception as e:
-            print(f"Error loading invoice data: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("Error loading invoice data: %s", e, exc_info=True)
             QTimer.singleShot(0, lambda: QMessageBox.critical(self, "Error", f"Failed to load invoice data: {str(e)}"))
             return False
         return True
@@ -1694,247 +1567,45 @@ class InvoiceFormDialog(QDialog):
             if not file_path:
                 return
 
-            c = canvas.Canvas(file_path, pagesize=letter)
-            width, height = letter
-            width, height = height, width
-            c.setPageSize((width, height))
-
-            x_margin = 50
-            y_margin = 50
-            header_height = 100
-            content_width = width - (2 * x_margin)
-            left_column_width = content_width * 0.45
-            right_column_width = content_width * 0.55
-            right_column_x = x_margin + left_column_width + 20
-            section_gap = 25
-            line_gap = 12
-
-            # Header
-            logo_path = "assets/logologin.png"
-            if os.path.exists(logo_path):
-                c.drawImage(logo_path, x_margin, height - y_margin - 50, width=50, height=50)
-            c.setFont("Helvetica-Bold", 16)
-            c.drawString(x_margin + 60, height - y_margin - 20, self.clinic_field.text())
-            
-            # Get clinic license number
-            db = Database()
-            try:
-                db.cursor.execute("SELECT vet_license FROM clinic_info LIMIT 1")
-                result = db.cursor.fetchone()
-                if result and result[0]:
-                    c.setFont("Helvetica", 10)
-                    c.drawString(x_margin + 60, height - y_margin - 35, f"License No: {result[0]}")
-            except Exception as e:
-                print(f"Error getting clinic license number: {e}")
-            finally:
-                db.close_connection()
-            
-            c.setFont("Helvetica", 12)
-            c.drawString(x_margin + 60, height - y_margin - 50, self.clinic_address_field.text())
-            c.drawString(x_margin + 60, height - y_margin - 70, f"Contact: {self.clinic_contact_field.text()}")
-            c.setFont("Helvetica-Bold", 14)
-            c.drawString(width - 250, height - y_margin - 20, "SERVICE BILLING")
-            c.setFont("Helvetica", 12)
-            c.drawString(width - 250, height - y_margin - 40, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-            c.setStrokeColorRGB(0.003922, 0.145098, 0.278431)
-            c.line(x_margin, height - y_margin - header_height, width - x_margin, height - y_margin - header_height)
-
-            # Start content below header
-            y_start = height - y_margin - header_height - 30
-            y_left = y_start
-            y_right = y_start
-
-            # LEFT COLUMN
-            c.setFont("Helvetica-Bold", 12)
-            c.drawString(x_margin, y_left, "Invoice Details")
-            y_left -= section_gap
-            c.setFont("Helvetica", 9)
-            
-            # Get veterinarian's license number
-            db = Database()
-            vet_display = invoice_data['veterinarian']
-            try:
-                license_number = db.get_vet_license_number(invoice_data['veterinarian'])
-                if license_number:
-                    vet_display = f"{invoice_data['veterinarian']} ({license_number})"
-            except Exception as e:
-                print(f"Error getting license number: {e}")
-            finally:
-                db.close_connection()
-            
-            details = [
-                ("Invoice No:", invoice_data['invoice_no']),
-                ("Date:", invoice_data['date_issued']),
-                ("Veterinarian:", vet_display),
-                ("Reason:", invoice_data['reason'])
-            ]
-            for label, value in details:
-                c.drawString(x_margin, y_left, f"{label} {value}")
-                y_left -= line_gap
-            y_left -= section_gap
-
-            c.setFont("Helvetica-Bold", 12)
-            c.drawString(x_margin, y_left, "Client Information")
-            y_left -= section_gap
-            c.setFont("Helvetica", 9)
-            client_details = [
-                ("Client:", self.client_dropdown.currentText()),
-                ("Control Number:", self.client_control_number_field.text()),
-                ("Address:", self.client_address_field.text()),
-                ("Contact:", self.client_contact_field.text()),
-                ("Email:", self.client_email_field.text())
-            ]
-            for label, value in client_details:
-                c.drawString(x_margin, y_left, f"{label} {value}")
-                y_left -= line_gap
-            y_left -= section_gap
-
-            c.setFont("Helvetica-Bold", 12)
-            c.drawString(x_margin, y_left, "Pet Information")
-            y_left -= section_gap
-            c.setFont("Helvetica", 9)
-            pet_details = [
-                ("Pet Name:", self.pet_dropdown.currentText()),
-                ("Species:", self.pet_species_field.text()),
-                ("Breed:", self.pet_breed_field.text()),
-                ("Age:", self.pet_age_field.text())
-            ]
-            for label, value in pet_details:
-                c.drawString(x_margin, y_left, f"{label} {value}")
-                y_left -= line_gap
-            y_left -= section_gap
-
-            # Notes (if any)
-            if invoice_data['notes']:
-                c.setFont("Helvetica-Bold", 12)
-                c.drawString(x_margin, y_left, "Notes:")
-                y_left -= section_gap
-                c.setFont("Helvetica", 9)
-                words = invoice_data['notes'].split()
-                line = ""
-                for word in words:
-                    if len(line + " " + word) < 60:
-                        line += " " + word if line else word
-                    else:
-                        c.drawString(x_margin, y_left, line)
-                        y_left -= line_gap
-                        line = word
-                if line:
-                    c.drawString(x_margin, y_left, line)
-                    y_left -= line_gap
-                y_left -= section_gap
-
-            # RIGHT COLUMN
-            c.setFont("Helvetica-Bold", 12)
-            c.drawString(right_column_x, y_right, "Services")
-            y_right -= section_gap
-            c.setFont("Helvetica", 9)
+            # The dialog's clinic fields win over the stored ones
+            clinic = {
+                "name": self.clinic_field.text(),
+                "address": self.clinic_address_field.text(),
+                "contact_number": self.clinic_contact_field.text(),
+                "vet_license": reference_data.clinic().get("vet_license"),
+            }
+
+            services = []
             for row in range(self.services_table.rowCount()):
                 checkbox = self.services_table.item(row, 0)
                 if checkbox and checkbox.checkState() == Qt.Checked:
-                    desc = self.services_table.item(row, 1).text()
-                    date = self.services_table.item(row, 2).text()
-                    qty = self.services_table.item(row, 3).text()
-                    unit_price = self.services_table.item(row, 4).text()
-                    total = self.services_table.item(row, 5).text()
-                    indent = 20
-                    max_width = 4.5*inch
-                    from reportlab.pdfbase.pdfmetrics import stringWidth
-                    # Service label and value
-                    c.setFont("Helvetica-Bold", 9)
-                    c.drawString(right_column_x, y_right, "Service:")
-                    y_right -= line_gap
-                    c.setFont("Helvetica", 9)
-                    words = desc.split()
-                    line = ""
-                    for word in words:
-                        test_line = (line + " " + word) if line else word
-                        if stringWidth(test_line, "Helvetica", 9) < max_width:
-                            line = test_line
-                        else:
-                            c.drawString(right_column_x + indent, y_right, line)
-                            y_right -= line_gap
-                            line = word
-                    if line:
-                        c.drawString(right_column_x + indent, y_right, line)
-                        y_right -= line_gap
-                    # Date label and value
-                    c.setFont("Helvetica-Bold", 9)
-                    c.drawString(right_column_x, y_right, "Date:")
-                    y_right -= line_gap
-                    c.setFont("Helvetica", 9)
-                    c.drawString(right_column_x + indent, y_right, date)
-                    y_right -= line_gap
-                    # Quantity label and value
-                    c.setFont("Helvetica-Bold", 9)
-                    c.drawString(right_column_x, y_right, "Quantity:")
-                    y_right -= line_gap
-                    c.setFont("Helvetica", 9)
-                    c.drawString(right_column_x + indent, y_right, qty)
-                    y_right -= line_gap
-                    # Unit Price label and value
-                    c.setFont("Helvetica-Bold", 9)
-                    c.drawString(right_column_x, y_right, "Unit Price:")
-                    y_right -= line_gap
-                    c.setFont("Helvetica", 9)
-                    c.drawString(right_column_x + indent, y_right, unit_price)
-                    y_right -= line_gap
-                    # Total label and value
-                    c.setFont("Helvetica-Bold", 9)
-                    c.drawString(right_column_x, y_right, "Total:")
-                    y_right -= line_gap
-                    c.setFont("Helvetica", 9)
-                    c.drawString(right_column_x + indent, y_right, total)
-                    y_right -= line_gap
-                    # Blank line between services
-                    y_right -= line_gap
-
-            # Totals
-            c.setFont("Helvetica-Bold", 10)
-            totals = [
-                ("Subtotal:", f"PHP {self.subtotal_field.text()}"),
-                ("VAT:", f"PHP {self.vat_field.text()}"),
-                ("Total Amount:", f"PHP {self.total_field.text()}")
-            ]
-            for label, value in totals:
-                c.drawString(right_column_x, y_right, f"{label} {value}")
-                y_right -= line_gap + 2
-            y_right -= section_gap
-
-            # Payment Information
-            c.setFont("Helvetica-Bold", 12)
-            c.drawString(right_column_x, y_right, "Payment Information")
-            y_right -= section_gap
-            c.setFont("Helvetica", 9)
-            payment_details = [
-                ("Payment Status:", invoice_data['payment_status']),
-                ("Payment Method:", invoice_data['payment_method']),
-                ("Received By:", invoice_data['received_by'])
-            ]
-            if invoice_data['payment_status'] == 'PARTIAL':
-                payment_details.append(("Partial Amount:", f"PHP {invoice_data['partial_amount']:.2f}"))
-            for label, value in payment_details:
-                c.drawString(right_column_x, y_right, f"{label} {value}")
-                y_right -= line_gap
-            y_right -= section_gap
-
-            # Calculate where to put the thank you message
-            y_final = min(y_left, y_right) - 30
-            c.setFont("Helvetica-Bold", 12)
-            c.drawCentredString(width/2, y_final, "THANK YOU FOR TRUSTING US WITH YOUR PET'S CARE!")
-
-            # Footer
-            c.setFont("Helvetica", 8)
-            c.drawString(x_margin, y_margin, f"Generated by PetMedix System on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            c.drawString(width - x_margin - 100, y_margin, f"Page 1")
-
-            c.save()
+                    services.append(tuple(self.services_table.item(row, col).text() for col in range(1, 6)))
+
+            render_invoice(file_path, clinic, {
+                **invoice_data,
+                "vet_license": reference_data.vet_license(invoice_data['veterinarian']),
+                "client": {
+                    "name": self.client_dropdown.currentText(),
+                    "control_number": self.client_control_number_field.text(),
+                    "address": self.client_address_field.text(),
+                    "contact_number": self.client_contact_field.text(),
+                    "email": self.client_email_field.text(),
+                },
+                "pet": {
+                    "name": self.pet_dropdown.currentText(),
+                    "species": self.pet_species_field.text(),
+                    "breed": self.pet_breed_field.text(),
+                    "age": self.pet_age_field.text(),
+                },
+                "services": services,
+                "subtotal": self.subtotal_field.text(),
+                "vat": self.vat_field.text(),
+                "total_amount": self.total_field.text(),
+            })
             show_message(None, "Invoice PDF generated successfully!", QMessageBox.Information)
             os.startfile(file_path)
         except Exception as e:
-            print(f"Error generating PDF: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("Error generating PDF: %s", e, exc_info=True)
             show_message(None, f"Error generating PDF: {str(e)}", QMessageBox.Critical)
 
     def show_date_picker(self):
@@ -1959,7 +1630,7 @@ class InvoiceFormDialog(QDialog):
             
             date_picker.show()
         except Exception as e:
-            print(f"Error showing date picker: {e}")
+            log.error("Error showing date picker: %s", e)
 
 def open_invoice_form():
     """Open the invoice form dialog."""
@@ -1970,11 +1641,30 @@ def open_invoice_form():
             # Get the form data
             invoice_data = dialog.get_invoice_data()
             
-            # Save to database
+            # Get selected services from the table
+            services = []
+            for row in range(dialog.services_table.rowCount()):
+                checkbox = dialog.services_table.item(row, 0)
+                if checkbox and checkbox.checkState() == Qt.Checked:
+                    # Convert date from DD/MM/YYYY to YYYY-MM-DD
+                    service_date = dialog.services_table.item(row, 2).text()
+                    try:
+                        service_date = datetime.strptime(service_date, '%d/%m/%Y').strftime('%Y-%m-%d')
+                    except ValueError:
+                        # If date is already in YYYY-MM-DD format or invalid, use as is
+                        pass
+                    services.append((
+                        dialog.services_table.item(row, 1).text(),
+                        float(dialog.services_table.item(row, 3).text()),
+                        float(dialog.services_table.item(row, 4).text()),
+                        float(dialog.services_table.item(row, 5).text()),
+                        service_date
+                    ))
+
+            # Save the invoice and its services in one transaction
             db = Database()
             try:
-                # Save the main billing record
-                billing_id = db.save_billing(
+                saved = db.save_billing(
                     client_id=invoice_data['client_id'],
                     pet_id=invoice_data['pet_id'],
                     date_issued=invoice_data['date_issued'],
@@ -1982,72 +1672,33 @@ def open_invoice_form():
                     payment_status=invoice_data['payment_status'],
                     payment_method=invoice_data['payment_method'],
                     received_by=invoice_data['received_by'],
-                    invoice_no=invoice_data['invoice_no'],
+                    invoice_no=None,  # numbered from the sequence when the row is inserted
                     reason=invoice_data['reason'],
                     veterinarian=invoice_data['veterinarian'],
                     notes=invoice_data['notes'],
                     subtotal=invoice_data['subtotal'],
                     vat=invoice_data['vat'],
-                    partial_amount=invoice_data['partial_amount']
+                    partial_amount=invoice_data['partial_amount'],
+                    services=services
                 )
-                
-                if billing_id:
-                    # Get selected services from the table
-                    services = []
-                    for row in range(dialog.services_table.rowCount()):
-                        checkbox = dialog.services_table.item(row, 0)
-                        if checkbox and checkbox.checkState() == Qt.Checked:
-                            service = {
-                                'description': dialog.services_table.item(row, 1).text(),
-                                'date': dialog.services_table.item(row, 2).text(),
-                                'quantity': float(dialog.services_table.item(row, 3).text()),
-                                'unit_price': float(dialog.services_table.item(row, 4).text()),
-                                'total': float(dialog.services_table.item(row, 5).text())
-                            }
-                            services.append(service)
-                    
-                    # Save the services
-                    for service in services:
-                        try:
-                            # Convert date from DD/MM/YYYY to YYYY-MM-DD
-                            try:
-                                service_date = datetime.strptime(service['date'], '%d/%m/%Y').strftime('%Y-%m-%d')
-                            except ValueError:
-                                # If date is already in YYYY-MM-DD format or invalid, use as is
-                                service_date = service['date']
-                                
-                            db.cursor.execute("""
-                                INSERT INTO billing_services 
-                                (billing_id, service_description, quantity, unit_price, line_total, service_date)
-                                VALUES (?, ?, ?, ?, ?, ?)
-                            """, (
-                                billing_id,
-                                service['description'],
-                                service['quantity'],
-                                service['unit_price'],
-                                service['total'],
-                                service_date
-                            ))
-                        except Exception as e:
-                            print(f"❌ Error saving service: {e}")
-                            continue
-                    
-                    db.conn.commit()
-                    show_message(None, "Invoice saved successfully!")
+
+                if saved:
+                    _, invoice_no = saved
+                    show_message(None, f"Invoice {invoice_no} saved successfully!")
                     return True
                 else:
                     show_message(None, "Failed to save invoice", QMessageBox.Critical)
                     return False
                     
             except Exception as e:
-                print(f"❌ Error saving invoice: {e}")
+                log.error("❌ Error saving invoice: %s", e)
                 show_message(None, f"Error saving invoice: {str(e)}", QMessageBox.Critical)
                 return False
             finally:
                 db.close_connection()
                 
         except Exception as e:
-            print(f"❌ Error processing invoice form: {e}")
+            log.error("❌ Error processing invoice form: %s", e)
             show_message(None, f"Error processing invoice: {str(e)}", QMessageBox.Critical)
             return False
     return False
@@ -2273,8 +1924,11 @@ def update_billing_widget(user_role=None):
             layout.addWidget(header)
             layout.addWidget(self.billings_table)
 
-            # Load initial data
+            # Load initial data; afterwards single invoices are patched as they change
+            self.billing_items = {}
             self.load_billing_data()
+            self.synced_versions = {}
+            data_events.subscribe(self.on_data_changed, owner=self)
 
         def handle_row_selection(self):
             """Handle row selection and show/hide action buttons accordingly."""
@@ -2296,246 +1950,190 @@ def update_billing_widget(user_role=None):
 
         def on_add_receipt(self):
             """Handle adding a new receipt."""
-            if open_invoice_form():
-                self.load_billing_data()  # Refresh table after successful addition
+            # The new invoice's row is added by on_data_changed
+            open_invoice_form()
 
         def view_invoice(self):
             """View the selected invoice."""
             try:
-                print("\n=== Debug: Starting view_invoice ===")
+                log.debug("=== Starting view_invoice ===")
                 selected_rows = self.billings_table.selectionModel().selectedRows()
                 if not selected_rows:
                     QMessageBox.warning(self, "Warning", "Please select an invoice to view")
                     return
                     
                 row = selected_rows[0].row()
-                print(f"Selected row: {row}")
+                log.debug("Selected row: %s", row)
                 
                 billing_id_item = self.billings_table.item(row, 0)
                 if not billing_id_item:
-                    print("Error: Could not get billing_id_item")
+                    log.error("Error: Could not get billing_id_item")
                     QMessageBox.critical(self, "Error", "Could not retrieve invoice data")
                     return
                     
                 billing_id = billing_id_item.data(Qt.UserRole)  # Get billing_id from hidden data
-                print(f"Billing ID: {billing_id}")
+                log.debug("Billing ID: %s", billing_id)
                 
                 if not billing_id:
-                    print("Error: Invalid billing_id")
+                    log.error("Error: Invalid billing_id")
                     QMessageBox.critical(self, "Error", "Invalid invoice ID")
                     return
                 
                 # Create and show the invoice dialog in view mode
                 try:
-                    print("Creating InvoiceFormDialog...")
+                    log.debug("Creating InvoiceFormDialog...")
                     dialog = InvoiceFormDialog(is_view_mode=True, user_role=self.user_role)  # Pass user_role here
-                    print("Dialog created successfully")
+                    log.debug("Dialog created successfully")
                     
-                    print("Loading invoice data...")
+                    log.debug("Loading invoice data...")
                     if not dialog.load_invoice_data(billing_id):
-                        print("Error: Failed to load invoice data")
+                        log.error("Error: Failed to load invoice data")
                         return  # Error already shown by load_invoice_data
-                    print("Invoice data loaded successfully")
+                    log.debug("Invoice data loaded successfully")
                     
-                    print("Showing dialog...")
+                    log.debug("Showing dialog...")
                     dialog.exec()
-                    print("Dialog closed")
+                    log.debug("Dialog closed")
                     
                 except Exception as dialog_error:
-                    print(f"Error in dialog creation/execution: {dialog_error}")
-                    import traceback
-                    traceback.print_exc()
+                    log.error("Error in dialog creation/execution: %s", dialog_error, exc_info=True)
                     QMessageBox.critical(self, "Error", "Failed to display invoice form. Please try again.")
                     return
                     
             except Exception as e:
-                print(f"Error in view_invoice: {e}")
-                import traceback
-                traceback.print_exc()
+                log.error("Error in view_invoice: %s", e, exc_info=True)
                 QMessageBox.critical(self, "Error", "An unexpected error occurred while viewing the invoice. Please try again.")
                 return
 
         def edit_invoice(self):
             """Edit the selected invoice."""
             try:
-                print("\n=== Debug: Starting edit_invoice ===")
+                log.debug("=== Starting edit_invoice ===")
                 selected_rows = self.billings_table.selectionModel().selectedRows()
                 if not selected_rows:
                     show_message(self, "Please select an invoice to edit", QMessageBox.Warning)
                     return False
                     
                 row = selected_rows[0].row()
-                print(f"Selected row: {row}")
+                log.debug("Selected row: %s", row)
                 
                 billing_id_item = self.billings_table.item(row, 0)
                 if not billing_id_item:
-                    print("Error: Could not get billing_id_item")
+                    log.error("Error: Could not get billing_id_item")
                     show_message(self, "Could not retrieve invoice data", QMessageBox.Critical)
                     return False
                     
                 billing_id = billing_id_item.data(Qt.UserRole)  # Get billing_id from hidden data
-                print(f"Billing ID: {billing_id}")
+                log.debug("Billing ID: %s", billing_id)
                 
                 if not billing_id:
-                    print("Error: Invalid billing_id")
+                    log.error("Error: Invalid billing_id")
                     show_message(self, "Invalid invoice ID", QMessageBox.Critical)
                     return False
                 
                 # Create and show the invoice dialog
                 try:
-                    print("Creating InvoiceFormDialog...")
+                    log.debug("Creating InvoiceFormDialog...")
                     dialog = InvoiceFormDialog(is_view_mode=False)
-                    print("Dialog created successfully")
+                    log.debug("Dialog created successfully")
                     
-                    print("Loading invoice data...")
+                    log.debug("Loading invoice data...")
                     if not dialog.load_invoice_data(billing_id):
-                        print("Error: Failed to load invoice data")
+                        log.error("Error: Failed to load invoice data")
                         return False  # Error already shown by load_invoice_data
-                    print("Invoice data loaded successfully")
+                    log.debug("Invoice data loaded successfully")
                     
-                    print("Showing dialog...")
+                    log.debug("Showing dialog...")
                     if dialog.exec():
-                        print("Dialog accepted")
+                        log.debug("Dialog accepted")
                         try:
                             # Get the form data
-                            print("Getting invoice data...")
+                            log.debug("Getting invoice data...")
                             invoice_data = dialog.get_invoice_data()
                             if not invoice_data:
-                                print("Error: Invalid invoice data")
+                                log.error("Error: Invalid invoice data")
                                 show_message(self, "Invalid invoice data", QMessageBox.Critical)
                                 return False
-                            print("Invoice data retrieved successfully")
+                            log.debug("Invoice data retrieved successfully")
                             
                             # Save to database
-                            print("Saving to database...")
+                            log.debug("Saving to database...")
                             db = Database()
                             try:
-                                # Update the main billing record
-                                print("Updating billing record...")
-                                db.cursor.execute("""
-                                    UPDATE billing SET
-                                        client_id = ?,
-                                        pet_id = ?,
-                                        date_issued = ?,
-                                        total_amount = ?,
-                                        payment_status = ?,
-                                        payment_method = ?,
-                                        received_by = ?,
-                                        reason = ?,
-                                        veterinarian = ?,
-                                        notes = ?,
-                                        subtotal = ?,
-                                        vat = ?,
-                                        partial_amount = ?
-                                    WHERE billing_id = ?
-                                """, (
-                                    invoice_data['client_id'],
-                                    invoice_data['pet_id'],
-                                    invoice_data['date_issued'],
-                                    invoice_data['total_amount'],
-                                    invoice_data['payment_status'],
-                                    invoice_data['payment_method'],
-                                    invoice_data['received_by'],
-                                    invoice_data['reason'],
-                                    invoice_data['veterinarian'],
-                                    invoice_data['notes'],
-                                    invoice_data['subtotal'],
-                                    invoice_data['vat'],
-                                    invoice_data['partial_amount'],
-                                    billing_id
-                                ))
-                                print("Billing record updated successfully")
-                                
-                                # Delete existing services
-                                print("Deleting existing services...")
-                                db.cursor.execute("DELETE FROM billing_services WHERE billing_id = ?", (billing_id,))
-                                print("Existing services deleted")
-                                
                                 # Get selected services from the table
-                                print("Processing services...")
+                                log.debug("Processing services...")
                                 services = []
                                 for row in range(dialog.services_table.rowCount()):
                                     try:
                                         checkbox = dialog.services_table.item(row, 0)
                                         if checkbox and checkbox.checkState() == Qt.Checked:
-                                            service = {
-                                                'description': dialog.services_table.item(row, 1).text(),
-                                                'date': dialog.services_table.item(row, 2).text(),
-                                                'quantity': float(dialog.services_table.item(row, 3).text() or 0),
-                                                'unit_price': float(dialog.services_table.item(row, 4).text() or 0),
-                                                'total': float(dialog.services_table.item(row, 5).text() or 0)
-                                            }
-                                            services.append(service)
+                                            # Convert date from DD/MM/YYYY to YYYY-MM-DD
+                                            service_date = dialog.services_table.item(row, 2).text()
+                                            try:
+                                                service_date = datetime.strptime(service_date, '%d/%m/%Y').strftime('%Y-%m-%d')
+                                            except ValueError:
+                                                # If date is already in YYYY-MM-DD format or invalid, use as is
+                                                pass
+                                            services.append((
+                                                dialog.services_table.item(row, 1).text(),
+                                                float(dialog.services_table.item(row, 3).text() or 0),
+                                                float(dialog.services_table.item(row, 4).text() or 0),
+                                                float(dialog.services_table.item(row, 5).text() or 0),
+                                                service_date
+                                            ))
                                     except (ValueError, AttributeError) as e:
-                                        print(f"Error processing service row {row}: {e}")
+                                        log.error("Error processing service row %s: %s", row, e)
                                         continue
-                                
-                                # Save the updated services
-                                print(f"Saving {len(services)} services...")
-                                for service in services:
-                                    try:
-                                        # Convert date from DD/MM/YYYY to YYYY-MM-DD
-                                        try:
-                                            service_date = datetime.strptime(service['date'], '%d/%m/%Y').strftime('%Y-%m-%d')
-                                        except ValueError:
-                                            # If date is already in YYYY-MM-DD format or invalid, use as is
-                                            service_date = service['date']
-                                            
-                                        db.cursor.execute("""
-                                            INSERT INTO billing_services 
-                                            (billing_id, service_description, quantity, unit_price, line_total, service_date)
-                                            VALUES (?, ?, ?, ?, ?, ?)
-                                        """, (
-                                            billing_id,
-                                            service['description'],
-                                            service['quantity'],
-                                            service['unit_price'],
-                                            service['total'],
-                                            service_date
-                                        ))
-                                    except Exception as e:
-                                        print(f"Error saving service: {e}")
-                                        continue
-                                
-                                print("Committing changes...")
-                                db.conn.commit()
-                                print("Changes committed successfully")
-                                
+
+                                # Invoice and service lines in one transaction; on_data_changed redraws the row
+                                log.debug("Saving invoice %s with %s services...", billing_id, len(services))
+                                updated = db.update_billing(
+                                    billing_id,
+                                    client_id=invoice_data['client_id'],
+                                    pet_id=invoice_data['pet_id'],
+                                    date_issued=invoice_data['date_issued'],
+                                    total_amount=invoice_data['total_amount'],
+                                    payment_status=invoice_data['payment_status'],
+                                    payment_method=invoice_data['payment_method'],
+                                    received_by=invoice_data['received_by'],
+                                    reason=invoice_data['reason'],
+                                    veterinarian=invoice_data['veterinarian'],
+                                    notes=invoice_data['notes'],
+                                    subtotal=invoice_data['subtotal'],
+                                    vat=invoice_data['vat'],
+                                    partial_amount=invoice_data['partial_amount'],
+                                    services=services
+                                )
+                                if not updated:
+                                    show_message(self, "Failed to update invoice in database. Please try again.", QMessageBox.Critical)
+                                    return False
+
                                 # Show success message
                                 show_message(self, "Invoice updated successfully!", QMessageBox.Information)
-                                self.load_billing_data()  # Refresh the table
                                 return True
                                 
                             except Exception as db_error:
-                                print(f"Database error updating invoice: {db_error}")
-                                import traceback
-                                traceback.print_exc()
+                                log.error("Database error updating invoice: %s", db_error, exc_info=True)
                                 show_message(self, "Failed to update invoice in database. Please try again.", QMessageBox.Critical)
                                 return False
                             finally:
                                 db.close_connection()
                                 
                         except Exception as form_error:
-                            print(f"Error processing form data: {form_error}")
-                            import traceback
-                            traceback.print_exc()
+                            log.error("Error processing form data: %s", form_error, exc_info=True)
                             show_message(self, "Failed to process invoice data. Please try again.", QMessageBox.Critical)
                             return False
                         else:
-                            print("Dialog rejected")
+                            log.debug("Dialog rejected")
                             return False
                             
                 except Exception as dialog_error:
-                    print(f"Error in dialog creation/execution: {dialog_error}")
-                    import traceback
-                    traceback.print_exc()
+                    log.error("Error in dialog creation/execution: %s", dialog_error, exc_info=True)
                     show_message(self, "Failed to display invoice form. Please try again.", QMessageBox.Critical)
                     return False
                     
             except Exception as e:
-                print(f"Error in edit_invoice: {e}")
-                import traceback
-                traceback.print_exc()
+                log.error("Error in edit_invoice: %s", e, exc_info=True)
                 show_message(self, "An unexpected error occurred while editing the invoice. Please try again.", QMessageBox.Critical)
                 return False
 
@@ -2560,76 +2158,118 @@ def update_billing_widget(user_role=None):
                 if reply == QMessageBox.Yes:
                     db = Database()
                     try:
-                        # First delete associated services
-                        db.cursor.execute("DELETE FROM billing_services WHERE billing_id = ?", (billing_id,))
-                        
-                        # Then delete the main billing record
-                        db.cursor.execute("DELETE FROM billing WHERE billing_id = ?", (billing_id,))
-                        
-                        db.conn.commit()
-                        self.load_billing_data()  # Refresh the table
-                        
-                        # Show success message
-                        show_message(self, "Invoice deleted successfully!", QMessageBox.Information)
-                    except Exception as e:
-                        db.conn.rollback()  # Rollback changes if there's an error
-                        show_message(self, f"Failed to delete invoice: {str(e)}", QMessageBox.Critical)
+                        # Services and invoice go together; on_data_changed removes the row
+                        deleted = db.delete_invoice(billing_id)
                     finally:
                         db.close_connection()
 
+                    if deleted:
+                        show_message(self, "Invoice deleted successfully!", QMessageBox.Information)
+                    else:
+                        show_message(self, "Failed to delete invoice.", QMessageBox.Critical)
+
+        def refresh(self):
+            """Called by the main window when the page is shown again after data changed."""
+            self.load_billing_data()
+
         def load_billing_data(self):
-            """Load billing data into the table."""
-            db = Database()
+            """Load billing data into the table without blocking the UI."""
+            db_executor.submit(
+                lambda db: db.fetch_billing_data(),
+                key="billing_data",
+                on_result=self.populate_billing_table,
+                context=self.billings_table,
+            )
+
+        def populate_billing_table(self, billing_data):
+            """Fill the billings table with rows from Database.fetch_billing_data."""
             try:
-                billing_data = db.fetch_billing_data()
-
                 self.billings_table.setRowCount(0)  # Clear the table
+                self.billing_items.clear()
 
                 for row_num, data in enumerate(billing_data):
                     self.billings_table.insertRow(row_num)
-
-                    # Create table items with center alignment
-                    receipt_no = QTableWidgetItem(str(data[1] or f"REC-{data[0]}"))
-                    receipt_no.setData(Qt.UserRole, data[0])  # Store billing_id
-                    receipt_no.setTextAlignment(Qt.AlignCenter)
-                    
-                    date_issued = QTableWidgetItem(data[2].strftime("%Y-%m-%d") if isinstance(data[2], datetime) else str(data[2]))
-                    date_issued.setTextAlignment(Qt.AlignCenter)
-                    
-                    client_name = QTableWidgetItem(str(data[3]))
-                    client_name.setTextAlignment(Qt.AlignCenter)
-                    
-                    pet_name = QTableWidgetItem(str(data[4]))
-                    pet_name.setTextAlignment(Qt.AlignCenter)
-                    
-                    total_amount = QTableWidgetItem(f"₱ {data[5]:.2f}")
-                    total_amount.setTextAlignment(Qt.AlignCenter)
-                    
-                    payment_method = QTableWidgetItem(str(data[6] or ""))
-                    payment_method.setTextAlignment(Qt.AlignCenter)
-                    
-                    payment_status = QTableWidgetItem(str(data[7]))
-                    payment_status.setTextAlignment(Qt.AlignCenter)
-
-                    # Add items to table
-                    self.billings_table.setItem(row_num, 0, receipt_no)
-                    self.billings_table.setItem(row_num, 1, date_issued)
-                    self.billings_table.setItem(row_num, 2, client_name)
-                    self.billings_table.setItem(row_num, 3, pet_name)
-                    self.billings_table.setItem(row_num, 4, total_amount)
-                    
-                    # Display "UNPAID" in payment column if payment status is "UNPAID"
-                    if data[7] == "UNPAID":
-                        payment_method = QTableWidgetItem("UNPAID")
-                        payment_method.setTextAlignment(Qt.AlignCenter)
-                    
-                    self.billings_table.setItem(row_num, 5, payment_method)
-                    self.billings_table.setItem(row_num, 6, payment_status)
+                    self.set_billing_row(row_num, data)
 
             except Exception as e:
-                print(f"Error loading billing data: {e}")
-            finally:
-                db.close_connection()
+                log.error("Error loading billing data: %s", e)
+
+        def set_billing_row(self, row_num, data):
+            """Write one fetch_billing_data row into the table at row_num."""
+            # Create table items with center alignment
+            receipt_no = QTableWidgetItem(str(data[1] or f"REC-{data[0]}"))
+            receipt_no.setData(Qt.UserRole, data[0])  # Store billing_id
+            receipt_no.setTextAlignment(Qt.AlignCenter)
+            
+            date_issued = QTableWidgetItem(data[2].strftime("%Y-%m-%d") if isinstance(data[2], datetime) else str(data[2]))
+            date_issued.setTextAlignment(Qt.AlignCenter)
+            
+            client_name = QTableWidgetItem(str(data[3]))
+            client_name.setTextAlignment(Qt.AlignCenter)
+            
+            pet_name = QTableWidgetItem(str(data[4]))
+            pet_name.setTextAlignment(Qt.AlignCenter)
+            
+            total_amount = QTableWidgetItem(f"₱ {data[5]:.2f}")
+            total_amount.setTextAlignment(Qt.AlignCenter)
+            
+            payment_method = QTableWidgetItem(str(data[6] or ""))
+            payment_method.setTextAlignment(Qt.AlignCenter)
+            
+            payment_status = QTableWidgetItem(str(data[7]))
+            payment_status.setTextAlignment(Qt.AlignCenter)
+
+            # Add items to table
+            self.billings_table.setItem(row_num, 0, receipt_no)
+            self.billings_table.setItem(row_num, 1, date_issued)
+            self.billings_table.setItem(row_num, 2, client_name)
+            self.billings_table.setItem(row_num, 3, pet_name)
+            self.billings_table.setItem(row_num, 4, total_amount)
+            
+            # Display "UNPAID" in payment column if payment status is "UNPAID"
+            if data[7] == "UNPAID":
+                payment_method = QTableWidgetItem("UNPAID")
+                payment_method.setTextAlignment(Qt.AlignCenter)
+            
+            self.billings_table.setItem(row_num, 5, payment_method)
+            self.billings_table.setItem(row_num, 6, payment_status)
+            self.billing_items[data[0]] = receipt_no
+
+        def on_data_changed(self, entity, billing_id, op):
+            """data_events listener: re-read just the invoice that changed instead of the whole table."""
+            if entity != "billing":
+                return
+            # The row is redrawn here, so this write needs no reload when the page is shown again
+            self.synced_versions.update(table_versions.snapshot("billing", "billing_services"))
+            if op == DELETE:
+                self.apply_billing_row(billing_id, None)
+                return
+            db_executor.submit(
+                lambda db: db.fetch_billing_row(billing_id),
+                key=f"billing_row:{billing_id}",
+                on_result=lambda data: self.apply_billing_row(billing_id, data),
+                context=self.billings_table,
+            )
+
+        def apply_billing_row(self, billing_id, data):
+            """Patch one invoice's row: rewrite it, move it, add it, or (data None) remove it."""
+            item = self.billing_items.get(billing_id)
+            receipt = str(data[1] or f"REC-{data[0]}") if data else None
+            if item is not None and item.text() == receipt:
+                # Same invoice number, same place
+                self.set_billing_row(item.row(), data)
+                return
+            if item is not None:
+                self.billings_table.removeRow(item.row())
+                del self.billing_items[billing_id]
+            if data is None:
+                return
+            # Rows are ordered by invoice number, highest first; new invoices go near the top
+            row = 0
+            while row < self.billings_table.rowCount() and self.billings_table.item(row, 0).text() > receipt:
+                row += 1
+            self.billings_table.insertRow(row)
+            self.set_billing_row(row, data)
 
     return BillingWidget  # Return the class, not an instance
 
@@ -1,14 +1,21 @@
 from PySide6.QtWidgets import (
     QWidget, QLabel, QHBoxLayout, QVBoxLayout, QPushButton, QLineEdit,
-    QTableWidget, QScroller, QScrollArea,
+    QTableWidget, QScroller,
     QStackedLayout, QComboBox, QTabWidget, QDateEdit, QMessageBox,
-    QFileDialog, QHeaderView, QDialog, QFrame
+    QFileDialog, QHeaderView, QDialog
 )
-from PySide6.QtGui import QIcon, QPixmap, QPainter, QPainterPath
+from PySide6.QtGui import QIcon, QPixmap
 from PySide6.QtCore import Qt, QSize, QDate
 from modules.database import Database
+from modules.db_worker import db_executor
+from modules.dashboard_stats import dashboard_stats
+from modules.pet_cards import PET_ACTIONS, PET_ID_INDEX, PetCardListView, PetListModel
+from modules.search_index import client_search
 from modules.utils import create_styled_message_box, show_message
 from datetime import datetime
+from modules.log import get_logger
+
+log = get_logger(__name__)
 
 class AddPetDialog(QDialog):                                                
     def __init__(self, client_email, parent=None):
@@ -276,6 +283,7 @@ class AddPetDialog(QDialog):
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (name, gender, species, breed, color, birthdate, age, weight_float, height_float, self.photo_path, client_id))
             db.conn.commit()
+            client_search.refresh(client_id)
             show_message(self, "New pet added successfully!")
             self.accept()
         except Exception as e:
@@ -295,7 +303,7 @@ def get_client_widget(main_window, user_role=None):
         """Open the form for editing the selected client."""
         selected_row = table.currentRow()
         if selected_row == -1:
-            print("❌ No client selected.")
+            log.error("❌ No client selected.")
             return
 
         selected_widget = table.cellWidget(selected_row, 0)  # 🛠 get the widget!
@@ -304,10 +312,10 @@ def get_client_widget(main_window, user_role=None):
             if name_label:
                 client_name = name_label.text()
             else:
-                print("❌ Could not find client name label.")
+                log.error("❌ Could not find client name label.")
                 return
         else:
-            print("❌ Could not find selected widget.")
+            log.error("❌ Could not find selected widget.")
             return
 
         # Fetch client data from the database
@@ -316,7 +324,7 @@ def get_client_widget(main_window, user_role=None):
             db.cursor.execute("SELECT name, control_number, address, contact_number, email FROM clients WHERE name = ?", (client_name,))
             client_data = db.cursor.fetchone()
         except Exception as e:
-            print(f"❌ Error fetching client data: {e}")
+            log.error("❌ Error fetching client data: %s", e)
             return
         finally:
             db.close_connection()
@@ -552,12 +560,27 @@ def get_client_widget(main_window, user_role=None):
     pet_picture.setText("No Photo")
 
 
-   # Scroll area setup
-    scroll_area = QScrollArea(client_info_view)
-    scroll_area.setWidgetResizable(True)
-    scroll_area.setFixedHeight(300)
-    scroll_area.setStyleSheet("""
-        QScrollArea {
+    # Pet cards: a list view whose delegate paints only the visible cards;
+    # further pages are fetched as it is scrolled
+    def load_pet_page(client_email, after_id, limit, on_rows):
+        db_executor.submit(
+            lambda db: db.fetch_pets_page(client_email, after_id, limit),
+            key="pet_cards",
+            on_result=on_rows,
+            on_error=lambda message: on_rows([]),
+            context=pet_list,
+        )
+
+    pet_actions = [
+        action for action in PET_ACTIONS
+        if not (action[0] == "records" and user_role and user_role.lower() == "receptionist")
+    ]
+    pet_list = PetCardListView(client_info_view, pet_actions)
+    pet_model = PetListModel(pet_list, page_loader=load_pet_page)
+    pet_list.setModel(pet_model)
+    pet_list.setFixedHeight(300)
+    pet_list.setStyleSheet("""
+        QListView {
             border: none;
             background-color: transparent;
         }
@@ -576,15 +599,8 @@ def get_client_widget(main_window, user_role=None):
             height: 0px;
         }
     """)
-    
-    scroll_content = QWidget()
-    scroll_layout = QVBoxLayout(scroll_content)
-    scroll_layout.setSpacing(10)
-    scroll_layout.setContentsMargins(0, 0, 0, 0)
-    scroll_layout.setAlignment(Qt.AlignTop)
-    scroll_area.setWidget(scroll_content)
 
-    client_info_layout.addWidget(scroll_area)
+    client_info_layout.addWidget(pet_list)
 
     # ===== CLIENT EDIT FORM =====
     edit_form_widget = QWidget(client_info_stack_widget)  # Set parent
@@ -1051,7 +1067,7 @@ def get_client_widget(main_window, user_role=None):
     # --- Hook up button functionality ---
     def save_pet_data():
         """Save the pet data from the form."""
-        print("Starting save_pet_data function...")
+        log.debug("Starting save_pet_data function...")
         
         name = name_input.text().strip()
         gender = pet_gender.currentText()
@@ -1063,7 +1079,8 @@ def get_client_widget(main_window, user_role=None):
         weight = weight_input.text().strip()
         height = height_input.text().strip()
 
-        print(f"Form data collected: name={name}, gender={gender}, species={species}, breed={breed}, color={color}, birthdate={birthdate}, age={age}, weight={weight}, height={height}")
+        log.debug("Form data collected: name=%s, gender=%s, species=%s, breed=%s, color=%s, birthdate=%s, "
+                  "age=%s, weight=%s, height=%s", name, gender, species, breed, color, birthdate, age, weight, height)
 
         if not all([name, species, breed, color, birthdate, weight, height]):
             show_message(pets_edit_widget, "All fields are required!", QMessageBox.Warning)
@@ -1101,14 +1118,14 @@ def get_client_widget(main_window, user_role=None):
 
         # Get the client email from the selected client
         client_email = edit_form_widget.property("original_email")
-        print(f"Initial client_email from property: {client_email}")
+        log.debug("Initial client_email from property: %s", client_email)
         
         if not client_email:
             # Try to get the email from the client info view
             email_input = client_info_view.findChild(QLineEdit, "EmailInput")
             if email_input:
                 client_email = email_input.text().strip()
-                print(f"Got client_email from EmailInput: {client_email}")
+                log.debug("Got client_email from EmailInput: %s", client_email)
             
         if not client_email:
             show_message(pets_edit_widget, "No client selected for adding a pet!", QMessageBox.Warning)
@@ -1117,29 +1134,29 @@ def get_client_widget(main_window, user_role=None):
         db = Database()
         try:
             # Get client_id
-            print(f"Querying database for client_id with email: {client_email}")
+            log.debug("Querying database for client_id with email: %s", client_email)
             db.cursor.execute("SELECT client_id FROM clients WHERE email = ?", (client_email,))
             result = db.cursor.fetchone()
             if not result:
                 show_message(pets_edit_widget, "No client found with the provided email!", QMessageBox.Warning)
                 return
             client_id = result[0]
-            print(f"Found client_id: {client_id}")
+            log.debug("Found client_id: %s", client_id)
 
             # Get the photo path from the pet_picture label
             photo_path = pet_picture.property("photo_path")
-            print(f"Photo path: {photo_path}")
+            log.debug("Photo path: %s", photo_path)
 
             mode = pets_edit_widget.property("mode")
-            print(f"Current mode: {mode}")
+            log.debug("Current mode: %s", mode)
 
             # If mode is None, default to "add" mode
             if mode is None:
                 mode = "add"
-                print("Mode was None, defaulting to add mode")
+                log.debug("Mode was None, defaulting to add mode")
 
             if mode == "add":
-                print("Attempting to add new pet...")
+                log.debug("Attempting to add new pet...")
                 # Check if pet with same name already exists for this client
                 db.cursor.execute("""
                     SELECT COUNT(*) FROM pets 
@@ -1150,19 +1167,20 @@ def get_client_widget(main_window, user_role=None):
                     return
 
                 # Insert new pet
-                print("Inserting new pet into database...")
+                log.debug("Inserting new pet into database...")
                 db.cursor.execute("""
                     INSERT INTO pets (name, gender, species, breed, color, birthdate, age, weight, height, photo_path, client_id)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, (name, gender, species, breed, color, birthdate, age, weight_float, height_float, photo_path, client_id))
                 db.conn.commit()
-                print("Pet successfully added to database")
+                client_search.refresh(client_id)
+                log.debug("Pet successfully added to database")
                 show_message(pets_edit_widget, "New pet added successfully!")
             elif mode == "edit":
-                print("Attempting to update existing pet...")
+                log.debug("Attempting to update existing pet...")
                 # Get the current pet name for updating
                 current_pet_name = pet_info_widget.property("pets")[pet_info_widget.property("current_index")][0]
-                print(f"Updating pet: {current_pet_name}")
+                log.debug("Updating pet: %s", current_pet_name)
                 
                 # Update existing pet
                 db.cursor.execute("""
@@ -1171,15 +1189,16 @@ def get_client_widget(main_window, user_role=None):
                     WHERE name = ? AND client_id = ?
                 """, (name, gender, species, breed, color, birthdate, age, weight_float, height_float, photo_path, current_pet_name, client_id))
                 db.conn.commit()
-                print("Pet successfully updated in database")
+                client_search.refresh(client_id)
+                log.debug("Pet successfully updated in database")
                 show_message(pets_edit_widget, "Pet updated successfully!")
 
             # Update the pet info display
-            print("Updating pet info display...")
+            log.debug("Updating pet info display...")
             update_pet_info(client_email)
             
             # Clear the form and switch back to view mode
-            print("Clearing form and switching to view mode...")
+            log.debug("Clearing form and switching to view mode...")
             name_input.clear()
             age_input.clear()
             species_input.clear()
@@ -1195,14 +1214,14 @@ def get_client_widget(main_window, user_role=None):
             pet_picture.setProperty("photo_path", None)
             
             client_info_stack.setCurrentIndex(0)
-            print("Save process completed successfully")
+            log.debug("Save process completed successfully")
 
         except Exception as e:
-            print(f"Error occurred while saving pet: {str(e)}")
+            log.error("Error occurred while saving pet: %s", e)
             show_message(pets_edit_widget, f"Failed to save pet data: {e}", QMessageBox.Critical)
         finally:
             db.close_connection()
-            print("Database connection closed")
+            log.debug("Database connection closed")
 
     def open_add_pet_form():
         """Open the form to add a new pet."""
@@ -1223,7 +1242,7 @@ def get_client_widget(main_window, user_role=None):
         
         # Set the form mode to add
         pets_edit_widget.setProperty("mode", "add")
-        print("Set form mode to: add")
+        log.debug("Set form mode to: add")
         
         # Hide delete button in add mode
         pets_delete_btn.hide()
@@ -1283,6 +1302,11 @@ def get_client_widget(main_window, user_role=None):
 
     def update_client_table():
         """Update the client table with data from the database."""
+        # Rebuild the search index alongside the list, then re-run the current search over it
+        client_search.reload(
+            then=lambda: filter_clients_table(table.property("search_text") or "", table),
+            context=table,
+        )
         db = Database()
         db.cursor.execute("SELECT name, email FROM clients")
         clients = db.cursor.fetchall()
@@ -1338,8 +1362,14 @@ def get_client_widget(main_window, user_role=None):
         if response == QMessageBox.Yes:
             db = Database()
             try:
+                db.cursor.execute("SELECT client_id FROM clients WHERE email = ?", (email,))
+                result = db.cursor.fetchone()
                 db.cursor.execute("DELETE FROM clients WHERE email = ?", (email,))
                 db.conn.commit()
+                # Pets, treatments and appointments cascade with the client
+                dashboard_stats.invalidate()
+                if result:
+                    client_search.remove(result[0])
                 show_message(content, f"Client with email {email} deleted successfully.")
                 
                 # Clear client information display
@@ -1356,10 +1386,7 @@ def get_client_widget(main_window, user_role=None):
                 if email_input: email_input.clear()
                 
                 # Clear pet information display
-                while scroll_layout.count():
-                    child = scroll_layout.takeAt(0)
-                    if child.widget():
-                        child.widget().deleteLater()
+                pet_model.clear()
                 
                 # Update the client table
                 update_client_table()
@@ -1375,17 +1402,20 @@ def get_client_widget(main_window, user_role=None):
 
   # --- Function to Update Client Info ---
     def update_client_info(email):
-        """Update the client info labels with data from the database."""
-        db = Database()
-        try:
+        """Update the client info labels with data from the database, fetched on a worker thread."""
+        def fetch_client(db):
             db.cursor.execute("SELECT name, control_number, address, contact_number, email FROM clients WHERE email = ?", (email,))
-            client_data = db.cursor.fetchone()
-        except Exception as e:
-            print(f"❌ Error fetching client data: {e}")
-            return
-        finally:
-            db.close_connection()
+            return db.cursor.fetchone()
+
+        db_executor.submit(
+            fetch_client,
+            key="client_info",
+            on_result=show_client_info,
+            context=client_info_view,
+        )
 
+    def show_client_info(client_data):
+        """Fill the client info labels from a clients row."""
         if client_data:
             name, control_number, address, contact_number, email = client_data
 
@@ -1410,63 +1440,21 @@ def get_client_widget(main_window, user_role=None):
                 
     def update_pet_info(client_email=None):
         """Update the pet info section with either all pets or filtered by client."""
-        db = Database()
-        try:
-            if client_email:
-                # Get client_id for filtering
-                db.cursor.execute("SELECT client_id FROM clients WHERE email = ?", (client_email,))
-                result = db.cursor.fetchone()
-                
-                if not result:
-                    print("❌ No client found with email")
-                    return
-                client_id = result[0]
-                print(f"✅ Retrieved client_id: {client_id}")
-
-                # Fetch pets for specific client
-                db.cursor.execute("""
-                    SELECT name, gender, species, breed, color, birthdate, age, weight, height, photo_path
-                    FROM pets
-                    WHERE client_id = ?
-                """, (client_id,))
-            else:
-                # Fetch all pets
-                db.cursor.execute("""
-                    SELECT name, gender, species, breed, color, birthdate, age, weight, height, photo_path
-                    FROM pets
-                """)
-
-            pets = db.cursor.fetchall()
-
-            # Clear existing widgets in the scroll layout
-            while scroll_layout.count():
-                child = scroll_layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
-
-            if pets:
-                # Create cards for all pets and add to scroll area
-                for index, pet in enumerate(pets):
-                    pet_card = create_pet_card(pet, index, user_role)
-                    scroll_layout.addWidget(pet_card)
-                    
-                    # Add separator after each pet card except the last one
-                    if index < len(pets) - 1:
-                        separator = QFrame()
-                        separator.setFrameShape(QFrame.HLine)
-                        separator.setStyleSheet("background-color: #012547;")
-                        separator.setFixedHeight(3)
-                        scroll_layout.addWidget(separator)
-            else:
-                no_pet_label = QLabel("No pets found.")
-                no_pet_label.setAlignment(Qt.AlignCenter)
-                scroll_layout.addWidget(no_pet_label)
-
-        except Exception as e:
-            print(f"❌ Error fetching pets: {e}")
-            return
-        finally:
-            db.close_connection()
+        pet_list.scrollToTop()
+        pet_model.load(client_email)
+
+    def handle_pet_action(action, row):
+        """Run a pet card button: update, schedule or records."""
+        pet = pet_model.pet(row)
+        if action == "update":
+            handle_update_pet(pet[:PET_ID_INDEX], row)
+        elif action == "schedule":
+            show_pet_appointments(pet[0])
+        elif action == "records":
+            main_window.selected_pet_name = pet[0]
+            main_window.show_pet_records()
+
+    pet_list.action_triggered.connect(handle_pet_action)
 
     def handle_update_pet(pet_data, index):
         """Handle updating a pet's information."""
@@ -1544,242 +1532,6 @@ def get_client_widget(main_window, user_role=None):
         
         client_info_stack.setCurrentIndex(2)  # Switch to pet form
 
-    def create_pet_card(pet_data, index, user_role=None):
-            pet_card = QWidget()
-            pet_card.setFixedHeight(160)
-            pet_card_layout = QHBoxLayout(pet_card)
-            pet_card_layout.setContentsMargins(10, 0, 20, 0)
-            pet_card_layout.setSpacing(20)  # Increased spacing from 10 to 20 pixels
-
-            pet_card.setStyleSheet("background-color: white; border-radius: 20px;")
-
-            # 📷 Pet photo on the left
-            pet_card_picture = QLabel()
-            pet_card_picture.setFixedSize(150, 150)
-            pet_card_picture.setAlignment(Qt.AlignCenter)
-            pet_card_picture.setStyleSheet("""
-                QLabel {
-                    background-color: white;
-                    border-radius: 75px;  /* Half of width/height for perfect circle */
-                    border: 2px solid #012547;
-                }
-            """)
-
-            # Extract photo path from the last element of pet_data
-            photo_path = pet_data[-1]  # Get the last element which should be the photo path
-            if photo_path:
-                # Create a circular pixmap
-                pixmap = QPixmap(photo_path)
-                circular_pixmap = QPixmap(150, 150)
-                circular_pixmap.fill(Qt.transparent)
-                
-                # Create a painter to draw the circular mask
-                painter = QPainter(circular_pixmap)
-                painter.setRenderHint(QPainter.Antialiasing)
-                
-                # Create a circular path
-                path = QPainterPath()
-                path.addEllipse(0, 0, 150, 150)
-                painter.setClipPath(path)
-                
-                # Calculate scaling to fill the circle
-                scaled_pixmap = pixmap.scaled(
-                    150, 150,
-                    Qt.KeepAspectRatioByExpanding,  # Changed to fill mode
-                    Qt.SmoothTransformation
-                )
-                
-                # Center the scaled pixmap
-                x = (150 - scaled_pixmap.width()) // 2
-                y = (150 - scaled_pixmap.height()) // 2
-                
-                # Draw the scaled pixmap centered
-                painter.drawPixmap(x, y, scaled_pixmap)
-                painter.end()
-                
-                pet_card_picture.setPixmap(circular_pixmap)
-            else:
-                pet_card_picture.setText("No Photo")
-                pet_card_picture.setStyleSheet("""
-                    QLabel {
-                        background-color: white;
-                        border-radius: 75px;
-                        border: 2px solid #012547;
-                        color: #012547;
-                        font-weight: bold;
-                        font-family: Lato;
-                    }
-                """)
-
-            # 📄 Pet info in the middle (two columns)
-            pet_info_widget = QWidget()
-            pet_info_main_layout = QHBoxLayout(pet_info_widget)
-            pet_info_main_layout.setContentsMargins(0, 0, 0, 0)
-            pet_info_main_layout.setSpacing(20)
-
-            left_column = QVBoxLayout()
-            right_column = QVBoxLayout()
-            left_column.setSpacing(2)
-            right_column.setSpacing(2)
-
-            # Define the fields and their corresponding indices in pet_data
-            fields = [
-                ("Name", 0),
-                ("Gender", 1),
-                ("Species", 2),
-                ("Breed", 3),
-                ("Color", 4),
-                ("Birthdate", 5),
-                ("Age", 6),
-                ("Weight", 7),
-                ("Height", 8)
-            ]
-
-            # Split fields into two columns
-            mid = (len(fields) + 1) // 2
-            left_fields = fields[:mid]
-            right_fields = fields[mid:]
-
-            for label_text, index in left_fields:
-                row_layout = QHBoxLayout()
-                value = pet_data[index]
-                label = QLabel(f"{label_text}:")
-                label.setStyleSheet("font-weight: bold; font-family: Lato;")
-                label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                
-                # Format value based on field type
-                if label_text == "Age" and value is not None:
-                    try:
-                        # Convert age to float first to handle decimal values
-                        age_value = float(value)
-                        if age_value >= 1:
-                            value = f"{int(age_value)} year{'s' if age_value > 1 else ''}"
-                        else:
-                            # Calculate months (multiply by 12 since age is in years)
-                            months = int(age_value * 12)
-                            if months >= 1:
-                                value = f"{months} month{'s' if months > 1 else ''}"
-                            else:
-                                # Calculate weeks (multiply by 52 since age is in years)
-                                weeks = int(age_value * 52)
-                                value = f"{weeks} week{'s' if weeks > 1 else ''}"
-                    except (ValueError, TypeError):
-                        value = "N/A"
-                elif label_text == "Weight" and value is not None:
-                    try:
-                        value = f"{float(value):.2f} kg"
-                    except (ValueError, TypeError):
-                        value = "N/A"
-                elif label_text == "Height" and value is not None:
-                    try:
-                        value = f"{float(value):.2f} in"
-                    except (ValueError, TypeError):
-                        value = "N/A"
-                
-                value_label = QLabel(str(value))
-                value_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                label.setFixedWidth(80)
-                row_layout.addWidget(label)
-                row_layout.addWidget(value_label)
-                row_layout.addStretch()
-                left_column.addLayout(row_layout)
-
-            for label_text, index in right_fields:
-                row_layout = QHBoxLayout()
-                value = pet_data[index]
-                label = QLabel(f"{label_text}:")
-                label.setStyleSheet("font-weight: bold; font-family: Lato;")
-                label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                
-                # Format value based on field type
-                if label_text == "Age" and value is not None:
-                    try:
-                        # Convert age to float first to handle decimal values
-                        age_value = float(value)
-                        if age_value >= 1:
-                            value = f"{int(age_value)} year{'s' if age_value > 1 else ''}"
-                        else:
-                            # Calculate months (multiply by 12 since age is in years)
-                            months = int(age_value * 12)
-                            if months >= 1:
-                                value = f"{months} month{'s' if months > 1 else ''}"
-                            else:
-                                # Calculate weeks (multiply by 52 since age is in years)
-                                weeks = int(age_value * 52)
-                                value = f"{weeks} week{'s' if weeks > 1 else ''}"
-                    except (ValueError, TypeError):
-                        value = "N/A"
-                elif label_text == "Weight" and value is not None:
-                    try:
-                        value = f"{float(value):.2f} kg"
-                    except (ValueError, TypeError):
-                        value = "N/A"
-                elif label_text == "Height" and value is not None:
-                    try:
-                        value = f"{float(value):.2f} in"
-                    except (ValueError, TypeError):
-                        value = "N/A"
-                
-                value_label = QLabel(str(value))
-                value_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                label.setFixedWidth(80)
-                row_layout.addWidget(label)
-                row_layout.addWidget(value_label)
-                row_layout.addStretch()
-                right_column.addLayout(row_layout)
-
-            pet_info_main_layout.addLayout(left_column)
-            pet_info_main_layout.addLayout(right_column)
-
-            # 🔘 Buttons on the right
-            pet_buttons_widget = QWidget()
-            pet_buttons_layout = QVBoxLayout(pet_buttons_widget)
-            pet_buttons_layout.setContentsMargins(0, 0, 0, 0)
-            pet_buttons_layout.setSpacing(5)  # Reduced spacing for compact layout
-            
-            # Create buttons
-            update_info_button = QPushButton("Update Info")
-            check_schedule_button = QPushButton("Check Schedule")
-            see_records_button = QPushButton("See Records")
-                
-            # Style buttons
-            button_style = """
-                background-color: #012547; 
-                color: white; 
-                font-family: Lato; 
-                font-size: 10px; 
-                font-weight: 700; 
-                border-radius: 15px; 
-                padding: 0;
-                margin: 0;
-            """
-            
-            for btn in [update_info_button, check_schedule_button, see_records_button]:
-                btn.setFixedSize(200, 20)
-                btn.setStyleSheet(button_style)
-                pet_buttons_layout.addWidget(btn)
-                
-            
-            # Connect the "Check Schedule" button to show the appointments dialog
-            pet_name = pet_data[0]  # Get the pet name
-            check_schedule_button.clicked.connect(lambda checked, name=pet_name: show_pet_appointments(name))
-
-            update_info_button.clicked.connect(lambda _, d=pet_data, i=index: handle_update_pet(d, i))
-            see_records_button.clicked.connect(lambda: setattr(main_window, 'selected_pet_name', pet_data[0]) or main_window.show_pet_records())
-
-            # Hide "See Records" button for Receptionist
-            if user_role and user_role.lower() == "receptionist":
-                see_records_button.hide()
-
-            pet_buttons_layout.addStretch()
-
-            # 🧩 Assemble layout: [Photo] [Info] [Buttons]
-            pet_card_layout.addWidget(pet_card_picture)
-            pet_card_layout.addWidget(pet_info_widget, 1)  # Give info widget more space
-            pet_card_layout.addWidget(pet_buttons_widget)
-
-            return pet_card
-
     def show_pet_appointments(pet_name):
         """Show a dialog with the pet's appointments."""
         from modules.appointment import PetAppointmentsDialog
@@ -1836,12 +1588,18 @@ def get_client_widget(main_window, user_role=None):
         if response == QMessageBox.Yes:
             db = Database()
             try:
+                db.cursor.execute("SELECT client_id FROM clients WHERE email = ?", (client_email,))
+                result = db.cursor.fetchone()
+                client_id = result[0] if result else None
                 db.cursor.execute("""
                     DELETE FROM pets 
                     WHERE name = ? 
-                    AND client_id = (SELECT client_id FROM clients WHERE email = ?)
-                """, (pet_name, client_email))
+                    AND client_id = ?
+                """, (pet_name, client_id))
                 db.conn.commit()
+                dashboard_stats.invalidate()
+                if client_id is not None:
+                    client_search.refresh(client_id)
                 show_message(pets_edit_widget, f"Pet \"{pet_name}\" was successfully deleted!")
 
                 # Update the pet info section
@@ -1897,7 +1655,7 @@ def get_client_widget(main_window, user_role=None):
                     db.cursor.execute("SELECT email FROM clients WHERE name = ?", (client_name,))
                     result = db.cursor.fetchone()
                 except Exception as e:
-                    print(f"❌ Error fetching client email: {e}")
+                    log.error("❌ Error fetching client email: %s", e)
                     return
                 finally:
                     db.close_connection()
@@ -1997,6 +1755,7 @@ def get_client_widget(main_window, user_role=None):
                         (name, address, contact_number, email, control_number, original_email)
                     )
                     db.conn.commit()
+                    client_search.refresh(client_id)
                     show_message(content, "Client updated successfully!")
                 else:  # Add mode
                     # Insert new client first to get the client_id
@@ -2005,6 +1764,7 @@ def get_client_widget(main_window, user_role=None):
                         (name, address, contact_number, email)
                     )
                     db.conn.commit()
+                    dashboard_stats.record_change("clients")
                     
                     # Get the new client_id
                     client_id = db.cursor.lastrowid
@@ -2018,6 +1778,7 @@ def get_client_widget(main_window, user_role=None):
                         (control_number, client_id)
                     )
                     db.conn.commit()
+                    client_search.refresh(client_id)
                     show_message(content, "Client added successfully!")
 
                 # Update the client table
@@ -2067,16 +1828,25 @@ def get_client_widget(main_window, user_role=None):
     # Connect the "+" button to the open_add_form function
     add_button.clicked.connect(open_add_form)
 
+    def refresh():
+        """Reload the client list and the pet cards currently shown (used when the page is re-entered)."""
+        update_client_table()
+        update_pet_info(pet_model.client_email)
+
+    content.refresh = refresh
+
     return content
 
 def filter_clients_table(search_text, table):
-    """Filter the clients table based on the search text."""
-    search_text = search_text.strip().lower()  # Normalize the search text
+    """Filter the clients table by client name, email or pet name using the shared index."""
+    # Kept so the search can be re-run once the index has been rebuilt
+    table.setProperty("search_text", search_text)
+    matching_names = client_search.matching_names(search_text)
     for row in range(table.rowCount()):
         cell_widget = table.cellWidget(row, 0)
         if cell_widget:
             name_label = cell_widget.findChild(QLabel)
             if name_label:
-                client_name = name_label.text().strip().lower()  # Normalize the client name
                 # Show or hide the row based on the search text
-                table.setRowHidden(row, search_text not in client_name)
\ No newline at end of file
+                show_row = matching_names is None or name_label.text() in matching_names
+                table.setRowHidden(row, not show_row)
@@ -0,0 +1,174 @@
+import threading
+import time
+import mariadb
+
+
+class PoolExhaustedError(mariadb.Error):
+    """Raised when no pooled connection becomes free within the checkout timeout."""
+
+
+class ConnectionPool:
+    """Bounded pool of MariaDB connections shared by every Database instance."""
+
+    def __init__(self, max_size=8, idle_timeout=300, checkout_timeout=10, **connect_args):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = checkout_timeout
+        self.connect_args = connect_args
+
+        self._idle = []  # (connection, released_at) pairs, most recently released last
+        self._in_use = 0
+        self._lock = threading.Condition()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "waits": 0,
+            "wait_time": 0.0,
+            "timeouts": 0,
+            "evicted": 0,
+            "failed_health_checks": 0,
+        }
+
+    def acquire(self):
+        """Check out a healthy connection, opening a new one if the pool has room."""
+        deadline = time.monotonic() + self.checkout_timeout
+        waited = False
+        wait_started = None
+
+        with self._lock:
+            while True:
+                self._evict_idle()
+
+                while self._idle:
+                    conn, _ = self._idle.pop()
+                    if self._is_healthy(conn):
+                        self._in_use += 1
+                        self._stats["hits"] += 1
+                        self._record_wait(waited, wait_started)
+                        return conn
+                    self._stats["failed_health_checks"] += 1
+                    self._close_quietly(conn)
+
+                if self._in_use < self.max_size:
+                    # Reserve the slot now, connect outside the lock
+                    self._in_use += 1
+                    self._stats["misses"] += 1
+                    self._record_wait(waited, wait_started)
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise PoolExhaustedError(
+                        f"No database connection available after {self.checkout_timeout}s "
+                        f"(pool size {self.max_size})"
+                    )
+                if not waited:
+                    waited = True
+                    wait_started = time.monotonic()
+                    self._stats["waits"] += 1
+                self._lock.wait(remaining)
+
+        try:
+            return mariadb.connect(**self.connect_args)
+        except mariadb.Error:
+            with self._lock:
+                self._in_use -= 1
+                self._lock.notify()
+            raise
+
+    def release(self, conn):
+        """Return a connection to the pool, rolling back any uncommitted work."""
+        try:
+            conn.rollback()
+            reusable = True
+        except mariadb.Error:
+            reusable = False
+
+        with self._lock:
+            self._in_use -= 1
+            if reusable:
+                self._idle.append((conn, time.monotonic()))
+            else:
+                self._close_quietly(conn)
+            self._lock.notify()
+
+    def close_all(self):
+        """Close every idle connection. Checked-out connections are closed on release."""
+        with self._lock:
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._close_quietly(conn)
+
+    def stats(self):
+        """Return a snapshot of the pool counters for sizing under real load."""
+        with self._lock:
+            snapshot = dict(self._stats)
+            snapshot["idle"] = len(self._idle)
+            snapshot["in_use"] = self._in_use
+            snapshot["max_size"] = self.max_size
+            checkouts = snapshot["hits"] + snapshot["misses"]
+            snapshot["hit_ratio"] = snapshot["hits"] / checkouts if checkouts else 0.0
+            snapshot["avg_wait"] = snapshot["wait_time"] / snapshot["waits"] if snapshot["waits"] else 0.0
+            return snapshot
+
+    def _evict_idle(self):
+        """Drop connections that have sat idle longer than idle_timeout."""
+        now = time.monotonic()
+        keep = []
+        for conn, released_at in self._idle:
+            if now - released_at > self.idle_timeout:
+                self._stats["evicted"] += 1
+                self._close_quietly(conn)
+            else:
+                keep.append((conn, released_at))
+        self._idle = keep
+
+    def _record_wait(self, waited, wait_started):
+        if waited:
+            self._stats["wait_time"] += time.monotonic() - wait_started
+
+    @staticmethod
+    def _is_healthy(conn):
+        try:
+            conn.ping()
+            return True
+        except mariadb.Error:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except mariadb.Error:
+            pass
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(host, user, password, database, **options):
+    """Return the process-wide pool for these credentials, creating it on first use."""
+    key = (host, user, password, database)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(host=host, user=user, password=password, database=database, **options)
+            _pools[key] = pool
+        return pool
+
+
+def get_pool_stats():
+    """Return statistics for every pool created in this process, keyed by host/database."""
+    with _pools_lock:
+        pools = list(_pools.items())
+    return {f"{user}@{host}/{database}": pool.stats() for (host, user, _, database), pool in pools}
+
+
+def close_all_pools():
+    """Close idle connections in every pool, e.g. when the application exits."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close_all()
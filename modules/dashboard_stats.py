@@ -0,0 +1,87 @@
+import threading
+import time
+import mariadb
+from modules.log import get_logger
+
+log = get_logger(__name__)
+
+TREATMENT_TABLES = ("consultations", "deworming", "vaccinations", "surgeries", "grooming", "other_treatments")
+
+# One round trip for every dashboard counter
+COUNTS_QUERY = """
+    SELECT
+        (SELECT COUNT(*) FROM clients) AS clients,
+        {treatments} AS medical_records,
+        (SELECT COUNT(*) FROM appointments) AS appointments
+""".format(treatments=" + ".join(f"(SELECT COUNT(*) FROM {table})" for table in TREATMENT_TABLES))
+
+
+class DashboardStats:
+    """TTL cache for the home screen counters, kept current by the Database write methods."""
+
+    COUNTERS = ("clients", "medical_records", "appointments")
+
+    def __init__(self, ttl=60):
+        self.ttl = ttl
+        self._counts = None
+        self._loaded_at = 0.0
+        # Moves on every change, so a query that overlapped one is not cached over it
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_counts(self, db=None):
+        """Return (clients, medical_records, appointments), querying only when the cache is stale."""
+        with self._lock:
+            if self._counts is not None and time.monotonic() - self._loaded_at < self.ttl:
+                return tuple(self._counts[name] for name in self.COUNTERS)
+            generation = self._generation
+
+        counts = self._query(db)
+        if counts is None:
+            return 0, 0, 0
+
+        with self._lock:
+            if self._generation == generation:
+                self._counts = dict(zip(self.COUNTERS, counts))
+                self._loaded_at = time.monotonic()
+            else:
+                # The query may or may not have seen that change; keep the cache stale and ask again next time
+                log.debug("Counts changed while they were queried; not caching them")
+        return counts
+
+    def record_change(self, counter, delta=1):
+        """Adjust a cached counter after a committed insert (delta=1) or delete (delta=-1)."""
+        with self._lock:
+            self._generation += 1
+            if self._counts is not None:
+                self._counts[counter] = max(0, self._counts[counter] + delta)
+
+    def invalidate(self):
+        """Force the next read to re-query, e.g. after a cascading delete."""
+        with self._lock:
+            self._generation += 1
+            self._counts = None
+
+    def _query(self, db):
+        # Imported here because modules.database imports this module
+        from modules.database import Database
+
+        owns_connection = db is None
+        if owns_connection:
+            db = Database()
+        try:
+            if not db.cursor:
+                log.error("❌ Database not connected.")
+                return None
+            db.cursor.execute(COUNTS_QUERY)
+            row = db.cursor.fetchone()
+            return tuple(int(value or 0) for value in row)
+        except mariadb.Error as e:
+            log.error("❌ Error fetching counts: %s", e)
+            return None
+        finally:
+            if owns_connection:
+                db.close_connection()
+
+
+dashboard_stats = DashboardStats()
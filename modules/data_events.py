@@ -0,0 +1,45 @@
+import threading
+from modules.log import get_logger
+
+log = get_logger(__name__)
+
+INSERT, UPDATE, DELETE = "insert", "update", "delete"
+
+
+class DataEvents:
+    """In-process notice of committed writes: (entity, primary key, operation).
+
+    Database write methods publish here after their commit, with the table
+    name as the entity, so open screens can patch the one row that changed
+    instead of reloading everything. Listeners run on the thread that made
+    the write; the screens write from the UI thread.
+    """
+
+    def __init__(self):
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, listener, owner=None):
+        """Call listener(entity, pk, op) after every write; stop when owner (a QObject) is destroyed."""
+        with self._lock:
+            self._listeners.append(listener)
+        if owner is not None:
+            owner.destroyed.connect(lambda *_: self.unsubscribe(listener))
+
+    def unsubscribe(self, listener):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def publish(self, entity, pk, op):
+        log.debug("%s %s %s", op, entity, pk)
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(entity, pk, op)
+            except Exception:
+                log.exception("❌ Error handling %s of %s %s", op, entity, pk)
+
+
+data_events = DataEvents()
@@ -1,441 +1,137 @@
 import mariadb
 import hashlib
 from datetime import datetime
+from modules.connection_pool import get_pool, get_pool_stats
+from modules.migrations import ensure_schema, run_migrations
+from modules.dashboard_stats import dashboard_stats
+from modules.reference_data import reference_data
+from modules.query_stats import InstrumentedCursor, query_stats
+from modules.table_versions import table_versions, VersionedConnection
+from modules.sequences import (
+    allocate, peek, invoice_prefix, format_invoice_no, user_id_prefix, format_user_id
+)
+from modules.date_windows import date_window, date_range_sql
+from modules.treatment_events import (
+    events_query, EVENT_TYPE, EVENT_DATE, EVENT_VETERINARIAN, EVENT_PET_NAME, EVENT_CLIENT_NAME,
+    REPORT_TABLES, RISK_STATUS_REPORTS
+)
+from modules.data_events import data_events, INSERT, UPDATE, DELETE
+from modules.log import get_logger
+
+log = get_logger(__name__)
 
 class Database:
-    def __init__(self, host="localhost", user="root", password="", database="petmedix"):
+    # Rows of fetch_appointments_page / fetch_appointment; the last three columns are the keyset
+    APPOINTMENT_PAGE_QUERY = """
+        SELECT 
+            DATE_FORMAT(a.date, '%Y-%m-%d') as date,
+            TIME_FORMAT(a.time, '%H:%i:%s') as time,
+            p.name, c.name, a.reason, a.status, 
+            a.payment_status, a.veterinarian,
+            a.date, a.time, a.appointment_id
+        FROM appointments a
+        JOIN pets p ON a.pet_id = p.pet_id
+        JOIN clients c ON a.client_id = c.client_id
+    """
+
+    # Columns the appointment search looks in, as displayed by the appointments screen
+    APPOINTMENT_SEARCH_COLUMNS = (
+        "DATE_FORMAT(a.date, '%Y-%m-%d')", "TIME_FORMAT(a.time, '%h:%i %p')", "p.name", "c.name",
+        "a.reason", "a.status", "a.payment_status", "a.veterinarian",
+    )
+
+    # Rows of fetch_billing_data / fetch_billing_row
+    BILLING_ROW_QUERY = """
+        SELECT b.billing_id, b.invoice_no, b.date_issued, c.name as client_name, 
+            p.name as pet_name, b.total_amount, b.payment_method, b.payment_status
+        FROM billing b
+        JOIN clients c ON b.client_id = c.client_id
+        JOIN pets p ON b.pet_id = p.pet_id
+    """
+
+    # Used when no database is passed; benchmarks point every screen at a scratch database with it
+    default_database = "petmedix"
+
+    def __init__(self, host="localhost", user="root", password="", database=None):
+        self._pool = get_pool(host, user, password, database or Database.default_database)
+        conn = None
         try:
-            self.conn = mariadb.connect(
-                host=host,
-                user=user,
-                password=password,
-                database=database
-            )
-            self.cursor = self.conn.cursor()
-            print("✅ Database connection established.")
-            self.create_tables()
+            conn = self._pool.acquire()
+            self.conn = VersionedConnection(conn, table_versions)
+            # Every statement's latency and row count is recorded in query_stats,
+            # and every committed write bumps its table's version for screens to notice
+            self.cursor = InstrumentedCursor(self.conn.cursor(), query_stats, self.conn.note_statement)
+            ensure_schema(self, self._pool)
         except mariadb.Error as e:
-            print(f"❌ Error connecting to MariaDB: {e}")
+            log.error("❌ Error connecting to MariaDB: %s", e)
+            if conn is not None:
+                # Acquired but unusable: hand it back, or its pool slot is lost for good
+                self._pool.release(conn)
             self.conn = None
             self.cursor = None
 
-    def create_tables(self):
-        """Create all necessary tables if they don't exist."""
-        try:
-            # Users Table (No foreign key dependencies)
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                user_id VARCHAR(10) PRIMARY KEY,
-                name VARCHAR(100) NOT NULL,
-                last_name VARCHAR(100),
-                email VARCHAR(100) NOT NULL UNIQUE,
-                hashed_password VARCHAR(64) NOT NULL,
-                role VARCHAR(50) NOT NULL,
-                status VARCHAR(20) DEFAULT 'Pending',
-                license_number VARCHAR(50),
-                created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-            """)
+    def __enter__(self):
+        return self
 
-            # Check if license_number column exists in users table
-            self.cursor.execute("SHOW COLUMNS FROM users LIKE 'license_number'")
-            if not self.cursor.fetchone():
-                print("Adding license_number column to users table...")
-                self.cursor.execute("ALTER TABLE users ADD COLUMN license_number VARCHAR(50)")
-                self.conn.commit()
-                print("✅ license_number column added to users table")
-                
-                # Generate license numbers for existing veterinarians
-                self.generate_license_numbers()
-            else:
-                # Update any old format license numbers
-                self.update_old_license_numbers()
-
-            # Check if risk_status column exists in consultations table
-            self.cursor.execute("SHOW COLUMNS FROM consultations LIKE 'risk_status'")
-            if not self.cursor.fetchone():
-                print("Adding risk_status column to consultations table...")
-                self.cursor.execute("ALTER TABLE consultations ADD COLUMN risk_status ENUM('Low Risk', 'Medium Risk', 'High Risk') DEFAULT 'Low Risk'")
-                self.conn.commit()
-                print("✅ risk_status column added to consultations table")
-
-            # Check if control_number column exists in clients table
-            self.cursor.execute("SHOW COLUMNS FROM clients LIKE 'control_number'")
-            if not self.cursor.fetchone():
-                print("Adding control_number column to clients table...")
-                self.cursor.execute("ALTER TABLE clients ADD COLUMN control_number VARCHAR(20) UNIQUE")
-                self.conn.commit()
-                print("✅ control_number column added to clients table")
-
-            # Check if time column exists in appointments table
-            self.cursor.execute("SHOW COLUMNS FROM appointments LIKE 'time'")
-            if not self.cursor.fetchone():
-                print("Adding time column to appointments table...")
-                self.cursor.execute("ALTER TABLE appointments ADD COLUMN time TIME NOT NULL AFTER date")
-                self.conn.commit()
-                print("✅ Time column added to appointments table")
-
-            # Clients Table (No foreign key dependencies)
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS clients (
-                client_id INT AUTO_INCREMENT PRIMARY KEY,
-                name VARCHAR(100) NOT NULL,
-                address VARCHAR(255),
-                contact_number VARCHAR(15),
-                email VARCHAR(100) UNIQUE,
-                control_number VARCHAR(20) UNIQUE
-            );
-            """)
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close_connection()
+        return False
 
-            # Pets Table (Depends on clients)
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS pets (
-                pet_id INT AUTO_INCREMENT PRIMARY KEY,
-                client_id INT NOT NULL,
-                name VARCHAR(100) NOT NULL,
-                gender ENUM('Male', 'Female'),
-                species VARCHAR(50),
-                breed VARCHAR(50),
-                color VARCHAR(50),
-                birthdate DATE,
-                age INT,
-                weight DECIMAL(10,2),
-                height DECIMAL(10,2),
-                photo_path VARCHAR(255),
-                FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
-            );
-            """)
+    def __del__(self):
+        # Handlers that never call close_connection() must not leak a pool slot
+        if getattr(self, "conn", None):
+            self.close_connection()
 
-            # Billing Table (Depends on clients and pets)
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS billing (
-                billing_id INT AUTO_INCREMENT PRIMARY KEY,
-                invoice_no VARCHAR(50),
-                client_id INT NOT NULL,
-                pet_id INT NOT NULL,
-                date_issued DATE NOT NULL,
-                subtotal DECIMAL(10, 2) NOT NULL DEFAULT 0.00,
-                vat DECIMAL(10, 2) NOT NULL DEFAULT 0.00,
-                total_amount DECIMAL(10, 2) NOT NULL,
-                payment_status ENUM('PAID', 'UNPAID', 'PARTIAL') NOT NULL,
-                partial_amount DECIMAL(10, 2) DEFAULT 0.00,
-                payment_method ENUM('CASH', 'CREDIT CARD', 'GCASH', 'BANK TRANSFER'),
-                received_by VARCHAR(100),
-                reason VARCHAR(200),
-                veterinarian VARCHAR(100),
-                notes TEXT,
-                FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE,
-                FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE
-            );
-            """)
-            
-            # Billing Services Table (Depends on billing)
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS billing_services (
-                service_id INT AUTO_INCREMENT PRIMARY KEY,
-                billing_id INT NOT NULL,
-                service_description VARCHAR(255) NOT NULL,
-                quantity INT NOT NULL,
-                unit_price DECIMAL(10, 2) NOT NULL,
-                line_total DECIMAL(10, 2) NOT NULL,
-                service_date DATE,
-                FOREIGN KEY (billing_id) REFERENCES billing(billing_id) ON DELETE CASCADE
-            );
-            """)
-
-            # Clinic Information Table (No foreign key dependencies)
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS clinic_info (
-                clinic_id INT AUTO_INCREMENT PRIMARY KEY,
-                name VARCHAR(100) NOT NULL,
-                address VARCHAR(255),
-                contact_number VARCHAR(15),
-                email VARCHAR(100),
-                employees_count INT,
-                photo_path VARCHAR(255),
-                logo_path VARCHAR(255),
-                vet_license VARCHAR(20)
-            );
-            """)
+    @staticmethod
+    def pool_stats():
+        """Return hit/miss/wait statistics for the shared connection pools."""
+        return get_pool_stats()
 
-            # Check if vet_license column exists in clinic_info table
-            self.cursor.execute("SHOW COLUMNS FROM clinic_info LIKE 'vet_license'")
-            if not self.cursor.fetchone():
-                print("Adding vet_license column to clinic_info table...")
-                self.cursor.execute("ALTER TABLE clinic_info ADD COLUMN vet_license VARCHAR(20)")
-                self.conn.commit()
-                print("✅ vet_license column added to clinic_info table")
-
-            # User Profiles Table (Depends on users)
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_profiles (
-                profile_id INT AUTO_INCREMENT PRIMARY KEY,
-                user_id VARCHAR(10) NOT NULL,
-                contact_number VARCHAR(15),
-                address VARCHAR(255),
-                gender VARCHAR(20),
-                birthdate DATE,
-                photo_path VARCHAR(255),
-                FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
-            );
-            """)
-
-            # Security Questions Table (Depends on users)
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS security_questions (
-                question_id INT AUTO_INCREMENT PRIMARY KEY,
-                user_id VARCHAR(10) NOT NULL,
-                question_one VARCHAR(255) NOT NULL,
-                answer_one VARCHAR(255) NOT NULL,
-                question_two VARCHAR(255) NOT NULL,
-                answer_two VARCHAR(255) NOT NULL,
-                question_three VARCHAR(255) NOT NULL,
-                answer_three VARCHAR(255) NOT NULL,
-                FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
-            );
-            """)
-
-            # Password History Table (Depends on users)
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS password_history (
-                history_id INT AUTO_INCREMENT PRIMARY KEY,
-                user_id VARCHAR(10) NOT NULL,
-                hashed_password VARCHAR(64) NOT NULL,
-                created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
-            );
-            """)
-
-            # Consultations Table (Depends on pets and clients)
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS consultations (
-                consultation_id INT AUTO_INCREMENT PRIMARY KEY,
-                pet_id INT NOT NULL,
-                client_id INT NOT NULL,
-                date DATE NOT NULL,
-                reason TEXT NOT NULL,
-                diagnosis TEXT NOT NULL,
-                prescribed_treatment TEXT NOT NULL,
-                veterinarian VARCHAR(100) NOT NULL,
-                risk_status ENUM('Low Risk', 'Medium Risk', 'High Risk') DEFAULT 'Low Risk',
-                FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE,
-                FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
-            );
-            """)
-
-            # Deworming Table (Depends on pets and clients)
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS deworming (
-                deworming_id INT AUTO_INCREMENT PRIMARY KEY,
-                pet_id INT NOT NULL,
-                client_id INT NOT NULL,
-                date DATE NOT NULL,
-                medication TEXT NOT NULL,
-                dosage TEXT NOT NULL,
-                next_scheduled DATE NOT NULL,
-                veterinarian VARCHAR(100) NOT NULL,
-                FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE,
-                FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
-            );
-            """)
-
-            # Vaccination Table (Depends on pets and clients)
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS vaccinations (
-                vaccination_id INT AUTO_INCREMENT PRIMARY KEY,
-                pet_id INT NOT NULL,
-                client_id INT NOT NULL,
-                date DATE NOT NULL,
-                vaccine TEXT NOT NULL,
-                dosage TEXT NOT NULL,
-                next_scheduled DATE NOT NULL,
-                veterinarian VARCHAR(100) NOT NULL,
-                FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE,
-                FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
-            );
-            """)
-
-            # Surgery Table (Depends on pets and clients)
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS surgeries (
-                surgery_id INT AUTO_INCREMENT PRIMARY KEY,
-                pet_id INT NOT NULL,
-                client_id INT NOT NULL,
-                date DATE NOT NULL,
-                surgery_type TEXT NOT NULL,
-                anesthesia TEXT NOT NULL,
-                next_followup DATE NOT NULL,
-                veterinarian VARCHAR(100) NOT NULL,
-                risk_status VARCHAR(20) DEFAULT 'Low Risk',
-                FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE,
-                FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
-            );
-            """)
-
-            # Grooming Table (Depends on pets and clients)
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS grooming (
-                grooming_id INT AUTO_INCREMENT PRIMARY KEY,
-                pet_id INT NOT NULL,
-                client_id INT NOT NULL,
-                date DATE NOT NULL,
-                services TEXT NOT NULL,
-                notes TEXT NOT NULL,
-                next_scheduled DATE NOT NULL,
-                veterinarian VARCHAR(100) NOT NULL,
-                FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE,
-                FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
-            );
-            """)
-
-            # Other Treatments Table (Depends on pets and clients)
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS other_treatments (
-                treatment_id INT AUTO_INCREMENT PRIMARY KEY,
-                pet_id INT NOT NULL,
-                client_id INT NOT NULL,
-                date DATE NOT NULL,
-                treatment_type TEXT NOT NULL,
-                medication TEXT NOT NULL,
-                dosage TEXT NOT NULL,
-                veterinarian VARCHAR(100) NOT NULL,
-                FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE,
-                FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
-            );
-            """)
-
-            # Pet Notes Table (Depends on pets)
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS pet_notes (
-                note_id INT AUTO_INCREMENT PRIMARY KEY,
-                pet_id INT NOT NULL,
-                note_type VARCHAR(20) NOT NULL CHECK (note_type IN ('past_illnesses', 'medical_history')),
-                notes TEXT,
-                last_updated TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE KEY pet_note_type (pet_id, note_type),
-                FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE
-            );
-            """)
-
-            # Create indexes for pet_notes
-            self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_pet_notes_pet_id ON pet_notes(pet_id);")
-            self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_pet_notes_type ON pet_notes(note_type);")
-
-            # Appointments Table (Depends on pets and clients)
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS appointments (
-                appointment_id INT AUTO_INCREMENT PRIMARY KEY,
-                pet_id INT NOT NULL,
-                client_id INT NOT NULL,
-                date DATE NOT NULL,
-                time TIME NOT NULL,
-                status ENUM('Scheduled', 'Completed', 'Cancelled', 'No-Show', 'Rescheduled', 'Urgent') NOT NULL,
-                payment_status ENUM('Pending', 'Paid', 'Unpaid') NOT NULL,
-                reason TEXT,
-                veterinarian VARCHAR(100),
-                FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE,
-                FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
-            );
-            """)
-
-            # Ensure the status column exists in users table
-            try:
-                self.cursor.execute("SHOW COLUMNS FROM users LIKE 'status'")
-                if not self.cursor.fetchone():
-                    self.cursor.execute("ALTER TABLE users ADD COLUMN status VARCHAR(20) DEFAULT 'Pending'")
-                    print("✅ 'status' column added to users table")
-            except mariadb.Error as e:
-                print(f"❌ Error checking/adding 'status' column: {e}")
-
-            # Create default admin account if it doesn't exist
-            self.cursor.execute("SELECT 1 FROM users WHERE role = 'Admin'")
-            if not self.cursor.fetchone():
-                admin_id = "2025A0001"
-                name = "Admin"
-                email = "admin@petmedix.com"
-                password = "admin123"
-                hashed_password = hashlib.sha256(password.encode()).hexdigest()
-                
-                try:
-                    self.cursor.execute("""
-                        INSERT INTO users (user_id, name, email, hashed_password, role, status, created_date)
-                        VALUES (?, ?, ?, ?, 'Admin', 'Verified', NOW())
-                    """, (admin_id, name, email, hashed_password))
-                    self.conn.commit()
-                    print("✅ Default admin account created")
-                except mariadb.Error as e:
-                    print(f"❌ Error creating admin account: {e}")
-                    # If the error is due to duplicate entry, try to update the existing admin
-                    if "Duplicate entry" in str(e):
-                        self.cursor.execute("""
-                            UPDATE users 
-                            SET hashed_password = ?, status = 'Verified'
-                            WHERE role = 'Admin'
-                        """, (hashed_password,))
-                        self.conn.commit()
-                        print("✅ Admin account updated")
-
-            self.conn.commit()
-            print("✅ Tables created successfully.")
-        except mariadb.Error as e:
-            print(f"❌ Error creating tables: {e}")
-
-    def _ensure_billing_columns(self):
-        """Make sure the billing table has all required columns."""
+    def create_tables(self):
+        """Apply any pending schema migrations (see modules/migrations.py)."""
         try:
-            # Check if columns exist and add them if they don't
-            self.cursor.execute("SHOW COLUMNS FROM billing LIKE 'invoice_no'")
-            if not self.cursor.fetchone():
-                self.cursor.execute("ALTER TABLE billing ADD COLUMN invoice_no VARCHAR(50)")
-                
-            self.cursor.execute("SHOW COLUMNS FROM billing LIKE 'reason'")
-            if not self.cursor.fetchone():
-                self.cursor.execute("ALTER TABLE billing ADD COLUMN reason TEXT")
-                
-            self.cursor.execute("SHOW COLUMNS FROM billing LIKE 'veterinarian'")
-            if not self.cursor.fetchone():
-                self.cursor.execute("ALTER TABLE billing ADD COLUMN veterinarian VARCHAR(100)")
-                
-            self.conn.commit()
-            print("✅ Billing table columns verified.")
+            run_migrations(self)
         except mariadb.Error as e:
-            print(f"❌ Error ensuring billing columns: {e}")
+            log.error("❌ Error creating tables: %s", e)
 
     def close_connection(self):
-        """Close the database connection."""
+        """Return the connection to the shared pool."""
         if self.conn:
-            self.conn.close()
-            print("✅ Database connection closed.")
+            try:
+                self.cursor.close()
+            except mariadb.Error:
+                pass
+            self._pool.release(self.conn.raw)
+            self.conn = None
+            self.cursor = None
 
     def generate_user_id(self, role):
-        """Generate a new USER_ID based on role (2025R0001 for Receptionist, 2025V0001 for Veterinarian)."""
-        year = datetime.now().year
-        prefix = f"{year}{'R' if role == 'Receptionist' else 'V'}"
+        """Reserve the next USER_ID for role (2025R0001 for Receptionist, 2025V0001 for Veterinarian).
+
+        Call inside the transaction that inserts the user: the number is only
+        taken for good when that transaction commits.
+        """
+        user_ids = self.generate_user_ids(role)
+        return user_ids[0] if user_ids else None
+
+    def generate_user_ids(self, role, count=1):
+        """Reserve count consecutive USER_IDs for role in one statement (for bulk imports)."""
+        prefix = user_id_prefix(datetime.now().year, role)
         try:
-            self.cursor.execute(
-                "SELECT USER_ID FROM users WHERE USER_ID LIKE ? ORDER BY USER_ID DESC LIMIT 1",
-                (prefix + '%',)
-            )
-            last_id = self.cursor.fetchone()
-            if last_id:
-                last_number = int(last_id[0][-4:])
-                next_number = last_number + 1
-            else:
-                next_number = 1
-            return f"{prefix}{str(next_number).zfill(4)}"
+            return [format_user_id(prefix, n) for n in allocate(self.cursor, prefix, count)]
         except mariadb.Error as e:
-            print(f"❌ Error generating USER_ID: {e}")
-            return None
+            log.error("❌ Error generating USER_ID: %s", e)
+            return []
 
     def create_user(self, name, last_name, email, password, role, status='Pending', license_number=None):
         """Insert a user with a generated USER_ID. Status can be set (default 'Pending')."""
         if not self.cursor:
-            print("❌ Database not connected.")
+            log.error("❌ Database not connected.")
             return None
 
         user_id = self.generate_user_id(role)
         if not user_id:
-            print("❌ Could not generate USER_ID.")
+            log.error("❌ Could not generate USER_ID.")
             return None
 
         hashed_password = hashlib.sha256(password.encode()).hexdigest()
@@ -445,16 +141,19 @@ class Database:
                 (user_id, name, last_name, email, hashed_password, role, status, license_number)
             )
             self.conn.commit()
-            print(f"✅ User created with USER_ID: {user_id}")
+            reference_data.invalidate_users()
+            log.info("✅ User created with USER_ID: %s", user_id)
             return user_id  # Return the generated USER_ID
         except Exception as e:
-            print(f"❌ Error inserting user: {e}")
+            # Also hands the reserved USER_ID back to the sequence
+            self.conn.rollback()
+            log.error("❌ Error inserting user: %s", e)
             return None
             
     def authenticate_user(self, identifier, password):
         """Authenticate a user by email or user_id and password."""
         if not self.cursor:
-            print("❌ Database connection not established. Cannot authenticate user.")
+            log.error("❌ Database connection not established. Cannot authenticate user.")
             return None
 
         hashed_password = hashlib.sha256(password.encode()).hexdigest()  # Hash the input password
@@ -499,76 +198,36 @@ class Database:
                     "status": user[4]
                 }
             else:
-                print(f"❌ No user found with identifier: {identifier}")
+                log.error("❌ No user found with identifier: %s", identifier)
                 return None
         except Exception as e:
-            print(f"❌ Error authenticating user: {e}")
+            log.error("❌ Error authenticating user: %s", e)
             return None
 
     def user_exists(self, email):
         """Check if a user already exists by email."""
         if not self.cursor:
-            print("Database connection not established. Cannot check user existence.")
+            log.error("Database connection not established. Cannot check user existence.")
             return False
 
         try:
             self.cursor.execute("SELECT 1 FROM users WHERE EMAIL = ?", (email,))
             return self.cursor.fetchone() is not None
         except mariadb.Error as e:
-            print(f"Error checking user existence: {e}")
+            log.error("Error checking user existence: %s", e)
             return False
         
     def fetch_counts(self):
-        """Fetch counts for clients, medical records, and appointments from the database."""
+        """Fetch counts for clients, medical records, and appointments (cached, see dashboard_stats)."""
         if not self.cursor:
-            print("❌ Database not connected.")
+            log.error("❌ Database not connected.")
             return 0, 0, 0  # Default counts
-
-        try:
-            # Count clients
-            self.cursor.execute("SELECT COUNT(*) FROM clients")
-            clients_count = self.cursor.fetchone()[0]
-
-            # Count medical records from all treatment tables
-            total_medical_records = 0
-            
-            # Count consultations
-            self.cursor.execute("SELECT COUNT(*) FROM consultations")
-            total_medical_records += self.cursor.fetchone()[0]
-            
-            # Count deworming records
-            self.cursor.execute("SELECT COUNT(*) FROM deworming")
-            total_medical_records += self.cursor.fetchone()[0]
-            
-            # Count vaccination records
-            self.cursor.execute("SELECT COUNT(*) FROM vaccinations")
-            total_medical_records += self.cursor.fetchone()[0]
-            
-            # Count surgery records
-            self.cursor.execute("SELECT COUNT(*) FROM surgeries")
-            total_medical_records += self.cursor.fetchone()[0]
-            
-            # Count grooming records
-            self.cursor.execute("SELECT COUNT(*) FROM grooming")
-            total_medical_records += self.cursor.fetchone()[0]
-            
-            # Count other treatments records
-            self.cursor.execute("SELECT COUNT(*) FROM other_treatments")
-            total_medical_records += self.cursor.fetchone()[0]
-
-            # Count appointments
-            self.cursor.execute("SELECT COUNT(*) FROM appointments")
-            appointments_count = self.cursor.fetchone()[0]
-
-            return clients_count, total_medical_records, appointments_count
-        except mariadb.Error as e:
-            print(f"❌ Error fetching counts: {e}")
-            return 0, 0, 0  # Default counts in case of an error
+        return dashboard_stats.get_counts(self)
         
     def save_client(self, name, address, contact_number, email):
         """Save or update a client in the database."""
         if not self.cursor:
-            print("❌ Database not connected.")
+            log.error("❌ Database not connected.")
             return False
 
         try:
@@ -603,16 +262,18 @@ class Database:
                 """, (control_number, client_id))
 
             self.conn.commit()
-            print("✅ Client saved successfully.")
+            if not result:
+                dashboard_stats.record_change("clients")
+            log.info("✅ Client saved successfully.")
             return True
         except mariadb.Error as e:
-            print(f"❌ Error saving client: {e}")
+            log.error("❌ Error saving client: %s", e)
             return False
 
     def get_client_info(self, email):
         """Fetch client information by email."""
         if not self.cursor:
-            print("❌ Database not connected.")
+            log.error("❌ Database not connected.")
             return None
 
         try:
@@ -623,26 +284,61 @@ class Database:
             """, (email,))
             return self.cursor.fetchone()
         except mariadb.Error as e:
-            print(f"❌ Error fetching client info: {e}")
+            log.error("❌ Error fetching client info: %s", e)
             return None
             
-    def save_appointment(self, pet_id, client_id, date, status, payment_status, reason, veterinarian):
-        """Save an appointment to the database."""
+    def save_appointment(self, pet_id, client_id, date, status, payment_status, reason, veterinarian, time=None):
+        """Save an appointment to the database and return its appointment_id."""
         try:
             self.cursor.execute("""
-                INSERT INTO appointments (pet_id, client_id, date, status, payment_status, reason, veterinarian)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (pet_id, client_id, date, status, payment_status, reason, veterinarian))
+                INSERT INTO appointments (pet_id, client_id, date, time, status, payment_status, reason, veterinarian)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (pet_id, client_id, date, time, status, payment_status, reason, veterinarian))
+            appointment_id = self.cursor.lastrowid
             self.conn.commit()  # Ensure the transaction is committed
-            print("✅ Appointment saved successfully.")
+            dashboard_stats.record_change("appointments")
+            data_events.publish("appointments", appointment_id, INSERT)
+            log.info("✅ Appointment saved successfully.")
+            return appointment_id
         except Exception as e:
-            print(f"❌ Error saving appointment: {e}")
+            log.error("❌ Error saving appointment: %s", e)
             raise
-        
-    def fetch_appointments(self):
-        """Fetch all appointments with pet and client information."""
+
+    def update_appointment(self, appointment_id, pet_id, client_id, date, time, status, payment_status,
+                           reason, veterinarian):
+        """Update an appointment by its appointment_id; errors are raised like save_appointment's."""
         try:
             self.cursor.execute("""
+                UPDATE appointments
+                SET date = ?, time = ?, status = ?, payment_status = ?,
+                    reason = ?, veterinarian = ?, pet_id = ?, client_id = ?
+                WHERE appointment_id = ?
+            """, (date, time, status, payment_status, reason, veterinarian, pet_id, client_id, appointment_id))
+            self.conn.commit()
+        except mariadb.Error:
+            self.conn.rollback()
+            raise
+        data_events.publish("appointments", appointment_id, UPDATE)
+
+    def delete_appointment(self, appointment_id):
+        """Delete an appointment by its appointment_id. Returns True if a row was deleted."""
+        try:
+            self.cursor.execute("DELETE FROM appointments WHERE appointment_id = ?", (appointment_id,))
+            deleted = self.cursor.rowcount
+            self.conn.commit()
+        except mariadb.Error:
+            self.conn.rollback()
+            raise
+        if deleted:
+            dashboard_stats.record_change("appointments", -deleted)
+            data_events.publish("appointments", appointment_id, DELETE)
+        return deleted > 0
+        
+    def fetch_appointments(self, start=None, end=None):
+        """Fetch all appointments with pet and client information, optionally dated in [start, end)."""
+        range_sql, params = date_range_sql("a.date", (start, end))
+        try:
+            self.cursor.execute(f"""
                 SELECT 
                     DATE_FORMAT(a.date, '%Y-%m-%d') as date,
                     TIME_FORMAT(a.time, '%H:%i:%s') as time,
@@ -651,149 +347,299 @@ class Database:
                 FROM appointments a
                 JOIN pets p ON a.pet_id = p.pet_id
                 JOIN clients c ON a.client_id = c.client_id
+                WHERE 1 = 1{range_sql}
                 ORDER BY a.date DESC, a.time DESC
-            """)
+            """, tuple(params))
             return self.cursor.fetchall()
         except mariadb.Error as e:
-            print(f"Error fetching appointments: {e}")
+            log.error("Error fetching appointments: %s", e)
             return []
         
-    def save_billing(self, client_id, pet_id, date_issued, total_amount, payment_status, 
-                    payment_method, received_by, invoice_no, reason, veterinarian, notes,
-                    subtotal=0.00, vat=0.00, partial_amount=0.00):
-        """Save billing information to database."""
+    def fetch_appointments_page(self, after_date=None, after_time=None, after_id=None, limit=200,
+                                search=None, status=None):
+        """Fetch one page of appointments (newest first) after the given keyset position.
+
+        Pass the date, time and appointment_id of the last row of the previous page
+        (the last three columns of each row) to get the next page; leave them as None
+        for the first page. status keeps one status only; search keeps appointments
+        where every word of it occurs in one of the displayed columns.
+        """
+        query = self.APPOINTMENT_PAGE_QUERY
+        conditions = []
+        params = []
+        if after_date is not None:
+            # Keyset condition on (date, time, appointment_id), newest first
+            conditions.append("""(
+                a.date < ?
+                OR (a.date = ? AND a.time < ?)
+                OR (a.date = ? AND a.time = ? AND a.appointment_id < ?)
+            )""")
+            params += [after_date, after_date, after_time, after_date, after_time, after_id]
+        if status is not None:
+            conditions.append("a.status = ?")
+            params.append(status)
+        for word in (search or "").split():
+            conditions.append("(" + " OR ".join(f"{column} LIKE ?" for column in self.APPOINTMENT_SEARCH_COLUMNS) + ")")
+            pattern = "%" + word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            params += [pattern] * len(self.APPOINTMENT_SEARCH_COLUMNS)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY a.date DESC, a.time DESC, a.appointment_id DESC LIMIT ?"
+        params.append(limit)
         try:
-            print(f"\n=== Debug: Saving Billing ===")
-            print(f"client_id: {client_id}")
-            print(f"pet_id: {pet_id}")
-            print(f"date_issued: {date_issued}")
-            print(f"total_amount: {total_amount}")
-            print(f"payment_status: {payment_status}")
-            print(f"payment_method: {payment_method}")
-            print(f"received_by: {received_by}")
-            print(f"invoice_no: {invoice_no}")
-            print(f"reason: {reason}")
-            print(f"veterinarian: {veterinarian}")
-            print(f"notes: {notes}")
-            print(f"subtotal: {subtotal}")
-            print(f"vat: {vat}")
-            print(f"partial_amount: {partial_amount}")
-
-            # Validate required fields
-            if not client_id or not pet_id or not date_issued or not total_amount or not payment_status:
-                print("❌ Missing required fields")
-                return None
+            self.cursor.execute(query, tuple(params))
+            return self.cursor.fetchall()
+        except mariadb.Error as e:
+            log.error("Error fetching appointments page: %s", e)
+            return []
 
-            # Check if client_id exists
-            self.cursor.execute("SELECT 1 FROM clients WHERE client_id = ?", (client_id,))
-            if not self.cursor.fetchone():
-                print(f"❌ Client ID {client_id} does not exist")
-                return None
+    def fetch_appointment(self, appointment_id):
+        """Fetch one appointment as a fetch_appointments_page row, or None."""
+        try:
+            self.cursor.execute(self.APPOINTMENT_PAGE_QUERY + " WHERE a.appointment_id = ?", (appointment_id,))
+            return self.cursor.fetchone()
+        except mariadb.Error as e:
+            log.error("Error fetching appointment: %s", e)
+            return None
 
-            # Check if pet_id exists
-            self.cursor.execute("SELECT 1 FROM pets WHERE pet_id = ?", (pet_id,))
-            if not self.cursor.fetchone():
-                print(f"❌ Pet ID {pet_id} does not exist")
-                return None
+    def fetch_pets_page(self, client_email=None, after_id=None, limit=50):
+        """Fetch one page of pets in pet_id order, optionally only one client's.
+
+        Rows are (name, gender, species, breed, color, birthdate, age, weight, height,
+        photo_path, pet_id); pass the last pet_id of the previous page as after_id.
+        """
+        query = """
+            SELECT p.name, p.gender, p.species, p.breed, p.color, p.birthdate,
+                   p.age, p.weight, p.height, p.photo_path, p.pet_id
+            FROM pets p
+        """
+        conditions = []
+        params = []
+        if client_email is not None:
+            query += " JOIN clients c ON p.client_id = c.client_id"
+            conditions.append("c.email = ?")
+            params.append(client_email)
+        if after_id is not None:
+            conditions.append("p.pet_id > ?")
+            params.append(after_id)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY p.pet_id LIMIT ?"
+        params.append(limit)
+        try:
+            self.cursor.execute(query, tuple(params))
+            return self.cursor.fetchall()
+        except mariadb.Error as e:
+            log.error("Error fetching pets page: %s", e)
+            return []
 
-            # Print the SQL query for debugging
-            query = """
-                INSERT INTO billing (
-                    client_id, pet_id, date_issued, total_amount, payment_status, 
+    def save_billing(self, client_id, pet_id, date_issued, total_amount, payment_status,
                     payment_method, received_by, invoice_no, reason, veterinarian, notes,
-                    subtotal, vat, partial_amount
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            print(f"\nExecuting query:\n{query}")
-            print(f"With values: {client_id}, {pet_id}, {date_issued}, {total_amount}, {payment_status}, {payment_method}, {received_by}, {invoice_no}, {reason}, {veterinarian}, {notes}, {subtotal}, {vat}, {partial_amount}")
+                    subtotal=0.00, vat=0.00, partial_amount=0.00, services=()):
+        """Save an invoice and its service lines in one transaction.
+
+        services are (description, quantity, unit_price, line_total, service_date)
+        tuples, inserted with a single executemany. Pass invoice_no=None to number
+        the invoice from the INV-<year> sequence as part of the insert. Unknown
+        client or pet IDs are rejected by the foreign keys. Returns
+        (billing_id, invoice_no), or None if nothing was saved.
+        """
+        if not self.cursor:
+            log.error("❌ Database not connected.")
+            return None
 
-            # Start transaction
-            print("\nStarting transaction...")
-            self.conn.begin()
+        if not client_id or not pet_id or not date_issued or not total_amount or not payment_status:
+            log.error("❌ Missing required fields")
+            return None
 
-            try:
-                self.cursor.execute(query, (
+        try:
+            if not invoice_no:
+                # Taken inside this transaction so a failed save gives the number back
+                prefix = invoice_prefix(datetime.now().year)
+                invoice_no = format_invoice_no(prefix, allocate(self.cursor, prefix)[0])
+
+            self.cursor.execute("""
+                INSERT INTO billing (
                     client_id, pet_id, date_issued, total_amount, payment_status,
                     payment_method, received_by, invoice_no, reason, veterinarian, notes,
                     subtotal, vat, partial_amount
-                ))
-                
-                # Get the inserted ID
-                billing_id = self.cursor.lastrowid
-                print(f"\nInserted billing_id: {billing_id}")
-                
-                # Verify the record was actually inserted
-                self.cursor.execute("SELECT * FROM billing WHERE billing_id = ?", (billing_id,))
-                inserted_record = self.cursor.fetchone()
-                if inserted_record:
-                    print(f"✅ Verified record in database: {inserted_record}")
-                else:
-                    print("❌ Record not found in database after insert!")
-                
-                # Commit the transaction
-                print("\nCommitting transaction...")
-                self.conn.commit()
-                print("✅ Transaction committed successfully")
-                
-                print(f"✅ Billing saved successfully with ID: {billing_id}")
-                return billing_id
-                
-            except Exception as e:
-                print(f"❌ Error during transaction: {e}")
-                print("Rolling back transaction...")
-                self.conn.rollback()
-                raise e
-                
-        except Exception as e:
-            print(f"❌ Database error saving billing: {e}")
-            import traceback
-            traceback.print_exc()
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                client_id, pet_id, date_issued, total_amount, payment_status,
+                payment_method, received_by, invoice_no, reason, veterinarian, notes,
+                subtotal, vat, partial_amount
+            ))
+            billing_id = self.cursor.lastrowid
+
+            if services:
+                self.cursor.executemany("""
+                    INSERT INTO billing_services
+                    (billing_id, service_description, quantity, unit_price, line_total, service_date)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, [(billing_id, *service) for service in services])
+
+            self.conn.commit()
+            data_events.publish("billing", billing_id, INSERT)
+            log.info("✅ Invoice %s saved with ID: %s", invoice_no, billing_id)
+            return billing_id, invoice_no
+        except mariadb.Error as e:
+            self.conn.rollback()
+            log.error("❌ Database error saving billing: %s", e)
             return None
-        
+
+    def update_billing(self, billing_id, client_id, pet_id, date_issued, total_amount, payment_status,
+                       payment_method, received_by, reason, veterinarian, notes,
+                       subtotal=0.00, vat=0.00, partial_amount=0.00, services=()):
+        """Replace an invoice's fields and service lines in one transaction (services as in save_billing).
+
+        Returns True on success.
+        """
+        try:
+            self.cursor.execute("""
+                UPDATE billing SET
+                    client_id = ?, pet_id = ?, date_issued = ?, total_amount = ?,
+                    payment_status = ?, payment_method = ?, received_by = ?, reason = ?,
+                    veterinarian = ?, notes = ?, subtotal = ?, vat = ?, partial_amount = ?
+                WHERE billing_id = ?
+            """, (
+                client_id, pet_id, date_issued, total_amount, payment_status, payment_method,
+                received_by, reason, veterinarian, notes, subtotal, vat, partial_amount, billing_id
+            ))
+            self.cursor.execute("DELETE FROM billing_services WHERE billing_id = ?", (billing_id,))
+            if services:
+                self.cursor.executemany("""
+                    INSERT INTO billing_services
+                    (billing_id, service_description, quantity, unit_price, line_total, service_date)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, [(billing_id, *service) for service in services])
+            self.conn.commit()
+        except mariadb.Error as e:
+            self.conn.rollback()
+            log.error("❌ Database error updating billing: %s", e)
+            return False
+        data_events.publish("billing", billing_id, UPDATE)
+        return True
+
     def generate_invoice_no(self):
-        """Generate a unique invoice number like INV-2025-0001."""
-        year = datetime.now().year
-        prefix = f"INV-{year}"
+        """Reserve the next invoice number like INV-2025-0001.
+
+        Call inside the transaction that inserts the invoice: the number is
+        only taken for good when that transaction commits.
+        """
+        invoice_nos = self.generate_invoice_nos()
+        return invoice_nos[0] if invoice_nos else None
+
+    def generate_invoice_nos(self, count=1):
+        """Reserve count consecutive invoice numbers in one statement (for bulk imports)."""
+        prefix = invoice_prefix(datetime.now().year)
         try:
-            self.cursor.execute(
-                "SELECT invoice_no FROM billing WHERE invoice_no LIKE ? ORDER BY invoice_no DESC LIMIT 1",
-                (f"{prefix}-%",)
-            )
-            last_invoice = self.cursor.fetchone()
-            if last_invoice:
-                last_number = int(last_invoice[0].split('-')[-1])
-                next_number = last_number + 1
-            else:
-                next_number = 1
-            return f"{prefix}-{str(next_number).zfill(4)}"
-        except Exception as e:
-            print(f"❌ Error generating invoice number: {e}")
-            return f"{prefix}-0001"
+            return [format_invoice_no(prefix, n) for n in allocate(self.cursor, prefix, count)]
+        except mariadb.Error as e:
+            log.error("❌ Error generating invoice number: %s", e)
+            return []
+
+    def preview_invoice_no(self):
+        """The invoice number the next saved invoice will most likely get, without reserving it."""
+        prefix = invoice_prefix(datetime.now().year)
+        try:
+            return format_invoice_no(prefix, peek(self.cursor, prefix))
+        except mariadb.Error as e:
+            log.error("❌ Error reading invoice sequence: %s", e)
+            return format_invoice_no(prefix, 1)
 
     def fetch_billing_data(self):
         """Fetch all billing data to display in the table."""
         if not self.cursor:
-            print("❌ Database not connected.")
+            log.error("❌ Database not connected.")
             return []
 
         try:
-            self.cursor.execute("""
-                SELECT b.billing_id, b.invoice_no, b.date_issued, c.name as client_name, 
-                    p.name as pet_name, b.total_amount, b.payment_method, b.payment_status
+            self.cursor.execute(self.BILLING_ROW_QUERY + " ORDER BY b.invoice_no DESC")
+            return self.cursor.fetchall()
+        except mariadb.Error as e:
+            log.error("❌ Error fetching billing data: %s", e)
+            return []
+
+    def fetch_billing_row(self, billing_id):
+        """Fetch one invoice as a fetch_billing_data row, or None."""
+        try:
+            self.cursor.execute(self.BILLING_ROW_QUERY + " WHERE b.billing_id = ?", (billing_id,))
+            return self.cursor.fetchone()
+        except mariadb.Error as e:
+            log.error("❌ Error fetching billing row: %s", e)
+            return None
+
+    def fetch_invoice_documents(self, start=None, end=None):
+        """Fetch everything an invoice PDF shows for invoices issued in [start, end).
+
+        Returns one dict per invoice (client, pet, services, totals, payment),
+        built from two queries rather than one per invoice.
+        """
+        if not self.cursor:
+            log.error("❌ Database not connected.")
+            return []
+
+        range_sql, params = date_range_sql("b.date_issued", (start, end))
+        try:
+            self.cursor.execute(f"""
+                SELECT b.billing_id, b.invoice_no, b.date_issued, b.veterinarian,
+                       (SELECT u.license_number FROM users u
+                        WHERE u.role = 'Veterinarian'
+                        AND (u.name = b.veterinarian OR CONCAT(u.name, ' ', u.last_name) = b.veterinarian)
+                        LIMIT 1) AS vet_license,
+                       b.reason, b.notes, b.subtotal, b.vat, b.total_amount,
+                       b.payment_status, b.payment_method, b.received_by, b.partial_amount,
+                       c.name, c.control_number, c.address, c.contact_number, c.email,
+                       p.name, p.species, p.breed, p.age
                 FROM billing b
                 JOIN clients c ON b.client_id = c.client_id
                 JOIN pets p ON b.pet_id = p.pet_id
-                ORDER BY b.invoice_no DESC
-            """)
-            return self.cursor.fetchall()
+                WHERE 1 = 1{range_sql}
+                ORDER BY b.date_issued, b.billing_id
+            """, tuple(params))
+            invoices = {}
+            for row in self.cursor.fetchall():
+                invoices[row[0]] = {
+                    "invoice_no": row[1],
+                    "date_issued": row[2],
+                    "veterinarian": row[3],
+                    "vet_license": row[4],
+                    "reason": row[5],
+                    "notes": row[6],
+                    "subtotal": row[7],
+                    "vat": row[8],
+                    "total_amount": row[9],
+                    "payment_status": row[10],
+                    "payment_method": row[11],
+                    "received_by": row[12],
+                    "partial_amount": row[13],
+                    "client": {"name": row[14], "control_number": row[15], "address": row[16],
+                               "contact_number": row[17], "email": row[18]},
+                    "pet": {"name": row[19], "species": row[20], "breed": row[21], "age": row[22]},
+                    "services": [],
+                }
+
+            if invoices:
+                self.cursor.execute(f"""
+                    SELECT s.billing_id, s.service_description, s.service_date,
+                           s.quantity, s.unit_price, s.line_total
+                    FROM billing_services s
+                    JOIN billing b ON s.billing_id = b.billing_id
+                    WHERE 1 = 1{range_sql}
+                    ORDER BY s.billing_id, s.service_id
+                """, tuple(params))
+                for billing_id, *service in self.cursor.fetchall():
+                    if billing_id in invoices:
+                        invoices[billing_id]["services"].append(tuple(service))
+            return list(invoices.values())
         except mariadb.Error as e:
-            print(f"❌ Error fetching billing data: {e}")
+            log.error("❌ Error fetching invoices: %s", e)
             return []
 
     def delete_invoice(self, billing_id):
         """Delete an invoice and its associated services from the database."""
         if not self.cursor:
-            print("❌ Database not connected.")
+            log.error("❌ Database not connected.")
             return False
 
         try:
@@ -804,16 +650,18 @@ class Database:
             self.cursor.execute("DELETE FROM billing WHERE billing_id = ?", (billing_id,))
             
             self.conn.commit()
-            print(f"✅ Invoice {billing_id} deleted successfully.")
+            data_events.publish("billing", billing_id, DELETE)
+            log.info("✅ Invoice %s deleted successfully.", billing_id)
             return True
         except mariadb.Error as e:
-            print(f"❌ Error deleting invoice: {e}")
+            self.conn.rollback()
+            log.error("❌ Error deleting invoice: %s", e)
             return False
 
     def get_client_id_by_name(self, client_name):
         """Get client ID by name."""
         if not self.cursor:
-            print("❌ Database not connected.")
+            log.error("❌ Database not connected.")
             return None
 
         try:
@@ -821,13 +669,13 @@ class Database:
             result = self.cursor.fetchone()
             return result[0] if result else None
         except mariadb.Error as e:
-            print(f"❌ Error getting client ID: {e}")
+            log.error("❌ Error getting client ID: %s", e)
             return None
 
     def get_pet_id_by_name_and_client(self, pet_name, client_id):
         """Get pet ID by name and client ID."""
         if not self.cursor:
-            print("❌ Database not connected.")
+            log.error("❌ Database not connected.")
             return None
 
         try:
@@ -836,14 +684,14 @@ class Database:
             result = self.cursor.fetchone()
             return result[0] if result else None
         except mariadb.Error as e:
-            print(f"❌ Error getting pet ID: {e}")
+            log.error("❌ Error getting pet ID: %s", e)
             return None
         
         
     def save_user_profile(self, user_id, contact_number, address, gender, birthdate, photo_path=None):
         """Save or update a user profile in the database."""
         if not self.cursor:
-            print("❌ Database not connected.")
+            log.error("❌ Database not connected.")
             return False
 
         try:
@@ -873,16 +721,16 @@ class Database:
                 """, (user_id, contact_number, address, gender, birthdate, photo_path))
 
             self.conn.commit()
-            print("✅ User profile saved successfully.")
+            log.info("✅ User profile saved successfully.")
             return True
         except mariadb.Error as e:
-            print(f"❌ Error saving user profile: {e}")
+            log.error("❌ Error saving user profile: %s", e)
             return False
 
     def save_security_questions(self, user_id, question_one, answer_one, question_two, answer_two, question_three, answer_three):
         """Save security questions and answers for a user."""
         if not self.cursor:
-            print("❌ Database not connected.")
+            log.error("❌ Database not connected.")
             return False
 
         try:
@@ -898,16 +746,16 @@ class Database:
             """, (user_id, question_one, hashed_answer_one, question_two, hashed_answer_two, question_three, hashed_answer_three))
             
             self.conn.commit()
-            print("✅ Security questions saved successfully.")
+            log.info("✅ Security questions saved successfully.")
             return True
         except mariadb.Error as e:
-            print(f"❌ Error saving security questions: {e}")
+            log.error("❌ Error saving security questions: %s", e)
             return False
 
     def verify_security_answers(self, user_id, answer_one, answer_two, answer_three):
         """Verify security answers for password reset."""
         if not self.cursor:
-            print("❌ Database not connected.")
+            log.error("❌ Database not connected.")
             return False
 
         try:
@@ -926,7 +774,7 @@ class Database:
             
             return self.cursor.fetchone() is not None
         except mariadb.Error as e:
-            print(f"❌ Error verifying security answers: {e}")
+            log.error("❌ Error verifying security answers: %s", e)
             return False
 
     def save_clinic_info(self, name, address, contact_number, email, employees_count, logo_path=None, vet_license=None):
@@ -954,42 +802,41 @@ class Database:
                 """, (name, address, contact_number, email, employees_count, logo_path, vet_license))
 
             self.conn.commit()
-            print("✅ Clinic info saved.")
+            reference_data.invalidate_clinic()
+            log.info("✅ Clinic info saved.")
             return True
         except Exception as e:
-            print(f"❌ Error saving clinic info: {e}")
+            log.error("❌ Error saving clinic info: %s", e)
             return False
         
     def get_clinic_info(self):
         """Return the clinic information as a dictionary."""
         try:
-            self.cursor.execute("SELECT name, address, contact_number, email FROM clinic_info LIMIT 1")
+            self.cursor.execute("""
+                SELECT name, address, contact_number, email, vet_license, employees_count, logo_path
+                FROM clinic_info LIMIT 1
+            """)
             row = self.cursor.fetchone()
             if row:
                 return {
                     "name": row[0],
                     "address": row[1],
                     "contact_number": row[2],
-                    "email": row[3]
+                    "email": row[3],
+                    "vet_license": row[4],
+                    "employees_count": row[5],
+                    "logo_path": row[6]
                 }
         except Exception as e:
-            print(f"❌ Error fetching clinic info: {e}")
+            log.error("❌ Error fetching clinic info: %s", e)
         return None
 
     def save_medical_record(self, pet_id, client_id, date, type, reason, diagnosis, prescribed_treatment, veterinarian, risk_status=None):
         """Save a medical record to the appropriate table based on type."""
         try:
-            print(f"\n=== Debug: Saving {type} Record ===")
-            print(f"Pet ID: {pet_id}")
-            print(f"Client ID: {client_id}")
-            print(f"Date: {date}")
-            print(f"Type: {type}")
-            print(f"Reason: {reason}")
-            print(f"Diagnosis: {diagnosis}")
-            print(f"Prescribed: {prescribed_treatment}")
-            print(f"Veterinarian: {veterinarian}")
-            if type == "Consultation":
-                print(f"Risk Status: {risk_status}")
+            log.debug("Saving %s record: pet_id=%s client_id=%s date=%s reason=%r diagnosis=%r "
+                      "prescribed=%r veterinarian=%s risk_status=%s", type, pet_id, client_id, date, reason,
+                      diagnosis, prescribed_treatment, veterinarian, risk_status)
 
             # Convert empty strings to None for date fields
             if not date or date.strip() == "":
@@ -1022,7 +869,7 @@ class Database:
                 """, (pet_id, client_id, date, reason, diagnosis, prescribed_treatment, veterinarian))
             
             elif type == "Surgery":
-                print("\n=== Debug: Inserting into surgeries table ===")
+                log.debug("=== Inserting into surgeries table ===")
                 try:
                     self.cursor.execute("""
                         INSERT INTO surgeries (
@@ -1030,9 +877,9 @@ class Database:
                             next_followup, veterinarian, risk_status
                         ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                     """, (pet_id, client_id, date, reason, diagnosis, prescribed_treatment, veterinarian, risk_status))
-                    print("✅ Surgery record inserted successfully")
+                    log.info("✅ Surgery record inserted successfully")
                 except Exception as e:
-                    print(f"❌ Error inserting surgery record: {e}")
+                    log.error("❌ Error inserting surgery record: %s", e)
                     raise e
             
             elif type == "Grooming":
@@ -1044,143 +891,211 @@ class Database:
                 """, (pet_id, client_id, date, reason, diagnosis, prescribed_treatment, veterinarian))
             
             elif type == "Other Treatments":
-                print("\n=== Debug: Saving Other Treatments Record ===")
-                print(f"Inserting into other_treatments table:")
-                print(f"pet_id: {pet_id}")
-                print(f"client_id: {client_id}")
-                print(f"date: {date}")
-                print(f"treatment_type: {reason}")
-                print(f"medication: {diagnosis}")
-                print(f"dosage: {prescribed_treatment}")
-                print(f"veterinarian: {veterinarian}")
                 self.cursor.execute("""
                     INSERT INTO other_treatments (
                         pet_id, client_id, date, treatment_type, medication, 
                         dosage, veterinarian
                     ) VALUES (?, ?, ?, ?, ?, ?, ?)
                 """, (pet_id, client_id, date, reason, diagnosis, prescribed_treatment, veterinarian))
-                print("✅ Other Treatments record inserted successfully")
+                log.info("✅ Other Treatments record inserted successfully")
 
+            record_id = self.cursor.lastrowid
             self.conn.commit()
-            print("✅ Medical record saved successfully.")
+            dashboard_stats.record_change("medical_records")
+            if type in REPORT_TABLES:
+                data_events.publish(REPORT_TABLES[type][0], record_id, INSERT)
+            log.info("✅ Medical record saved successfully.")
             return True
         except Exception as e:
-            print(f"❌ Error saving medical record: {e}")
+            log.error("❌ Error saving medical record: %s", e)
             return False
 
-    def fetch_medical_records(self, record_type=None):
-        """Fetch medical records from the appropriate table based on type."""
+    @staticmethod
+    def _medical_records_query(record_type):
+        """The SELECT behind fetch_medical_records and its table alias, or (None, None) for an unknown type.
+
+        Rows end with the record's primary key (record_id).
+        """
+        if record_type == "Consultation":
+            query = """
+                SELECT 
+                    DATE_FORMAT(c.date, '%Y-%m-%d') as date,
+                    'Consultation' as type,
+                    p.name AS pet_name,
+                    cl.name AS client_name,
+                    c.reason,
+                    c.diagnosis,
+                    c.prescribed_treatment,
+                    c.veterinarian,
+                    c.risk_status,
+                    c.consultation_id AS record_id
+                FROM consultations c
+                JOIN pets p ON c.pet_id = p.pet_id
+                JOIN clients cl ON c.client_id = cl.client_id
+            """
+            alias = "c"
+        elif record_type == "Deworming":
+            query = """
+                SELECT 
+                    DATE_FORMAT(d.date, '%Y-%m-%d') as date,
+                    'Deworming' as type,
+                    p.name AS pet_name,
+                    cl.name AS client_name,
+                    d.medication as reason,
+                    d.dosage as diagnosis,
+                    d.next_scheduled as prescribed_treatment,
+                    d.veterinarian,
+                    d.deworming_id AS record_id
+                FROM deworming d
+                JOIN pets p ON d.pet_id = p.pet_id
+                JOIN clients cl ON d.client_id = cl.client_id
+            """
+            alias = "d"
+        elif record_type == "Vaccination":
+            query = """
+                SELECT 
+                    DATE_FORMAT(v.date, '%Y-%m-%d') as date,
+                    'Vaccination' as type,
+                    p.name AS pet_name,
+                    cl.name AS client_name,
+                    v.vaccine as reason,
+                    v.dosage as diagnosis,
+                    v.next_scheduled as prescribed_treatment,
+                    v.veterinarian,
+                    v.vaccination_id AS record_id
+                FROM vaccinations v
+                JOIN pets p ON v.pet_id = p.pet_id
+                JOIN clients cl ON v.client_id = cl.client_id
+            """
+            alias = "v"
+        elif record_type == "Surgery":
+            query = """
+                SELECT 
+                    DATE_FORMAT(s.date, '%Y-%m-%d') as date,
+                    'Surgery' as type,
+                    p.name AS pet_name,
+                    cl.name AS client_name,
+                    s.surgery_type as reason,
+                    s.anesthesia as diagnosis,
+                    s.next_followup as prescribed_treatment,
+                    s.veterinarian,
+                    s.risk_status,
+                    s.surgery_id AS record_id
+                FROM surgeries s
+                JOIN pets p ON s.pet_id = p.pet_id
+                JOIN clients cl ON s.client_id = cl.client_id
+            """
+            alias = "s"
+        elif record_type == "Grooming":
+            query = """
+                SELECT 
+                    DATE_FORMAT(g.date, '%Y-%m-%d') as date,
+                    'Grooming' as type,
+                    p.name AS pet_name,
+                    cl.name AS client_name,
+                    g.services as reason,
+                    g.notes as diagnosis,
+                    g.next_scheduled as prescribed_treatment,
+                    g.veterinarian,
+                    g.grooming_id AS record_id
+                FROM grooming g
+                JOIN pets p ON g.pet_id = p.pet_id
+                JOIN clients cl ON g.client_id = cl.client_id
+            """
+            alias = "g"
+        elif record_type == "Other Treatments":
+            query = """
+                SELECT 
+                    DATE_FORMAT(ot.date, '%Y-%m-%d') as date,
+                    'Other Treatments' as type,
+                    p.name AS pet_name,
+                    cl.name AS client_name,
+                    ot.treatment_type as reason,
+                    ot.medication as diagnosis,
+                    ot.dosage as prescribed_treatment,
+                    ot.veterinarian,
+                    ot.treatment_id AS record_id
+                FROM other_treatments ot
+                JOIN pets p ON ot.pet_id = p.pet_id
+                JOIN clients cl ON ot.client_id = cl.client_id
+            """
+            alias = "ot"
+        else:
+            return None, None
+        return query, alias
+
+    def fetch_medical_records(self, record_type=None, start=None, end=None):
+        """Fetch medical records from the appropriate table based on type, optionally dated in [start, end)."""
         try:
-            if record_type == "Consultation":
-                self.cursor.execute("""
-                    SELECT 
-                        DATE_FORMAT(c.date, '%Y-%m-%d') as date,
-                        'Consultation' as type,
-                        p.name AS pet_name,
-                        cl.name AS client_name,
-                        c.reason,
-                        c.diagnosis,
-                        c.prescribed_treatment,
-                        c.veterinarian,
-                        c.risk_status
-                    FROM consultations c
-                    JOIN pets p ON c.pet_id = p.pet_id
-                    JOIN clients cl ON c.client_id = cl.client_id
-                    ORDER BY c.date DESC
-                """)
-            elif record_type == "Deworming":
-                self.cursor.execute("""
-                    SELECT 
-                        DATE_FORMAT(d.date, '%Y-%m-%d') as date,
-                        'Deworming' as type,
-                        p.name AS pet_name,
-                        cl.name AS client_name,
-                        d.medication as reason,
-                        d.dosage as diagnosis,
-                        d.next_scheduled as prescribed_treatment,
-                        d.veterinarian
-                    FROM deworming d
-                    JOIN pets p ON d.pet_id = p.pet_id
-                    JOIN clients cl ON d.client_id = cl.client_id
-                    ORDER BY d.date DESC
-                """)
-            elif record_type == "Vaccination":
-                self.cursor.execute("""
-                    SELECT 
-                        DATE_FORMAT(v.date, '%Y-%m-%d') as date,
-                        'Vaccination' as type,
-                        p.name AS pet_name,
-                        cl.name AS client_name,
-                        v.vaccine as reason,
-                        v.dosage as diagnosis,
-                        v.next_scheduled as prescribed_treatment,
-                        v.veterinarian
-                    FROM vaccinations v
-                    JOIN pets p ON v.pet_id = p.pet_id
-                    JOIN clients cl ON v.client_id = cl.client_id
-                    ORDER BY v.date DESC
-                """)
-            elif record_type == "Surgery":
-                self.cursor.execute("""
-                    SELECT 
-                        DATE_FORMAT(s.date, '%Y-%m-%d') as date,
-                        'Surgery' as type,
-                        p.name AS pet_name,
-                        cl.name AS client_name,
-                        s.surgery_type as reason,
-                        s.anesthesia as diagnosis,
-                        s.next_followup as prescribed_treatment,
-                        s.veterinarian,
-                        s.risk_status
-                    FROM surgeries s
-                    JOIN pets p ON s.pet_id = p.pet_id
-                    JOIN clients cl ON s.client_id = cl.client_id
-                    ORDER BY s.date DESC
-                """)
-            elif record_type == "Grooming":
-                self.cursor.execute("""
-                    SELECT 
-                        DATE_FORMAT(g.date, '%Y-%m-%d') as date,
-                        'Grooming' as type,
-                        p.name AS pet_name,
-                        cl.name AS client_name,
-                        g.services as reason,
-                        g.notes as diagnosis,
-                        g.next_scheduled as prescribed_treatment,
-                        g.veterinarian
-                    FROM grooming g
-                    JOIN pets p ON g.pet_id = p.pet_id
-                    JOIN clients cl ON g.client_id = cl.client_id
-                    ORDER BY g.date DESC
-                """)
-            elif record_type == "Other Treatments":
-                self.cursor.execute("""
-                    SELECT 
-                        DATE_FORMAT(ot.date, '%Y-%m-%d') as date,
-                        'Other Treatments' as type,
-                        p.name AS pet_name,
-                        cl.name AS client_name,
-                        ot.treatment_type as reason,
-                        ot.medication as diagnosis,
-                        ot.dosage as prescribed_treatment,
-                        ot.veterinarian
-                    FROM other_treatments ot
-                    JOIN pets p ON ot.pet_id = p.pet_id
-                    JOIN clients cl ON ot.client_id = cl.client_id
-                    ORDER BY ot.date DESC
-                """)
-            
+            query, alias = self._medical_records_query(record_type)
+            if query is None:
+                return []
+
+            range_sql, params = date_range_sql(f"{alias}.date", (start, end))
+            if params:
+                query += " WHERE 1 = 1" + range_sql
+            query += f" ORDER BY {alias}.date DESC"
+            self.cursor.execute(query, tuple(params))
             records = self.cursor.fetchall()
-            print(f"Fetched {len(records)} records from database")
+            log.debug("Fetched %s records from database", len(records))
             return records
         except Exception as e:
-            print(f"❌ Error fetching medical records: {e}")
+            log.error("❌ Error fetching medical records: %s", e)
             return []
 
+    def fetch_medical_record(self, record_type, record_id):
+        """Fetch one fetch_medical_records row by its record_id, or None."""
+        query, alias = self._medical_records_query(record_type)
+        if query is None:
+            return None
+        try:
+            self.cursor.execute(query + f" WHERE {alias}.{REPORT_TABLES[record_type][1]} = ?", (record_id,))
+            return self.cursor.fetchone()
+        except mariadb.Error as e:
+            log.error("❌ Error fetching medical record: %s", e)
+            return None
+
+    def update_medical_record(self, record_type, record_id, date, reason, diagnosis, prescribed_treatment,
+                              veterinarian, risk_status=None):
+        """Update a report by its record_id; the fields mean what they mean in save_medical_record."""
+        table, key, columns = REPORT_TABLES[record_type]
+        assignments = ["date = ?"] + [f"{column} = ?" for column in columns] + ["veterinarian = ?"]
+        params = [date, reason, diagnosis, prescribed_treatment, veterinarian]
+        if record_type in RISK_STATUS_REPORTS:
+            assignments.append("risk_status = ?")
+            params.append(risk_status or "Low Risk")
+        try:
+            self.cursor.execute(
+                f"UPDATE {table} SET {', '.join(assignments)} WHERE {key} = ?", (*params, record_id)
+            )
+            self.conn.commit()
+        except mariadb.Error as e:
+            self.conn.rollback()
+            log.error("❌ Error updating medical record: %s", e)
+            return False
+        data_events.publish(table, record_id, UPDATE)
+        return True
+
+    def delete_medical_record(self, record_type, record_id):
+        """Delete a report by its record_id. Returns True if a row was deleted."""
+        table, key, _ = REPORT_TABLES[record_type]
+        try:
+            self.cursor.execute(f"DELETE FROM {table} WHERE {key} = ?", (record_id,))
+            deleted = self.cursor.rowcount
+            self.conn.commit()
+        except mariadb.Error as e:
+            self.conn.rollback()
+            log.error("❌ Error deleting medical record: %s", e)
+            return False
+        if deleted:
+            dashboard_stats.record_change("medical_records", -deleted)
+            data_events.publish(table, record_id, DELETE)
+        return deleted > 0
+
     def check_password_history(self, user_id, new_password):
         """Check if the new password has been used before."""
         if not self.cursor:
-            print("❌ Database not connected.")
+            log.error("❌ Database not connected.")
             return False
 
         try:
@@ -1204,13 +1119,13 @@ class Database:
             
             return self.cursor.fetchone() is not None
         except mariadb.Error as e:
-            print(f"❌ Error checking password history: {e}")
+            log.error("❌ Error checking password history: %s", e)
             return False
 
     def add_to_password_history(self, user_id, hashed_password):
         """Add a password to the history."""
         if not self.cursor:
-            print("❌ Database not connected.")
+            log.error("❌ Database not connected.")
             return False
 
         try:
@@ -1221,13 +1136,13 @@ class Database:
             self.conn.commit()
             return True
         except mariadb.Error as e:
-            print(f"❌ Error adding to password history: {e}")
+            log.error("❌ Error adding to password history: %s", e)
             return False
 
     def update_password(self, user_id, new_password):
         """Update user password and add to history."""
         if not self.cursor:
-            print("❌ Database not connected.")
+            log.error("❌ Database not connected.")
             return False
 
         try:
@@ -1254,13 +1169,13 @@ class Database:
             self.conn.commit()
             return True
         except mariadb.Error as e:
-            print(f"❌ Error updating password: {e}")
+            log.error("❌ Error updating password: %s", e)
             return False
 
     def migrate_medical_records(self):
         """Migrate records from medical_records table to their respective treatment tables."""
         try:
-            print("\n=== Starting Medical Records Migration ===")
+            log.debug("=== Starting Medical Records Migration ===")
             
             # Get all records from medical_records
             self.cursor.execute("""
@@ -1270,7 +1185,7 @@ class Database:
             """)
             records = self.cursor.fetchall()
             
-            print(f"Found {len(records)} records to migrate")
+            log.debug("Found %s records to migrate", len(records))
             
             # Migrate each record to its respective table
             for record in records:
@@ -1326,28 +1241,28 @@ class Database:
                         """, (pet_id, client_id, date, reason, diagnosis, prescribed, veterinarian))
                     
                     self.conn.commit()
-                    print(f"✅ Migrated record: {type} for pet_id {pet_id}")
+                    log.info("✅ Migrated record: %s for pet_id %s", type, pet_id)
                     
                 except Exception as e:
-                    print(f"❌ Error migrating record: {e}")
+                    log.error("❌ Error migrating record: %s", e)
                     self.conn.rollback()
             
             # Drop the medical_records table
             self.cursor.execute("DROP TABLE IF EXISTS medical_records")
             self.conn.commit()
-            print("✅ Dropped medical_records table")
+            log.info("✅ Dropped medical_records table")
             
-            print("=== Migration Complete ===")
+            log.debug("=== Migration Complete ===")
             return True
             
         except Exception as e:
-            print(f"❌ Error during migration: {e}")
+            log.error("❌ Error during migration: %s", e)
             return False
 
     def has_security_questions(self, user_id):
         """Check if a user has already set up security questions."""
         if not self.cursor:
-            print("❌ Database not connected.")
+            log.error("❌ Database not connected.")
             return False
 
         try:
@@ -1358,7 +1273,7 @@ class Database:
             
             return self.cursor.fetchone() is not None
         except mariadb.Error as e:
-            print(f"❌ Error checking security questions: {e}")
+            log.error("❌ Error checking security questions: %s", e)
             return False
 
     def fetch_vet_appointments(self, veterinarian, filter_type='all'):
@@ -1373,189 +1288,78 @@ class Database:
                 WHERE a.veterinarian = ?
             """
             
-            if filter_type == 'today':
-                base_query += " AND DATE(a.date) = CURDATE()"
-            elif filter_type == 'upcoming':
-                base_query += " AND DATE(a.date) >= CURDATE()"
+            date_sql, date_params = date_range_sql("a.date", date_window(filter_type))
+            base_query += date_sql
             
             base_query += " ORDER BY a.date ASC"
             
-            self.cursor.execute(base_query, (veterinarian,))
+            self.cursor.execute(base_query, (veterinarian, *date_params))
             return self.cursor.fetchall()
         except Exception as e:
-            print(f"❌ Error fetching vet appointments: {e}")
+            log.error("❌ Error fetching vet appointments: %s", e)
             return []
 
-    def fetch_unpaid_reports(self, filter_type='all'):
-        """Fetch reports that haven't been billed yet."""
+    def fetch_treatment_events(self, pet_id=None, treatment_type=None, veterinarian=None,
+                               start=None, end=None, limit=None):
+        """Fetch rows of the treatment_events view, newest first.
+
+        Each row is EVENT_COLUMNS followed by pet_name and client_name; start/end
+        bound the date as [start, end).
+        """
         try:
-            base_query = """
-                SELECT 
-                    COALESCE(c.date, d.date, v.date, s.date, g.date, o.date) as treatment_date,
-                    p.name AS pet_name,
-                    cl.name AS client_name,
-                    CASE
-                        WHEN c.consultation_id IS NOT NULL THEN 'Consultation'
-                        WHEN d.deworming_id IS NOT NULL THEN 'Deworming'
-                        WHEN v.vaccination_id IS NOT NULL THEN 'Vaccination'
-                        WHEN s.surgery_id IS NOT NULL THEN 'Surgery'
-                        WHEN g.grooming_id IS NOT NULL THEN 'Grooming'
-                        WHEN o.treatment_id IS NOT NULL THEN 'Other Treatment'
-                    END as treatment_type,
-                    COALESCE(c.veterinarian, d.veterinarian, v.veterinarian, s.veterinarian, g.veterinarian, o.veterinarian) as veterinarian
-                FROM pets p
-                JOIN clients cl ON p.client_id = cl.client_id
-                LEFT JOIN consultations c ON p.pet_id = c.pet_id
-                LEFT JOIN deworming d ON p.pet_id = d.pet_id
-                LEFT JOIN vaccinations v ON p.pet_id = v.pet_id
-                LEFT JOIN surgeries s ON p.pet_id = s.pet_id
-                LEFT JOIN grooming g ON p.pet_id = g.pet_id
-                LEFT JOIN other_treatments o ON p.pet_id = o.pet_id
-                LEFT JOIN billing b ON (
-                    p.pet_id = b.pet_id AND 
-                    (
-                        DATE(c.date) = b.date_issued OR
-                        DATE(d.date) = b.date_issued OR
-                        DATE(v.date) = b.date_issued OR
-                        DATE(s.date) = b.date_issued OR
-                        DATE(g.date) = b.date_issued OR
-                        DATE(o.date) = b.date_issued
-                    )
-                )
-                WHERE b.billing_id IS NULL
-            """
-            
-            if filter_type == 'today':
-                base_query += " AND DATE(COALESCE(c.date, d.date, v.date, s.date, g.date, o.date)) = CURDATE()"
-            elif filter_type == 'upcoming':
-                base_query += " AND DATE(COALESCE(c.date, d.date, v.date, s.date, g.date, o.date)) >= CURDATE()"
-            
-            base_query += " ORDER BY treatment_date DESC"
-            
-            self.cursor.execute(base_query)
+            query, params = events_query(pet_id, treatment_type, veterinarian, start, end, limit)
+            self.cursor.execute(query, params)
             return self.cursor.fetchall()
         except Exception as e:
-            print(f"❌ Error fetching unpaid reports: {e}")
+            log.error("❌ Error fetching treatment events: %s", e)
             return []
 
-    def fetch_recent_reports(self, filter_type='all'):
-        """Fetch recent reports from all treatment tables."""
+    def fetch_unpaid_reports(self, filter_type='all'):
+        """Fetch treatments that haven't been billed yet."""
         try:
-            base_query = """
-                SELECT 
-                    COALESCE(c.date, d.date, v.date, s.date, g.date, o.date) as treatment_date,
-                    p.name AS pet_name,
-                    cl.name AS client_name,
-                    CASE
-                        WHEN c.consultation_id IS NOT NULL THEN 'Consultation'
-                        WHEN d.deworming_id IS NOT NULL THEN 'Deworming'
-                        WHEN v.vaccination_id IS NOT NULL THEN 'Vaccination'
-                        WHEN s.surgery_id IS NOT NULL THEN 'Surgery'
-                        WHEN g.grooming_id IS NOT NULL THEN 'Grooming'
-                        WHEN o.treatment_id IS NOT NULL THEN 'Other Treatment'
-                    END as treatment_type,
-                    COALESCE(c.veterinarian, d.veterinarian, v.veterinarian, s.veterinarian, g.veterinarian, o.veterinarian) as veterinarian
-                FROM pets p
+            query = """
+                SELECT t.date AS treatment_date, p.name AS pet_name, cl.name AS client_name,
+                       t.treatment_type, t.veterinarian
+                FROM treatment_events t
+                JOIN pets p ON t.pet_id = p.pet_id
                 JOIN clients cl ON p.client_id = cl.client_id
-                LEFT JOIN consultations c ON p.pet_id = c.pet_id
-                LEFT JOIN deworming d ON p.pet_id = d.pet_id
-                LEFT JOIN vaccinations v ON p.pet_id = v.pet_id
-                LEFT JOIN surgeries s ON p.pet_id = s.pet_id
-                LEFT JOIN grooming g ON p.pet_id = g.pet_id
-                LEFT JOIN other_treatments o ON p.pet_id = o.pet_id
-                WHERE COALESCE(c.date, d.date, v.date, s.date, g.date, o.date) IS NOT NULL
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM billing b
+                    WHERE b.pet_id = t.pet_id AND b.date_issued = t.date
+                )
             """
-            
-            if filter_type == 'today':
-                base_query += " AND DATE(COALESCE(c.date, d.date, v.date, s.date, g.date, o.date)) = CURDATE()"
-            elif filter_type == 'upcoming':
-                base_query += " AND DATE(COALESCE(c.date, d.date, v.date, s.date, g.date, o.date)) >= CURDATE()"
-            
-            base_query += " ORDER BY treatment_date DESC LIMIT 50"  # Show only the 50 most recent reports
-            
-            self.cursor.execute(base_query)
+            date_sql, params = date_range_sql("t.date", date_window(filter_type))
+            query += date_sql + " ORDER BY treatment_date DESC"
+
+            self.cursor.execute(query, tuple(params))
             return self.cursor.fetchall()
         except Exception as e:
-            print(f"❌ Error fetching recent reports: {e}")
+            log.error("❌ Error fetching unpaid reports: %s", e)
             return []
 
+    def fetch_recent_reports(self, filter_type='all'):
+        """Fetch recent reports from all treatment tables."""
+        start, end = date_window(filter_type)
+        # Show only the 50 most recent reports
+        events = self.fetch_treatment_events(start=start, end=end, limit=50)
+        return [
+            (event[EVENT_DATE], event[EVENT_PET_NAME], event[EVENT_CLIENT_NAME], event[EVENT_TYPE], event[EVENT_VETERINARIAN])
+            for event in events
+        ]
+
     def fetch_recent_reports_summary(self, user_role=None):
         """Fetch recent reports with only consultation date, pet name, owner name, and veterinarian."""
-        try:
-            print("\n=== Debug: Starting fetch_recent_reports_summary ===")
-            # Union query to combine all treatment types
-            query = """
-                SELECT * FROM (
-                    SELECT date, 'Consultation' as type, p.name as pet_name, cl.name as client_name, 
-                           CASE 
-                               WHEN veterinarian LIKE 'Dr. %' THEN veterinarian
-                               ELSE CONCAT('Dr. ', veterinarian)
-                           END as veterinarian
-                    FROM consultations c
-                    JOIN pets p ON c.pet_id = p.pet_id
-                    JOIN clients cl ON c.client_id = cl.client_id
-                    UNION ALL
-                    SELECT date, 'Deworming' as type, p.name as pet_name, cl.name as client_name, 
-                           CASE 
-                               WHEN veterinarian LIKE 'Dr. %' THEN veterinarian
-                               ELSE CONCAT('Dr. ', veterinarian)
-                           END as veterinarian
-                    FROM deworming d
-                    JOIN pets p ON d.pet_id = p.pet_id
-                    JOIN clients cl ON d.client_id = cl.client_id
-                    UNION ALL
-                    SELECT date, 'Vaccination' as type, p.name as pet_name, cl.name as client_name, 
-                           CASE 
-                               WHEN veterinarian LIKE 'Dr. %' THEN veterinarian
-                               ELSE CONCAT('Dr. ', veterinarian)
-                           END as veterinarian
-                    FROM vaccinations v
-                    JOIN pets p ON v.pet_id = p.pet_id
-                    JOIN clients cl ON v.client_id = cl.client_id
-                    UNION ALL
-                    SELECT date, 'Surgery' as type, p.name as pet_name, cl.name as client_name, 
-                           CASE 
-                               WHEN veterinarian LIKE 'Dr. %' THEN veterinarian
-                               ELSE CONCAT('Dr. ', veterinarian)
-                           END as veterinarian
-                    FROM surgeries s
-                    JOIN pets p ON s.pet_id = p.pet_id
-                    JOIN clients cl ON s.client_id = cl.client_id
-                    UNION ALL
-                    SELECT date, 'Grooming' as type, p.name as pet_name, cl.name as client_name, 
-                           CASE 
-                               WHEN veterinarian LIKE 'Dr. %' THEN veterinarian
-                               ELSE CONCAT('Dr. ', veterinarian)
-                           END as veterinarian
-                    FROM grooming g
-                    JOIN pets p ON g.pet_id = p.pet_id
-                    JOIN clients cl ON g.client_id = cl.client_id
-                    UNION ALL
-                    SELECT date, 'Other Treatment' as type, p.name as pet_name, cl.name as client_name, 
-                           CASE 
-                               WHEN veterinarian LIKE 'Dr. %' THEN veterinarian
-                               ELSE CONCAT('Dr. ', veterinarian)
-                           END as veterinarian
-                    FROM other_treatments o
-                    JOIN pets p ON o.pet_id = p.pet_id
-                    JOIN clients cl ON o.client_id = cl.client_id
-                ) AS combined_reports
-            """
-            
-            # Add WHERE clause for receptionists to show only this week's reports
-            if user_role == "Receptionist":
-                query += " WHERE YEARWEEK(date) = YEARWEEK(CURDATE())"
-            
-            query += """
-                ORDER BY date DESC
-                LIMIT 20;
-            """
-            
-            self.cursor.execute(query)
-            return self.cursor.fetchall()
-        except Exception as e:
-            print(f"❌ Error fetching recent reports summary: {e}")
-            return []
+        # Receptionists only see this week's reports
+        start, end = date_window('week' if user_role == "Receptionist" else 'all')
+
+        events = self.fetch_treatment_events(start=start, end=end, limit=20)
+        summary = []
+        for event in events:
+            veterinarian = event[EVENT_VETERINARIAN] or ""
+            if not veterinarian.startswith("Dr. "):
+                veterinarian = f"Dr. {veterinarian}"
+            summary.append((event[EVENT_DATE], event[EVENT_TYPE], event[EVENT_PET_NAME], event[EVENT_CLIENT_NAME], veterinarian))
+        return summary
 
     def fetch_recent_appointments_summary(self, user_role=None):
         """Fetch recent appointments for the home page."""
@@ -1575,21 +1379,23 @@ class Database:
             """
             
             # Add WHERE clause for veterinarians to show only this week's appointments
+            params = ()
             if user_role == "Veterinarian":
                 base_query += """
-                WHERE YEARWEEK(a.date) = YEARWEEK(CURDATE())
+                WHERE a.date >= ? AND a.date < ?
                 """
+                params = date_window('week')
             
             base_query += """
                 ORDER BY a.date DESC, a.time DESC
                 LIMIT 10
             """
             
-            self.cursor.execute(base_query)
+            self.cursor.execute(base_query, params)
             appointments = self.cursor.fetchall()
             return appointments
         except mariadb.Error as e:
-            print(f"Error fetching recent appointments: {e}")
+            log.error("Error fetching recent appointments: %s", e)
             return []
 
     def generate_license_numbers(self):
@@ -1618,10 +1424,11 @@ class Database:
                 """, (license_number, vet[0]))
             
             self.conn.commit()
-            print(f"✅ Generated license numbers for {len(vets)} veterinarians")
+            reference_data.invalidate_users()
+            log.info("✅ Generated license numbers for %s veterinarians", len(vets))
             return True
         except Exception as e:
-            print(f"❌ Error generating license numbers: {e}")
+            log.error("❌ Error generating license numbers: %s", e)
             return False
 
     def update_old_license_numbers(self):
@@ -1649,15 +1456,30 @@ class Database:
                     WHERE user_id = ?
                 """, (new_license, vet[0]))
                 
-                print(f"Updated license number for {vet[0]} from {vet[1]} to {new_license}")
+                log.debug("Updated license number for %s from %s to %s", vet[0], vet[1], new_license)
             
             self.conn.commit()
-            print(f"✅ Updated license numbers for {len(vets)} veterinarians")
+            reference_data.invalidate_users()
+            log.info("✅ Updated license numbers for %s veterinarians", len(vets))
             return True
         except Exception as e:
-            print(f"❌ Error updating license numbers: {e}")
+            log.error("❌ Error updating license numbers: %s", e)
             return False
 
+    def fetch_staff(self, role):
+        """Fetch (user_id, name, last_name, license_number) of every user with the given role, by name."""
+        try:
+            self.cursor.execute("""
+                SELECT user_id, name, last_name, license_number
+                FROM users
+                WHERE role = ?
+                ORDER BY name
+            """, (role,))
+            return self.cursor.fetchall()
+        except mariadb.Error as e:
+            log.error("❌ Error fetching %s list: %s", role, e)
+            return None
+
     def get_vet_license_number(self, veterinarian_name):
         """Get the license number for a veterinarian by their name."""
         try:
@@ -1670,5 +1492,5 @@ class Database:
             result = self.cursor.fetchone()
             return result[0] if result else None
         except Exception as e:
-            print(f"❌ Error getting veterinarian license number: {e}")
+            log.error("❌ Error getting veterinarian license number: %s", e)
             return None
\ No newline at end of file
@@ -0,0 +1,43 @@
+from datetime import date, timedelta
+
+# Date filters are applied as half-open ranges "col >= start AND col < end" on
+# the bare column, so MariaDB can use a date index. Wrapping the column, as in
+# DATE(col) = CURDATE() or YEARWEEK(col) = YEARWEEK(CURDATE()), forces a scan.
+
+
+def date_window(kind, today=None, start=None, end=None):
+    """Return the (start, end) dates of a named window; either side may be None (unbounded).
+
+    kind is 'all', 'today', 'upcoming', 'week' (Sunday to Saturday, like
+    YEARWEEK's default mode), 'month', or 'custom' with an inclusive start/end.
+    """
+    today = today or date.today()
+    if kind == 'today':
+        return today, today + timedelta(days=1)
+    if kind == 'upcoming':
+        return today, None
+    if kind == 'week':
+        first = today - timedelta(days=(today.weekday() + 1) % 7)
+        return first, first + timedelta(days=7)
+    if kind == 'month':
+        first = today.replace(day=1)
+        return first, (first + timedelta(days=32)).replace(day=1)
+    if kind == 'custom':
+        return start, end + timedelta(days=1) if end is not None else None
+    if kind == 'all':
+        return None, None
+    raise ValueError(f"Unknown date window: {kind}")
+
+
+def date_range_sql(column, window):
+    """Return (sql, params) restricting column to window, e.g. (" AND a.date >= ? AND a.date < ?", [...])."""
+    window_start, window_end = window
+    sql = ""
+    params = []
+    if window_start is not None:
+        sql += f" AND {column} >= ?"
+        params.append(window_start)
+    if window_end is not None:
+        sql += f" AND {column} < ?"
+        params.append(window_end)
+    return sql, params
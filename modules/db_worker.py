@@ -0,0 +1,162 @@
+import threading
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+from modules.log import get_logger
+
+log = get_logger(__name__)
+
+# Database work for the screens runs on a small QThreadPool. Each job gets its
+# own pooled Database connection; its result comes back as a signal on the UI
+# thread, so slots can touch widgets directly.
+
+
+class QueryFuture(QObject):
+    """Handle for one background job; finished/failed are emitted on the UI thread."""
+
+    finished = Signal(object)
+    failed = Signal(str)
+    settled = Signal(object)  # always emitted last, with the future itself
+
+    # Emitted from the worker thread; queued to _deliver on the UI thread
+    _completed = Signal(object, object)
+
+    def __init__(self, key=None):
+        super().__init__()
+        self.key = key
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+        self._result = None
+        self._error = None
+        self._completed.connect(self._deliver)
+
+    def cancel(self):
+        """Drop the result: finished/failed will not be emitted for this job."""
+        self._cancelled.set()
+
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def done(self):
+        return self._done.is_set()
+
+    def result(self, timeout=None):
+        """Block until the job ends and return its rows, re-raising its error (for scripts, not the UI)."""
+        if not self._done.wait(timeout):
+            raise TimeoutError("Database job did not finish in time")
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def _complete(self, result, error):
+        # Worker thread
+        self._result = result
+        self._error = error
+        self._done.set()
+        self._completed.emit(result, error)
+
+    @Slot(object, object)
+    def _deliver(self, result, error):
+        if not self.cancelled():
+            if error is None:
+                self.finished.emit(result)
+            else:
+                self.failed.emit(str(error))
+        self.settled.emit(self)
+
+
+class _DatabaseJob(QRunnable):
+    def __init__(self, future, fn, args, kwargs):
+        super().__init__()
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self):
+        if self.future.cancelled():
+            self.future._complete(None, None)
+            return
+
+        # Imported here because modules.database is imported by the screens that use this
+        from modules.database import Database
+
+        result = error = None
+        db = Database()
+        try:
+            if not db.cursor:
+                raise ConnectionError("Database not connected.")
+            result = self.fn(db, *self.args, **self.kwargs)
+        except Exception as e:
+            log.error("❌ Background database job failed: %s", e)
+            error = e
+        finally:
+            db.close_connection()
+        self.future._complete(result, error)
+
+
+class DatabaseExecutor(QObject):
+    """Runs fn(db, *args) off the GUI thread and reports back through a QueryFuture.
+
+    Jobs submitted with the same key supersede each other: submitting a new
+    one cancels the previous, so a screen that refreshes twice only ever
+    renders the latest rows. busy_changed(True/False) is the loading hook.
+    """
+
+    busy_changed = Signal(bool)
+
+    def __init__(self, max_threads=4, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        # Keep below the connection pool size so the UI thread can still get a connection
+        self._pool.setMaxThreadCount(max_threads)
+        self._latest = {}
+        self._in_flight = set()
+
+    def submit(self, fn, *args, key=None, on_result=None, on_error=None, context=None, **kwargs):
+        """Queue fn(db, *args, **kwargs); on_result(rows) / on_error(message) run on the UI thread.
+
+        Pass the widget the callbacks update as context: the job is cancelled
+        if it is destroyed before the rows arrive.
+        """
+        if key is not None and key in self._latest:
+            self._latest[key].cancel()
+
+        future = QueryFuture(key)
+        if on_result is not None:
+            future.finished.connect(on_result)
+        if on_error is not None:
+            future.failed.connect(on_error)
+        future.settled.connect(self._on_settled)
+        if context is not None:
+            context.destroyed.connect(future.cancel)
+
+        if key is not None:
+            self._latest[key] = future
+        self._in_flight.add(future)
+        if len(self._in_flight) == 1:
+            self.busy_changed.emit(True)
+
+        self._pool.start(_DatabaseJob(future, fn, args, kwargs))
+        return future
+
+    def cancel(self, key):
+        """Cancel the latest job submitted under key, if any."""
+        future = self._latest.get(key)
+        if future is not None:
+            future.cancel()
+
+    def is_busy(self):
+        return bool(self._in_flight)
+
+    def wait_for_done(self, msecs=-1):
+        return self._pool.waitForDone(msecs)
+
+    @Slot(object)
+    def _on_settled(self, future):
+        self._in_flight.discard(future)
+        if future.key is not None and self._latest.get(future.key) is future:
+            del self._latest[future.key]
+        if not self._in_flight:
+            self.busy_changed.emit(False)
+
+
+db_executor = DatabaseExecutor()
@@ -3,7 +3,12 @@ from PySide6.QtGui import QPixmap, QIcon, QColor, QBrush
 from PySide6.QtCore import Qt, QSize
 from PySide6.QtWidgets import QSizePolicy
 from modules.database import Database  # Import the Database class
+from modules.dashboard_stats import dashboard_stats
+from modules.search_index import client_search
 from datetime import datetime
+from modules.log import get_logger
+
+log = get_logger(__name__)
 
 def get_home_widget(user_role):
         content = QWidget()
@@ -16,10 +21,8 @@ def get_home_widget(user_role):
         boxes_layout.setContentsMargins(20, 0, 0, 0)  # Add left margin to align with search bar
         boxes_layout.setSpacing(6)  # Reduce spacing between boxes
 
-        # Connect to the database and fetch counts
-        db = Database()
-        clients_count, medical_records_count, appointments_count = db.fetch_counts()
-        db.close_connection()
+        # Cached counters; only hits the database when the cache is stale
+        clients_count, medical_records_count, appointments_count = dashboard_stats.get_counts()
 
         # Box 1: Clients
         box1 = QWidget()
@@ -367,7 +370,7 @@ def get_home_widget(user_role):
                     time_obj = datetime.strptime(time_str, "%H:%M:%S")
                     display_time = time_obj.strftime("%I:%M %p")
                 except ValueError as e:
-                    print(f"Error parsing time {time_str}: {e}")
+                    log.error("Error parsing time %s: %s", time_str, e)
                     display_time = time_str
                 
                 # Patient Name (Pet Name)
@@ -445,7 +448,7 @@ def get_home_widget(user_role):
                             item.setTextAlignment(Qt.AlignCenter)
                             table_widget.setItem(row, col, item)
             except Exception as e:
-                print(f"Error populating reports table: {e}")
+                log.error("Error populating reports table: %s", e)
             finally:
                 db.close_connection()
 
@@ -507,47 +510,14 @@ class HomeWindow(QWidget):
         
 def filter_clients_table(search_text, table):
     """Filter the clients table based on the search text."""
-    search_text = search_text.strip().lower()  # Normalize the search text
-    
-    # If search text is empty, show all rows
-    if not search_text:
-        for row in range(table.rowCount()):
-            table.setRowHidden(row, False)
-        return
-        
-    # Get all client names and their associated pet names from the database
-    db = Database()
-    try:
-        db.cursor.execute("""
-            SELECT c.name as client_name, GROUP_CONCAT(p.name) as pet_names
-            FROM clients c
-            LEFT JOIN pets p ON c.client_id = p.client_id
-            GROUP BY c.client_id
-        """)
-        client_pet_data = db.cursor.fetchall()
-    except Exception as e:
-        print(f"Error fetching client and pet data: {e}")
-        return
-    finally:
-        db.close_connection()
-    
-    # Create a mapping of client names to their pet names
-    client_pet_map = {client: pets.split(',') if pets else [] for client, pets in client_pet_data}
-    
-    # Filter the table rows
+    # Client and pet names come from the shared in-memory index, not a query per keystroke
+    matching_names = client_search.matching_names(search_text)
     for row in range(table.rowCount()):
         cell_widget = table.cellWidget(row, 0)
         if cell_widget:
             name_label = cell_widget.findChild(QLabel)
             if name_label:
-                client_name = name_label.text().strip().lower()
-                pet_names = [pet.lower() for pet in client_pet_map.get(name_label.text(), [])]
-                
-                # Show row if search text matches either client name or any pet name
-                should_show = (
-                    search_text in client_name or
-                    any(search_text in pet for pet in pet_names)
-                )
+                should_show = matching_names is None or name_label.text() in matching_names
                 table.setRowHidden(row, not should_show)
 
 def filter_recent_table(search_text, table, user_role):
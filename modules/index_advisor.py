@@ -0,0 +1,137 @@
+from datetime import date
+import mariadb
+from modules.migrations import MANAGED_INDEXES
+from modules.log import get_logger
+
+log = get_logger(__name__)
+
+# Read paths of the Database class, called with representative arguments.
+# Keep this in step with database.py when a query method is added.
+READ_METHODS = [
+    ("user_exists", ("client@example.com",), {}),
+    ("get_client_info", ("client@example.com",), {}),
+    ("get_client_id_by_name", ("Client",), {}),
+    ("get_pet_id_by_name_and_client", ("Pet", 1), {}),
+    ("get_clinic_info", (), {}),
+    ("fetch_pets_page", (), {}),
+    ("fetch_pets_page", ("client@example.com", 1), {}),
+    ("get_vet_license_number", ("Dr. Vet",), {}),
+    ("fetch_staff", ("Veterinarian",), {}),
+    ("has_security_questions", ("2025V0001",), {}),
+    ("fetch_appointments", (), {}),
+    ("fetch_appointments_page", (), {}),
+    ("fetch_appointments_page", (date.today(), "12:00:00", 1), {}),
+    ("fetch_appointments_page", (), {"status": "Urgent"}),
+    ("fetch_appointments_page", (date.today(), "12:00:00", 1), {"status": "Urgent"}),
+    ("fetch_appointments_page", (), {"search": "Pet"}),
+    ("fetch_appointment", (1,), {}),
+    ("fetch_recent_appointments_summary", ("Veterinarian",), {}),
+    ("preview_invoice_no", (), {}),
+    ("fetch_billing_data", (), {}),
+    ("fetch_billing_row", (1,), {}),
+    ("fetch_invoice_documents", (date.today().replace(day=1), date.today()), {}),
+    ("fetch_appointments", (date.today().replace(day=1), date.today()), {}),
+    ("fetch_treatment_events", (), {"pet_id": 1}),
+    ("fetch_treatment_events", (), {"veterinarian": "Dr. Vet"}),
+    ("fetch_recent_reports_summary", ("Receptionist",), {}),
+] + [
+    ("fetch_medical_records", (record_type,) + window, {})
+    for record_type in ("Consultation", "Deworming", "Vaccination", "Surgery", "Grooming", "Other Treatments")
+    for window in ((), (date.today().replace(day=1), date.today()))
+] + [
+    ("fetch_medical_record", (record_type, 1), {})
+    for record_type in ("Consultation", "Deworming", "Vaccination", "Surgery", "Grooming", "Other Treatments")
+] + [
+    (method, (filter_type,), {})
+    for method in ("fetch_unpaid_reports", "fetch_recent_reports")
+    for filter_type in ("all", "today", "upcoming")
+] + [
+    ("fetch_vet_appointments", ("Dr. Vet", filter_type), {})
+    for filter_type in ("all", "today", "upcoming")
+]
+
+
+class _RecordingCursor:
+    """Stands in for a cursor: records each statement and returns no rows."""
+
+    rowcount = 0
+    lastrowid = 0
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, sql, params=()):
+        self.statements.append((sql, tuple(params or ())))
+
+    def executemany(self, sql, seq_of_params):
+        pass
+
+    def fetchone(self):
+        return None
+
+    def fetchall(self):
+        return []
+
+    def close(self):
+        pass
+
+
+def capture_queries(db):
+    """Run every READ_METHODS entry against a recording cursor and return [(method, sql, params)]."""
+    captured = []
+    real_cursor = db.cursor
+    for method, args, kwargs in READ_METHODS:
+        recorder = _RecordingCursor()
+        db.cursor = recorder
+        try:
+            getattr(db, method)(*args, **kwargs)
+        except Exception as e:
+            # A method that cannot run on empty results still recorded what it sent
+            log.warning("⚠️ %s stopped early while capturing: %s", method, e)
+        finally:
+            db.cursor = real_cursor
+        captured += [
+            (method, sql, params) for sql, params in recorder.statements
+            if sql.lstrip().upper().startswith("SELECT")
+        ]
+    return captured
+
+
+def find_full_scans(db, captured):
+    """EXPLAIN each captured query and return the plan rows that scan a whole table or index."""
+    findings = []
+    for method, sql, params in captured:
+        try:
+            db.cursor.execute("EXPLAIN " + sql, params)
+            plan = db.cursor.fetchall()
+            columns = [column[0] for column in db.cursor.description]
+        except mariadb.Error as e:
+            log.error("❌ Could not EXPLAIN query from %s: %s", method, e)
+            continue
+        for row in plan:
+            step = dict(zip(columns, row))
+            table = step.get("table") or ""
+            # Derived/union tables are materialized results, not stored tables
+            if step.get("type") in ("ALL", "index") and not table.startswith("<"):
+                findings.append({
+                    "method": method,
+                    "table": table,
+                    "type": step["type"],
+                    "rows": step.get("rows") or 0,
+                    "extra": step.get("Extra") or "",
+                })
+    return findings
+
+
+def missing_indexes(db):
+    """Return the MANAGED_INDEXES entries that do not exist in the current database."""
+    db.cursor.execute("""
+        SELECT DISTINCT table_name, index_name
+        FROM information_schema.statistics
+        WHERE table_schema = DATABASE()
+    """)
+    existing = {(table.lower(), index.lower()) for table, index in db.cursor.fetchall()}
+    return [
+        (name, table, columns) for name, table, columns in MANAGED_INDEXES
+        if (table.lower(), name.lower()) not in existing
+    ]
@@ -0,0 +1,86 @@
+import os
+import threading
+from datetime import datetime
+from reportlab.lib.utils import ImageReader
+from modules.reference_data import reference_data
+
+LOGO_PATH = "assets/logologin.png"
+X_MARGIN = 50
+Y_MARGIN = 50
+HEADER_HEIGHT = 100
+NAVY_RGB = (0.003922, 0.145098, 0.278431)  # #012547
+
+
+class Letterhead:
+    """The clinic header shared by every PDF, drawn once per document as a form XObject.
+
+    The static part (logo, clinic name, licence, address, contact, rule) is
+    recorded with beginForm/endForm the first time a canvas needs it and then
+    placed with doForm on every page, so each page only references it. The
+    clinic record comes from the reference_data cache and the decoded logo is
+    kept for the whole process (reloaded if the file changes).
+    """
+
+    def __init__(self, logo_path=LOGO_PATH):
+        self.logo_path = logo_path
+        self._logo = None
+        self._logo_mtime = None
+        self._lock = threading.Lock()
+
+    def logo(self):
+        """The logo as a reportlab ImageReader, decoded once per process (None if missing)."""
+        try:
+            mtime = os.path.getmtime(self.logo_path)
+        except OSError:
+            return None
+        with self._lock:
+            if self._logo is None or self._logo_mtime != mtime:
+                self._logo = ImageReader(self.logo_path)
+                self._logo_mtime = mtime
+            return self._logo
+
+    def draw(self, c, title, width, height, clinic=None, generated=True):
+        """Place the letterhead on the current page, plus the document title (and timestamp)."""
+        clinic = reference_data.clinic() if clinic is None else clinic
+        c.doForm(self._form(c, clinic, width, height))
+
+        c.setFont("Helvetica-Bold", 14)
+        c.drawString(width - 250, height - Y_MARGIN - 20, title)
+        if generated:
+            c.setFont("Helvetica", 12)
+            c.drawString(width - 250, height - Y_MARGIN - 40, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+
+    def _form(self, c, clinic, width, height):
+        # One form per distinct clinic record and page size in each document
+        key = (clinic.get("name"), clinic.get("vet_license"), clinic.get("address"),
+               clinic.get("contact_number"), width, height)
+        forms = c.__dict__.setdefault("_letterhead_forms", {})
+        name = forms.get(key)
+        if name is not None:
+            return name
+
+        name = f"letterhead{len(forms)}"
+        c.beginForm(name)
+        c.saveState()
+        logo = self.logo()
+        if logo is not None:
+            c.drawImage(logo, X_MARGIN, height - Y_MARGIN - 50, width=50, height=50)
+
+        c.setFont("Helvetica-Bold", 16)
+        c.drawString(X_MARGIN + 60, height - Y_MARGIN - 20, clinic.get("name") or "PetMedix Animal Clinic")
+        if clinic.get("vet_license"):
+            c.setFont("Helvetica", 10)
+            c.drawString(X_MARGIN + 60, height - Y_MARGIN - 35, f"License No: {clinic['vet_license']}")
+        c.setFont("Helvetica", 12)
+        c.drawString(X_MARGIN + 60, height - Y_MARGIN - 50, clinic.get("address") or "")
+        c.drawString(X_MARGIN + 60, height - Y_MARGIN - 70, f"Contact: {clinic.get('contact_number') or ''}")
+
+        c.setStrokeColorRGB(*NAVY_RGB)
+        c.line(X_MARGIN, height - Y_MARGIN - HEADER_HEIGHT, width - X_MARGIN, height - Y_MARGIN - HEADER_HEIGHT)
+        c.restoreState()
+        c.endForm()
+        forms[key] = name
+        return name
+
+
+letterhead = Letterhead()
@@ -0,0 +1,82 @@
+import logging
+import os
+import sys
+from logging.handlers import RotatingFileHandler
+
+# Every module logs through get_logger(__name__), under the "petmedix" logger:
+# modules.billing -> petmedix.billing. Until setup_logging() is called (main.py
+# does), INFO and above go to the console exactly like the old print() output
+# and DEBUG messages are dropped before their arguments are formatted.
+
+ROOT_LOGGER = "petmedix"
+LOG_FILE = os.path.join("logs", "petmedix.log")
+FILE_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+_root = logging.getLogger(ROOT_LOGGER)
+
+
+def get_logger(name):
+    """Logger for a module, e.g. get_logger(__name__) in modules/billing.py -> petmedix.billing."""
+    if name.startswith("modules."):
+        name = name[len("modules."):]
+    return _root.getChild(name)
+
+
+def _console_handler():
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
+
+
+def setup_logging(level="INFO", log_file=LOG_FILE, console=True, max_bytes=1_000_000, backups=5,
+                  module_levels=None):
+    """Configure the application loggers; safe to call again to change the setup.
+
+    log_file rotates after max_bytes keeping backups old files (None: no file).
+    module_levels maps module names to levels, e.g. {"billing": "DEBUG"}.
+    """
+    for handler in list(_root.handlers):
+        _root.removeHandler(handler)
+        handler.close()
+
+    _root.setLevel(level)
+    if console:
+        _root.addHandler(_console_handler())
+    if log_file:
+        os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
+        handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+        handler.setFormatter(logging.Formatter(FILE_FORMAT))
+        _root.addHandler(handler)
+    for module, module_level in (module_levels or {}).items():
+        set_module_level(module, module_level)
+
+
+def set_level(level):
+    """Change the global level at runtime; modules given their own level keep it."""
+    _root.setLevel(level)
+
+
+def get_level():
+    return logging.getLevelName(_root.level)
+
+
+def set_module_level(module, level):
+    """Change one module's level at runtime ("billing", "DEBUG"); level None follows the global level."""
+    get_logger(module).setLevel(level or logging.NOTSET)
+
+
+def module_levels():
+    """{module: level name} for every module logger created so far."""
+    prefix = ROOT_LOGGER + "."
+    return {
+        name[len(prefix):]: logging.getLevelName(logger.getEffectiveLevel())
+        for name, logger in sorted(logging.Logger.manager.loggerDict.items())
+        if name.startswith(prefix) and isinstance(logger, logging.Logger)
+    }
+
+
+# Default until setup_logging(): INFO to the console, nothing to disk
+_root.setLevel(logging.INFO)
+_root.addHandler(_console_handler())
+_root.propagate = False
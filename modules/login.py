@@ -9,6 +9,9 @@ from modules.petmedix import PetMedix
 from modules.utils import create_styled_message_box, show_message
 import re
 import hashlib
+from modules.log import get_logger
+
+log = get_logger(__name__)
 
 class ForgotPasswordDialog(QDialog):
     def __init__(self, parent=None):
@@ -417,7 +420,7 @@ class LoginWindow(QMainWindow):
         self.signup_button.clicked.connect(self.go_to_signup)
 
     def go_to_signup(self):
-        print("Switching to signup page...")
+        log.debug("Switching to signup page...")
         from modules.signup import SignUpWindow
         self.signup_window = SignUpWindow()  
         self.signup_window.showMaximized() 
@@ -443,11 +446,11 @@ class LoginWindow(QMainWindow):
                 last_name = user.get('last_name', 'Unknown')
                 status = user.get('status', 'Unknown')
                 
-                print(f"Login successful - User ID: {user_id}, Role: {role}, Status: {status}")
+                log.debug("Login successful - User ID: %s, Role: %s, Status: %s", user_id, role, status)
                 
                 # Check if user is admin
                 if role == 'Admin':
-                    print("Admin login detected, launching admin dashboard...")
+                    log.debug("Admin login detected, launching admin dashboard...")
                     from modules.admin_dashboard import AdminDashboard
                     self.admin_dashboard = AdminDashboard()
                     self.admin_dashboard.showMaximized()
@@ -474,7 +477,7 @@ class LoginWindow(QMainWindow):
             else:
                 show_message(self, "Invalid email/User ID or password.", QMessageBox.Warning)
         except Exception as e:
-            print(f"Login error: {str(e)}")
+            log.error("Login error: %s", e)
             show_message(self, f"Failed to login: {e}", QMessageBox.Critical)
         finally:
             db.close_connection()
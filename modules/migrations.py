@@ -0,0 +1,521 @@
+import hashlib
+import threading
+import mariadb
+from modules.treatment_events import TREATMENT_EVENT_SOURCES, create_view_sql
+from modules.sequences import seed_from_existing
+from modules.log import get_logger
+
+log = get_logger(__name__)
+
+# Migrations are applied in version order and recorded in schema_version.
+# Every step is written to be safe on databases that were created before
+# versioning existed (e.g. imported from data.sql), so column additions
+# check for the column first instead of assuming a fresh schema.
+
+
+def _column_exists(cursor, table, column):
+    cursor.execute(f"SHOW COLUMNS FROM {table} LIKE ?", (column,))
+    return cursor.fetchone() is not None
+
+
+def _table_exists(cursor, table):
+    cursor.execute("SHOW TABLES LIKE ?", (table,))
+    return cursor.fetchone() is not None
+
+
+def _add_column(cursor, table, column, definition):
+    if not _column_exists(cursor, table, column):
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+        log.info("✅ %s column added to %s table", column, table)
+
+
+def create_base_tables(db):
+    """Create every application table in foreign-key dependency order."""
+    cursor = db.cursor
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS users (
+        user_id VARCHAR(10) PRIMARY KEY,
+        name VARCHAR(100) NOT NULL,
+        last_name VARCHAR(100),
+        email VARCHAR(100) NOT NULL UNIQUE,
+        hashed_password VARCHAR(64) NOT NULL,
+        role VARCHAR(50) NOT NULL,
+        status VARCHAR(20) DEFAULT 'Pending',
+        license_number VARCHAR(50),
+        created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS clients (
+        client_id INT AUTO_INCREMENT PRIMARY KEY,
+        name VARCHAR(100) NOT NULL,
+        address VARCHAR(255),
+        contact_number VARCHAR(15),
+        email VARCHAR(100) UNIQUE,
+        control_number VARCHAR(20) UNIQUE
+    );
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS pets (
+        pet_id INT AUTO_INCREMENT PRIMARY KEY,
+        client_id INT NOT NULL,
+        name VARCHAR(100) NOT NULL,
+        gender ENUM('Male', 'Female'),
+        species VARCHAR(50),
+        breed VARCHAR(50),
+        color VARCHAR(50),
+        birthdate DATE,
+        age INT,
+        weight DECIMAL(10,2),
+        height DECIMAL(10,2),
+        photo_path VARCHAR(255),
+        FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
+    );
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS billing (
+        billing_id INT AUTO_INCREMENT PRIMARY KEY,
+        invoice_no VARCHAR(50),
+        client_id INT NOT NULL,
+        pet_id INT NOT NULL,
+        date_issued DATE NOT NULL,
+        subtotal DECIMAL(10, 2) NOT NULL DEFAULT 0.00,
+        vat DECIMAL(10, 2) NOT NULL DEFAULT 0.00,
+        total_amount DECIMAL(10, 2) NOT NULL,
+        payment_status ENUM('PAID', 'UNPAID', 'PARTIAL') NOT NULL,
+        partial_amount DECIMAL(10, 2) DEFAULT 0.00,
+        payment_method ENUM('CASH', 'CREDIT CARD', 'GCASH', 'BANK TRANSFER'),
+        received_by VARCHAR(100),
+        reason VARCHAR(200),
+        veterinarian VARCHAR(100),
+        notes TEXT,
+        FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE,
+        FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE
+    );
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS billing_services (
+        service_id INT AUTO_INCREMENT PRIMARY KEY,
+        billing_id INT NOT NULL,
+        service_description VARCHAR(255) NOT NULL,
+        quantity INT NOT NULL,
+        unit_price DECIMAL(10, 2) NOT NULL,
+        line_total DECIMAL(10, 2) NOT NULL,
+        service_date DATE,
+        FOREIGN KEY (billing_id) REFERENCES billing(billing_id) ON DELETE CASCADE
+    );
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS clinic_info (
+        clinic_id INT AUTO_INCREMENT PRIMARY KEY,
+        name VARCHAR(100) NOT NULL,
+        address VARCHAR(255),
+        contact_number VARCHAR(15),
+        email VARCHAR(100),
+        employees_count INT,
+        photo_path VARCHAR(255),
+        logo_path VARCHAR(255),
+        vet_license VARCHAR(20)
+    );
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS user_profiles (
+        profile_id INT AUTO_INCREMENT PRIMARY KEY,
+        user_id VARCHAR(10) NOT NULL,
+        contact_number VARCHAR(15),
+        address VARCHAR(255),
+        gender VARCHAR(20),
+        birthdate DATE,
+        photo_path VARCHAR(255),
+        FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+    );
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS security_questions (
+        question_id INT AUTO_INCREMENT PRIMARY KEY,
+        user_id VARCHAR(10) NOT NULL,
+        question_one VARCHAR(255) NOT NULL,
+        answer_one VARCHAR(255) NOT NULL,
+        question_two VARCHAR(255) NOT NULL,
+        answer_two VARCHAR(255) NOT NULL,
+        question_three VARCHAR(255) NOT NULL,
+        answer_three VARCHAR(255) NOT NULL,
+        FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+    );
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS password_history (
+        history_id INT AUTO_INCREMENT PRIMARY KEY,
+        user_id VARCHAR(10) NOT NULL,
+        hashed_password VARCHAR(64) NOT NULL,
+        created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+    );
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS consultations (
+        consultation_id INT AUTO_INCREMENT PRIMARY KEY,
+        pet_id INT NOT NULL,
+        client_id INT NOT NULL,
+        date DATE NOT NULL,
+        reason TEXT NOT NULL,
+        diagnosis TEXT NOT NULL,
+        prescribed_treatment TEXT NOT NULL,
+        veterinarian VARCHAR(100) NOT NULL,
+        risk_status ENUM('Low Risk', 'Medium Risk', 'High Risk') DEFAULT 'Low Risk',
+        FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE,
+        FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
+    );
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS deworming (
+        deworming_id INT AUTO_INCREMENT PRIMARY KEY,
+        pet_id INT NOT NULL,
+        client_id INT NOT NULL,
+        date DATE NOT NULL,
+        medication TEXT NOT NULL,
+        dosage TEXT NOT NULL,
+        next_scheduled DATE NOT NULL,
+        veterinarian VARCHAR(100) NOT NULL,
+        FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE,
+        FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
+    );
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS vaccinations (
+        vaccination_id INT AUTO_INCREMENT PRIMARY KEY,
+        pet_id INT NOT NULL,
+        client_id INT NOT NULL,
+        date DATE NOT NULL,
+        vaccine TEXT NOT NULL,
+        dosage TEXT NOT NULL,
+        next_scheduled DATE NOT NULL,
+        veterinarian VARCHAR(100) NOT NULL,
+        FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE,
+        FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
+    );
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS surgeries (
+        surgery_id INT AUTO_INCREMENT PRIMARY KEY,
+        pet_id INT NOT NULL,
+        client_id INT NOT NULL,
+        date DATE NOT NULL,
+        surgery_type TEXT NOT NULL,
+        anesthesia TEXT NOT NULL,
+        next_followup DATE NOT NULL,
+        veterinarian VARCHAR(100) NOT NULL,
+        risk_status VARCHAR(20) DEFAULT 'Low Risk',
+        FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE,
+        FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
+    );
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS grooming (
+        grooming_id INT AUTO_INCREMENT PRIMARY KEY,
+        pet_id INT NOT NULL,
+        client_id INT NOT NULL,
+        date DATE NOT NULL,
+        services TEXT NOT NULL,
+        notes TEXT NOT NULL,
+        next_scheduled DATE NOT NULL,
+        veterinarian VARCHAR(100) NOT NULL,
+        FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE,
+        FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
+    );
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS other_treatments (
+        treatment_id INT AUTO_INCREMENT PRIMARY KEY,
+        pet_id INT NOT NULL,
+        client_id INT NOT NULL,
+        date DATE NOT NULL,
+        treatment_type TEXT NOT NULL,
+        medication TEXT NOT NULL,
+        dosage TEXT NOT NULL,
+        veterinarian VARCHAR(100) NOT NULL,
+        FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE,
+        FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
+    );
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS pet_notes (
+        note_id INT AUTO_INCREMENT PRIMARY KEY,
+        pet_id INT NOT NULL,
+        note_type VARCHAR(20) NOT NULL CHECK (note_type IN ('past_illnesses', 'medical_history')),
+        notes TEXT,
+        last_updated TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE KEY pet_note_type (pet_id, note_type),
+        FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE
+    );
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_pet_notes_pet_id ON pet_notes(pet_id);")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_pet_notes_type ON pet_notes(note_type);")
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS appointments (
+        appointment_id INT AUTO_INCREMENT PRIMARY KEY,
+        pet_id INT NOT NULL,
+        client_id INT NOT NULL,
+        date DATE NOT NULL,
+        time TIME NOT NULL,
+        status ENUM('Scheduled', 'Completed', 'Cancelled', 'No-Show', 'Rescheduled', 'Urgent') NOT NULL,
+        payment_status ENUM('Pending', 'Paid', 'Unpaid') NOT NULL,
+        reason TEXT,
+        veterinarian VARCHAR(100),
+        FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE,
+        FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
+    );
+    """)
+
+
+def add_license_number(db):
+    """Add users.license_number and give existing veterinarians a PRC number."""
+    if not _column_exists(db.cursor, "users", "license_number"):
+        _add_column(db.cursor, "users", "license_number", "VARCHAR(50)")
+        db.conn.commit()
+    db.generate_license_numbers()
+
+
+def convert_old_license_numbers(db):
+    """Rewrite VET-/PRC No. license numbers to the PRC0000 format."""
+    db.update_old_license_numbers()
+
+
+def add_risk_status(db):
+    _add_column(db.cursor, "consultations", "risk_status",
+                "ENUM('Low Risk', 'Medium Risk', 'High Risk') DEFAULT 'Low Risk'")
+
+
+def add_control_number(db):
+    _add_column(db.cursor, "clients", "control_number", "VARCHAR(20) UNIQUE")
+
+
+def add_appointment_time(db):
+    _add_column(db.cursor, "appointments", "time", "TIME NOT NULL AFTER date")
+
+
+def add_vet_license(db):
+    _add_column(db.cursor, "clinic_info", "vet_license", "VARCHAR(20)")
+
+
+def add_user_status(db):
+    _add_column(db.cursor, "users", "status", "VARCHAR(20) DEFAULT 'Pending'")
+
+
+def add_billing_columns(db):
+    _add_column(db.cursor, "billing", "invoice_no", "VARCHAR(50)")
+    _add_column(db.cursor, "billing", "reason", "TEXT")
+    _add_column(db.cursor, "billing", "veterinarian", "VARCHAR(100)")
+
+
+def split_medical_records(db):
+    """Move rows from the legacy medical_records table into the treatment tables."""
+    if _table_exists(db.cursor, "medical_records"):
+        db.migrate_medical_records()
+
+
+def create_default_admin(db):
+    """Create the default admin account when no admin exists yet."""
+    cursor = db.cursor
+    cursor.execute("SELECT 1 FROM users WHERE role = 'Admin'")
+    if cursor.fetchone():
+        return
+
+    hashed_password = hashlib.sha256("admin123".encode()).hexdigest()
+    try:
+        cursor.execute("""
+            INSERT INTO users (user_id, name, email, hashed_password, role, status, created_date)
+            VALUES (?, ?, ?, ?, 'Admin', 'Verified', NOW())
+        """, ("2025A0001", "Admin", "admin@petmedix.com", hashed_password))
+        log.info("✅ Default admin account created")
+    except mariadb.Error as e:
+        # If the admin row exists under another role, promote it back
+        if "Duplicate entry" not in str(e):
+            raise
+        cursor.execute("""
+            UPDATE users
+            SET hashed_password = ?, status = 'Verified'
+            WHERE role = 'Admin'
+        """, (hashed_password,))
+        log.info("✅ Admin account updated")
+
+
+def add_treatment_indexes(db):
+    """Index treatments by (pet_id, date) and date, and billing by (pet_id, date_issued)."""
+    cursor = db.cursor
+    for table in ("consultations", "deworming", "vaccinations", "surgeries", "grooming", "other_treatments"):
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_pet_date ON {table}(pet_id, date);")
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_date ON {table}(date);")
+    # A treatment counts as billed when its pet has an invoice issued on the treatment date
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_billing_pet_date ON billing(pet_id, date_issued);")
+
+
+def create_treatment_events_view(db):
+    """Create the treatment_events view and index the treatment tables by veterinarian."""
+    cursor = db.cursor
+    for table, _, _, _, _, _ in TREATMENT_EVENT_SOURCES:
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_vet_date ON {table}(veterinarian, date);")
+    cursor.execute(create_view_sql())
+
+
+# Every secondary index the application relies on, as (name, table, columns).
+# Migrations create them; advise_indexes.py reports any that are missing and
+# any query that still falls back to a full scan.
+MANAGED_INDEXES = [
+    ("idx_pet_notes_pet_id", "pet_notes", "pet_id"),
+    ("idx_pet_notes_type", "pet_notes", "note_type"),
+    # Vet schedules and this-week filters, and keyset paging of the appointment list
+    ("idx_appointments_vet_date", "appointments", "veterinarian, date"),
+    ("idx_appointments_date_time", "appointments", "date, time, appointment_id"),
+    # The Urgent tab pages one status in the same order
+    ("idx_appointments_status_date_time", "appointments", "status, date, time, appointment_id"),
+    # Client and pet lookups by name
+    ("idx_clients_name", "clients", "name"),
+    ("idx_pets_client_name", "pets", "client_id, name"),
+    ("idx_pets_name", "pets", "name"),
+    # Invoice lookups by number and unbilled-treatment checks
+    ("idx_billing_invoice_no", "billing", "invoice_no"),
+    ("idx_billing_pet_date", "billing", "pet_id, date_issued"),
+] + [
+    # Treatment lookups by pet, by date window and by veterinarian
+    (f"idx_{table}_{suffix}", table, columns)
+    for table, *_ in TREATMENT_EVENT_SOURCES
+    for suffix, columns in (("pet_date", "pet_id, date"), ("date", "date"), ("vet_date", "veterinarian, date"))
+]
+
+
+def create_managed_indexes(db):
+    """Create any index in MANAGED_INDEXES that does not exist yet."""
+    for name, table, columns in MANAGED_INDEXES:
+        db.cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({columns});")
+
+
+def create_sequences(db):
+    """Create the ID counter table and start each counter after the highest ID in use."""
+    db.cursor.execute("""
+    CREATE TABLE IF NOT EXISTS sequences (
+        name VARCHAR(20) PRIMARY KEY,
+        last_value BIGINT UNSIGNED NOT NULL
+    );
+    """)
+    seed_from_existing(db.cursor)
+
+
+MIGRATIONS = [
+    (1, "Create base tables", create_base_tables),
+    (2, "Add users.license_number", add_license_number),
+    (3, "Convert old license number format", convert_old_license_numbers),
+    (4, "Add consultations.risk_status", add_risk_status),
+    (5, "Add clients.control_number", add_control_number),
+    (6, "Add appointments.time", add_appointment_time),
+    (7, "Add clinic_info.vet_license", add_vet_license),
+    (8, "Add users.status", add_user_status),
+    (9, "Add billing invoice/reason/veterinarian columns", add_billing_columns),
+    (10, "Split legacy medical_records table", split_medical_records),
+    (11, "Create default admin account", create_default_admin),
+    (12, "Index treatments and billing by pet and date", add_treatment_indexes),
+    (13, "Create treatment_events view", create_treatment_events_view),
+    (14, "Create managed secondary indexes", create_managed_indexes),
+    (15, "Create invoice and user ID sequences", create_sequences),
+    (16, "Index appointments by status for the Urgent tab", create_managed_indexes),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+_LOCK_NAME = "petmedix_schema_migration"
+_checked = set()
+_checked_lock = threading.Lock()
+
+
+def _ensure_version_table(cursor):
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INT PRIMARY KEY,
+        description VARCHAR(255) NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    """)
+
+
+def current_version(db):
+    """Return the highest applied migration version, or 0 for an unversioned schema."""
+    try:
+        db.cursor.execute("SELECT MAX(version) FROM schema_version")
+        row = db.cursor.fetchone()
+        return (row[0] or 0) if row else 0
+    except mariadb.Error:
+        return 0
+
+
+def pending_migrations(db):
+    """Return the (version, description) pairs that have not been applied yet."""
+    version = current_version(db)
+    return [(v, description) for v, description, _ in MIGRATIONS if v > version]
+
+
+def run_migrations(db):
+    """Apply every pending migration in order. Returns the number applied."""
+    cursor = db.cursor
+    # Serialise migrations across workstations that start at the same time
+    cursor.execute("SELECT GET_LOCK(?, 30)", (_LOCK_NAME,))
+    cursor.fetchone()
+    applied = 0
+    try:
+        _ensure_version_table(cursor)
+        version = current_version(db)
+        for target, description, step in MIGRATIONS:
+            if target <= version:
+                continue
+            log.info("Applying migration %s: %s...", target, description)
+            try:
+                step(db)
+                cursor.execute(
+                    "INSERT INTO schema_version (version, description) VALUES (?, ?)",
+                    (target, description)
+                )
+                db.conn.commit()
+                applied += 1
+            except mariadb.Error as e:
+                db.conn.rollback()
+                log.error("❌ Migration %s failed: %s", target, e)
+                raise
+        if applied:
+            log.info("✅ Schema is at version %s (%s migration(s) applied)", LATEST_VERSION, applied)
+        return applied
+    finally:
+        cursor.execute("SELECT RELEASE_LOCK(?)", (_LOCK_NAME,))
+        cursor.fetchone()
+
+
+def ensure_schema(db, key):
+    """Bring the schema up to date and make sure an admin exists, at most once per process for the given pool key."""
+    with _checked_lock:
+        if key in _checked:
+            return
+        try:
+            if current_version(db) < LATEST_VERSION:
+                run_migrations(db)
+            # Checked on every start, not only by migration 11: deleting or demoting
+            # the last admin must not lock everyone out
+            create_default_admin(db)
+            db.conn.commit()
+        except mariadb.Error as e:
+            log.error("❌ Error migrating schema: %s", e)
+            return
+        _checked.add(key)
@@ -0,0 +1,350 @@
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from multiprocessing import get_context
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+from modules.letterhead import HEADER_HEIGHT, X_MARGIN, Y_MARGIN, letterhead
+from modules.reference_data import reference_data
+
+# PDF documents drawn from plain rows and dicts, with no Qt objects involved, so
+# the same code serves the Save PDF buttons and batch exports running in a
+# process pool. A batch job is a picklable (kind, file_path, clinic, payload)
+# tuple; see render_document for the kinds. clinic=None means the cached
+# clinic record (see modules/reference_data.py).
+
+PAGE_SIZE = (letter[1], letter[0])  # landscape
+ROW_HEIGHT = 25
+
+TREATMENT_REPORT_HEADERS = {
+    "Consultation": ["Consultation Date", "Pet Name", "Owner/Client", "Risk Status",
+                     "Reason for Consultation", "Diagnosis", "Prescribed Treatment/Medication", "Veterinarian"],
+    "Deworming": ["Deworming Date", "Pet Name", "Owner/Client", "Deworming Medication",
+                  "Dosage Administered", "Next Scheduled Deworming", "Veterinarian"],
+    "Vaccination": ["Vaccination Date", "Pet Name", "Owner/Client", "Vaccine Administered",
+                    "Dosage Administered", "Next Scheduled Vaccination", "Veterinarian"],
+    "Surgery": ["Surgery Date", "Pet Name", "Owner/Client", "Risk Status",
+                "Type of Surgery", "Anesthesia Used", "Next Follow-up Date", "Veterinarian"],
+    "Grooming": ["Grooming Date", "Pet Name", "Owner/Client", "Grooming Service/s Availed",
+                 "Notes", "Next Grooming Date", "Veterinarian"],
+    "Other Treatments": ["Treatment Date", "Pet Name", "Owner/Client", "Treatment Type",
+                         "Medication/Procedure Used", "Dosage/Duration", "Veterinarian"],
+}
+
+# Appointment status cell colours, as STATUS_BRUSHES in appointment_model
+STATUS_FILLS = {
+    "scheduled": (1.0, 0.933, 0.729),
+    "completed": (0.875, 0.949, 0.749),
+    "urgent": (1.0, 0.729, 0.729),
+    "cancelled": (0.827, 0.827, 0.827),
+    "no-show": (0.827, 0.827, 0.827),
+    "rescheduled": (1.0, 0.647, 0.0),
+}
+
+
+def _text(value):
+    if value is None:
+        return ""
+    if isinstance(value, (date, datetime)):
+        return value.strftime("%Y-%m-%d")
+    return str(value)
+
+
+def _money(value):
+    if isinstance(value, (int, float, Decimal)):
+        return f"{value:.2f}"
+    return _text(value)
+
+
+def treatment_report_row(treatment, record):
+    """Turn a fetch_medical_records row into the cells the report table shows."""
+    try:
+        record_date = datetime.strptime(record[0], "%Y-%m-%d").strftime("%d/%m/%Y")
+    except (ValueError, TypeError):
+        record_date = _text(record[0])
+    vet_name = _text(record[7])
+    if not vet_name.startswith("Dr. "):
+        vet_name = f"Dr. {vet_name}"
+    if treatment in ("Consultation", "Surgery"):
+        values = [record_date, record[2], record[3], record[8], record[4], record[5], record[6], vet_name]
+    else:
+        values = [record_date, record[2], record[3], record[4], record[5], record[6], vet_name]
+    return [_text(value) for value in values]
+
+
+def draw_footer(c, width, page=1):
+    c.setFont("Helvetica", 8)
+    c.drawString(X_MARGIN, Y_MARGIN, f"Generated by PetMedix System on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    c.drawString(width - X_MARGIN - 100, Y_MARGIN, f"Page {page}")
+
+
+def render_table(file_path, clinic, title, headers, rows, fill_column=None):
+    """Write a landscape table document (treatment reports, appointment lists).
+
+    rows are lists of strings; when fill_column is given, that column's cell is
+    shaded by STATUS_FILLS.
+    """
+    c = canvas.Canvas(file_path, pagesize=PAGE_SIZE)
+    width, height = PAGE_SIZE
+    letterhead.draw(c, title, width, height, clinic)
+
+    # Column widths from content, shrunk to fit the page
+    col_widths = [
+        max([len(header) * 7] + [len(row[i]) * 7 for row in rows]) + 10
+        for i, header in enumerate(headers)
+    ]
+    total_width = width - 2 * X_MARGIN
+    if sum(col_widths) > total_width:
+        ratio = total_width / sum(col_widths)
+        col_widths = [w * ratio for w in col_widths]
+
+    y_pos = height - Y_MARGIN - HEADER_HEIGHT - 30
+    x_pos = X_MARGIN
+    c.setFont("Helvetica-Bold", 10)
+    for i, header in enumerate(headers):
+        c.drawString(x_pos + 5, y_pos, header)
+        x_pos += col_widths[i]
+
+    c.setFont("Helvetica", 10)
+    y_pos -= ROW_HEIGHT
+    page = 1
+    for row in rows:
+        if y_pos < Y_MARGIN + ROW_HEIGHT:
+            draw_footer(c, width, page)
+            c.showPage()
+            page += 1
+            # The letterhead form is only referenced again, not redrawn
+            letterhead.draw(c, f"{title} (continued)", width, height, clinic, generated=False)
+            c.setFont("Helvetica", 10)
+            y_pos = height - Y_MARGIN - HEADER_HEIGHT - 30
+
+        x_pos = X_MARGIN
+        for col, text in enumerate(row):
+            if col == fill_column and text.lower() in STATUS_FILLS:
+                c.setFillColorRGB(*STATUS_FILLS[text.lower()])
+                c.rect(x_pos, y_pos - 15, col_widths[col], ROW_HEIGHT, fill=True)
+                c.setFillColorRGB(0, 0, 0)
+            c.drawString(x_pos + 5, y_pos, text)
+            x_pos += col_widths[col]
+        y_pos -= ROW_HEIGHT
+
+    draw_footer(c, width, page)
+    c.save()
+    return file_path
+
+
+def render_invoice(file_path, clinic, invoice):
+    """Write an invoice in the SERVICE BILLING layout from a fetch_invoice_documents dict."""
+    c = canvas.Canvas(file_path, pagesize=PAGE_SIZE)
+    width, height = PAGE_SIZE
+    letterhead.draw(c, "SERVICE BILLING", width, height, clinic)
+
+    content_width = width - 2 * X_MARGIN
+    right_column_x = X_MARGIN + content_width * 0.45 + 20
+    section_gap = 25
+    line_gap = 12
+    y_left = y_right = height - Y_MARGIN - HEADER_HEIGHT - 30
+
+    def section(x, y, heading, details):
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(x, y, heading)
+        y -= section_gap
+        c.setFont("Helvetica", 9)
+        for label, value in details:
+            c.drawString(x, y, f"{label} {_text(value)}")
+            y -= line_gap
+        return y - section_gap
+
+    vet_display = _text(invoice.get("veterinarian"))
+    if invoice.get("vet_license"):
+        vet_display = f"{vet_display} ({invoice['vet_license']})"
+    client = invoice.get("client") or {}
+    pet = invoice.get("pet") or {}
+
+    # LEFT COLUMN
+    y_left = section(X_MARGIN, y_left, "Invoice Details", [
+        ("Invoice No:", invoice.get("invoice_no")),
+        ("Date:", invoice.get("date_issued")),
+        ("Veterinarian:", vet_display),
+        ("Reason:", invoice.get("reason")),
+    ])
+    y_left = section(X_MARGIN, y_left, "Client Information", [
+        ("Client:", client.get("name")),
+        ("Control Number:", client.get("control_number")),
+        ("Address:", client.get("address")),
+        ("Contact:", client.get("contact_number")),
+        ("Email:", client.get("email")),
+    ])
+    y_left = section(X_MARGIN, y_left, "Pet Information", [
+        ("Pet Name:", pet.get("name")),
+        ("Species:", pet.get("species")),
+        ("Breed:", pet.get("breed")),
+        ("Age:", pet.get("age")),
+    ])
+
+    if invoice.get("notes"):
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(X_MARGIN, y_left, "Notes:")
+        y_left -= section_gap
+        c.setFont("Helvetica", 9)
+        line = ""
+        for word in invoice["notes"].split():
+            if len(line + " " + word) < 60:
+                line += " " + word if line else word
+            else:
+                c.drawString(X_MARGIN, y_left, line)
+                y_left -= line_gap
+                line = word
+        if line:
+            c.drawString(X_MARGIN, y_left, line)
+            y_left -= line_gap
+        y_left -= section_gap
+
+    # RIGHT COLUMN
+    c.setFont("Helvetica-Bold", 12)
+    c.drawString(right_column_x, y_right, "Services")
+    y_right -= section_gap
+    indent = 20
+    max_width = 4.5 * inch
+    for description, service_date, quantity, unit_price, line_total in invoice.get("services", []):
+        c.setFont("Helvetica-Bold", 9)
+        c.drawString(right_column_x, y_right, "Service:")
+        y_right -= line_gap
+        c.setFont("Helvetica", 9)
+        line = ""
+        for word in _text(description).split():
+            test_line = (line + " " + word) if line else word
+            if stringWidth(test_line, "Helvetica", 9) < max_width:
+                line = test_line
+            else:
+                c.drawString(right_column_x + indent, y_right, line)
+                y_right -= line_gap
+                line = word
+        if line:
+            c.drawString(right_column_x + indent, y_right, line)
+            y_right -= line_gap
+        for label, value in (("Date:", _text(service_date)), ("Quantity:", _text(quantity)),
+                             ("Unit Price:", _money(unit_price)), ("Total:", _money(line_total))):
+            c.setFont("Helvetica-Bold", 9)
+            c.drawString(right_column_x, y_right, label)
+            y_right -= line_gap
+            c.setFont("Helvetica", 9)
+            c.drawString(right_column_x + indent, y_right, value)
+            y_right -= line_gap
+        y_right -= line_gap
+
+    c.setFont("Helvetica-Bold", 10)
+    for label, value in (("Subtotal:", invoice.get("subtotal")), ("VAT:", invoice.get("vat")),
+                         ("Total Amount:", invoice.get("total_amount"))):
+        c.drawString(right_column_x, y_right, f"{label} PHP {_money(value)}")
+        y_right -= line_gap + 2
+    y_right -= section_gap
+
+    payment_details = [
+        ("Payment Status:", invoice.get("payment_status")),
+        ("Payment Method:", invoice.get("payment_method")),
+        ("Received By:", invoice.get("received_by")),
+    ]
+    if invoice.get("payment_status") == "PARTIAL":
+        payment_details.append(("Partial Amount:", f"PHP {_money(invoice.get('partial_amount') or 0)}"))
+    y_right = section(right_column_x, y_right, "Payment Information", payment_details)
+
+    c.setFont("Helvetica-Bold", 12)
+    c.drawCentredString(width / 2, min(y_left, y_right) - 30, "THANK YOU FOR TRUSTING US WITH YOUR PET'S CARE!")
+
+    draw_footer(c, width)
+    c.save()
+    return file_path
+
+
+def render_document(job):
+    """Render one batch job; runs in a worker process. Returns (file_path, error message or None)."""
+    kind, file_path, clinic, payload = job
+    try:
+        if kind == "invoice":
+            render_invoice(file_path, clinic, payload)
+        elif kind == "treatment_report":
+            treatment, records = payload
+            render_table(file_path, clinic, f"{treatment} Reports", TREATMENT_REPORT_HEADERS[treatment],
+                         [treatment_report_row(treatment, record) for record in records])
+        elif kind == "table":
+            title, headers, rows, fill_column = payload
+            render_table(file_path, clinic, title, headers, [[_text(value) for value in row] for row in rows],
+                         fill_column)
+        else:
+            raise ValueError(f"Unknown document kind: {kind}")
+        return file_path, None
+    except Exception as e:
+        return file_path, str(e)
+
+
+def _safe_name(text):
+    return "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in _text(text))
+
+
+def invoice_jobs(db, start, end, folder):
+    """One job per invoice issued in [start, end)."""
+    clinic = reference_data.clinic(db)
+    return [
+        ("invoice", os.path.join(folder, f"Invoice_{_safe_name(invoice['invoice_no'])}.pdf"), clinic, invoice)
+        for invoice in db.fetch_invoice_documents(start, end)
+    ]
+
+
+def treatment_report_jobs(db, start, end, folder, treatments=tuple(TREATMENT_REPORT_HEADERS)):
+    """One job per treatment type with records dated in [start, end)."""
+    clinic = reference_data.clinic(db)
+    jobs = []
+    for treatment in treatments:
+        records = db.fetch_medical_records(treatment, start, end)
+        if records:
+            file_name = f"{_safe_name(treatment)}_Reports_{_text(start)}_{_text(end)}.pdf"
+            jobs.append(("treatment_report", os.path.join(folder, file_name), clinic, (treatment, records)))
+    return jobs
+
+
+def appointment_jobs(db, start, end, folder):
+    """One appointment list per day in [start, end)."""
+    from modules.appointment_model import APPOINTMENT_HEADERS, STATUS_COLUMN, to_display_time
+    clinic = reference_data.clinic(db)
+    by_day = {}
+    for row in db.fetch_appointments(start, end):
+        by_day.setdefault(row[0], []).append([row[0], to_display_time(row[1]), *row[2:]])
+    return [
+        ("table", os.path.join(folder, f"Appointments_{day}.pdf"), clinic,
+         (f"Appointments {day}", APPOINTMENT_HEADERS, rows, STATUS_COLUMN))
+        for day, rows in sorted(by_day.items())
+    ]
+
+
+def export_batch(jobs, processes=None, progress=None):
+    """Render jobs across a process pool; progress(done, total, file_path, error) after each one.
+
+    Returns (written file paths, [(file_path, error)]). processes=1 renders in
+    this process, which is also what the timing baseline uses.
+    """
+    written, failed = [], []
+    total = len(jobs)
+    for file_path in {os.path.dirname(job[1]) for job in jobs}:
+        os.makedirs(file_path or ".", exist_ok=True)
+
+    def record(done, file_path, error):
+        (failed.append((file_path, error)) if error else written.append(file_path))
+        if progress:
+            progress(done, total, file_path, error)
+
+    if processes == 1 or total <= 1:
+        for done, job in enumerate(jobs, 1):
+            record(done, *render_document(job))
+        return written, failed
+
+    # spawn: the GUI process holds Qt and pooled DB connections that must not be forked
+    processes = min(processes or os.cpu_count() or 1, total)
+    with get_context("spawn").Pool(processes) as pool:
+        chunksize = max(1, total // (processes * 4))
+        for done, result in enumerate(pool.imap_unordered(render_document, jobs, chunksize), 1):
+            record(done, *result)
+    return written, failed
+
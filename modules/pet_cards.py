@@ -0,0 +1,313 @@
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize, QEvent, Signal
+from PySide6.QtGui import QColor, QFont, QPainter, QPen
+from PySide6.QtWidgets import QListView, QStyledItemDelegate, QAbstractItemView
+from modules.thumbnails import thumbnails
+
+# Pet rows as returned by Database.fetch_pets_page
+PET_FIELDS = [
+    ("Name", 0),
+    ("Gender", 1),
+    ("Species", 2),
+    ("Breed", 3),
+    ("Color", 4),
+    ("Birthdate", 5),
+    ("Age", 6),
+    ("Weight", 7),
+    ("Height", 8)
+]
+PHOTO_INDEX = 9
+PET_ID_INDEX = 10
+
+PET_ACTIONS = [
+    ("update", "Update Info"),
+    ("schedule", "Check Schedule"),
+    ("records", "See Records"),
+]
+
+CARD_HEIGHT = 160
+PHOTO_SIZE = 150
+ROW_HEIGHT = CARD_HEIGHT + 23  # 10px gap, 3px separator, 10px gap
+BUTTON_WIDTH = 200
+BUTTON_HEIGHT = 20
+NAVY = QColor("#012547")
+
+
+def format_pet_value(label_text, value):
+    """Format one pet field the way the pet card shows it."""
+    if value is None:
+        return str(value)
+    if label_text == "Age":
+        try:
+            # Convert age to float first to handle decimal values
+            age_value = float(value)
+            if age_value >= 1:
+                return f"{int(age_value)} year{'s' if age_value > 1 else ''}"
+            # Calculate months (multiply by 12 since age is in years)
+            months = int(age_value * 12)
+            if months >= 1:
+                return f"{months} month{'s' if months > 1 else ''}"
+            # Calculate weeks (multiply by 52 since age is in years)
+            weeks = int(age_value * 52)
+            return f"{weeks} week{'s' if weeks > 1 else ''}"
+        except (ValueError, TypeError):
+            return "N/A"
+    if label_text == "Weight":
+        try:
+            return f"{float(value):.2f} kg"
+        except (ValueError, TypeError):
+            return "N/A"
+    if label_text == "Height":
+        try:
+            return f"{float(value):.2f} in"
+        except (ValueError, TypeError):
+            return "N/A"
+    return str(value)
+
+
+class PetListModel(QAbstractListModel):
+    """Pet rows fetched a page at a time as the list is scrolled.
+
+    Pages come from page_loader(client_email, after_id, limit, on_rows), which
+    fetches them off the UI thread and calls on_rows(rows) when they arrive.
+    One page is requested at a time; a page requested before the last load()
+    or clear() is dropped when it arrives.
+    """
+
+    PetRole = Qt.UserRole
+
+    def __init__(self, parent=None, page_loader=None, page_size=50):
+        super().__init__(parent)
+        self._rows = []
+        self._page_loader = page_loader
+        self._page_size = page_size
+        self._client_email = None
+        self._exhausted = True
+        self._loading = False
+        self._generation = 0  # moves on every load, so late pages of an old client are dropped
+        self.loaded = False
+
+    @property
+    def page_size(self):
+        return self._page_size
+
+    @property
+    def client_email(self):
+        """The client whose pets are listed, or None for every pet."""
+        return self._client_email
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][0]
+        if role == self.PetRole:
+            return self._rows[index.row()]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted and not self._loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted or self._loading:
+            return
+        self._request(self._rows[-1][PET_ID_INDEX] if self._rows else None)
+
+    def load(self, client_email=None):
+        """List the pets of client_email (every pet if None), starting over from the first page.
+
+        Switching clients empties the list at once; reloading the same client
+        keeps its cards until the new first page replaces them. Either way no
+        further page is fetched until that first page has arrived.
+        """
+        self._generation += 1
+        if client_email != self._client_email:
+            self._client_email = client_email
+            self._set_rows([])
+        if self._page_loader is None:
+            self._exhausted = True
+            self._loading = False
+            return
+        self._exhausted = False
+        self._request(None)
+
+    def clear(self):
+        self._generation += 1
+        self._client_email = None
+        self._exhausted = True
+        self._loading = False
+        self._set_rows([])
+        self.loaded = False
+
+    def pet(self, row):
+        return self._rows[row]
+
+    def _request(self, after_id):
+        self._loading = True
+        generation = self._generation
+        self._page_loader(self._client_email, after_id, self._page_size,
+                          lambda rows: self._page_arrived(generation, after_id, rows))
+
+    def _page_arrived(self, generation, after_id, rows):
+        if generation != self._generation:
+            return
+        self._loading = False
+        rows = rows or []
+        self._exhausted = len(rows) < self._page_size
+        if after_id is None:
+            self._set_rows(rows)
+            self.loaded = True
+        elif rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+
+    def _set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+
+class PetCardDelegate(QStyledItemDelegate):
+    """Paints a pet card (photo, two info columns, action buttons) for each visible row."""
+
+    action_triggered = Signal(str, int)  # action name, model row
+
+    def __init__(self, view, actions=PET_ACTIONS):
+        super().__init__(view)
+        self._view = view
+        self.actions = list(actions)
+        self._requested = set()
+        self._failed = {}  # path -> its file fingerprint when it failed to load
+        self._label_font = QFont("Lato")
+        self._label_font.setBold(True)
+        self._value_font = QFont("Lato")
+        self._button_font = QFont("Lato", 7)
+        self._button_font.setBold(True)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        pet = index.data(PetListModel.PetRole)
+        card = QRect(option.rect.x(), option.rect.y(), option.rect.width(), CARD_HEIGHT)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(Qt.white)
+        painter.drawRoundedRect(card, 20, 20)
+
+        self._paint_photo(painter, card, pet[PHOTO_INDEX])
+        self._paint_fields(painter, card, pet)
+        for (_, text), rect in zip(self.actions, self._button_rects(card)):
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(NAVY)
+            painter.drawRoundedRect(rect, 10, 10)
+            painter.setPen(Qt.white)
+            painter.setFont(self._button_font)
+            painter.drawText(rect, Qt.AlignCenter, text)
+
+        # Separator between cards, none after the last one
+        if index.row() < index.model().rowCount() - 1:
+            painter.fillRect(QRect(card.x(), card.bottom() + 11, card.width(), 3), NAVY)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            card = QRect(option.rect.x(), option.rect.y(), option.rect.width(), CARD_HEIGHT)
+            position = event.position().toPoint()
+            for (action, _), rect in zip(self.actions, self._button_rects(card)):
+                if rect.contains(position):
+                    self.action_triggered.emit(action, index.row())
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+    def _button_rects(self, card):
+        x = card.right() - 20 - BUTTON_WIDTH
+        return [
+            QRect(x, card.y() + 5 + i * (BUTTON_HEIGHT + 5), BUTTON_WIDTH, BUTTON_HEIGHT)
+            for i in range(len(self.actions))
+        ]
+
+    def _paint_photo(self, painter, card, photo_path):
+        photo = QRect(card.x() + 10, card.y() + (CARD_HEIGHT - PHOTO_SIZE) // 2, PHOTO_SIZE, PHOTO_SIZE)
+        pixmap = thumbnails.cached(photo_path, PHOTO_SIZE) if photo_path else None
+        if pixmap is not None:
+            painter.drawPixmap(photo, pixmap)
+        elif photo_path and photo_path not in self._requested and not self._still_failing(photo_path):
+            # Decoded off the UI thread; the card repaints when it arrives
+            self._requested.add(photo_path)
+            thumbnails.request(photo_path, PHOTO_SIZE, lambda result, path=photo_path: self._photo_ready(path, result))
+
+        painter.setBrush(Qt.NoBrush)
+        painter.setPen(QPen(NAVY, 2))
+        painter.drawEllipse(photo.adjusted(1, 1, -1, -1))
+        if not photo_path:
+            painter.setFont(self._label_font)
+            painter.drawText(photo, Qt.AlignCenter, "No Photo")
+
+    def _still_failing(self, path):
+        """True if path failed to load and the file has not changed (or appeared) since."""
+        if path not in self._failed:
+            return False
+        if self._failed[path] == thumbnails.fingerprint(path):
+            return True
+        del self._failed[path]
+        return False
+
+    def _photo_ready(self, path, pixmap):
+        self._requested.discard(path)
+        if pixmap is None:
+            self._failed[path] = thumbnails.fingerprint(path)
+        self._view.viewport().update()
+
+    def _paint_fields(self, painter, card, pet):
+        left = card.x() + 10 + PHOTO_SIZE + 20
+        right = card.right() - 20 - BUTTON_WIDTH - 20
+        column_width = max(0, (right - left - 20) // 2)
+        line_height = 18
+
+        # Split fields into two columns
+        mid = (len(PET_FIELDS) + 1) // 2
+        for column, fields in enumerate((PET_FIELDS[:mid], PET_FIELDS[mid:])):
+            x = left + column * (column_width + 20)
+            top = card.y() + (CARD_HEIGHT - len(fields) * line_height) // 2
+            for row, (label_text, field_index) in enumerate(fields):
+                y = top + row * line_height
+                painter.setPen(Qt.black)
+                painter.setFont(self._label_font)
+                painter.drawText(QRect(x, y, 80, line_height), Qt.AlignLeft | Qt.AlignVCenter, f"{label_text}:")
+                painter.setFont(self._value_font)
+                value = painter.fontMetrics().elidedText(
+                    format_pet_value(label_text, pet[field_index]), Qt.ElideRight, max(0, column_width - 80)
+                )
+                painter.drawText(QRect(x + 80, y, column_width - 80, line_height), Qt.AlignLeft | Qt.AlignVCenter, value)
+
+
+class PetCardListView(QListView):
+    """Virtualized pet list: only the visible cards are painted, no widgets per pet."""
+
+    action_triggered = Signal(str, int)
+
+    def __init__(self, parent=None, actions=PET_ACTIONS, empty_text="No pets found."):
+        super().__init__(parent)
+        self.empty_text = empty_text
+        self.setItemDelegate(PetCardDelegate(self, actions))
+        self.itemDelegate().action_triggered.connect(self.action_triggered)
+        self.setUniformItemSizes(True)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setFrameShape(QListView.NoFrame)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        model = self.model()
+        if model is not None and model.rowCount() == 0 and getattr(model, "loaded", True):
+            painter = QPainter(self.viewport())
+            painter.drawText(self.viewport().rect().adjusted(0, 10, 0, 0), Qt.AlignHCenter | Qt.AlignTop, self.empty_text)
+            painter.end()
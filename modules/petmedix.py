@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import (QWidget, QTextEdit, QLabel, QHeaderView, QHBoxLayout, QVBoxLayout, 
     QPushButton, QFrame, QLineEdit, QTableWidget, QTableWidgetItem, QAbstractItemView, QScrollBar, 
-    QHeaderView, QScrollArea, QMenu, QDialog, QGridLayout, QStyledItemDelegate, QToolButton)
+    QHeaderView, QScrollArea, QMenu, QDialog, QGridLayout, QStyledItemDelegate, QToolButton, QStackedWidget)
 from PySide6.QtGui import QPixmap, QIcon
 from PySide6.QtCore import Qt, QTimer, QSize
 from modules.home import get_home_widget
@@ -10,7 +10,29 @@ from modules.appointment import get_appointment_widget
 from modules.billing import update_billing_widget
 from modules.setting import get_setting_widget
 from modules.database import Database
+from modules.treatment_events import EVENT_TYPE, EVENT_DATE, EVENT_VETERINARIAN, EVENT_REMARKS, EVENT_NEXT_DUE
+from modules.search_index import debounce
+from modules.db_worker import db_executor
+from modules.reference_data import reference_data
+from modules.dashboard_stats import TREATMENT_TABLES
+from modules.table_versions import table_versions
 import os
+import time
+from modules.log import get_logger
+
+log = get_logger(__name__)
+
+# Tables each cached page shows; a write to any of them makes the page reload on re-entry
+PAGE_TABLES = {
+    "dashboard": ("clients", "pets", "appointments", "billing") + TREATMENT_TABLES,
+    "clients": ("clients", "pets"),
+    "reports": ("pets", "clients", "billing") + TREATMENT_TABLES,
+    "appointments": ("appointments", "pets", "clients"),
+    "billings": ("billing", "billing_services", "clients", "pets"),
+    "settings": ("users", "user_profiles", "clinic_info"),
+}
+# Other workstations' writes are not counted, so a page hidden this long reloads anyway
+PAGE_MAX_AGE = 60
 
 class CustomTableDelegate(QStyledItemDelegate):
     def createEditor(self, parent, option, index):
@@ -139,20 +161,13 @@ class PetMedix(QWidget):
         navbar_layout.setSpacing(5)
 
         navbar_logo = QLabel()
-        # Load clinic logo from database for navbar only
-        db = Database()
-        try:
-            db.cursor.execute("SELECT logo_path FROM clinic_info LIMIT 1")
-            logo_path = db.cursor.fetchone()
-            if logo_path and logo_path[0] and os.path.exists(logo_path[0]):
-                navbar_logo_pixmap = QPixmap(logo_path[0])
-            else:
-                navbar_logo_pixmap = QPixmap("assets/logo.png")  # Default logo
-        except Exception as e:
-            print(f"❌ Error loading clinic logo: {e}")
+        # Clinic logo and name come from one cached clinic_info read
+        clinic = reference_data.clinic()
+        logo_path = clinic.get("logo_path")
+        if logo_path and os.path.exists(logo_path):
+            navbar_logo_pixmap = QPixmap(logo_path)
+        else:
             navbar_logo_pixmap = QPixmap("assets/logo.png")  # Default logo
-        finally:
-            db.close_connection()
             
         navbar_logo.setPixmap(navbar_logo_pixmap)
         navbar_logo.setObjectName("Navbarlogo")
@@ -161,20 +176,8 @@ class PetMedix(QWidget):
         navbar_logo.setAlignment(Qt.AlignCenter)
         navbar_logo.setScaledContents(True)
 
-        # Load clinic name from database
-        db = Database()
-        try:
-            db.cursor.execute("SELECT name FROM clinic_info LIMIT 1")
-            clinic_name = db.cursor.fetchone()
-            if clinic_name and clinic_name[0]:
-                clinic_name_text = clinic_name[0]  # Use the name directly without splitting
-            else:
-                clinic_name_text = "Petmedix Animal Clinic"
-        except Exception as e:
-            print(f"❌ Error loading clinic name: {e}")
-            clinic_name_text = "Petmedix Animal Clinic"
-        finally:
-            db.close_connection()
+        # Use the clinic name directly without splitting
+        clinic_name_text = clinic.get("name") or "Petmedix Animal Clinic"
 
         # Format the clinic name to display on two lines
         if "PetMedix" in clinic_name_text:
@@ -273,11 +276,24 @@ class PetMedix(QWidget):
         self.content_area = QWidget()
         self.content_layout = QVBoxLayout(self.content_area)
         self.content_layout.setContentsMargins(0, 0, 0, 0)
+        self.content_layout.setSpacing(0)
         self.content_area.setStyleSheet("background-color: #F4F5FC;")  # Background color for content area
 
+        # One search bar shared by every page, above a stack of pages that are built once
+        self.add_search_bar()
+        self.search_bar.textChanged.connect(self.filter_current_page)
+        self.page_stack = QStackedWidget()
+        self.content_layout.addWidget(self.page_stack)
+        self.pages = {}
+        self.current_page = None
+        self.records_page = None
+
         # Add content area to the right side of the body layout
         body_layout.addWidget(self.content_area)
 
+        # Show a busy cursor over the content while background queries run
+        db_executor.busy_changed.connect(self.set_loading)
+
         # Add the body layout (navbar + content) to the main layout
         main_layout.addLayout(body_layout)
 
@@ -306,32 +322,83 @@ class PetMedix(QWidget):
             else:
                 btn.setStyleSheet("")
 
-    def clear_content(self):
-        if self.content_layout is not None:
-            while self.content_layout.count():
-                item = self.content_layout.takeAt(0)
-                widget = item.widget()
-                layout = item.layout()
-                if widget is not None:
-                    widget.setParent(None)
-                    widget.deleteLater()
-                elif layout is not None:
-                    # Clear the layout recursively
-                    self.clear_layout(layout)
-                    
-    def clear_layout(self, layout):
-        """Recursively clear a layout and all its child widgets and layouts."""
-        if layout is not None:
-            while layout.count():
-                item = layout.takeAt(0)
-                widget = item.widget()
-                child_layout = item.layout()
-                if widget is not None:
-                    widget.setParent(None)
-                    widget.deleteLater()
-                elif child_layout is not None:
-                    self.clear_layout(child_layout)
-                    
+    def set_loading(self, loading):
+        """Loading hook for db_executor: busy cursor while any background query is running."""
+        if loading:
+            self.content_area.setCursor(Qt.BusyCursor)
+        else:
+            self.content_area.unsetCursor()
+
+    def show_page(self, name, build):
+        """Bring a cached page to the front, building it on first use.
+
+        build() returns (widget, filter slot or None). A page whose tables were
+        written while it was hidden, or that was hidden longer than
+        PAGE_MAX_AGE seconds, reloads through widget.refresh() if it has one
+        and is rebuilt otherwise. Writes the page has already redrawn from
+        data_events, recorded in its widget.synced_versions, do not count.
+        Each page keeps its own search text.
+        """
+        self.leave_current_page()
+        version = table_versions.version(*PAGE_TABLES[name])
+        page = self.pages.get(name)
+        if page is None:
+            page = self.build_page(name, build)
+        elif self.page_seen_version(name, page) != version or time.monotonic() - page["left"] > PAGE_MAX_AGE:
+            refresh = getattr(page["widget"], "refresh", None)
+            if refresh is not None:
+                log.debug("Refreshing %s page", name)
+                refresh()
+                if page["filter"] and page["search"]:
+                    page["filter"](page["search"])
+            else:
+                log.debug("Rebuilding %s page", name)
+                self.page_stack.removeWidget(page["widget"])
+                page["widget"].deleteLater()
+                page = self.build_page(name, build)
+        page["version"] = version
+        self.current_page = name
+
+        self.search_container.setVisible(page["filter"] is not None)
+        self.search_bar.blockSignals(True)
+        self.search_bar.setText(page["search"])
+        self.search_bar.blockSignals(False)
+        self.page_stack.setCurrentWidget(page["widget"])
+        return page["widget"]
+
+    def page_seen_version(self, name, page):
+        """The versions of the page's tables it already shows: as it was left, or later where it patched itself."""
+        synced = getattr(page["widget"], "synced_versions", {})
+        return tuple(
+            max(seen, synced.get(table, 0)) for table, seen in zip(PAGE_TABLES[name], page["version"])
+        )
+
+    def build_page(self, name, build):
+        widget, filter_slot = build()
+        self.page_stack.addWidget(widget)
+        page = self.pages[name] = {"widget": widget, "filter": filter_slot, "search": "", "version": None, "left": 0}
+        return page
+
+    def leave_current_page(self):
+        """Remember when and with what search text the current page was left; drop the pet records page."""
+        page = self.pages.get(self.current_page)
+        if page is not None:
+            # Writes made while the page was on screen came from the page itself, which
+            # already redrew the rows (see data_events); only later writes need a reload
+            page["version"] = table_versions.version(*PAGE_TABLES[self.current_page])
+            page["left"] = time.monotonic()
+            page["search"] = self.search_bar.text()
+        self.current_page = None
+        if self.records_page is not None:
+            self.page_stack.removeWidget(self.records_page)
+            self.records_page.deleteLater()
+            self.records_page = None
+
+    def filter_current_page(self, text):
+        page = self.pages.get(self.current_page)
+        if page is not None and page["filter"] is not None:
+            page["filter"](text)
+
     def get_greeting(self, role, first_name, last_name):
         """Generate a greeting based on the user's role and full name."""
         if role.lower() == "receptionist":
@@ -386,60 +453,56 @@ class PetMedix(QWidget):
         
         # Add the search container widget to the content layout
         self.content_layout.addWidget(search_container)
+        self.search_container = search_container
 
     def show_dashboard_content(self):
-        self.clear_content()
         self.set_active_button(self.button1)  # Set dashboard button as active
-        
-        # Reset content layout spacing and margins
-        self.content_layout.setSpacing(0)
-        self.content_layout.setContentsMargins(0, 0, 0, 0)
-        
-        self.add_search_bar()  # Keep the search bar
-        home_widget = get_home_widget(self.user_role)
-        self.content_layout.addWidget(home_widget)
-        
-        # Connect the search bar to the home filtering function if it exists
-        if hasattr(home_widget, 'filter_table'):
-            self.search_bar.textChanged.connect(home_widget.filter_table)
+
+        def build():
+            home_widget = get_home_widget(self.user_role)
+            # Connect the search bar to the home filtering function if it exists
+            return home_widget, getattr(home_widget, 'filter_table', None)
+
+        self.show_page("dashboard", build)
     
     #CLIENT TAB
     def show_client_content(self):
-        self.clear_content()
-        self.add_search_bar()
-        client_widget = get_client_widget(self, self.user_role)
-        self.content_layout.addWidget(client_widget)
-
-        # Find the clients table in the client widget
+        def build():
+            client_widget = get_client_widget(self, self.user_role)
+            # Find the clients table in the client widget
+            clients_table = client_widget.findChild(QTableWidget)
+            if not clients_table:
+                return client_widget, None
+            return client_widget, debounce(lambda text: filter_clients_table(text, clients_table), parent=client_widget)
+
+        client_widget = self.show_page("clients", build)
         clients_table = client_widget.findChild(QTableWidget)
 
-        # Connect the search bar to the filtering function
-        if clients_table:
-            self.search_bar.textChanged.connect(lambda text: filter_clients_table(text, clients_table))
-            
-            # If we have a selected client email, find and select that client in the table
-            if hasattr(self, 'selected_client_email') and self.selected_client_email:
-                for row in range(clients_table.rowCount()):
-                    cell_widget = clients_table.cellWidget(row, 0)
-                    if cell_widget:
-                        name_label = cell_widget.findChild(QLabel)
-                        if name_label:
-                            db = Database()
-                            try:
-                                db.cursor.execute("SELECT email FROM clients WHERE name = ?", (name_label.text(),))
-                                result = db.cursor.fetchone()
-                                if result and result[0] == self.selected_client_email:
-                                    # Select the row
-                                    clients_table.selectRow(row)
-                                    # Highlight the selected row
-                                    cell_widget.setStyleSheet("background-color: rgba(74, 144, 226, 0.22);")
-                                    # Simulate clicking the cell to select the client
-                                    clients_table.cellClicked.emit(row, 0)
-                                    break
-                            except Exception as e:
-                                print(f"Error finding selected client: {e}")
-                            finally:
-                                db.close_connection()
+        # If we have a selected client email, find and select that client in the table
+        if clients_table and hasattr(self, 'selected_client_email') and self.selected_client_email:
+            if clients_table.selectionModel().hasSelection():
+                return
+            for row in range(clients_table.rowCount()):
+                cell_widget = clients_table.cellWidget(row, 0)
+                if cell_widget:
+                    name_label = cell_widget.findChild(QLabel)
+                    if name_label:
+                        db = Database()
+                        try:
+                            db.cursor.execute("SELECT email FROM clients WHERE name = ?", (name_label.text(),))
+                            result = db.cursor.fetchone()
+                            if result and result[0] == self.selected_client_email:
+                                # Select the row
+                                clients_table.selectRow(row)
+                                # Highlight the selected row
+                                cell_widget.setStyleSheet("background-color: rgba(74, 144, 226, 0.22);")
+                                # Simulate clicking the cell to select the client
+                                clients_table.cellClicked.emit(row, 0)
+                                break
+                        except Exception as e:
+                            log.error("Error finding selected client: %s", e)
+                        finally:
+                            db.close_connection()
 
     def show_pet_records(self):
         # Store the current client email before showing records
@@ -450,8 +513,12 @@ class PetMedix(QWidget):
                     self.selected_client_email = widget.property("original_email")
                     break
         
-        self.clear_content()  
-        self.add_search_bar()
+        # Shown on top of the cached pages until the next page switch drops it
+        self.leave_current_page()
+        self.search_container.show()
+        self.search_bar.blockSignals(True)
+        self.search_bar.clear()
+        self.search_bar.blockSignals(False)
 
         # Create the main widget that will contain the content
         records_space = QWidget()
@@ -820,133 +887,97 @@ class PetMedix(QWidget):
         # Set the layout for the records space
         records_space.setLayout(main_layout)
         
-        # Add the records space to the content layout
-        self.content_layout.addWidget(records_space)
+        # Add the records space to the page stack
+        self.page_stack.addWidget(records_space)
+        self.page_stack.setCurrentWidget(records_space)
+        self.records_page = records_space
         
-        # Load data from database
-        db = Database()
-        try:
-            # Load pet and owner information
-            if hasattr(self, 'selected_pet_name'):
+        def fetch_pet_records(db, pet_name):
+            """Worker thread: (pet row, treatment events, medical history, past illnesses), or None."""
+            db.cursor.execute("""
+                SELECT 
+                    p.name, p.age, p.gender, p.species, p.breed, p.color,
+                    p.weight, p.height, p.pet_id
+                FROM pets p
+                WHERE p.name = ?
+            """, (pet_name,))
+            pet = db.cursor.fetchone()
+            if not pet:
+                return None
+            events = db.fetch_treatment_events(pet_id=pet[8])
+            notes = {}
+            for note_type in ("medical_history", "past_illnesses"):
                 db.cursor.execute("""
-                    SELECT 
-                        p.name, p.age, p.gender, p.species, p.breed, p.color,
-                        p.weight, p.height
-                    FROM pets p
-                    WHERE p.name = ?
-                """, (self.selected_pet_name,))
-                
+                    SELECT notes 
+                    FROM pet_notes 
+                    WHERE pet_id = ?
+                    AND note_type = ?
+                """, (pet[8], note_type))
                 result = db.cursor.fetchone()
-                if result:
-                    # Set pet information
-                    pet_widgets["NAME"].setText(result[0])
-                    pet_widgets["AGE"].setText(str(result[1]))
-                    pet_widgets["GENDER"].setText(result[2])
-                    pet_widgets["SPECIES"].setText(result[3])
-                    pet_widgets["BREED"].setText(result[4])
-                    pet_widgets["COLOR"].setText(result[5])
-                    pet_widgets["WEIGHT"].setText(f"{result[6]} kg")
-                    pet_widgets["HEIGHT"].setText(f"{result[7]} in")
-                    
-                    # Load medical records
-                    db.cursor.execute("""
-                        SELECT 
-                            DATE_FORMAT(date, '%d/%m/%Y') as date,
-                            type,
-                            veterinarian,
-                            CASE
-                                WHEN type = 'Consultation' THEN CONCAT('Diagnosis: ', diagnosis, '\nPrescribed: ', prescribed_treatment)
-                                WHEN type = 'Deworming' THEN CONCAT('Medication: ', medication, '\nDosage: ', dosage)
-                                WHEN type = 'Vaccination' THEN CONCAT('Vaccine: ', vaccine, '\nDosage: ', dosage)
-                                WHEN type = 'Surgery' THEN CONCAT('Type: ', surgery_type, '\nAnesthesia: ', anesthesia)
-                                WHEN type = 'Grooming' THEN CONCAT('Services: ', services, '\nNotes: ', notes)
-                                WHEN type = 'Other Treatment' THEN CONCAT('Treatment Type: ', treatment_type, '\nMedication: ', medication, '\nDosage: ', dosage)
-                            END as remarks,
-                            CASE
-                                WHEN type = 'Consultation' THEN NULL
-                                WHEN type = 'Deworming' THEN DATE_FORMAT(next_scheduled, '%d/%m/%Y')
-                                WHEN type = 'Vaccination' THEN DATE_FORMAT(next_scheduled, '%d/%m/%Y')
-                                WHEN type = 'Surgery' THEN DATE_FORMAT(next_followup, '%d/%m/%Y')
-                                WHEN type = 'Grooming' THEN DATE_FORMAT(next_scheduled, '%d/%m/%Y')
-                                WHEN type = 'Other Treatment' THEN NULL
-                            END as next_due_date
-                        FROM (
-                            SELECT date, 'Consultation' as type, veterinarian, diagnosis, prescribed_treatment, NULL as medication, NULL as dosage, NULL as vaccine, NULL as surgery_type, NULL as anesthesia, NULL as services, NULL as notes, NULL as treatment_type, NULL as next_scheduled, NULL as next_followup
-                            FROM consultations
-                            WHERE pet_id = (SELECT pet_id FROM pets WHERE name = ?)
-                            UNION ALL
-                            SELECT date, 'Deworming' as type, veterinarian, NULL as diagnosis, NULL as prescribed_treatment, medication, dosage, NULL as vaccine, NULL as surgery_type, NULL as anesthesia, NULL as services, NULL as notes, NULL as treatment_type, next_scheduled, NULL as next_followup
-                            FROM deworming
-                            WHERE pet_id = (SELECT pet_id FROM pets WHERE name = ?)
-                            UNION ALL
-                            SELECT date, 'Vaccination' as type, veterinarian, NULL as diagnosis, NULL as prescribed_treatment, NULL as medication, dosage, vaccine, NULL as surgery_type, NULL as anesthesia, NULL as services, NULL as notes, NULL as treatment_type, next_scheduled, NULL as next_followup
-                            FROM vaccinations
-                            WHERE pet_id = (SELECT pet_id FROM pets WHERE name = ?)
-                            UNION ALL
-                            SELECT date, 'Surgery' as type, veterinarian, NULL as diagnosis, NULL as prescribed_treatment, NULL as medication, NULL as dosage, NULL as vaccine, surgery_type, anesthesia, NULL as services, NULL as notes, NULL as treatment_type, NULL as next_scheduled, next_followup
-                            FROM surgeries
-                            WHERE pet_id = (SELECT pet_id FROM pets WHERE name = ?)
-                            UNION ALL
-                            SELECT date, 'Grooming' as type, veterinarian, NULL as diagnosis, NULL as prescribed_treatment, NULL as medication, NULL as dosage, NULL as vaccine, NULL as surgery_type, NULL as anesthesia, services, notes, NULL as treatment_type, next_scheduled, NULL as next_followup
-                            FROM grooming
-                            WHERE pet_id = (SELECT pet_id FROM pets WHERE name = ?)
-                            UNION ALL
-                            SELECT date, 'Other Treatment' as type, veterinarian, NULL as diagnosis, NULL as prescribed_treatment, medication, dosage, NULL as vaccine, NULL as surgery_type, NULL as anesthesia, NULL as services, NULL as notes, treatment_type, NULL as next_scheduled, NULL as next_followup
-                            FROM other_treatments
-                            WHERE pet_id = (SELECT pet_id FROM pets WHERE name = ?)
-                        ) AS combined_records
-                        ORDER BY date DESC
-                    """, (self.selected_pet_name,) * 6)
-                    
-                    records = db.cursor.fetchall()
-                    records_table.setRowCount(0)
-                    
-                    for row, record in enumerate(records):
-                        records_table.insertRow(row)
-                        for col, value in enumerate(record):
-                            item = QTableWidgetItem(str(value) if value else "")
-                            # Center align all columns except remarks (col 3)
-                            if col == 3:  # Remarks column
-                                item.setTextAlignment(Qt.AlignTop | Qt.AlignLeft)  # Left align for remarks
-                                # Calculate the height needed based on content
-                                text = str(value) if value else ""
-                                lines = text.count('\n') + 1
-                                height = max(25, lines * 20)  # Minimum height of 25, 20 pixels per line
-                                records_table.setRowHeight(row, height)
-                            else:  # All other columns
-                                item.setTextAlignment(Qt.AlignCenter)  # Center align for other columns
-                            records_table.setItem(row, col, item)
-                    
-                    # Load past illnesses and medical history notes
-                    self.past_illnesses_text.clear()
-                    self.medical_history_text.clear()
-                    
-                    # Load medical history notes
-                    db.cursor.execute("""
-                        SELECT notes 
-                        FROM pet_notes 
-                        WHERE pet_id = (SELECT pet_id FROM pets WHERE name = ?)
-                        AND note_type = 'medical_history'
-                    """, (self.selected_pet_name,))
-                    result = db.cursor.fetchone()
-                    if result and result[0]:
-                        self.medical_history_text.setPlainText(result[0])
-                    
-                    # Load past illnesses notes
-                    db.cursor.execute("""
-                        SELECT notes 
-                        FROM pet_notes 
-                        WHERE pet_id = (SELECT pet_id FROM pets WHERE name = ?)
-                        AND note_type = 'past_illnesses'
-                    """, (self.selected_pet_name,))
-                    result = db.cursor.fetchone()
-                    if result and result[0]:
-                        self.past_illnesses_text.setPlainText(result[0])
-            
-        except Exception as e:
-            print(f"Error loading pet records: {e}")
-        finally:
-            db.close_connection()
+                notes[note_type] = result[0] if result else None
+            return pet, events, notes["medical_history"], notes["past_illnesses"]
+
+        def show_pet_records_data(data):
+            """Fill the page from fetch_pet_records' result."""
+            if not data:
+                return
+            result, events, medical_history, past_illnesses = data
+
+            # Set pet information
+            pet_widgets["NAME"].setText(result[0])
+            pet_widgets["AGE"].setText(str(result[1]))
+            pet_widgets["GENDER"].setText(result[2])
+            pet_widgets["SPECIES"].setText(result[3])
+            pet_widgets["BREED"].setText(result[4])
+            pet_widgets["COLOR"].setText(result[5])
+            pet_widgets["WEIGHT"].setText(f"{result[6]} kg")
+            pet_widgets["HEIGHT"].setText(f"{result[7]} in")
+
+            # Load medical records
+            records = [
+                (
+                    event[EVENT_DATE].strftime('%d/%m/%Y'),
+                    event[EVENT_TYPE],
+                    event[EVENT_VETERINARIAN],
+                    event[EVENT_REMARKS],
+                    event[EVENT_NEXT_DUE].strftime('%d/%m/%Y') if event[EVENT_NEXT_DUE] else None,
+                )
+                for event in events
+            ]
+            records_table.setRowCount(0)
+
+            for row, record in enumerate(records):
+                records_table.insertRow(row)
+                for col, value in enumerate(record):
+                    item = QTableWidgetItem(str(value) if value else "")
+                    # Center align all columns except remarks (col 3)
+                    if col == 3:  # Remarks column
+                        item.setTextAlignment(Qt.AlignTop | Qt.AlignLeft)  # Left align for remarks
+                        # Calculate the height needed based on content
+                        text = str(value) if value else ""
+                        lines = text.count('\n') + 1
+                        height = max(25, lines * 20)  # Minimum height of 25, 20 pixels per line
+                        records_table.setRowHeight(row, height)
+                    else:  # All other columns
+                        item.setTextAlignment(Qt.AlignCenter)  # Center align for other columns
+                    records_table.setItem(row, col, item)
+
+            # Load past illnesses and medical history notes
+            past_illnesses_text.clear()
+            medical_history_text.clear()
+            if medical_history:
+                medical_history_text.setPlainText(medical_history)
+            if past_illnesses:
+                past_illnesses_text.setPlainText(past_illnesses)
+
+        # Load the pet, its records and notes on a worker thread
+        if hasattr(self, 'selected_pet_name'):
+            db_executor.submit(
+                fetch_pet_records, self.selected_pet_name,
+                key="pet_records",
+                on_result=show_pet_records_data,
+                context=records_space,
+            )
 
     def position_side_buttons(self, buttons_widget, parent_widget):
         """Position the side buttons at the right edge of the parent widget"""
@@ -954,47 +985,44 @@ class PetMedix(QWidget):
 
     #REPORTS TAB
     def show_report_content(self):
-        self.clear_content()
-        self.add_search_bar()
-        report_widget = get_report_widget(self.user_role)
-        self.content_layout.addWidget(report_widget)
-        
-        # Connect the search bar to the report filtering function
-        if hasattr(report_widget, 'filter_tables'):
-            self.search_bar.textChanged.connect(report_widget.filter_tables)
+        def build():
+            report_widget = get_report_widget(self.user_role)
+            # Connect the search bar to the report filtering function
+            if hasattr(report_widget, 'filter_tables'):
+                return report_widget, debounce(report_widget.filter_tables, parent=report_widget)
+            return report_widget, None
+
+        self.show_page("reports", build)
     
     # -- APPOINTMENT TAB -- #   
     def show_appointments_content(self):
-        self.clear_content()
-        self.add_search_bar()
-        appointment_widget = get_appointment_widget(self.user_role)
-        self.content_layout.addWidget(appointment_widget)
-        
-        # Connect the search bar to the appointments filtering function
-        if hasattr(appointment_widget, 'filter_appointments'):
-            self.search_bar.textChanged.connect(appointment_widget.filter_appointments)
+        def build():
+            appointment_widget = get_appointment_widget(self.user_role)
+            # Connect the search bar to the appointments filtering function
+            if hasattr(appointment_widget, 'filter_appointments'):
+                return appointment_widget, debounce(appointment_widget.filter_appointments, parent=appointment_widget)
+            return appointment_widget, None
+
+        self.show_page("appointments", build)
             
     # -- Billings Tab -- #
     def show_billings_content(self):
-        self.clear_content()
-        self.add_search_bar()
-        get_billing_widget = update_billing_widget(self.user_role)
-        billing_widget = get_billing_widget(self.user_role)
-        self.content_layout.addWidget(billing_widget)
-        
-        # Connect the search bar to the billings filtering function
-        if hasattr(billing_widget, 'filter_billings'):
-            self.search_bar.textChanged.connect(billing_widget.filter_billings)
+        def build():
+            get_billing_widget = update_billing_widget(self.user_role)
+            billing_widget = get_billing_widget(self.user_role)
+            # Connect the search bar to the billings filtering function
+            return billing_widget, getattr(billing_widget, 'filter_billings', None)
+
+        self.show_page("billings", build)
     
     # -- Settings Tab -- #
     def show_settings_content(self):
-        self.clear_content()
         # Uncheck all navigation buttons when entering settings
         for btn in self.nav_buttons:
             btn.setChecked(False)
             btn.setStyleSheet("")
-        settings_widget = get_setting_widget(user_id=self.user_id)
-        self.content_layout.addWidget(settings_widget)
+        # Settings has no search bar
+        self.show_page("settings", lambda: (get_setting_widget(user_id=self.user_id), None))
     
     def show_user_menu(self, event):
         """Show the user menu when clicking the user icon."""
@@ -1113,10 +1141,10 @@ class PetMedix(QWidget):
             """, (self.selected_pet_name, past_illnesses_notes))
                     
             db.conn.commit()
-            print("✅ Changes saved successfully")
+            log.info("✅ Changes saved successfully")
             
         except Exception as e:
-            print(f"❌ Error saving changes: {e}")
+            log.error("❌ Error saving changes: %s", e)
         finally:
             db.close_connection()
 
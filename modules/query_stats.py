@@ -0,0 +1,198 @@
+import bisect
+import json
+import re
+import sys
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from modules.log import get_logger
+
+log = get_logger(__name__)
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+BUCKET_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+PERCENTILES = (50, 95, 99)
+MAX_CALLERS = 8  # call sites kept per statement
+
+_LITERALS = re.compile(r"'(?:[^'\\]|\\.|'')*'|\b\d+(?:\.\d+)?\b")
+_IN_LISTS = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_SPACES = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def normalize(sql):
+    """Collapse a statement to its shape: literals become ?, IN lists one ?, whitespace single spaces."""
+    sql = _LITERALS.sub("?", sql)
+    sql = _IN_LISTS.sub("IN (?)", sql)
+    return _SPACES.sub(" ", sql).strip()
+
+
+class _Statement:
+    __slots__ = ("calls", "errors", "rows", "total_ms", "max_ms", "buckets", "callers")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.callers = {}
+
+    def percentile(self, p):
+        """Upper bound of the bucket holding the p-th percentile call (capped at the slowest call)."""
+        rank = self.calls * p / 100
+        seen = 0
+        for bound, count in zip(BUCKET_BOUNDS_MS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+
+class QueryStats:
+    """Per-statement call counts, latency histograms, rows returned and call sites.
+
+    Every Database cursor reports here through InstrumentedCursor. Statements
+    are grouped by normalize(sql), so the same query with different literals
+    is one entry. Recording costs a clock read and a dict update per execute.
+    """
+
+    def __init__(self):
+        self.enabled = True
+        self.started = datetime.now()
+        self._statements = {}
+        self._lock = threading.Lock()
+
+    def record(self, sql, elapsed_ms, caller, failed=False):
+        """Record one execute and return its statement key (for add_rows)."""
+        key = normalize(sql)
+        with self._lock:
+            statement = self._statements.get(key)
+            if statement is None:
+                statement = self._statements[key] = _Statement()
+            statement.calls += 1
+            statement.errors += failed
+            statement.total_ms += elapsed_ms
+            statement.max_ms = max(statement.max_ms, elapsed_ms)
+            statement.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, elapsed_ms)] += 1
+            if caller in statement.callers or len(statement.callers) < MAX_CALLERS:
+                statement.callers[caller] = statement.callers.get(caller, 0) + 1
+        return key
+
+    def add_rows(self, key, rows):
+        with self._lock:
+            statement = self._statements.get(key)
+            if statement is not None:
+                statement.rows += rows
+
+    def snapshot(self, sort="total_ms"):
+        """Return one dict per statement, slowest (by the sort field) first."""
+        with self._lock:
+            items = list(self._statements.items())
+            result = []
+            for sql, statement in items:
+                entry = {
+                    "sql": sql,
+                    "calls": statement.calls,
+                    "errors": statement.errors,
+                    "rows": statement.rows,
+                    "total_ms": round(statement.total_ms, 3),
+                    "mean_ms": round(statement.total_ms / statement.calls, 3),
+                    "max_ms": round(statement.max_ms, 3),
+                    "histogram": dict(zip([str(b) for b in BUCKET_BOUNDS_MS] + ["inf"], statement.buckets)),
+                    "callers": sorted(statement.callers.items(), key=lambda item: -item[1]),
+                }
+                for p in PERCENTILES:
+                    entry[f"p{p}_ms"] = round(statement.percentile(p), 3)
+                result.append(entry)
+        result.sort(key=lambda entry: entry[sort], reverse=True)
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._statements.clear()
+            self.started = datetime.now()
+
+    def dump(self, path):
+        """Write the snapshot to path as JSON (read it back with query_report.py)."""
+        data = {
+            "started": self.started.isoformat(timespec="seconds"),
+            "dumped": datetime.now().isoformat(timespec="seconds"),
+            "bucket_bounds_ms": list(BUCKET_BOUNDS_MS),
+            "statements": self.snapshot(),
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        log.info("✅ Query statistics written to %s", path)
+
+
+class InstrumentedCursor:
+    """Wraps a MariaDB cursor and reports every execute/executemany to a QueryStats.
+
+    Rows are counted as they are fetched and credited to the last statement.
+    on_success, if given, is called with the SQL of every statement that ran
+    without error. Anything else (rowcount, lastrowid, close, ...) goes
+    straight to the wrapped cursor.
+    """
+
+    def __init__(self, cursor, stats, on_success=None):
+        self._cursor = cursor
+        self._stats = stats
+        self._on_success = on_success
+        self._last_key = None
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def execute(self, sql, *args, **kwargs):
+        return self._timed(self._cursor.execute, sql, args, kwargs)
+
+    def executemany(self, sql, *args, **kwargs):
+        return self._timed(self._cursor.executemany, sql, args, kwargs)
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._count(1)
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        self._count(len(rows))
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._count(len(rows))
+        return rows
+
+    def _timed(self, run, sql, args, kwargs):
+        if not self._stats.enabled:
+            self._last_key = None
+            result = run(sql, *args, **kwargs)
+        else:
+            frame = sys._getframe(2)
+            caller = f"{frame.f_globals.get('__name__', '?')}.{frame.f_code.co_name}"
+            started = time.perf_counter()
+            failed = True
+            try:
+                result = run(sql, *args, **kwargs)
+                failed = False
+            finally:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                self._last_key = self._stats.record(sql, elapsed_ms, caller, failed)
+        if self._on_success is not None:
+            self._on_success(sql)
+        return result
+
+    def _count(self, rows):
+        if self._last_key is not None and rows:
+            self._stats.add_rows(self._last_key, rows)
+
+
+query_stats = QueryStats()
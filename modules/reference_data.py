@@ -0,0 +1,93 @@
+import threading
+import time
+
+# Default unit price per service type on a new invoice (all 0.00 for now)
+SERVICE_DEFAULT_PRICES = {
+    "Consultation": 0.00,
+    "Deworming": 0.00,
+    "Vaccination": 0.00,
+    "Surgery": 0.00,
+    "Grooming": 0.00,
+    "Other": 0.00
+}
+
+
+class ReferenceData:
+    """Clinic record and staff lists shared by every screen, loaded once and kept current.
+
+    The Database write methods that change clinic_info or users call
+    invalidate_clinic()/invalidate_users(); screens that write those tables
+    with their own SQL call them after committing. Entries also expire after
+    ttl seconds so edits made from another machine show up eventually.
+    """
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._entries = {}  # name -> (value, loaded_at)
+        self._lock = threading.Lock()
+
+    def clinic(self, db=None):
+        """Return the clinic_info record as a dict ({} when none is saved yet)."""
+        return self._get("clinic", lambda db: db.get_clinic_info(), db, default={})
+
+    def veterinarians(self, db=None):
+        """Return [(user_id, name, last_name, license_number)] ordered by name."""
+        return self._get("veterinarians", lambda db: db.fetch_staff("Veterinarian"), db, default=[])
+
+    def receptionists(self, db=None):
+        """Return [(user_id, name, last_name, license_number)] ordered by name."""
+        return self._get("receptionists", lambda db: db.fetch_staff("Receptionist"), db, default=[])
+
+    def vet_license(self, veterinarian_name, db=None):
+        """License number of a veterinarian given by first name or full name, or None."""
+        for _, name, last_name, license_number in self.veterinarians(db):
+            if veterinarian_name in (name, f"{name} {last_name}"):
+                return license_number
+        return None
+
+    def default_price(self, service_type):
+        return SERVICE_DEFAULT_PRICES.get(service_type, 0.00)
+
+    def invalidate_clinic(self):
+        self._drop("clinic")
+
+    def invalidate_users(self):
+        self._drop("veterinarians", "receptionists")
+
+    def invalidate(self):
+        """Drop everything, forcing the next read of each entry to re-query."""
+        with self._lock:
+            self._entries.clear()
+
+    def _drop(self, *names):
+        with self._lock:
+            for name in names:
+                self._entries.pop(name, None)
+
+    def _get(self, name, load, db, default):
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and time.monotonic() - entry[1] < self.ttl:
+                return entry[0]
+
+        # Imported here because modules.database imports this module
+        from modules.database import Database
+
+        owns_connection = db is None
+        if owns_connection:
+            db = Database()
+        try:
+            value = load(db) if db.cursor else None
+        finally:
+            if owns_connection:
+                db.close_connection()
+
+        if value is None:
+            # Failed (or nothing saved yet): not cached, so the next call retries
+            return default
+        with self._lock:
+            self._entries[name] = (value, time.monotonic())
+        return value
+
+
+reference_data = ReferenceData()
@@ -1,16 +1,28 @@
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QAbstractItemView,
     QDialog, QFormLayout, QLineEdit, QComboBox, QTextEdit, QDateEdit, QHeaderView,
-    QMessageBox, QTableWidgetItem, QFileDialog, QStackedWidget
+    QMessageBox, QFileDialog, QStackedWidget
 )
 from PySide6.QtCore import Qt, QDate, QSize
 from PySide6.QtGui import QColor, QBrush, QIcon, QPixmap
 from modules.database import Database
+from modules.db_worker import db_executor
+from modules.pdf_export import render_table
+from modules.reference_data import reference_data
+from modules.report_model import ReportTableView
+from modules.data_events import data_events, DELETE
+from modules.treatment_events import REPORT_TABLES
+from modules.table_versions import table_versions
 from datetime import datetime
-from modules.utils import show_message, create_styled_message_box
+from modules.utils import create_styled_message_box
 import os
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
+import time
+from modules.log import get_logger
+
+log = get_logger(__name__)
+
+# Writes from other workstations are not counted, so a tab loaded this long ago reloads when shown
+TAB_MAX_AGE = 60
 
 
 class ReportFormDialog(QDialog):
@@ -488,15 +500,12 @@ class ReportFormDialog(QDialog):
 
             db.close_connection()
         except Exception as e:
-            print("Failed to load pet names:", e)
+            log.error("Failed to load pet names: %s", e)
             self.pet_name_combo.addItem("Error loading pets")
             
     def load_vet_names(self):
         """Load veterinarian names into the vet_combo."""
         try:
-            db = Database()
-            cursor = db.cursor
-
             # Store current selection
             current_vet = self.vet_combo.currentText()
 
@@ -506,20 +515,15 @@ class ReportFormDialog(QDialog):
             # Add placeholder first
             self.vet_combo.addItem("Select Veterinarian")
 
-            cursor.execute("""
-                SELECT DISTINCT name
-                FROM users
-                WHERE role = 'Veterinarian'
-                ORDER BY name ASC
-            """)
-            rows = cursor.fetchall()
+            # Distinct veterinarian names from the shared reference-data cache
+            rows = list(dict.fromkeys(name for _, name, _, _ in reference_data.veterinarians()))
 
             if not rows:
                 self.vet_combo.addItem("No veterinarians found")
                 return
 
-            for row in rows:
-                vet_name = row[0].strip()  # Remove any whitespace
+            for name in rows:
+                vet_name = name.strip()  # Remove any whitespace
                 if vet_name:  # Only add if name is not empty
                     if not vet_name.startswith("Dr. "):
                         vet_name = f"Dr. {vet_name}"
@@ -537,10 +541,8 @@ class ReportFormDialog(QDialog):
                         current_vet = f"Dr. {current_vet}"
                     self.vet_combo.addItem(current_vet)
                     self.vet_combo.setCurrentText(current_vet)
-
-            db.close_connection()
         except Exception as e:
-            print("Failed to load veterinarian names:", e)
+            log.error("Failed to load veterinarian names: %s", e)
             self.vet_combo.clear()
             self.vet_combo.addItem("Error loading veterinarians")
 
@@ -888,7 +890,7 @@ class ViewReportDialog(QDialog):
                     
                     # Set field labels based on treatment type
                     if data[1] == "Consultation":
-                        print("Debug - Setting Consultation Data:", data)  # Debug print
+                        log.debug("Setting Consultation Data: %s", data)
                         self.field1_label.setText("Risk Status")
                         self.field1_input.setPlainText(data[3] if len(data) > 3 else "Low Risk")
                         self.field2_label.setText("Reason for Consultation")
@@ -952,7 +954,7 @@ class ViewReportDialog(QDialog):
             
             # Set other fields
             if data[1] == "Consultation":
-                print("Debug - Setting Consultation Data:", data)  # Debug print
+                log.debug("Setting Consultation Data: %s", data)
                 self.field1_label.setText("Risk Status")
                 self.field1_input.setPlainText(data[3] if len(data) > 3 else "Low Risk")
                 self.field2_label.setText("Reason for Consultation")
@@ -1013,7 +1015,7 @@ class ViewReportDialog(QDialog):
                 self.vet_combo.addItem("No veterinarian assigned")
             
         except Exception as e:
-            print(f"Error setting report data: {e}")
+            log.error("Error setting report data: %s", e)
 
 def get_report_widget(user_role):
     content = QWidget()
@@ -1175,52 +1177,17 @@ def get_report_widget(user_role):
     header.setLayout(header_layout)
     layout.addWidget(header)
 
-    # Create tables for each treatment type
+    # Create tables for each treatment type. Each is a ReportTableView over its
+    # own ReportTableModel, filled by refresh_tables and patched by
+    # on_data_changed; the Edit/Delete buttons are painted by one delegate.
     tables = {}
     for treatment in treatments:
-        table = QTableWidget()
-        if treatment == "Consultation":
-            table.setColumnCount(9)  # Increased to 9 columns
-            table.setHorizontalHeaderLabels([
-                "Consultation Date", "Pet Name", "Owner/Client", "Risk Status",
-                "Reason for Consultation", "Diagnosis", "Prescribed Treatment/Medication", "Veterinarian", "Action"
-            ])
-        elif treatment == "Deworming":
-            table.setColumnCount(8)
-            table.setHorizontalHeaderLabels([
-                "Deworming Date", "Pet Name", "Owner/Client", "Deworming Medication",
-                "Dosage Administered", "Next Scheduled Deworming", "Veterinarian", "Action"
-            ])
-        elif treatment == "Vaccination":
-            table.setColumnCount(8)
-            table.setHorizontalHeaderLabels([
-                "Vaccination Date", "Pet Name", "Owner/Client", "Vaccine Administered",
-                "Dosage Administered", "Next Scheduled Vaccination", "Veterinarian", "Action"
-            ])
-        elif treatment == "Surgery":
-            table.setColumnCount(9)  # 9 columns: 8 data + 1 action
-            table.setHorizontalHeaderLabels([
-                "Surgery Date", "Pet Name", "Owner/Client", "Risk Status",
-                "Type of Surgery", "Anesthesia Used", "Next Follow-up Date", "Veterinarian", "Action"
-            ])
-        elif treatment == "Grooming":
-            table.setColumnCount(8)
-            table.setHorizontalHeaderLabels([
-                "Grooming Date", "Pet Name", "Owner/Client", "Grooming Service/s Availed",
-                "Notes", "Next Grooming Date", "Veterinarian", "Action"
-            ])
-        elif treatment == "Other Treatments":
-            table.setColumnCount(8)
-            table.setHorizontalHeaderLabels([
-                "Treatment Date", "Pet Name", "Owner/Client", "Treatment Type",
-                "Medication/Procedure Used", "Dosage/Duration", "Veterinarian", "Action"
-            ])
-            
+        table = ReportTableView(treatment)
         table.horizontalHeader().setStretchLastSection(True)
         table.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
-        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: white;
                 color: black;
                 gridline-color: #000;
@@ -1238,67 +1205,28 @@ def get_report_widget(user_role):
         table.verticalHeader().setVisible(False)
         table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         table.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-
-        # Set column widths based on treatment type
-        if treatment == "Consultation":
-            # Column widths in order: Date, Pet Name, Owner/Client, Risk Status, Reason, Diagnosis, Prescribed, Vet, Action
-            column_widths = [
-                120,  # Consultation Date
-                120,  # Pet Name
-                150,  # Owner/Client
-                100,  # Risk Status
-                180,  # Reason for Consultation
-                150,  # Diagnosis
-                200,  # Prescribed Treatment/Medication
-                100,  # Veterinarian
-                140   # Action
-            ]
-            for i, width in enumerate(column_widths):
-                table.setColumnWidth(i, width)
-                # Center align the header
-                header_item = table.horizontalHeaderItem(i)
-                if header_item:
-                    header_item.setTextAlignment(Qt.AlignCenter)
-        elif treatment == "Deworming":
-            for i, width in enumerate([150, 120, 150, 180, 150, 180, 150, 100]):
-                table.setColumnWidth(i, width)
-                header_item = table.horizontalHeaderItem(i)
-                if header_item:
-                    header_item.setTextAlignment(Qt.AlignCenter)
-        elif treatment == "Vaccination":
-            for i, width in enumerate([150, 120, 150, 180, 150, 180, 150, 100]):
-                table.setColumnWidth(i, width)
-                header_item = table.horizontalHeaderItem(i)
-                if header_item:
-                    header_item.setTextAlignment(Qt.AlignCenter)
-        elif treatment == "Surgery":
-            for i, width in enumerate([120, 120, 150, 100, 180, 180, 180, 100, 140]):
-                table.setColumnWidth(i, width)
-                header_item = table.horizontalHeaderItem(i)
-                if header_item:
-                    header_item.setTextAlignment(Qt.AlignCenter)
-        elif treatment == "Grooming":
-            for i, width in enumerate([150, 120, 150, 200, 180, 180, 150, 100]):
-                table.setColumnWidth(i, width)
-                header_item = table.horizontalHeaderItem(i)
-                if header_item:
-                    header_item.setTextAlignment(Qt.AlignCenter)
-        elif treatment == "Other Treatments":
-            for i, width in enumerate([150, 120, 150, 180, 200, 180, 150, 100]):
-                table.setColumnWidth(i, width)
-                header_item = table.horizontalHeaderItem(i)
-                if header_item:
-                    header_item.setTextAlignment(Qt.AlignCenter)
+        table.action_triggered.connect(
+            lambda action, record_id, t=treatment: (
+                handle_edit_action(record_id, t) if action == "edit" else handle_delete_action(record_id, t)
+            )
+        )
 
         tables[treatment] = table
         layout.addWidget(table)
         if treatment != "Consultation":
             table.hide()
 
-    def show_table(table_to_show):
+    current_treatment = "Consultation"
+
+    def show_table(treatment):
+        nonlocal current_treatment
+        current_treatment = treatment
         for table in tables.values():
             table.hide()
-        table_to_show.show()
+        tables[treatment].show()
+        # A tab is loaded on first selection and again only once its data changed
+        if tab_is_stale(treatment):
+            load_tab(treatment)
         # Reapply current search filter when switching tables
         if current_search:
             filter_tables(current_search)
@@ -1316,7 +1244,7 @@ def get_report_widget(user_role):
     # Connect treatment buttons
     for treatment, button in treatment_buttons.items():
         button.clicked.connect(lambda checked, t=treatment: [
-            show_table(tables[t]),
+            show_table(t),
             select_treatment(treatment_buttons[t])
         ])
 
@@ -1351,23 +1279,16 @@ def get_report_widget(user_role):
     def handle_cell_click(row, col, table):
         """Handle cell click event to show report details."""
         # Skip if clicking on action buttons
-        if col == 7:  # Action column
+        if col == table.source_model.action_column:
             return
             
         try:
-            record = []
-            
             # Get all data from the row
-            for i in range(table.columnCount() - 1):  # Exclude action column
-                item = table.item(row, i)
-                if item:
-                    record.append(item.text())
-                else:
-                    record.append("")
+            record = table.proxy.row_values(row)
             
             # Ensure we have enough data
             if len(record) < 7:
-                print(f"Warning: Not enough data in row {row}")
+                log.warning("Not enough data in row %s", row)
                 return
             
             # Convert date back to yyyy-MM-dd format
@@ -1377,16 +1298,7 @@ def get_report_widget(user_role):
                 date = datetime.now().strftime("%Y-%m-%d")
             record[0] = date
             
-            # Get the treatment type from the table
-            treatment = None
-            for t, tab in tables.items():
-                if tab == table:
-                    treatment = t
-                    break
-            
-            if not treatment:
-                print("Warning: Could not determine treatment type")
-                return
+            treatment = table.source_model.treatment
             
             # Ensure the data is in the correct order for the view dialog
             try:
@@ -1403,7 +1315,7 @@ def get_report_widget(user_role):
                         record[7] if len(record) > 7 else ""   # Vet [7]
                     ]
                     
-                    print("Debug - Reordered Record:", reordered_record)  # Debug print
+                    log.debug("Reordered Record: %s", reordered_record)
                 elif treatment == "Surgery":
                     # Final mapping for Surgery
                     reordered_record = [
@@ -1434,15 +1346,15 @@ def get_report_widget(user_role):
                 dialog.exec()
                 
             except Exception as e:
-                print(f"Error processing report data: {e}")
+                log.error("Error processing report data: %s", e)
                 return
             
         except Exception as e:
-            print(f"Error showing report details: {e}")
+            log.error("Error showing report details: %s", e)
 
     # Connect cell click event for all tables
     for table in tables.values():
-        table.cellClicked.connect(lambda row, col, t=table: handle_cell_click(row, col, t))
+        table.clicked.connect(lambda index, t=table: handle_cell_click(index.row(), index.column(), t))
 
     def filter_tables(search_text):
         """Filter all tables based on search text."""
@@ -1451,16 +1363,8 @@ def get_report_widget(user_role):
         
         visible_rows = 0
         for table in tables.values():
-            for row in range(table.rowCount()):
-                show_row = False
-                for col in range(table.columnCount()):
-                    item = table.item(row, col)
-                    if item and current_search in item.text().lower():
-                        show_row = True
-                        break
-                table.setRowHidden(row, not show_row)
-                if show_row:
-                    visible_rows += 1
+            table.proxy.set_search_text(current_search)
+            visible_rows += table.proxy.rowCount()
 
         # Update table headers to show search status
         for table in tables.values():
@@ -1498,9 +1402,7 @@ def get_report_widget(user_role):
         if dialog.exec_() == QDialog.Accepted:
             # Get form data
             form_data = dialog.get_form_data()
-            print("\n=== Debug: Form Data ===")
-            print(f"Treatment Type: {treatment_type}")
-            print(f"Form Data: {form_data}")
+            log.debug("Creating %s report: %s", treatment_type, form_data)
             
             # Extract pet name and client name
             pet_name_display = form_data["pet_name"]
@@ -1512,9 +1414,7 @@ def get_report_widget(user_role):
                 pet_name = pet_name_display.strip()
                 client_name = ""
 
-            print(f"\n=== Debug: Extracted Names ===")
-            print(f"Pet Name: {pet_name}")
-            print(f"Client Name: {client_name}")
+            log.debug("Extracted names: pet=%s client=%s", pet_name, client_name)
 
             # Validate data
             if not (pet_name and form_data["veterinarian"]):
@@ -1550,9 +1450,7 @@ def get_report_widget(user_role):
                     return
 
                 pet_id, client_id, client_name = result
-                print(f"\n=== Debug: Database IDs ===")
-                print(f"Pet ID: {pet_id}")
-                print(f"Client ID: {client_id}")
+                log.debug("Database IDs: pet_id=%s client_id=%s", pet_id, client_id)
 
                 # Validate required fields based on treatment type
                 missing_fields = []
@@ -1618,12 +1516,10 @@ def get_report_widget(user_role):
                     form_data.get("prescribed", ""), form_data["veterinarian"],
                     form_data.get("risk_status", "Low Risk")  # Add risk_status parameter
                 ):
-                    # Refresh all tables with new data
-                    refresh_tables()
-                    
+                    # The new row is added by on_data_changed
                     # Show the appropriate table based on the report type
                     if treatment_type in tables:
-                        show_table(tables[treatment_type])
+                        show_table(treatment_type)
                         select_treatment(treatment_buttons[treatment_type])
                     
                     success_msg = create_styled_message_box(
@@ -1642,8 +1538,7 @@ def get_report_widget(user_role):
                     error_msg.setStandardButtons(QMessageBox.Ok)
                     error_msg.exec()
             except Exception as e:
-                print(f"\n=== Debug: Error ===")
-                print(f"Error: {e}")
+                log.error("Error creating report: %s", e)
                 error_msg = create_styled_message_box(
                     QMessageBox.Critical,
                     "Error",
@@ -1654,144 +1549,100 @@ def get_report_widget(user_role):
             finally:
                 db.close_connection()
         else:
-            print("Report creation cancelled")
+            log.debug("Report creation cancelled")
+
+    # Per-tab (table_versions snapshot, load time), None until the tab is first loaded
+    tab_state = {treatment: None for treatment in treatments}
+
+    def tab_version(treatment):
+        return table_versions.version(REPORT_TABLES[treatment][0], "pets", "clients")
+
+    def tab_is_stale(treatment):
+        state = tab_state[treatment]
+        return state is None or state[0] != tab_version(treatment) or time.monotonic() - state[1] > TAB_MAX_AGE
 
     def refresh_tables():
-        """Refresh all tables with data from the database."""
-        db = Database()
+        """Reload the visible tab if it is stale, then the stale hidden tabs, in the background."""
+        if tab_is_stale(current_treatment):
+            load_tab(current_treatment, then=load_hidden_tabs)
+        else:
+            load_hidden_tabs()
+
+    def load_hidden_tabs():
+        for treatment in treatments:
+            if treatment != current_treatment and tab_is_stale(treatment):
+                load_tab(treatment)
+
+    def load_tab(treatment, then=None):
+        """Fetch one treatment's records on a worker thread and fill its table when they arrive."""
+        # Taken before the query, so writes made while it runs still count as changes
+        version = tab_version(treatment)
+        db_executor.submit(
+            lambda db: db.fetch_medical_records(treatment),
+            key=f"report_tab:{treatment}",
+            on_result=lambda records: populate_tab(treatment, records, version, then),
+            context=content,
+        )
+
+    def populate_tab(treatment, records, version, then=None):
+        """Fill one table from fetch_medical_records' result."""
         try:
-            # Clear all tables
-            for table in tables.values():
-                table.setRowCount(0)
-
-            # Fetch and populate data for each treatment type
-            for treatment in treatments:
-                records = db.fetch_medical_records(treatment)
-                target_table = tables[treatment]
-                
-                for record in records:
-                    row_position = target_table.rowCount()
-                    target_table.insertRow(row_position)
-                    
-                    try:
-                        # Format date to dd/MM/yyyy
-                        date = datetime.strptime(record[0], "%Y-%m-%d").strftime("%d/%m/%Y")
-                        
-                        # Ensure veterinarian name has Dr. prefix
-                        vet_name = record[7]
-                        if not vet_name.startswith("Dr. "):
-                            vet_name = f"Dr. {vet_name}"
-                        
-                        # Add items to table with center alignment
-                        if treatment == "Consultation":
-                            # 9 columns, use record[8] for risk_status
-                            for i, value in enumerate([
-                                date, record[2], record[3], record[8], record[4], record[5], record[6], vet_name
-                            ]):
-                                item = QTableWidgetItem(str(value))
-                                item.setTextAlignment(Qt.AlignCenter)
-                                target_table.setItem(row_position, i, item)
-                        elif treatment == "Surgery":
-                            # 9 columns, use record[8] for risk_status
-                            for i, value in enumerate([
-                                date, record[2], record[3], record[8], record[4], record[5], record[6], vet_name
-                            ]):
-                                item = QTableWidgetItem(str(value))
-                                item.setTextAlignment(Qt.AlignCenter)
-                                target_table.setItem(row_position, i, item)
-                        else:
-                            # 8 columns, do NOT use record[8]
-                            for i, value in enumerate([
-                                date, record[2], record[3], record[4], record[5], record[6], vet_name
-                            ]):
-                                item = QTableWidgetItem(str(value))
-                                item.setTextAlignment(Qt.AlignCenter)
-                                target_table.setItem(row_position, i, item)
-
-                        # Add action buttons
-                        action_widget = QWidget()
-                        action_layout = QHBoxLayout(action_widget)
-                        action_layout.setContentsMargins(0, 0, 0, 0)
-                        action_layout.setSpacing(5)
-                        action_layout.setAlignment(Qt.AlignCenter)  # Center the buttons
-
-                        edit_button = QPushButton("Edit")
-                        edit_button.setFixedWidth(70)
-                        edit_button.setStyleSheet("""
-                            QPushButton {
-                                background-color: #FED766;
-                                border: none;
-                                border-radius: 5px;
-                                font-size: 10px;
-                                padding: 2px 8px;
-                                min-height: 10px;
-                                min-width: 30px;
-                                font-family: Lato;
-                            }
-                            QPushButton:hover {
-                                background-color: #FFC107;
-                            }
-                        """)
-
-                        delete_button = QPushButton("Delete")
-                        delete_button.setFixedWidth(70)
-                        delete_button.setStyleSheet("""
-                            QPushButton {
-                                background-color: #FF6F61;
-                                border: none;
-                                border-radius: 5px;
-                                font-size: 10px;
-                                color: white;
-                                padding: 2px 8px;
-                                min-height: 10px;
-                                min-width: 30px;
-                                font-family: Lato;
-                            }
-                            QPushButton:hover {
-                                background-color: #E53935;
-                            }
-                        """)
-
-                        # Connect button signals
-                        edit_button.clicked.connect(lambda checked, r=row_position, t=treatment: handle_edit_action(r, t))
-                        delete_button.clicked.connect(lambda checked, r=row_position, t=treatment: handle_delete_action(r, t))
-
-                        action_layout.addWidget(edit_button)
-                        action_layout.addWidget(delete_button)
-                        action_widget.setLayout(action_layout)
-                        
-                        # Set the action buttons in the correct column based on treatment type
-                        if treatment == "Consultation":
-                            target_table.setCellWidget(row_position, 8, action_widget)  # Column 8 for Consultation
-                        elif treatment == "Surgery":
-                            target_table.setCellWidget(row_position, 8, action_widget)  # Column 8 for Surgery
-                        else:
-                            target_table.setCellWidget(row_position, 7, action_widget)  # Column 7 for other treatments
-
-                    except Exception as e:
-                        print(f"Error adding row to table: {e}")
+            tables[treatment].source_model.set_records(records)
+            tab_state[treatment] = (version, time.monotonic())
         except Exception as e:
-            print(f"Error refreshing tables: {e}")
-        finally:
-            db.close_connection()
-            
+            log.error("Error refreshing %s table: %s", treatment, e)
+
         # Reapply current search filter after refresh
         if current_search:
             filter_tables(current_search)
+        if treatment == current_treatment and tab_version(treatment) != version:
+            # Written while the rows were being fetched
+            load_tab(treatment, then)
+        elif then is not None:
+            then()
+
+    def apply_record_change(treatment, record_id, record):
+        """Patch the one row of a record that was inserted or updated (record) or deleted (None)."""
+        if tab_state[treatment] is None:
+            # Not loaded yet; the change arrives with the rest of the tab
+            return
+        model = tables[treatment].source_model
+        if record is None:
+            model.remove_record(record_id)
+        else:
+            model.put_record(record)
+        # The patched tab is as current as a reload would make it
+        tab_state[treatment] = (tab_version(treatment), tab_state[treatment][1])
+
+    report_types = {REPORT_TABLES[treatment][0]: treatment for treatment in treatments}
+
+    def on_data_changed(entity, record_id, op):
+        """data_events listener: re-read just the changed record instead of every table."""
+        treatment = report_types.get(entity)
+        if treatment is None:
+            return
+        # The row is redrawn here, so this write needs no reload when the page is shown again
+        content.synced_versions.update(table_versions.snapshot(entity))
+        if op == DELETE:
+            apply_record_change(treatment, record_id, None)
+            return
+        db_executor.submit(
+            lambda db: db.fetch_medical_record(treatment, record_id),
+            key=f"report_record:{entity}:{record_id}",
+            on_result=lambda record: apply_record_change(treatment, record_id, record),
+            context=content,
+        )
 
-    def handle_edit_action(row, treatment):
+    content.synced_versions = {}
+    data_events.subscribe(on_data_changed, owner=content)
+
+    def handle_edit_action(record_id, treatment):
         """Handle edit button click in the action buttons."""
         try:
-            table = tables[treatment]
-            record = []
+            model = tables[treatment].source_model
             # Get all data from the row
-            for i in range(table.columnCount() - 1):  # Exclude action column
-                item = table.item(row, i)
-                if item:
-                    record.append(item.text())
-                else:
-                    record.append("")
-            print("Debug - Record array:", record)
+            record = model.row_values(model.row_of(record_id))
+            log.debug("Record array: %s", record)
 
             # Convert date back to yyyy-MM-dd format
             try:
@@ -1864,7 +1715,7 @@ def get_report_widget(user_role):
                 dialog.field_widgets[treatment]["diagnosis"][1].setPlainText(record[5])
                 dialog.field_widgets[treatment]["prescribed"][1].setPlainText(record[6])
             elif treatment == "Surgery":
-                print("Debug - Setting Surgery Data:", record)
+                log.debug("Setting Surgery Data: %s", record)
                 dialog.set_pet_name_for_edit(record[2].strip(), record[1].strip())
                 dialog.update_form_fields(treatment)
                 # Set risk status
@@ -1960,155 +1811,18 @@ def get_report_widget(user_role):
                 form_data = dialog.get_form_data()
                 # Keep the original treatment type
                 form_data["type"] = treatment
-                
-                pet_name_display = form_data["pet_name"]
-                parts = pet_name_display.split(" - ")
-                if len(parts) >= 2:
-                    client_name = parts[0].strip()
-                    pet_name = parts[-1].strip()
-                else:
-                    pet_name = pet_name_display.strip()
-                    client_name = ""
 
                 db = Database()
                 try:
-                    # Get pet and client IDs
-                    db.cursor.execute("""
-                        SELECT p.pet_id, c.client_id
-                        FROM pets p
-                        JOIN clients c ON p.client_id = c.client_id
-                        WHERE LOWER(p.name) = LOWER(?)
-                    """, (pet_name,))
-                    result = db.cursor.fetchone()
-                    if not result:
-                        error_msg = create_styled_message_box(
-                            QMessageBox.Warning,
-                            "Error",
-                            f"Pet '{pet_name}' not found!"
-                        )
-                        error_msg.setStandardButtons(QMessageBox.Ok)
-                        error_msg.exec()
-                        return
-                    pet_id, client_id = result
-
-                    # Get the record ID first
-                    record_id = None
-                    if treatment == "Consultation":
-                        db.cursor.execute("""
-                            SELECT consultation_id FROM consultations 
-                            WHERE pet_id = ? AND client_id = ? AND date = ? AND reason = ? AND risk_status = ?
-                        """, (pet_id, client_id, date, record[4], record[3]))
-                        result = db.cursor.fetchone()
-                        if result:
-                            record_id = result[0]
-                    elif treatment == "Surgery":
-                        print(f"Debug - Updating surgery record: pet_id={pet_id}, client_id={client_id}, date={date}, surgery_type={record[4]}, risk_status={record[3]}")
-                        db.cursor.execute("""
-                            SELECT surgery_id FROM surgeries 
-                            WHERE pet_id = ? AND client_id = ? AND date = ? AND surgery_type = ? AND risk_status = ?
-                        """, (pet_id, client_id, date, record[4], record[3]))
-                        result = db.cursor.fetchone()
-                        if result:
-                            record_id = result[0]
-                            print(f"Debug - Found surgery_id: {record_id}")
-                            # Update the surgery record
-                            db.cursor.execute("""
-                                UPDATE surgeries 
-                                SET date = ?, surgery_type = ?, anesthesia = ?, next_followup = ?, veterinarian = ?, risk_status = ?
-                                WHERE surgery_id = ?
-                            """, (form_data["date"], form_data["reason"], form_data["diagnosis"], 
-                                 form_data["prescribed"], form_data["veterinarian"], form_data.get("risk_status", "Low Risk"), record_id))
-                            db.conn.commit()
-                            success_msg = create_styled_message_box(
-                                QMessageBox.Information,
-                                "Success",
-                                "Surgery report updated successfully!"
-                            )
-                            success_msg.setStandardButtons(QMessageBox.Ok)
-                            success_msg.exec()
-                            refresh_tables()
-                            return
-                    elif treatment == "Deworming":
-                        db.cursor.execute("""
-                            SELECT deworming_id FROM deworming 
-                            WHERE pet_id = ? AND client_id = ? AND date = ? AND medication = ?
-                        """, (pet_id, client_id, date, record[3]))
-                        result = db.cursor.fetchone()
-                        if result:
-                            record_id = result[0]
-                    elif treatment == "Vaccination":
-                        db.cursor.execute("""
-                            SELECT vaccination_id FROM vaccinations 
-                            WHERE pet_id = ? AND client_id = ? AND date = ? AND vaccine = ?
-                        """, (pet_id, client_id, date, record[3]))
-                        result = db.cursor.fetchone()
-                        if result:
-                            record_id = result[0]
-                    elif treatment == "Grooming":
-                        db.cursor.execute("""
-                            SELECT grooming_id FROM grooming 
-                            WHERE pet_id = ? AND client_id = ? AND date = ? AND services = ?
-                        """, (pet_id, client_id, date, record[3]))
-                        result = db.cursor.fetchone()
-                        if result:
-                            record_id = result[0]
-                    elif treatment == "Other Treatments":
-                        db.cursor.execute("""
-                            SELECT treatment_id FROM other_treatments 
-                            WHERE pet_id = ? AND client_id = ? AND date = ? AND treatment_type = ?
-                        """, (pet_id, client_id, date, record[3]))
-                        result = db.cursor.fetchone()
-                        if result:
-                            record_id = result[0]
-
-                    if not record_id:
-                        error_msg = create_styled_message_box(
-                            QMessageBox.Warning,
-                            "Error",
-                            "Could not find the record to update!"
-                        )
-                        error_msg.setStandardButtons(QMessageBox.Ok)
-                        error_msg.exec()
-                        return
-
-                    # Update the record based on treatment type
-                    if treatment == "Consultation":
-                        db.cursor.execute("""
-                            UPDATE consultations 
-                            SET date = ?, reason = ?, diagnosis = ?, prescribed_treatment = ?, veterinarian = ?, risk_status = ?
-                            WHERE consultation_id = ?
-                        """, (form_data["date"], form_data["reason"], form_data["diagnosis"], 
-                             form_data["prescribed"], form_data["veterinarian"], form_data.get("risk_status", "Low Risk"), record_id))
-                    elif treatment == "Deworming":
-                        db.cursor.execute("""
-                            UPDATE deworming 
-                            SET date = ?, medication = ?, dosage = ?, next_scheduled = ?, veterinarian = ?
-                            WHERE deworming_id = ?
-                        """, (form_data["date"], form_data["reason"], form_data["diagnosis"], 
-                             form_data["prescribed"], form_data["veterinarian"], record_id))
-                    elif treatment == "Vaccination":
-                        db.cursor.execute("""
-                            UPDATE vaccinations 
-                            SET date = ?, vaccine = ?, dosage = ?, next_scheduled = ?, veterinarian = ?
-                            WHERE vaccination_id = ?
-                        """, (form_data["date"], form_data["reason"], form_data["diagnosis"], 
-                             form_data["prescribed"], form_data["veterinarian"], record_id))
-                    elif treatment == "Grooming":
-                        db.cursor.execute("""
-                            UPDATE grooming 
-                            SET date = ?, services = ?, notes = ?, next_scheduled = ?, veterinarian = ?
-                            WHERE grooming_id = ?
-                        """, (form_data["date"], form_data["reason"], form_data["diagnosis"], 
-                             form_data["prescribed"], form_data["veterinarian"], record_id))
-                    elif treatment == "Other Treatments":
-                        db.cursor.execute("""
-                            UPDATE other_treatments 
-                            SET date = ?, treatment_type = ?, medication = ?, dosage = ?, veterinarian = ?
-                            WHERE treatment_id = ?
-                        """, (form_data["date"], form_data["reason"], form_data["diagnosis"], 
-                             form_data["prescribed"], form_data["veterinarian"], record_id))
-                    
-                    db.conn.commit()
+                    updated = db.update_medical_record(
+                        treatment, record_id, form_data["date"], form_data["reason"], form_data["diagnosis"],
+                        form_data["prescribed"], form_data["veterinarian"], form_data.get("risk_status", "Low Risk")
+                    )
+                finally:
+                    db.close_connection()
+
+                # The row itself is patched by on_data_changed
+                if updated:
                     success_msg = create_styled_message_box(
                         QMessageBox.Information,
                         "Success",
@@ -2116,39 +1830,20 @@ def get_report_widget(user_role):
                     )
                     success_msg.setStandardButtons(QMessageBox.Ok)
                     success_msg.exec()
-                    refresh_tables()
-                except Exception as e:
-                    db.conn.rollback()
-                    print(f"Debug - Error updating record: {e}")
+                else:
                     error_msg = create_styled_message_box(
                         QMessageBox.Critical,
                         "Error",
-                        f"Failed to update report: {e}"
+                        "Failed to update report!"
                     )
                     error_msg.setStandardButtons(QMessageBox.Ok)
                     error_msg.exec()
-                finally:
-                    db.close_connection()
         except Exception as e:
-            print(f"Error editing report: {e}")
+            log.error("Error editing report: %s", e)
 
-    def handle_delete_action(row, treatment):
+    def handle_delete_action(record_id, treatment):
         """Handle delete button click in the action buttons."""
         try:
-            table = tables[treatment]
-            record = []
-            
-            # Get all data from the row
-            for i in range(table.columnCount() - 1):  # Exclude action column
-                item = table.item(row, i)
-                if item:
-                    record.append(item.text())
-                else:
-                    record.append("")
-            
-            # Convert date back to yyyy-MM-dd format
-            date = datetime.strptime(record[0], "%d/%m/%Y").strftime("%Y-%m-%d")
-            
             # Create confirmation message box
             confirm = create_styled_message_box(
                 QMessageBox.Question,
@@ -2159,60 +1854,14 @@ def get_report_widget(user_role):
             confirm.setDefaultButton(QMessageBox.No)
             
             if confirm.exec() == QMessageBox.Yes:
-                # Delete the report from the database
+                # Delete the report from the database; on_data_changed removes its row
                 db = Database()
                 try:
-                    # Get pet and client IDs first
-                    db.cursor.execute("""
-                        SELECT p.pet_id, c.client_id
-                        FROM pets p
-                        JOIN clients c ON p.client_id = c.client_id
-                        WHERE p.name = ? AND c.name = ?
-                    """, (record[1], record[2]))  # pet_name and client_name
-                    result = db.cursor.fetchone()
-                    
-                    if not result:
-                        show_message(None, "Could not find the pet and client records!", QMessageBox.Warning)
-                        return
-                        
-                    pet_id, client_id = result
-                    
-                    # Delete from the appropriate table based on treatment type
-                    if treatment == "Consultation":
-                        db.cursor.execute("""
-                            DELETE FROM consultations
-                            WHERE pet_id = ? AND client_id = ? AND date = ? AND reason = ? AND risk_status = ?
-                        """, (pet_id, client_id, date, record[4], record[3]))
-                    elif treatment == "Deworming":
-                        db.cursor.execute("""
-                            DELETE FROM deworming
-                            WHERE pet_id = ? AND client_id = ? AND date = ? AND medication = ?
-                        """, (pet_id, client_id, date, record[3]))
-                    elif treatment == "Vaccination":
-                        db.cursor.execute("""
-                            DELETE FROM vaccinations
-                            WHERE pet_id = ? AND client_id = ? AND date = ? AND vaccine = ?
-                        """, (pet_id, client_id, date, record[3]))
-                    elif treatment == "Surgery":
-                        print(f"Debug - Deleting surgery record: pet_id={pet_id}, client_id={client_id}, date={date}, surgery_type={record[4]}, risk_status={record[3]}")
-                        db.cursor.execute("""
-                            DELETE FROM surgeries
-                            WHERE pet_id = ? AND client_id = ? AND date = ? AND surgery_type = ? AND risk_status = ?
-                        """, (pet_id, client_id, date, record[4], record[3]))
-                    elif treatment == "Grooming":
-                        db.cursor.execute("""
-                            DELETE FROM grooming
-                            WHERE pet_id = ? AND client_id = ? AND date = ? AND services = ?
-                        """, (pet_id, client_id, date, record[3]))
-                    elif treatment == "Other Treatments":
-                        db.cursor.execute("""
-                            DELETE FROM other_treatments
-                            WHERE pet_id = ? AND client_id = ? AND date = ? AND treatment_type = ?
-                        """, (pet_id, client_id, date, record[3]))
-                    
-                    db.conn.commit()
-                    
-                    # Show success message
+                    deleted = db.delete_medical_record(treatment, record_id)
+                finally:
+                    db.close_connection()
+
+                if deleted:
                     success_msg = create_styled_message_box(
                         QMessageBox.Information,
                         "Success",
@@ -2220,32 +1869,26 @@ def get_report_widget(user_role):
                     )
                     success_msg.setStandardButtons(QMessageBox.Ok)
                     success_msg.exec()
-
-                    # Refresh the table
-                    refresh_tables()
-                except Exception as e:
-                    db.conn.rollback()
-                    print(f"Debug - Error deleting record: {e}")
+                else:
                     error_msg = create_styled_message_box(
                         QMessageBox.Critical,
                         "Error",
-                        f"Failed to delete report: {e}"
+                        "Failed to delete report!"
                     )
                     error_msg.setStandardButtons(QMessageBox.Ok)
                     error_msg.exec()
-                finally:
-                    db.close_connection()
                 
         except Exception as e:
-            print(f"Error deleting report: {e}")
+            log.error("Error deleting report: %s", e)
 
     # Initial load of data
     refresh_tables()
 
     add_report_button.clicked.connect(lambda: open_report_form(treatment_buttons["Consultation"].text()))
 
-    # Store the filter function in the content widget for external access
+    # Store the filter and reload functions in the content widget for external access
     content.filter_tables = filter_tables
+    content.refresh = refresh_tables
 
     def save_pdf():
         # Detect which table is visible
@@ -2260,6 +1903,18 @@ def get_report_widget(user_role):
         if not table:
             return
 
+        # A tab whose records have not arrived yet would export an empty document
+        if tab_state[table_type] is None:
+            load_tab(table_type)
+            info_msg = create_styled_message_box(
+                QMessageBox.Information,
+                "Loading",
+                f"{table_type} reports are still loading. Please try again in a moment."
+            )
+            info_msg.setStandardButtons(QMessageBox.Ok)
+            info_msg.exec()
+            return
+
         # Define the output folder relative to the project
         folder_path = os.path.join(os.getcwd(), "pdf_reports", "reports")
         os.makedirs(folder_path, exist_ok=True)  # Create folder if not exists
@@ -2269,125 +1924,11 @@ def get_report_widget(user_role):
         file_name = f"{table_type}_Reports_{timestamp}.pdf"
         file_path = os.path.join(folder_path, file_name)
 
-        # Create PDF in landscape mode
-        c = canvas.Canvas(file_path, pagesize=letter)
-        width, height = letter
-        # Swap width and height for landscape
-        width, height = height, width
-        c.setPageSize((width, height))
-
-        # Get clinic information from database
-        db = Database()
-        clinic_info = None
-        license_number = None
-        try:
-            clinic_info = db.get_clinic_info()
-            # Get clinic license number
-            db.cursor.execute("SELECT vet_license FROM clinic_info LIMIT 1")
-            result = db.cursor.fetchone()
-            if result and result[0]:
-                license_number = result[0]
-        except Exception as e:
-            print(f"Error fetching clinic info: {e}")
-        finally:
-            db.close_connection()
-
-        # Set up margins and spacing
-        x_margin = 50
-        y_margin = 50
-        row_height = 25
-        header_height = 100
-
-        # Draw header
-        # Clinic Logo (if available)
-        logo_path = "assets/logologin.png"
-        if os.path.exists(logo_path):
-            c.drawImage(logo_path, x_margin, height - y_margin - 50, width=50, height=50)
-
-        # Clinic Information
-        if clinic_info:
-            c.setFont("Helvetica-Bold", 16)
-            c.drawString(x_margin + 60, height - y_margin - 20, clinic_info.get("name", "PetMedix Animal Clinic"))
-            
-            # Draw license number if available
-            if license_number:
-                c.setFont("Helvetica", 10)
-                c.drawString(x_margin + 60, height - y_margin - 35, f"License No: {license_number}")
-            
-            c.setFont("Helvetica", 12)
-            c.drawString(x_margin + 60, height - y_margin - 50, clinic_info.get("address", ""))
-            c.drawString(x_margin + 60, height - y_margin - 70, f"Contact: {clinic_info.get('contact_number', '')}")
-
-        # Report Title and Date
-        c.setFont("Helvetica-Bold", 14)
-        c.drawString(width - 250, height - y_margin - 20, f"{table_type} Reports")
-        c.setFont("Helvetica", 12)
-        c.drawString(width - 250, height - y_margin - 40, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-
-        # Draw a line under the header
-        c.setStrokeColorRGB(0.003922, 0.145098, 0.278431)  # #012547 in RGB
-        c.line(x_margin, height - y_margin - header_height, width - x_margin, height - y_margin - header_height)
-
-        # Table headers - exclude action column
-        y_start = height - y_margin - header_height - 30
-        headers = [table.horizontalHeaderItem(i).text() for i in range(table.columnCount() - 1)]  # Exclude action column
-        
-        # Calculate column widths based on content
-        col_widths = []
-        total_width = width - (2 * x_margin)
-        for i in range(table.columnCount() - 1):  # Exclude action column
-            # Get the maximum width needed for this column
-            header_width = len(headers[i]) * 7  # Approximate width for header text
-            content_width = 0
-            for row in range(table.rowCount()):
-                item = table.item(row, i)
-                if item:
-                    content_width = max(content_width, len(item.text()) * 7)
-            col_widths.append(max(header_width, content_width) + 10)  # Add padding
-
-        # Adjust column widths to fit page
-        total_col_width = sum(col_widths)
-        if total_col_width > total_width:
-            ratio = total_width / total_col_width
-            col_widths = [w * ratio for w in col_widths]
-
-        # Draw table headers
-        x_pos = x_margin
-        c.setFont("Helvetica-Bold", 10)
-        for i, header in enumerate(headers):
-            c.drawString(x_pos + 5, y_start, header)
-            x_pos += col_widths[i]
-
-        # Draw table content
-        c.setFont("Helvetica", 10)
-        y_pos = y_start - row_height
-        for row in range(table.rowCount()):
-            # Check if we need a new page
-            if y_pos < y_margin + row_height:
-                c.showPage()
-                # Redraw header on new page
-                c.setFont("Helvetica-Bold", 16)
-                c.drawString(x_margin + 60, height - y_margin - 20, clinic_info.get("name", "PetMedix Animal Clinic"))
-                c.setFont("Helvetica-Bold", 14)
-                c.drawString(width - 250, height - y_margin - 20, f"{table_type} Reports (continued)")
-                c.setFont("Helvetica", 10)
-                y_pos = height - y_margin - header_height - 30
-
-            x_pos = x_margin
-            for col in range(table.columnCount() - 1):  # Exclude action column
-                item = table.item(row, col)
-                if item:
-                    # Draw text
-                    c.drawString(x_pos + 5, y_pos, item.text())
-                x_pos += col_widths[col]
-            y_pos -= row_height
-
-        # Add footer
-        c.setFont("Helvetica", 8)
-        c.drawString(x_margin, y_margin, f"Generated by PetMedix System on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        c.drawString(width - x_margin - 100, y_margin, f"Page 1")
-
-        c.save()
+        # Exclude action column
+        model = table.source_model
+        headers = model.headers[:model.action_column]
+        rows = [model.row_values(row) for row in range(model.rowCount())]
+        render_table(file_path, None, f"{table_type} Reports", headers, rows)
         
         # Show success message
         success_msg = create_styled_message_box(
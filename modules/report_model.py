@@ -0,0 +1,309 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QRect, QEvent, Signal
+from PySide6.QtGui import QColor, QFont, QPainter
+from PySide6.QtWidgets import QTableView, QStyledItemDelegate
+from modules.pdf_export import treatment_report_row
+from modules.search_index import SearchIndex
+from modules.log import get_logger
+
+log = get_logger(__name__)
+
+# Column headers of each treatment table; the last column holds the Edit/Delete actions
+REPORT_HEADERS = {
+    "Consultation": [
+        "Consultation Date", "Pet Name", "Owner/Client", "Risk Status",
+        "Reason for Consultation", "Diagnosis", "Prescribed Treatment/Medication", "Veterinarian", "Action"
+    ],
+    "Deworming": [
+        "Deworming Date", "Pet Name", "Owner/Client", "Deworming Medication",
+        "Dosage Administered", "Next Scheduled Deworming", "Veterinarian", "Action"
+    ],
+    "Vaccination": [
+        "Vaccination Date", "Pet Name", "Owner/Client", "Vaccine Administered",
+        "Dosage Administered", "Next Scheduled Vaccination", "Veterinarian", "Action"
+    ],
+    "Surgery": [
+        "Surgery Date", "Pet Name", "Owner/Client", "Risk Status",
+        "Type of Surgery", "Anesthesia Used", "Next Follow-up Date", "Veterinarian", "Action"
+    ],
+    "Grooming": [
+        "Grooming Date", "Pet Name", "Owner/Client", "Grooming Service/s Availed",
+        "Notes", "Next Grooming Date", "Veterinarian", "Action"
+    ],
+    "Other Treatments": [
+        "Treatment Date", "Pet Name", "Owner/Client", "Treatment Type",
+        "Medication/Procedure Used", "Dosage/Duration", "Veterinarian", "Action"
+    ],
+}
+
+REPORT_COLUMN_WIDTHS = {
+    "Consultation": [120, 120, 150, 100, 180, 150, 200, 100, 140],
+    "Deworming": [150, 120, 150, 180, 150, 180, 150, 100],
+    "Vaccination": [150, 120, 150, 180, 150, 180, 150, 100],
+    "Surgery": [120, 120, 150, 100, 180, 180, 180, 100, 140],
+    "Grooming": [150, 120, 150, 200, 180, 180, 150, 100],
+    "Other Treatments": [150, 120, 150, 180, 200, 180, 150, 100],
+}
+
+# (action, label, colour, hover colour, text colour), painted left to right
+REPORT_ACTIONS = [
+    ("edit", "Edit", QColor("#FED766"), QColor("#FFC107"), QColor("#000")),
+    ("delete", "Delete", QColor("#FF6F61"), QColor("#E53935"), QColor("#FFF")),
+]
+BUTTON_WIDTH = 70
+BUTTON_HEIGHT = 20
+BUTTON_SPACING = 5
+
+
+class ReportTableModel(QAbstractTableModel):
+    """The records of one treatment type, newest first, as the report table shows them.
+
+    Rows are Database.fetch_medical_records rows; each is kept as its display
+    values plus its date (yyyy-MM-dd, for ordering) and record id. The search
+    index is keyed by record id so single records can be put or removed
+    without re-indexing the rest.
+    """
+
+    def __init__(self, treatment, parent=None):
+        super().__init__(parent)
+        self.treatment = treatment
+        self.headers = REPORT_HEADERS[treatment]
+        self.action_column = len(self.headers) - 1
+        self._rows = []
+        self._dates = []
+        self._ids = []  # record id per row, for list.index lookups
+        self._index = SearchIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.column() == self.action_column:
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation != Qt.Horizontal:
+            return None
+        if role == Qt.DisplayRole:
+            return self.headers[section]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def set_records(self, records):
+        """Replace the contents with the rows of Database.fetch_medical_records."""
+        self.beginResetModel()
+        self._rows = []
+        self._dates = []
+        self._ids = []
+        for record in records:
+            try:
+                values = treatment_report_row(self.treatment, record)
+            except Exception as e:
+                log.error("Error adding row to table: %s", e)
+                continue
+            self._rows.append(values)
+            self._dates.append(str(record[0]))
+            self._ids.append(record[-1])
+        self._index.build(zip(self._ids, self._rows))
+        self.endResetModel()
+
+    def put_record(self, record):
+        """Insert or replace one record (a fetch_medical_records row) in its date order."""
+        record_id = record[-1]
+        values = treatment_report_row(self.treatment, record)
+        date = str(record[0])
+        row = self.row_of(record_id)
+        if row is not None and self._dates[row] == date:
+            # Same date, so the row keeps its place: rewrite its cells
+            self._rows[row] = values
+            self._index.add(record_id, values)
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.action_column - 1))
+            return
+        if row is not None:
+            self.remove_record(record_id)
+        # New records usually belong at the top
+        position = self._position(date)
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.insert(position, values)
+        self._dates.insert(position, date)
+        self._ids.insert(position, record_id)
+        self._index.add(record_id, values)
+        self.endInsertRows()
+
+    def remove_record(self, record_id):
+        """Drop one record's row, if it is shown."""
+        row = self.row_of(record_id)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._dates[row]
+        del self._ids[row]
+        self._index.remove(record_id)
+        self.endRemoveRows()
+
+    def record_id(self, row):
+        return self._ids[row]
+
+    def row_of(self, record_id):
+        """The row showing record_id, or None."""
+        try:
+            return self._ids.index(record_id)
+        except ValueError:
+            return None
+
+    def row_values(self, row):
+        """Return the display values of one row, without the action column."""
+        return list(self._rows[row])
+
+    def matching_ids(self, query):
+        """Return the set of record ids matching the query, or None when the query is empty."""
+        return self._index.search(query)
+
+    def _position(self, date):
+        """Where a record of this date goes in the newest-first order, ahead of its equals (binary search)."""
+        low, high = 0, len(self._dates)
+        while low < high:
+            middle = (low + high) // 2
+            if self._dates[middle] > date:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+
+class ReportFilterProxyModel(QSortFilterProxyModel):
+    """Search view over a ReportTableModel."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._search_text = ""
+
+    def set_search_text(self, text):
+        text = text.lower()
+        if text != self._search_text:
+            self._search_text = text
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._search_text:
+            return True
+        model = self.sourceModel()
+        matches = model.matching_ids(self._search_text)
+        return matches is None or model.record_id(source_row) in matches
+
+    def row_values(self, row):
+        """Return the display values of a row in this view's coordinates."""
+        return self.sourceModel().row_values(self.mapToSource(self.index(row, 0)).row())
+
+    def record_id(self, row):
+        """Return the record id of a row in this view's coordinates."""
+        return self.sourceModel().record_id(self.mapToSource(self.index(row, 0)).row())
+
+
+class ReportActionDelegate(QStyledItemDelegate):
+    """Paints the Edit/Delete buttons of the action column; no widgets or style sheets per row."""
+
+    action_triggered = Signal(str, int)  # action name, view row
+
+    def __init__(self, parent=None, actions=REPORT_ACTIONS):
+        super().__init__(parent)
+        self.actions = list(actions)
+        self.hovered = None  # (view row, action) under the mouse
+        self._font = QFont("Lato")
+        self._font.setPixelSize(10)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self._font)
+        for (action, text, colour, hover_colour, text_colour), rect in zip(self.actions, self.button_rects(option.rect)):
+            hovered = self.hovered == (index.row(), action)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(hover_colour if hovered else colour)
+            painter.drawRoundedRect(rect, 5, 5)
+            painter.setPen(text_colour)
+            painter.drawText(rect, Qt.AlignCenter, text)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            action = self.action_at(option.rect, event.position().toPoint())
+            if action is not None:
+                self.action_triggered.emit(action, index.row())
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def action_at(self, cell, position):
+        """The action whose button contains position, or None."""
+        for (action, *_), rect in zip(self.actions, self.button_rects(cell)):
+            if rect.contains(position):
+                return action
+        return None
+
+    def button_rects(self, cell):
+        """The buttons' rectangles, centred in the cell."""
+        total = len(self.actions) * BUTTON_WIDTH + (len(self.actions) - 1) * BUTTON_SPACING
+        x = cell.x() + (cell.width() - total) // 2
+        y = cell.y() + (cell.height() - BUTTON_HEIGHT) // 2
+        return [
+            QRect(x + i * (BUTTON_WIDTH + BUTTON_SPACING), y, BUTTON_WIDTH, BUTTON_HEIGHT)
+            for i in range(len(self.actions))
+        ]
+
+
+class ReportTableView(QTableView):
+    """A treatment table whose action column is painted by one ReportActionDelegate.
+
+    action_triggered carries the action name and the record id of its row.
+    """
+
+    action_triggered = Signal(str, int)
+
+    def __init__(self, treatment, parent=None):
+        super().__init__(parent)
+        self.source_model = ReportTableModel(treatment, self)
+        self.proxy = ReportFilterProxyModel(self)
+        self.proxy.setSourceModel(self.source_model)
+        self.setModel(self.proxy)
+        self.delegate = ReportActionDelegate(self)
+        self.setItemDelegateForColumn(self.source_model.action_column, self.delegate)
+        self.delegate.action_triggered.connect(
+            lambda action, row: self.action_triggered.emit(action, self.proxy.record_id(row))
+        )
+        self.setMouseTracking(True)
+        for column, width in enumerate(REPORT_COLUMN_WIDTHS[treatment]):
+            self.setColumnWidth(column, width)
+
+    def mouseMoveEvent(self, event):
+        super().mouseMoveEvent(event)
+        self._set_hovered(self._action_under(event.position().toPoint()))
+
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        self._set_hovered(None)
+
+    def _action_under(self, position):
+        index = self.indexAt(position)
+        if not index.isValid() or index.column() != self.source_model.action_column:
+            return None
+        action = self.delegate.action_at(self.visualRect(index), position)
+        return (index.row(), action) if action is not None else None
+
+    def _set_hovered(self, hovered):
+        if hovered == self.delegate.hovered:
+            return
+        self.delegate.hovered = hovered
+        if hovered is None:
+            self.unsetCursor()
+        else:
+            self.setCursor(Qt.PointingHandCursor)
+        self.viewport().update()
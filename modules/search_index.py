@@ -0,0 +1,238 @@
+import bisect
+import re
+import threading
+from PySide6.QtCore import QTimer
+from modules.db_worker import db_executor
+from modules.log import get_logger
+
+log = get_logger(__name__)
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+_MAX_CHAR = chr(0x10FFFF)
+_QUERY_CACHE_SIZE = 256
+
+
+def tokenize(text):
+    """Split text into lower-case alphanumeric words."""
+    return _TOKEN_RE.findall(str(text).lower()) if text else []
+
+
+class SearchIndex:
+    """In-memory token/prefix index from record keys to the words of their searchable fields.
+
+    A query matches a record when every query word is a prefix of some word in
+    the record, so "bel sant" finds Bella owned by Maria Santos. Lookups bisect a
+    sorted vocabulary instead of scanning records, and results are cached until
+    the index changes.
+    """
+
+    def __init__(self):
+        self._documents = {}   # key -> frozenset of tokens
+        self._postings = {}    # token -> set of keys
+        self._vocabulary = []  # sorted tokens, for prefix ranges
+        self._cache = {}
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._documents)
+
+    def build(self, records):
+        """Replace the contents with (key, fields) pairs in one pass."""
+        with self._lock:
+            self._documents = {}
+            self._postings = {}
+            for key, fields in records:
+                tokens = self._tokens(fields)
+                self._documents[key] = tokens
+                for token in tokens:
+                    self._postings.setdefault(token, set()).add(key)
+            self._vocabulary = sorted(self._postings)
+            self._cache.clear()
+
+    def add(self, key, fields):
+        """Index (or re-index) one record."""
+        with self._lock:
+            self._discard(key)
+            tokens = self._tokens(fields)
+            self._documents[key] = tokens
+            for token in tokens:
+                keys = self._postings.get(token)
+                if keys is None:
+                    self._postings[token] = {key}
+                    bisect.insort(self._vocabulary, token)
+                else:
+                    keys.add(key)
+            self._cache.clear()
+
+    def remove(self, key):
+        with self._lock:
+            self._discard(key)
+            self._cache.clear()
+
+    def clear(self):
+        self.build([])
+
+    def search(self, query):
+        """Return the set of matching keys, or None when the query has no words (match all)."""
+        words = tokenize(query)
+        if not words:
+            return None
+        cache_key = " ".join(sorted(set(words)))
+        with self._lock:
+            result = self._cache.get(cache_key)
+            if result is not None:
+                return result
+
+            result = None
+            # Longest words are the most selective, so intersect them first
+            for word in sorted(set(words), key=len, reverse=True):
+                matches = self._prefix_matches(word)
+                result = matches if result is None else result & matches
+                if not result:
+                    break
+            result = frozenset(result or ())
+
+            if len(self._cache) >= _QUERY_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[cache_key] = result
+            return result
+
+    def _prefix_matches(self, prefix):
+        low = bisect.bisect_left(self._vocabulary, prefix)
+        high = bisect.bisect_left(self._vocabulary, prefix + _MAX_CHAR, low)
+        if high - low == 1:
+            return set(self._postings[self._vocabulary[low]])
+        matches = set()
+        for token in self._vocabulary[low:high]:
+            matches.update(self._postings[token])
+        return matches
+
+    def _discard(self, key):
+        for token in self._documents.pop(key, ()):
+            keys = self._postings[token]
+            keys.discard(key)
+            if not keys:
+                del self._postings[token]
+                position = bisect.bisect_left(self._vocabulary, token)
+                del self._vocabulary[position]
+
+    @staticmethod
+    def _tokens(fields):
+        tokens = set()
+        for field in fields:
+            tokens.update(tokenize(field))
+        return frozenset(tokens)
+
+
+class ClientSearchIndex:
+    """Shared index of clients by name, email and pet names, keyed by client_id.
+
+    The whole index is built on a worker thread by reload(), which the
+    clients page calls whenever it reloads its list (so other workstations'
+    edits arrive with the page's own reload). Edits made here are applied
+    one client at a time through refresh()/remove(). Searching never
+    touches the database.
+    """
+
+    QUERY = """
+        SELECT c.client_id, c.name, c.email, GROUP_CONCAT(p.name SEPARATOR ' ')
+        FROM clients c
+        LEFT JOIN pets p ON c.client_id = p.client_id
+    """
+
+    def __init__(self):
+        self._index = SearchIndex()
+        self._names = {}
+        self._loaded = False
+        self._changed = False  # set by refresh/remove while a reload is running
+
+    def matching_names(self, query):
+        """Return the client names matching the query, or None when the query is empty or the index is not built yet."""
+        if not self._loaded:
+            return None
+        client_ids = self._index.search(query)
+        if client_ids is None:
+            return None
+        return {self._names[client_id] for client_id in client_ids if client_id in self._names}
+
+    def reload(self, then=None, context=None):
+        """Rebuild the index from the database on a worker thread, then call then() on the UI thread.
+
+        The job is dropped if context (a widget) is destroyed first.
+        """
+        self._changed = False
+
+        def install(rows):
+            self._names = {client_id: name for client_id, name, _, _ in rows}
+            self._index.build((client_id, (name, email, pets)) for client_id, name, email, pets in rows)
+            self._loaded = True
+            if self._changed:
+                # A client was written while the rows were read; they may predate it
+                self.reload(then, context)
+            elif then is not None:
+                then()
+
+        db_executor.submit(
+            lambda db: self._fetch(db, " GROUP BY c.client_id"),
+            key="client_search",
+            on_result=install,
+            context=context,
+        )
+
+    def refresh(self, client_id):
+        """Re-index one client after it or one of its pets changed."""
+        self._changed = True
+        if not self._loaded:
+            return
+        # Imported here because modules.database is imported by the screens that use this
+        from modules.database import Database
+
+        db = Database()
+        try:
+            rows = self._fetch(db, " WHERE c.client_id = ? GROUP BY c.client_id", (client_id,))
+        except Exception as e:
+            log.error("❌ Error loading client search index: %s", e)
+            return
+        finally:
+            db.close_connection()
+        if rows:
+            self._store(rows[0])
+        else:
+            self.remove(client_id)
+
+    def remove(self, client_id):
+        self._changed = True
+        self._index.remove(client_id)
+        self._names.pop(client_id, None)
+
+    def _store(self, row):
+        client_id, name, email, pets = row
+        self._names[client_id] = name
+        self._index.add(client_id, (name, email, pets))
+
+    def _fetch(self, db, clause, params=()):
+        db.cursor.execute(self.QUERY + clause, params)
+        return db.cursor.fetchall()
+
+
+client_search = ClientSearchIndex()
+
+
+def debounce(callback, delay_ms=150, parent=None):
+    """Return a slot that calls callback with the latest argument once typing pauses."""
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    pending = []
+
+    def fire():
+        if pending:
+            callback(pending.pop())
+            pending.clear()
+
+    def slot(value):
+        pending[:] = [value]
+        timer.start(delay_ms)
+
+    timer.timeout.connect(fire)
+    slot.timer = timer
+    return slot
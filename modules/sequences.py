@@ -0,0 +1,89 @@
+import re
+
+# Counters behind generated identifiers, one row per prefix:
+#   "INV-2025" -> invoice numbers INV-2025-0001, INV-2025-0002, ...
+#   "2025R"    -> receptionist user IDs 2025R0001, ...
+#   "2025V"    -> veterinarian user IDs 2025V0001, ...
+# last_value is the highest number handed out so far. Taking numbers bumps it
+# with a single primary-key UPDATE whose row lock is held until the caller's
+# transaction ends, so two workstations can never draw the same number and a
+# rolled-back insert gives its number back.
+
+INVOICE_PATTERN = re.compile(r"^(INV-\d{4})-(\d+)$")
+USER_ID_PATTERN = re.compile(r"^(\d{4}[RV])(\d+)$")
+
+
+def invoice_prefix(year):
+    return f"INV-{year}"
+
+
+def format_invoice_no(prefix, number):
+    return f"{prefix}-{str(number).zfill(4)}"
+
+
+def user_id_prefix(year, role):
+    return f"{year}{'R' if role == 'Receptionist' else 'V'}"
+
+
+def format_user_id(prefix, number):
+    return f"{prefix}{str(number).zfill(4)}"
+
+
+def allocate(cursor, name, count=1):
+    """Reserve count consecutive numbers of sequence name and return them as a range.
+
+    Must run inside the transaction that inserts the rows using the numbers;
+    other connections drawing from the same sequence wait until it commits
+    or rolls back. Bulk imports pass count=len(rows) to take a whole block
+    in one statement.
+    """
+    if count < 1:
+        raise ValueError("count must be at least 1")
+    # LAST_INSERT_ID(expr) leaves the new value in this connection's session,
+    # so reading it back cannot see another workstation's increment
+    cursor.execute(
+        """
+        INSERT INTO sequences (name, last_value) VALUES (?, LAST_INSERT_ID(?))
+        ON DUPLICATE KEY UPDATE last_value = LAST_INSERT_ID(last_value + ?)
+        """,
+        (name, count, count)
+    )
+    cursor.execute("SELECT LAST_INSERT_ID()")
+    last = cursor.fetchone()[0]
+    return range(last - count + 1, last + 1)
+
+
+def peek(cursor, name):
+    """The number allocate() would hand out next, without reserving it (for display only)."""
+    cursor.execute("SELECT last_value FROM sequences WHERE name = ?", (name,))
+    row = cursor.fetchone()
+    return (row[0] if row else 0) + 1
+
+
+def seed_from_existing(cursor):
+    """Raise every counter to at least the highest invoice number and user ID already stored.
+
+    Safe to run again after rows were imported outside the application
+    (e.g. from data.sql); counters never move backwards.
+    """
+    highest = {}
+    cursor.execute("SELECT invoice_no FROM billing WHERE invoice_no LIKE 'INV-%'")
+    values = [row[0] for row in cursor.fetchall()]
+    cursor.execute("SELECT user_id FROM users")
+    values += [row[0] for row in cursor.fetchall()]
+
+    for value in values:
+        match = INVOICE_PATTERN.match(value or "") or USER_ID_PATTERN.match(value or "")
+        if match:
+            prefix, number = match.group(1), int(match.group(2))
+            highest[prefix] = max(highest.get(prefix, 0), number)
+
+    for name, last_value in highest.items():
+        cursor.execute(
+            """
+            INSERT INTO sequences (name, last_value) VALUES (?, ?)
+            ON DUPLICATE KEY UPDATE last_value = GREATEST(last_value, VALUES(last_value))
+            """,
+            (name, last_value)
+        )
+    return highest
@@ -3,13 +3,19 @@ from PySide6.QtWidgets import (
     QLineEdit, QFrame, QGridLayout, QScrollArea, QComboBox, QDateEdit, QFileDialog, QMessageBox
 )
 from PySide6.QtCore import Qt, QSize, QDate
-from PySide6.QtGui import QIcon, QPixmap, QPainter, QPainterPath
+from PySide6.QtGui import QIcon, QPixmap
+import logging
 import os
 from shutil import copyfile
 import re
 
 from modules.database import Database
+from modules.reference_data import reference_data
+from modules.thumbnails import thumbnails
 from modules.utils import show_message
+from modules.log import get_logger
+
+log = get_logger(__name__)
 
 class UpdateInfoDialog(QDialog):
     def __init__(self, user_data=None):
@@ -767,23 +773,7 @@ def get_setting_widget(user_id=None):
         db.cursor.execute("SELECT photo_path FROM user_profiles WHERE user_id = ?", (user_id,))
         result = db.cursor.fetchone()
         if result and result[0] and os.path.exists(result[0]):
-            original_pixmap = QPixmap(result[0])
-            size = user_picture.size()
-            rounded_pixmap = QPixmap(size)
-            rounded_pixmap.fill(Qt.transparent)
-
-            painter = QPainter(rounded_pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            path = QPainterPath()
-            path.addEllipse(0, 0, size.width(), size.height())
-            painter.setClipPath(path)
-
-            scaled_pixmap = original_pixmap.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-            painter.drawPixmap(0, 0, scaled_pixmap)
-            painter.end()
-
-            user_picture.setPixmap(rounded_pixmap)
-            user_picture.setText("")
+            thumbnails.show_on(user_picture, result[0], fallback_text="User\nPicture")
         else:
             user_picture.setPixmap(QPixmap())
             user_picture.setText("User\nPicture")
@@ -820,9 +810,10 @@ def get_setting_widget(user_id=None):
             )
             db.conn.commit()
 
-            # Debug print: confirm photo_path in DB
-            db.cursor.execute("SELECT photo_path FROM user_profiles WHERE user_id = ?", (user_id,))
-            print("Photo path in DB after upload:", db.cursor.fetchone())
+            # Confirm photo_path in DB (an extra query, so only when debugging)
+            if log.isEnabledFor(logging.DEBUG):
+                db.cursor.execute("SELECT photo_path FROM user_profiles WHERE user_id = ?", (user_id,))
+                log.debug("Photo path in DB after upload: %s", db.cursor.fetchone())
 
             # Reload the user photo from the database
             reload_user_photo()
@@ -906,26 +897,10 @@ def get_setting_widget(user_id=None):
                     if user_db_data[4] == 'Veterinarian':  # Check if role is Veterinarian
                         info_fields.append(("License Number", "license"))
         except Exception as e:
-            print(f"Error fetching user data: {e}")
+            log.error("Error fetching user data: %s", e)
             
         if user_data.get("photo_path") and os.path.exists(user_data["photo_path"]):
-            original_pixmap = QPixmap(user_data["photo_path"])
-            size = user_picture.size()
-            rounded_pixmap = QPixmap(size)
-            rounded_pixmap.fill(Qt.transparent)
-
-            painter = QPainter(rounded_pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            path = QPainterPath()
-            path.addEllipse(0, 0, size.width(), size.height())
-            painter.setClipPath(path)
-
-            scaled_pixmap = original_pixmap.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-            painter.drawPixmap(0, 0, scaled_pixmap)
-            painter.end()
-
-            user_picture.setPixmap(rounded_pixmap)
-            user_picture.setText("")
+            thumbnails.show_on(user_picture, user_data["photo_path"])
     
     # Create and populate the info fields
     row = 0
@@ -1029,11 +1004,12 @@ def get_setting_widget(user_id=None):
                     )
 
                     db.conn.commit()
-                    print("✅ User information updated and saved to database.")
+                    reference_data.invalidate_users()
+                    log.info("✅ User information updated and saved to database.")
                 except Exception as e:
-                    print(f"❌ Error updating user info in database: {e}")
+                    log.error("❌ Error updating user info in database: %s", e)
         else:
-            print("Update cancelled")
+            log.debug("Update cancelled")
     
     def open_security_dialog():
         if user_id:
@@ -1121,18 +1097,17 @@ def get_setting_widget(user_id=None):
     clinic_info_container.setLayout(clinic_info_column)
     clinic_info_container.setFixedWidth(830)  # Set a fixed width to prevent stretching
     
-    # Load clinic info from database
+    # Load clinic info from the shared reference-data cache
     try:
-        db.cursor.execute("SELECT name, address, contact_number, email, employees_count, logo_path FROM clinic_info LIMIT 1")
-        clinic_row = db.cursor.fetchone()
+        clinic_row = reference_data.clinic()
         if clinic_row:
             clinic_data = {
                 "name": "PetMedix Animal Clinic",
-                "address": clinic_row[1],
-                "contact": clinic_row[2],
-                "email": clinic_row[3],
-                "employees": str(clinic_row[4]),
-                "logo_path": clinic_row[5] or "",
+                "address": clinic_row["address"],
+                "contact": clinic_row["contact_number"],
+                "email": clinic_row["email"],
+                "employees": str(clinic_row["employees_count"]),
+                "logo_path": clinic_row["logo_path"] or "",
                 "vet_license": "VET-214"  # Updated license number
             }
         else:
@@ -1145,26 +1120,10 @@ def get_setting_widget(user_id=None):
                 "vet_license": "VET-214"  # Updated license number
             }
     except Exception as e:
-        print(f"❌ Error loading clinic data: {e}")
+        log.error("❌ Error loading clinic data: %s", e)
         
     if clinic_data.get("logo_path") and os.path.exists(clinic_data["logo_path"]):
-        original_pixmap = QPixmap(clinic_data["logo_path"])
-        size = clinic_logo.size()
-        rounded_pixmap = QPixmap(size)
-        rounded_pixmap.fill(Qt.transparent)
-
-        painter = QPainter(rounded_pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        path = QPainterPath()
-        path.addEllipse(0, 0, size.width(), size.height())
-        painter.setClipPath(path)
-
-        scaled_pixmap = original_pixmap.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-        painter.drawPixmap(0, 0, scaled_pixmap)
-        painter.end()
-
-        clinic_logo.setPixmap(rounded_pixmap)
-        clinic_logo.setText("")
+        thumbnails.show_on(clinic_logo, clinic_data["logo_path"])
             
 
     # ✅ Now define clinic_fields using the loaded clinic_data
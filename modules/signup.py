@@ -4,6 +4,9 @@ from PySide6.QtGui import QPixmap, QIcon
 from modules.database import Database  # Import the Database class
 from modules.utils import create_styled_message_box
 import re
+from modules.log import get_logger
+
+log = get_logger(__name__)
 
 class SignUpWindow(QMainWindow):
     def __init__(self):
@@ -165,7 +168,7 @@ class SignUpWindow(QMainWindow):
         self.login_button.clicked.connect(self.go_to_login)
 
     def go_to_login(self):
-        print("Switching to login page...")
+        log.debug("Switching to login page...")
         from modules.login import LoginWindow
         self.login_window = LoginWindow() 
         self.login_window.showMaximized() 
@@ -239,11 +242,11 @@ class SignUpWindow(QMainWindow):
                 return
 
             # Create user and retrieve the generated USER_ID
-            print(f"Creating user with role: {role}")
+            log.debug("Creating user with role: %s", role)
             user_id = db.create_user(first_name, last_name, email, password, role)
             
             if not user_id:
-                print("Failed to generate user ID")
+                log.error("Failed to generate user ID")
                 error_msg = create_styled_message_box(
                     QMessageBox.Critical,
                     "Error",
@@ -253,10 +256,10 @@ class SignUpWindow(QMainWindow):
                 error_msg.exec()
                 return
 
-            print(f"User created with ID: {user_id}")
+            log.debug("User created with ID: %s", user_id)
             
             # Save security questions
-            print("Saving security questions...")
+            log.debug("Saving security questions...")
             if not db.save_security_questions(
                 user_id,
                 "What is your mother's maiden name?",
@@ -266,7 +269,7 @@ class SignUpWindow(QMainWindow):
                 "What is the name of the street you grew up on?",
                 answer_three
             ):
-                print("Failed to save security questions")
+                log.error("Failed to save security questions")
                 error_msg = create_styled_message_box(
                     QMessageBox.Critical,
                     "Error",
@@ -276,7 +279,7 @@ class SignUpWindow(QMainWindow):
                 error_msg.exec()
                 return
 
-            print("Security questions saved successfully")
+            log.debug("Security questions saved successfully")
             
             # Create success message
             success_msg = create_styled_message_box(
@@ -300,7 +303,7 @@ class SignUpWindow(QMainWindow):
             QTimer.singleShot(2000, self.redirect_to_login)
             
         except Exception as e:
-            print(f"Error creating account: {str(e)}")
+            log.error("Error creating account: %s", e)
             error_msg = create_styled_message_box(
                 QMessageBox.Critical,
                 "Error",
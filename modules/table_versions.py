@@ -0,0 +1,85 @@
+import re
+import threading
+from functools import lru_cache
+
+_WRITE = re.compile(
+    r"^\s*(?:INSERT(?:\s+IGNORE)?\s+INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM)\s+`?(\w+)`?",
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=1024)
+def written_table(sql):
+    """The table an INSERT/REPLACE/UPDATE/DELETE statement writes to, or None for anything else."""
+    match = _WRITE.match(sql)
+    return match.group(1).lower() if match else None
+
+
+class TableVersions:
+    """A change counter per table, bumped by every write this process commits.
+
+    Database connections report the tables of each committed transaction
+    here (see VersionedConnection), so writes made with ad-hoc SQL in the
+    screens count as well as the Database methods. Screens remember
+    version(...) of the tables they show and compare it later to tell
+    whether they need to reload. Writes from other workstations are not
+    seen; callers pair this with a time limit.
+    """
+
+    def __init__(self):
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def bump(self, *tables):
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+    def version(self, *tables):
+        """A value that changes whenever any of tables is written."""
+        with self._lock:
+            return tuple(self._versions.get(table, 0) for table in tables)
+
+    def snapshot(self, *tables):
+        """{table: version} for each of tables."""
+        with self._lock:
+            return {table: self._versions.get(table, 0) for table in tables}
+
+
+class VersionedConnection:
+    """Wraps a MariaDB connection and bumps the tables it wrote when it commits.
+
+    note_statement is the cursor's on_success hook. Written tables are held
+    until commit(); rollback() forgets them, as does handing the connection
+    back to the pool, which rolls back. In autocommit mode every write
+    counts at once. Anything else goes straight to the wrapped connection.
+    """
+
+    def __init__(self, conn, versions):
+        self.raw = conn
+        self._versions = versions
+        self._pending = set()
+
+    def __getattr__(self, name):
+        return getattr(self.raw, name)
+
+    def note_statement(self, sql):
+        table = written_table(sql)
+        if not table:
+            return
+        if self.raw.autocommit:
+            self._versions.bump(table)
+        else:
+            self._pending.add(table)
+
+    def commit(self):
+        self.raw.commit()
+        tables, self._pending = self._pending, set()
+        self._versions.bump(*tables)
+
+    def rollback(self):
+        self._pending.clear()
+        self.raw.rollback()
+
+
+table_versions = TableVersions()
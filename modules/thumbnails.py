@@ -0,0 +1,243 @@
+import hashlib
+import os
+import threading
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QSize, Qt, Signal, Slot
+from PySide6.QtGui import QImage, QImageReader, QPainter, QPainterPath, QPixmap, QPixmapCache
+from modules.log import get_logger
+
+log = get_logger(__name__)
+
+CACHE_DIR = "thumbnail_cache"
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def render_circular(image, width, height):
+    """Scale image to fill width x height and clip it to a centred circle."""
+    result = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+    result.fill(Qt.transparent)
+
+    painter = QPainter(result)
+    painter.setRenderHint(QPainter.Antialiasing)
+    path = QPainterPath()
+    path.addEllipse(0, 0, width, height)
+    painter.setClipPath(path)
+
+    scaled = image.scaled(width, height, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+    painter.drawImage((width - scaled.width()) // 2, (height - scaled.height()) // 2, scaled)
+    painter.end()
+    return result
+
+
+class _ThumbnailJob(QRunnable):
+    def __init__(self, service, path, width, height, request_key):
+        super().__init__()
+        self.service = service
+        self.path = path
+        self.width = width
+        self.height = height
+        self.request_key = request_key
+
+    def run(self):
+        key = self.service.cache_key(self.path, self.width, self.height)
+        image = self.service.load_image(self.path, self.width, self.height, key) if key else QImage()
+        self.service._loaded.emit(self.request_key, key or "", image)
+
+
+class ThumbnailService(QObject):
+    """Circular photo thumbnails, cached in memory (QPixmapCache) and on disk.
+
+    Entries are named by a SHA-1 of the photo's contents and the thumbnail
+    size, so a replaced photo gets a new entry and a copied or restored one
+    finds its old entry. Each file is hashed once per process, on a worker
+    thread, and the digest is remembered until the file's size, times or
+    inode change. The least recently used files are evicted once the
+    directory grows past max_bytes. Misses are decoded on a worker thread.
+    """
+
+    # Emitted from the worker thread; queued to _on_loaded on the UI thread
+    _loaded = Signal(str, str, QImage)
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=MAX_CACHE_BYTES, parent=None):
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+        self._waiting = {}  # (path, size) -> callbacks waiting for that thumbnail
+        self._digests = {}  # file fingerprint -> content digest
+        self._digest_lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._loaded.connect(self._on_loaded)
+        # Room for a few hundred 150px thumbnails (limit is in KB)
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), 32 * 1024))
+
+    def request(self, path, size, callback):
+        """Call callback(pixmap) with the thumbnail, now if cached, otherwise once decoded.
+
+        callback receives None when the file is missing or unreadable.
+        """
+        width, height = self._dimensions(size)
+        if self.fingerprint(path) is None:
+            callback(None)
+            return
+        pixmap = self.cached(path, (width, height))
+        if pixmap is not None:
+            callback(pixmap)
+            return
+        request_key = f"{os.path.abspath(path)}|{width}x{height}"
+        if request_key in self._waiting:
+            self._waiting[request_key].append(callback)
+            return
+        self._waiting[request_key] = [callback]
+        self._pool.start(_ThumbnailJob(self, path, width, height, request_key))
+
+    def show_on(self, label, path, size=None, fallback_text=None):
+        """Put the circular thumbnail of path on a QLabel (sized like the label by default).
+
+        When the photo cannot be loaded the label shows fallback_text instead, if given.
+        """
+        def apply(pixmap):
+            if pixmap is not None:
+                label.setPixmap(pixmap)
+                label.setText("")
+            elif fallback_text is not None:
+                label.setPixmap(QPixmap())
+                label.setText(fallback_text)
+
+        self.request(path, size if size is not None else label.size(), apply)
+
+    def cached(self, path, size):
+        """Return the thumbnail if it is already in memory, without reading the file."""
+        width, height = self._dimensions(size)
+        key = self.cache_key(path, width, height, hash_contents=False)
+        return QPixmapCache.find(key) if key is not None else None
+
+    def pixmap(self, path, size):
+        """Return the thumbnail synchronously (on the UI thread), or None."""
+        width, height = self._dimensions(size)
+        key = self.cache_key(path, width, height)
+        if key is None:
+            return None
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            image = self.load_image(path, width, height, key)
+            if image.isNull():
+                return None
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    @staticmethod
+    def fingerprint(path):
+        """(path, size, mtime, ctime, inode) of the file, or None when it cannot be read."""
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError, ValueError):
+            return None
+        return os.path.abspath(path), stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_ino
+
+    def cache_key(self, path, width, height, hash_contents=True):
+        """The cache name of path's thumbnail at width x height, or None.
+
+        None when the file is missing, or when its contents have not been
+        hashed yet and hash_contents is False.
+        """
+        fingerprint = self.fingerprint(path)
+        if fingerprint is None:
+            return None
+        with self._digest_lock:
+            digest = self._digests.get(fingerprint)
+        if digest is None:
+            if not hash_contents:
+                return None
+            digest = self._hash_file(path)
+            if digest is None:
+                return None
+            with self._digest_lock:
+                self._digests[fingerprint] = digest
+        return hashlib.sha1(f"{digest}|{width}x{height}".encode()).hexdigest()
+
+    @staticmethod
+    def _hash_file(path):
+        digest = hashlib.sha1()
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        except OSError as e:
+            log.error("❌ Could not read image %s: %s", path, e)
+            return None
+        return digest.hexdigest()
+
+    def load_image(self, path, width, height, key):
+        """Read the disk cache or render from the source photo. Safe to call off the UI thread."""
+        cached_path = os.path.join(self.cache_dir, f"{key}.png")
+        image = QImage(cached_path)
+        if not image.isNull():
+            try:
+                os.utime(cached_path)  # mark as recently used for eviction
+            except OSError:
+                pass
+            return image
+
+        reader = QImageReader(path)
+        source_size = reader.size()
+        if source_size.isValid():
+            # Let the decoder downscale (JPEG can do this cheaply) instead of
+            # decoding the full-resolution photo
+            scaled = source_size.scaled(width, height, Qt.KeepAspectRatioByExpanding)
+            if scaled.width() < source_size.width():
+                reader.setScaledSize(scaled)
+        source = reader.read()
+        if source.isNull():
+            log.error("❌ Could not read image %s: %s", path, reader.errorString())
+            return QImage()
+
+        image = render_circular(source, width, height)
+        self._store(cached_path, image)
+        return image
+
+    def _store(self, cached_path, image):
+        with self._disk_lock:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                image.save(cached_path, "PNG")
+                self._evict()
+            except OSError as e:
+                log.error("❌ Could not write thumbnail cache: %s", e)
+
+    def _evict(self):
+        entries = []
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    @Slot(str, str, QImage)
+    def _on_loaded(self, request_key, key, image):
+        pixmap = None
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(key, pixmap)
+        for callback in self._waiting.pop(request_key, []):
+            try:
+                callback(pixmap)
+            except RuntimeError:
+                # The label was deleted while the thumbnail was loading
+                pass
+
+    @staticmethod
+    def _dimensions(size):
+        if isinstance(size, QSize):
+            return size.width(), size.height()
+        return size, size
+
+
+thumbnails = ThumbnailService()
@@ -0,0 +1,108 @@
+# Every treatment table projected onto one row shape. The treatment_events view
+# and the top-N feed below are both generated from TREATMENT_EVENT_SOURCES, so
+# a new treatment column only has to be described once.
+
+EVENT_COLUMNS = (
+    "treatment_type", "treatment_id", "pet_id", "client_id", "date",
+    "veterinarian", "details", "remarks", "next_due",
+)
+
+# Positions in a fetched event row: EVENT_COLUMNS, then pet_name and client_name
+(EVENT_TYPE, EVENT_TREATMENT_ID, EVENT_PET_ID, EVENT_CLIENT_ID, EVENT_DATE, EVENT_VETERINARIAN,
+ EVENT_DETAILS, EVENT_REMARKS, EVENT_NEXT_DUE, EVENT_PET_NAME, EVENT_CLIENT_NAME) = range(len(EVENT_COLUMNS) + 2)
+
+# (table, primary key, label, details, remarks, next due date)
+TREATMENT_EVENT_SOURCES = (
+    ("consultations", "consultation_id", "Consultation", "prescribed_treatment",
+     "CONCAT('Diagnosis: ', diagnosis, '\\nPrescribed: ', prescribed_treatment)", "NULL"),
+    ("deworming", "deworming_id", "Deworming", "medication",
+     "CONCAT('Medication: ', medication, '\\nDosage: ', dosage)", "next_scheduled"),
+    ("vaccinations", "vaccination_id", "Vaccination", "vaccine",
+     "CONCAT('Vaccine: ', vaccine, '\\nDosage: ', dosage)", "next_scheduled"),
+    ("surgeries", "surgery_id", "Surgery", "surgery_type",
+     "CONCAT('Type: ', surgery_type, '\\nAnesthesia: ', anesthesia)", "next_followup"),
+    ("grooming", "grooming_id", "Grooming", "services",
+     "CONCAT('Services: ', services, '\\nNotes: ', notes)", "next_scheduled"),
+    ("other_treatments", "treatment_id", "Other Treatment", "medication",
+     "CONCAT('Treatment Type: ', treatment_type, '\\nMedication: ', medication, '\\nDosage: ', dosage)", "NULL"),
+)
+
+# Report type -> (table, primary key, the columns behind the report form's
+# reason / diagnosis / prescribed fields). Consultations and surgeries also
+# carry a risk_status.
+REPORT_TABLES = {
+    "Consultation": ("consultations", "consultation_id", ("reason", "diagnosis", "prescribed_treatment")),
+    "Deworming": ("deworming", "deworming_id", ("medication", "dosage", "next_scheduled")),
+    "Vaccination": ("vaccinations", "vaccination_id", ("vaccine", "dosage", "next_scheduled")),
+    "Surgery": ("surgeries", "surgery_id", ("surgery_type", "anesthesia", "next_followup")),
+    "Grooming": ("grooming", "grooming_id", ("services", "notes", "next_scheduled")),
+    "Other Treatments": ("other_treatments", "treatment_id", ("treatment_type", "medication", "dosage")),
+}
+RISK_STATUS_REPORTS = ("Consultation", "Surgery")
+
+
+def _branch(source, where="", suffix=""):
+    table, key, label, details, remarks, next_due = source
+    return (
+        f"SELECT '{label}' AS treatment_type, {key} AS treatment_id, pet_id, client_id, date, "
+        f"veterinarian, COALESCE({details}, '') AS details, {remarks} AS remarks, {next_due} AS next_due "
+        f"FROM {table}{where}{suffix}"
+    )
+
+
+def create_view_sql():
+    """DDL for the treatment_events view."""
+    branches = "\nUNION ALL\n".join(_branch(source) for source in TREATMENT_EVENT_SOURCES)
+    return f"CREATE OR REPLACE VIEW treatment_events AS\n{branches}"
+
+
+def events_query(pet_id=None, treatment_type=None, veterinarian=None, start=None, end=None, limit=None):
+    """Build (sql, params) returning EVENT_COLUMNS plus pet_name and client_name, newest first.
+
+    start/end bound the date as a half-open range [start, end). Filtered queries
+    read the view and let MariaDB push the predicates into each branch; a global
+    top-N (limit without pet_id) instead reads at most `limit` rows per table
+    through the date index, since ORDER BY ... LIMIT cannot be pushed through a view.
+    """
+    conditions = []
+    params = []
+    if pet_id is not None:
+        conditions.append("pet_id = ?")
+        params.append(pet_id)
+    if veterinarian is not None:
+        conditions.append("veterinarian = ?")
+        params.append(veterinarian)
+    if start is not None:
+        conditions.append("date >= ?")
+        params.append(start)
+    if end is not None:
+        conditions.append("date < ?")
+        params.append(end)
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+
+    if limit is not None and pet_id is None:
+        sources = [source for source in TREATMENT_EVENT_SOURCES
+                   if treatment_type is None or source[2] == treatment_type]
+        if not sources:
+            sources = TREATMENT_EVENT_SOURCES[:1]
+            where += (" AND" if where else " WHERE") + " 1 = 0"
+        suffix = f" ORDER BY date DESC LIMIT {int(limit)}"
+        source_sql = "\nUNION ALL\n".join(f"({_branch(source, where, suffix)})" for source in sources)
+        params = params * len(sources)
+    else:
+        source_sql = f"SELECT * FROM treatment_events{where}"
+        if treatment_type is not None:
+            source_sql += (" AND" if where else " WHERE") + " treatment_type = ?"
+            params.append(treatment_type)
+
+    columns = ", ".join(f"e.{column}" for column in EVENT_COLUMNS)
+    sql = f"""
+        SELECT {columns}, p.name AS pet_name, cl.name AS client_name
+        FROM ({source_sql}) AS e
+        JOIN pets p ON e.pet_id = p.pet_id
+        JOIN clients cl ON e.client_id = cl.client_id
+        ORDER BY e.date DESC
+    """
+    if limit is not None:
+        sql += f" LIMIT {int(limit)}"
+    return sql, tuple(params)
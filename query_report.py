@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Summarise a query statistics dump
+Usage: python query_report.py stats.json [--sort total_ms|p95_ms|max_ms|calls|rows] [--top N]
+
+Dumps come from "Save JSON" on the admin Diagnostics page or from
+python main.py --query-stats stats.json (written when the application exits).
+"""
+
+import argparse
+import json
+import sys
+
+SORT_FIELDS = ("total_ms", "p95_ms", "p99_ms", "max_ms", "mean_ms", "calls", "rows")
+
+def shorten(sql, width=90):
+    return sql if len(sql) <= width else sql[:width - 3] + "..."
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarise a query statistics dump")
+    parser.add_argument("path")
+    parser.add_argument("--sort", choices=SORT_FIELDS, default="total_ms")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    try:
+        with open(args.path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not read {args.path}: {e}")
+        sys.exit(1)
+
+    statements = sorted(data["statements"], key=lambda entry: entry[args.sort], reverse=True)
+    total_ms = sum(entry["total_ms"] for entry in statements) or 1
+    print(f"{len(statements)} statements recorded {data['started']} to {data['dumped']}, sorted by {args.sort}\n")
+    print(f"{'calls':>7} {'rows':>8} {'total ms':>10} {'share':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>9}")
+    for entry in statements[:args.top]:
+        print(f"{entry['calls']:7d} {entry['rows']:8d} {entry['total_ms']:10.1f} "
+              f"{entry['total_ms'] / total_ms:6.1%} {entry['p50_ms']:8.2f} {entry['p95_ms']:8.2f} "
+              f"{entry['p99_ms']:8.2f} {entry['max_ms']:9.2f}")
+        print(f"        {shorten(entry['sql'])}")
+        for caller, count in entry["callers"][:3]:
+            print(f"          ← {caller} ({count})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+from modules.appointment_model import AppointmentTableModel
+
+
+def appointment(appointment_id, date, time="10:00:00", pet="Bella", status="Scheduled"):
+    """A row of Database.fetch_appointments_page."""
+    return (date, time, pet, "Maria Santos", "Checkup", status, "Unpaid", "Dr. Reyes", date, time, appointment_id)
+
+
+def make_model(*rows, **kwargs):
+    model = AppointmentTableModel(**kwargs)
+    model.set_rows(rows)
+    return model
+
+
+def ids(model):
+    return [model.appointment_id(row) for row in range(model.rowCount())]
+
+
+def test_set_rows_formats_time():
+    model = make_model(appointment(1, "2025-01-01", "13:30:00"))
+    assert model.row_values(0)[:3] == ["2025-01-01", "01:30 PM", "Bella"]
+
+
+def test_put_new_row_in_order():
+    model = make_model(appointment(3, "2025-03-01"), appointment(1, "2025-01-01"))
+    model.put_row(appointment(4, "2025-04-01"))
+    model.put_row(appointment(2, "2025-02-01"))
+    model.put_row(appointment(0, "2024-12-01"))
+    assert ids(model) == [4, 3, 2, 1, 0]
+
+
+def test_same_day_ordered_by_time_then_id():
+    model = make_model(appointment(1, "2025-01-01", "09:00:00"))
+    model.put_row(appointment(2, "2025-01-01", "15:00:00"))
+    model.put_row(appointment(3, "2025-01-01", "09:00:00"))
+    assert ids(model) == [2, 3, 1]
+
+
+def test_put_same_key_rewrites_in_place():
+    model = make_model(appointment(2, "2025-02-01"), appointment(1, "2025-01-01"))
+    changed = []
+    model.dataChanged.connect(lambda top, bottom: changed.append(top.row()))
+    model.put_row(appointment(1, "2025-01-01", status="Completed"))
+    assert ids(model) == [2, 1]
+    assert model.status(1) == "Completed"
+    assert changed == [1]
+
+
+def test_reschedule_moves_row():
+    model = make_model(appointment(3, "2025-03-01"), appointment(2, "2025-02-01"), appointment(1, "2025-01-01"))
+    model.put_row(appointment(1, "2025-04-01"))
+    assert ids(model) == [1, 3, 2]
+    model.put_row(appointment(1, "2025-02-01", "08:00:00"))
+    assert ids(model) == [3, 2, 1]
+
+
+def test_row_below_unloaded_pages_is_left_out():
+    pages = []
+    model = AppointmentTableModel(page_loader=lambda *args: pages.append(args), page_size=2)
+    model.reload()
+    pages[-1][-1]([appointment(3, "2025-03-01"), appointment(2, "2025-02-01")])
+    assert model.has_more()
+    model.put_row(appointment(1, "2025-01-01"))  # belongs to a later page
+    assert ids(model) == [3, 2]
+    model.put_row(appointment(4, "2025-04-01"))
+    assert ids(model) == [4, 3, 2]
+
+
+def test_status_filter():
+    model = make_model(appointment(2, "2025-02-01", status="Urgent"), status="Urgent")
+    model.put_row(appointment(3, "2025-03-01", status="Scheduled"))
+    model.put_row(appointment(1, "2025-01-01", status="urgent"))
+    assert ids(model) == [2, 1]
+    model.put_row(appointment(2, "2025-02-01", status="Completed"))
+    assert ids(model) == [1]
+
+
+def test_remove_appointment():
+    model = make_model(appointment(2, "2025-02-01"), appointment(1, "2025-01-01"))
+    model.remove_appointment(2)
+    assert ids(model) == [1]
+    model.remove_appointment(2)  # not loaded
+    assert ids(model) == [1]
+
+
+def test_search_reloads_and_drops_stale_pages():
+    pages = []
+    model = AppointmentTableModel(page_loader=lambda *args: pages.append(args))
+    model.reload()
+    model.set_search("  Bel ")
+    assert [page[2] for page in pages] == [None, "bel"]
+    pages[1][-1]([appointment(2, "2025-02-01")])
+    pages[0][-1]([appointment(1, "2025-01-01", pet="Max")])  # the unfiltered page arrives late
+    assert ids(model) == [2]
+    model.put_row(appointment(3, "2025-03-01", pet="Max"))
+    model.put_row(appointment(4, "2025-04-01", pet="Bella"))
+    assert ids(model) == [4, 2]
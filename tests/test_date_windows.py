@@ -0,0 +1,110 @@
+from datetime import date, timedelta
+
+import pytest
+
+from modules.date_windows import date_window, date_range_sql
+
+
+def yearweek_mode0(day):
+    """MariaDB's YEARWEEK(day) (mode 0): weeks start on Sunday, week 1 starts on the year's first Sunday."""
+    new_year = date(day.year, 1, 1)
+    first_sunday = new_year + timedelta(days=(6 - new_year.weekday()) % 7)
+    if day < first_sunday:
+        return yearweek_mode0(new_year - timedelta(days=1))
+    return day.year * 100 + (day - first_sunday).days // 7 + 1
+
+
+def days(start, end):
+    """The dates of the half-open range [start, end)."""
+    return [start + timedelta(days=n) for n in range((end - start).days)]
+
+
+def test_yearweek_reference_matches_mariadb():
+    # SELECT YEARWEEK('2024-12-28'), YEARWEEK('2024-12-29'), YEARWEEK('2025-01-01'), YEARWEEK('2025-01-05')
+    assert yearweek_mode0(date(2024, 12, 28)) == 202451
+    assert yearweek_mode0(date(2024, 12, 29)) == 202452
+    assert yearweek_mode0(date(2025, 1, 1)) == 202452
+    assert yearweek_mode0(date(2025, 1, 5)) == 202501
+
+
+def test_today():
+    assert date_window("today", today=date(2025, 3, 14)) == (date(2025, 3, 14), date(2025, 3, 15))
+    assert date_window("today", today=date(2024, 12, 31)) == (date(2024, 12, 31), date(2025, 1, 1))
+
+
+def test_upcoming_is_open_ended():
+    assert date_window("upcoming", today=date(2025, 3, 14)) == (date(2025, 3, 14), None)
+
+
+@pytest.mark.parametrize("today, expected", [
+    (date(2025, 3, 1), (date(2025, 3, 1), date(2025, 4, 1))),
+    (date(2025, 3, 31), (date(2025, 3, 1), date(2025, 4, 1))),
+    (date(2024, 2, 29), (date(2024, 2, 1), date(2024, 3, 1))),
+    (date(2024, 12, 15), (date(2024, 12, 1), date(2025, 1, 1))),
+])
+def test_month(today, expected):
+    assert date_window("month", today=today) == expected
+
+
+def test_custom_end_is_inclusive():
+    start, end = date_window("custom", start=date(2025, 1, 10), end=date(2025, 1, 20))
+    assert (start, end) == (date(2025, 1, 10), date(2025, 1, 21))
+    assert date_window("custom", start=date(2025, 1, 10), end=date(2025, 1, 10)) == (date(2025, 1, 10), date(2025, 1, 11))
+
+
+def test_custom_one_sided():
+    assert date_window("custom", start=date(2025, 1, 10)) == (date(2025, 1, 10), None)
+    assert date_window("custom", end=date(2025, 1, 20)) == (None, date(2025, 1, 21))
+
+
+def test_all_is_unbounded():
+    assert date_window("all") == (None, None)
+
+
+def test_unknown_window():
+    with pytest.raises(ValueError):
+        date_window("fortnight")
+
+
+@pytest.mark.parametrize("today", days(date(2025, 3, 9), date(2025, 3, 16)))
+def test_week_on_every_weekday(today):
+    start, end = date_window("week", today=today)
+    assert (start, end) == (date(2025, 3, 9), date(2025, 3, 16))
+
+
+@pytest.mark.parametrize("today", [
+    day
+    for year in range(2019, 2031)
+    for day in days(date(year, 12, 22), date(year + 1, 1, 11))
+])
+def test_week_matches_yearweek_across_new_year(today):
+    start, end = date_window("week", today=today)
+    assert start.weekday() == 6  # Sunday
+    assert end - start == timedelta(days=7)
+    # The window holds exactly the days YEARWEEK puts in today's week
+    week = yearweek_mode0(today)
+    assert all(yearweek_mode0(day) == week for day in days(start, end))
+    assert yearweek_mode0(start - timedelta(days=1)) != week
+    assert yearweek_mode0(end) != week
+
+
+def test_range_sql_bounded():
+    sql, params = date_range_sql("a.date", (date(2025, 3, 1), date(2025, 4, 1)))
+    assert sql == " AND a.date >= ? AND a.date < ?"
+    assert params == [date(2025, 3, 1), date(2025, 4, 1)]
+
+
+def test_range_sql_start_only():
+    sql, params = date_range_sql("a.date", date_window("upcoming", today=date(2025, 3, 14)))
+    assert sql == " AND a.date >= ?"
+    assert params == [date(2025, 3, 14)]
+
+
+def test_range_sql_end_only():
+    sql, params = date_range_sql("b.date_issued", (None, date(2025, 1, 21)))
+    assert sql == " AND b.date_issued < ?"
+    assert params == [date(2025, 1, 21)]
+
+
+def test_range_sql_open_window():
+    assert date_range_sql("a.date", date_window("all")) == ("", [])
@@ -0,0 +1,78 @@
+from modules.report_model import ReportTableModel
+
+
+def record(record_id, date, pet="Bella"):
+    """A Deworming row of Database.fetch_medical_records."""
+    return (date, None, pet, "Maria Santos", "Pyrantel", "5 ml", "2025-06-01", "Reyes", record_id)
+
+
+def make_model(*records):
+    model = ReportTableModel("Deworming")
+    model.set_records(records)
+    return model
+
+
+def dates(model):
+    return [model.row_values(row)[0] for row in range(model.rowCount())]
+
+
+def ids(model):
+    return [model.record_id(row) for row in range(model.rowCount())]
+
+
+def test_set_records_keeps_order():
+    model = make_model(record(3, "2025-03-01"), record(2, "2025-02-01"), record(1, "2025-01-01"))
+    assert ids(model) == [3, 2, 1]
+    assert dates(model) == ["01/03/2025", "01/02/2025", "01/01/2025"]
+
+
+def test_position_binary_search():
+    model = make_model(
+        record(5, "2025-05-01"), record(4, "2025-04-01"), record(3, "2025-04-01"), record(1, "2025-01-01")
+    )
+    assert model._position("2025-06-01") == 0
+    assert model._position("2025-04-01") == 1  # ahead of its equals
+    assert model._position("2025-03-01") == 3
+    assert model._position("2024-12-31") == 4
+    assert ReportTableModel("Deworming")._position("2025-01-01") == 0
+
+
+def test_put_new_record_in_date_order():
+    model = make_model(record(3, "2025-03-01"), record(1, "2025-01-01"))
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append(first))
+    model.put_record(record(4, "2025-04-01"))
+    model.put_record(record(2, "2025-02-01"))
+    model.put_record(record(0, "2024-12-01"))
+    assert ids(model) == [4, 3, 2, 1, 0]
+    assert inserted == [0, 2, 4]
+
+
+def test_put_same_date_rewrites_in_place():
+    model = make_model(record(3, "2025-03-01"), record(2, "2025-02-01"), record(1, "2025-01-01"))
+    changed = []
+    model.dataChanged.connect(lambda top, bottom: changed.append(top.row()))
+    model.put_record(record(2, "2025-02-01", pet="Luna"))
+    assert ids(model) == [3, 2, 1]
+    assert model.row_values(1)[1] == "Luna"
+    assert changed == [1]
+    assert model.matching_ids("luna") == {2}
+
+
+def test_date_change_moves_row():
+    model = make_model(record(3, "2025-03-01"), record(2, "2025-02-01"), record(1, "2025-01-01"))
+    model.put_record(record(1, "2025-04-01"))
+    assert ids(model) == [1, 3, 2]
+    assert dates(model)[0] == "01/04/2025"
+    model.put_record(record(1, "2024-12-01"))
+    assert ids(model) == [3, 2, 1]
+    assert model.rowCount() == 3
+
+
+def test_remove_record():
+    model = make_model(record(2, "2025-02-01", pet="Max"), record(1, "2025-01-01"))
+    model.remove_record(2)
+    assert ids(model) == [1]
+    assert model.matching_ids("max") == set()
+    model.remove_record(2)  # not shown
+    assert ids(model) == [1]
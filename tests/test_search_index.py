@@ -0,0 +1,64 @@
+from modules.search_index import SearchIndex, tokenize
+
+
+def make_index():
+    index = SearchIndex()
+    index.build([
+        (1, ["Maria Santos", "maria@example.com", "Bella"]),
+        (2, ["John Cruz", "john@example.com", "Max, Bella"]),
+        (3, ["Ana Reyes", None, "Whiskers"]),
+    ])
+    return index
+
+
+def test_tokenize():
+    assert tokenize("Dr. Jose-Rizal, 2nd_floor") == ["dr", "jose", "rizal", "2nd", "floor"]
+    assert tokenize(None) == []
+
+
+def test_empty_query_matches_all():
+    index = make_index()
+    assert index.search("") is None
+    assert index.search("  ,. ") is None
+
+
+def test_word_prefix():
+    index = make_index()
+    assert index.search("bel") == {1, 2}
+    assert index.search("BELLA") == {1, 2}
+    assert index.search("ella") == set()
+
+
+def test_every_word_must_match():
+    index = make_index()
+    assert index.search("bel sant") == {1}
+    assert index.search("sant bel") == {1}
+    assert index.search("bel reyes") == set()
+
+
+def test_add_new_record():
+    index = make_index()
+    assert index.search("bel") == {1, 2}  # cached now
+    index.add(4, ["Belinda Lim", "", ""])
+    assert index.search("bel") == {1, 2, 4}
+    assert index.search("lim") == {4}
+    assert len(index) == 4
+
+
+def test_add_reindexes_existing_record():
+    index = make_index()
+    index.add(1, ["Maria Garcia", "maria@example.com", "Luna"])
+    assert index.search("santos") == set()
+    assert index.search("bella") == {2}
+    assert index.search("garc") == {1}
+    assert len(index) == 3
+
+
+def test_remove():
+    index = make_index()
+    assert index.search("whisk") == {3}
+    index.remove(3)
+    assert index.search("whisk") == set()
+    assert index.search("ana") == set()
+    index.remove(3)  # already gone
+    assert len(index) == 2